@@ -0,0 +1,87 @@
+"""Benchmark encoding `FunctionCall`s into call data.
+
+Compares the previous path of `SmartWallet.send_user_operation`, which built a web3 contract for
+every call, with `AbiRegistry` reusing the parsed ABI, for a direct ERC-20 transfer, a call with
+normalized arguments and a registry miss.
+
+Usage:
+    poetry run python benchmarks/abi_encoding_benchmark.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from web3 import Web3
+
+from cdp.abi_registry import AbiRegistry
+from cdp.evm_call_types import FunctionCall
+
+TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+RECIPIENT = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+
+def _function(name: str, *inputs: str) -> dict:
+    return {
+        "type": "function",
+        "name": name,
+        "inputs": [{"name": f"arg{i}", "type": abi_type} for i, abi_type in enumerate(inputs)],
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+    }
+
+
+ERC20_ABI = [
+    _function("transfer", "address", "uint256"),
+    _function("transferFrom", "address", "address", "uint256"),
+    _function("approve", "address", "uint256"),
+    _function("increaseAllowance", "address", "uint256"),
+    _function("decreaseAllowance", "address", "uint256"),
+    _function("balanceOf", "address"),
+    _function("allowance", "address", "address"),
+    _function("totalSupply"),
+    _function("permit", "address", "address", "uint256", "uint256", "uint8", "bytes32", "bytes32"),
+    _function("multicall", "bytes[]"),
+]
+
+CALLS = {
+    "transfer(address,uint256)": ("transfer", [RECIPIENT, 10**6]),
+    "multicall(bytes[])": ("multicall", [["0xa9059cbb", "0x095ea7b3"]]),
+}
+
+
+def _legacy_encode(call: FunctionCall) -> str:
+    """Encode a call the way `SmartWallet.send_user_operation` did before `AbiRegistry`."""
+    contract = Web3().eth.contract(address=call.to, abi=call.abi)
+    return contract.encode_abi(call.function_name, args=call.args)
+
+
+def main() -> None:
+    """Run the benchmark and print per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=500, help="calls per measurement")
+    args = parser.parse_args()
+
+    for label, (function_name, call_args) in CALLS.items():
+        call = FunctionCall(to=TOKEN, abi=ERC20_ABI, function_name=function_name, args=call_args)
+        assert call.encode().data == _legacy_encode(call)
+
+        cases = {
+            "legacy (contract per call)": lambda c=call: _legacy_encode(c),
+            "AbiRegistry (miss)": lambda c=call: AbiRegistry().encode(
+                c.abi, c.function_name, c.args
+            ),
+            "AbiRegistry (hit)": lambda c=call: c.abi_registry.encode(
+                c.abi, c.function_name, c.args
+            ),
+            "FunctionCall.encode": lambda c=call: c.encode(),
+        }
+
+        print(f"{label}:")
+        for name, fn in cases.items():
+            fn()
+            best = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number
+            print(f"  {name:<28} {best * 1e6:9.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
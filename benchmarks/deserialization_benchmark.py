@@ -0,0 +1,133 @@
+"""Benchmark deserializing large list responses into models.
+
+Compares the generated client's deserializer, which parses with `json.loads`, dispatches on the
+type name at every level and builds each nested model with `from_dict`, with
+`ResponseDeserializer` validating responses and trusting them (`validate_responses=False`).
+
+Usage:
+    poetry run python benchmarks/deserialization_benchmark.py [--items N] [--number N]
+"""
+
+import argparse
+import json
+import timeit
+
+from cdp.client.api_client import ApiClient
+from cdp.response_deserializer import ResponseDeserializer
+
+ASSET = {
+    "network_id": "base-sepolia",
+    "asset_id": "usdc",
+    "decimals": 6,
+    "contract_address": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
+}
+
+TRANSACTION = {
+    "network_id": "base-sepolia",
+    "block_hash": "0x" + "ab" * 32,
+    "block_height": "12345678",
+    "from_address_id": "0x" + "11" * 20,
+    "to_address_id": "0x" + "22" * 20,
+    "unsigned_payload": "02f8" + "00" * 120,
+    "signed_payload": "02f8" + "00" * 180,
+    "transaction_hash": "0x" + "cd" * 32,
+    "transaction_link": "https://sepolia.basescan.org/tx/0x" + "cd" * 32,
+    "status": "complete",
+    "content": {
+        "from": "0x" + "11" * 20,
+        "to": "0x" + "22" * 20,
+        "gas": 65000,
+        "gas_price": 1000000,
+        "hash": "0x" + "cd" * 32,
+        "input": "0xa9059cbb" + "00" * 64,
+        "nonce": 42,
+        "index": 3,
+        "value": "0",
+        "type": 2,
+        "block_timestamp": "2025-01-01T00:00:00Z",
+        "token_transfers": [
+            {
+                "contract_address": ASSET["contract_address"],
+                "from_address": "0x" + "11" * 20,
+                "to_address": "0x" + "22" * 20,
+                "value": "1000000",
+                "log_index": 7,
+                "token_transfer_type": "erc20",
+            }
+        ],
+    },
+}
+
+
+def _payloads(items: int) -> dict[str, str]:
+    transfers = [
+        {
+            "network_id": "base-sepolia",
+            "wallet_id": "wallet-id",
+            "address_id": "0x" + "11" * 20,
+            "destination": "0x" + "22" * 20,
+            "amount": "1000000",
+            "asset_id": "usdc",
+            "asset": ASSET,
+            "transfer_id": f"transfer-{index}",
+            "transaction": TRANSACTION,
+            "status": "complete",
+            "gasless": False,
+        }
+        for index in range(items)
+    ]
+    historical_balances = [
+        {
+            "amount": str(index * 1000),
+            "block_hash": "0x" + "ab" * 32,
+            "block_height": str(12345678 - index),
+            "asset": ASSET,
+        }
+        for index in range(items)
+    ]
+    return {
+        "TransferList": json.dumps(
+            {"data": transfers, "has_more": True, "next_page": "next", "total_count": items}
+        ),
+        "AddressTransactionList": json.dumps(
+            {"data": [TRANSACTION] * items, "has_more": True, "next_page": "next"}
+        ),
+        "AddressHistoricalBalanceList": json.dumps(
+            {"data": historical_balances, "has_more": True, "next_page": "next"}
+        ),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print per-response timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="items per response")
+    parser.add_argument("--number", type=int, default=50, help="calls per measurement")
+    args = parser.parse_args()
+
+    api_client = ApiClient()
+    deserializer = ResponseDeserializer()
+    trusted_deserializer = ResponseDeserializer(validate=False)
+
+    for response_type, response_text in _payloads(args.items).items():
+        cases = {
+            "generated client": lambda t=response_text, r=response_type: api_client.deserialize(
+                t, r, "application/json"
+            ),
+            "ResponseDeserializer": lambda t=response_text, r=response_type: (
+                deserializer.deserialize(t, r)
+            ),
+            "ResponseDeserializer (trusted)": lambda t=response_text, r=response_type: (
+                trusted_deserializer.deserialize(t, r)
+            ),
+        }
+
+        print(f"{response_type} ({args.items} items, {len(response_text) // 1024} KiB):")
+        for name, fn in cases.items():
+            fn()
+            best = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number
+            print(f"  {name:<32} {best * 1e3:9.2f} ms/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""Benchmark the CPU hot paths that run per SDK operation, against a stored baseline.
+
+Times JWT signing, deserializing large list responses, HD key derivation and attestations,
+transaction parsing and signing, user operation signing, EIP-712 hashing, contract read value
+conversion and asset amount conversion. Results can be saved as a baseline, and later runs
+compared against it to prove an optimization or flag a regression. Baselines are only comparable
+on the machine and Python version they were recorded on.
+
+Usage:
+    poetry run python benchmarks/hot_paths_benchmark.py [--filter NAME] [--number N] [--repeat N]
+        [--save PATH] [--compare PATH] [--threshold RATIO]
+"""
+
+import argparse
+import base64
+import json
+import os
+import platform
+import sys
+import timeit
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "hot_paths.json"
+URL = "https://api.cdp.coinbase.com/platform/v1/wallets/wallet-id/addresses/0xaddress/balances"
+ADDRESS = "0x" + "22" * 20
+
+TYPED_DATA = {
+    "types": {
+        "EIP712Domain": [
+            {"name": "name", "type": "string"},
+            {"name": "version", "type": "string"},
+            {"name": "chainId", "type": "uint256"},
+            {"name": "verifyingContract", "type": "address"},
+        ],
+        "Person": [{"name": "name", "type": "string"}, {"name": "wallet", "type": "address"}],
+        "Mail": [
+            {"name": "from", "type": "Person"},
+            {"name": "to", "type": "Person"},
+            {"name": "contents", "type": "string"},
+        ],
+    },
+    "primaryType": "Mail",
+    "domain": {
+        "name": "Ether Mail",
+        "version": "1",
+        "chainId": 1,
+        "verifyingContract": "0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC",
+    },
+    "message": {
+        "from": {"name": "Alice", "wallet": "0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826"},
+        "to": {"name": "Bob", "wallet": "0xbBbBBBBbbBBBbbbBbbBbbbbBBbBbbbbBbBbbBBbB"},
+        "contents": "Hello, Bob!",
+    },
+}
+
+
+def _jwt(key_type: str) -> Callable[[], object]:
+    from cdp.cdp_api_client import CdpApiClient
+
+    if key_type == "ecdsa":
+        private_key = (
+            ec.generate_private_key(ec.SECP256R1())
+            .private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+            .decode()
+        )
+    else:
+        private_key = base64.b64encode(
+            ed25519.Ed25519PrivateKey.generate().private_bytes(
+                serialization.Encoding.Raw,
+                serialization.PrivateFormat.Raw,
+                serialization.NoEncryption(),
+            )
+        ).decode()
+
+    client = CdpApiClient("organizations/org-id/apiKeys/key-id", private_key)
+    return lambda: client._build_jwt(URL)
+
+
+def _deserialize_transfer_list() -> Callable[[], object]:
+    from cdp.client.api_client import ApiClient
+
+    asset = {"network_id": "base-sepolia", "asset_id": "eth", "decimals": 18}
+    transfer = {
+        "network_id": "base-sepolia",
+        "wallet_id": "wallet-id",
+        "address_id": "0x" + "11" * 20,
+        "destination": ADDRESS,
+        "amount": "1000000000000000",
+        "asset_id": "eth",
+        "asset": asset,
+        "transfer_id": "transfer-id",
+        "transaction": {
+            "network_id": "base-sepolia",
+            "from_address_id": "0x" + "11" * 20,
+            "to_address_id": ADDRESS,
+            "unsigned_payload": "",
+            "transaction_hash": "0x" + "cd" * 32,
+            "status": "complete",
+        },
+        "status": "complete",
+        "gasless": False,
+    }
+    body = json.dumps(
+        {"data": [transfer] * 500, "has_more": False, "next_page": "", "total_count": 500}
+    )
+    client = ApiClient()
+    return lambda: client.deserialize(body, "TransferList", "application/json")
+
+
+def _wallet():
+    from cdp.client.models.feature_set import FeatureSet
+    from cdp.client.models.wallet import Wallet as WalletModel
+    from cdp.wallet import Wallet
+
+    feature_set = FeatureSet(
+        faucet=True, server_signer=True, transfer=True, trade=True, stake=True, gasless_send=True
+    )
+    model = WalletModel(id="wallet-id", network_id="base-sepolia", feature_set=feature_set)
+    return Wallet(model, os.urandom(64).hex())
+
+
+def _wallet_derive_key() -> Callable[[], object]:
+    wallet = _wallet()
+    wallet._derive_key(0)
+    return lambda: wallet._derive_key(7)
+
+
+def _wallet_create_attestation() -> Callable[[], object]:
+    wallet = _wallet()
+    key = wallet._derive_key(0)
+    public_key_hex = key.PublicKey().RawCompressed().ToHex()
+    return lambda: wallet._create_attestation(key, public_key_hex)
+
+
+def _transaction_model():
+    from cdp.client.models.transaction import Transaction as TransactionModel
+
+    payload = {
+        "chainId": hex(84532),
+        "nonce": hex(7),
+        "maxPriorityFeePerGas": hex(10**6),
+        "maxFeePerGas": hex(10**9),
+        "gas": hex(21000),
+        "value": hex(10**15),
+        "input": "0x",
+        "to": ADDRESS,
+    }
+    return TransactionModel(
+        network_id="base-sepolia",
+        from_address_id="0x" + "11" * 20,
+        unsigned_payload=json.dumps(payload).encode().hex(),
+        status="pending",
+    )
+
+
+def _transaction_raw() -> Callable[[], object]:
+    from cdp.transaction import Transaction
+
+    model = _transaction_model()
+    return lambda: Transaction(model).raw
+
+
+def _transaction_sign() -> Callable[[], object]:
+    from eth_account import Account
+
+    from cdp.transaction import Transaction
+
+    model = _transaction_model()
+    account = Account.create()
+    return lambda: Transaction(model).sign(account)
+
+
+def _user_operation_sign() -> Callable[[], object]:
+    from eth_account import Account
+
+    from cdp.client.models.call import Call
+    from cdp.client.models.user_operation import UserOperation as UserOperationModel
+    from cdp.user_operation import UserOperation
+
+    user_op_hash = "0x" + "ab" * 32
+    model = UserOperationModel(
+        id="user-operation-id",
+        network_id="base-sepolia",
+        calls=[Call(to=ADDRESS, data="0x", value="1")],
+        user_op_hash=user_op_hash,
+        unsigned_payload=user_op_hash,
+        status="pending",
+    )
+    account = Account.create()
+    return lambda: UserOperation(model, ADDRESS).sign(account)
+
+
+def _hash_typed_data_message() -> Callable[[], object]:
+    from cdp.hash_utils import hash_typed_data_message
+
+    return lambda: hash_typed_data_message(TYPED_DATA)
+
+
+def _convert_solidity_value() -> Callable[[], object]:
+    from cdp.client.models.solidity_value import SolidityValue
+    from cdp.smart_contract import SmartContract
+
+    def leaf(name: str) -> SolidityValue:
+        return SolidityValue(type="uint256", name=name, value=str(10**30))
+
+    def tuple_(name: str, depth: int) -> SolidityValue:
+        values = [leaf("amount"), SolidityValue(type="address", name="owner", value=ADDRESS)]
+        if depth:
+            values.append(tuple_("child", depth - 1))
+        return SolidityValue(type="tuple", name=name, values=values)
+
+    value = SolidityValue(type="array", values=[tuple_(f"item{i}", 4) for i in range(20)])
+    return lambda: SmartContract._convert_solidity_value(value)
+
+
+def _asset_to_atomic_amount() -> Callable[[], object]:
+    from cdp.asset import Asset
+
+    asset = Asset("base-sepolia", "usdc", "0x036CbD53842c5426634e7929541eC2318f3dCF7e", 6)
+    amount = Decimal("1234.567891")
+    return lambda: asset.to_atomic_amount(amount)
+
+
+CASES: dict[str, Callable[[], Callable[[], object]]] = {
+    "build_jwt_es256": lambda: _jwt("ecdsa"),
+    "build_jwt_eddsa": lambda: _jwt("ed25519"),
+    "deserialize_transfer_list_500": _deserialize_transfer_list,
+    "wallet_derive_key": _wallet_derive_key,
+    "wallet_create_attestation": _wallet_create_attestation,
+    "transaction_raw": _transaction_raw,
+    "transaction_sign": _transaction_sign,
+    "user_operation_sign": _user_operation_sign,
+    "hash_typed_data_message": _hash_typed_data_message,
+    "convert_solidity_value_nested": _convert_solidity_value,
+    "asset_to_atomic_amount": _asset_to_atomic_amount,
+}
+
+
+def run(names: list[str], number: int | None, repeat: int) -> dict[str, float]:
+    """Time each case and return its best time per call in seconds."""
+    results = {}
+    for name in names:
+        fn = CASES[name]()
+        fn()
+        calls = number
+        if calls is None:
+            # As many calls as take at least 0.2 seconds.
+            calls, _ = timeit.Timer(fn).autorange()
+        results[name] = min(timeit.repeat(fn, number=calls, repeat=repeat)) / calls
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> bool:
+    """Print each case relative to the baseline and return whether any case regressed."""
+    regressed = False
+    print(f"{'case':<34}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"{name:<34}{'-':>12}{seconds * 1e6:>10.1f}us{'new':>8}")
+            continue
+        ratio = seconds / baseline[name]
+        marker = ""
+        if ratio > threshold:
+            marker = "  REGRESSION"
+            regressed = True
+        elif ratio < 1 / threshold:
+            marker = "  faster"
+        print(
+            f"{name:<34}{baseline[name] * 1e6:>10.1f}us{seconds * 1e6:>10.1f}us{ratio:>8.2f}{marker}"
+        )
+    return regressed
+
+
+def main() -> int:
+    """Run the benchmarks, then save or compare against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--number", type=int, default=None, help="calls per repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats, the best is kept")
+    parser.add_argument("--save", type=Path, nargs="?", const=DEFAULT_BASELINE, default=None)
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE, default=None)
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio flagged as a regression"
+    )
+    args = parser.parse_args()
+
+    names = [name for name in CASES if args.filter in name]
+    results = run(names, args.number, args.repeat)
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressed = compare(results, baseline, args.threshold)
+    else:
+        regressed = False
+        for name, seconds in results.items():
+            print(f"{name:<34}{seconds * 1e6:>10.1f} us/call")
+
+    if args.save is not None:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": {name: round(seconds, 9) for name, seconds in results.items()},
+        }
+        args.save.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"saved baseline to {args.save}")
+
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
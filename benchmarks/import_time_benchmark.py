@@ -0,0 +1,80 @@
+"""Benchmark the startup cost of importing the SDK.
+
+Each statement is run in a fresh interpreter, so that nothing is cached in `sys.modules`, and
+reports its wall time along with the heavy dependencies it loaded. `import cdp` and the SDK
+classes are expected to load web3, eth_account, bip_utils, coincurve and the generated API
+modules only once signing or ABI encoding is used. Pass `--max-seconds` to fail when `import cdp`
+regresses past a budget, e.g. in CI.
+
+Usage:
+    poetry run python benchmarks/import_time_benchmark.py [--repeat N] [--max-seconds S]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "web3",
+    "eth_account",
+    "eth_abi",
+    "eth_utils",
+    "bip_utils",
+    "coincurve",
+    "Crypto",
+    "cdp.client.api.wallets_api",
+)
+
+STATEMENTS = {
+    "import cdp": "import cdp",
+    "configure the SDK": "from cdp import Cdp",
+    "import every wrapper": "from cdp import *",
+    "import the wallets API": "from cdp.client.api import WalletsApi",
+    "hash a message": "from cdp import hash_message; hash_message('hello')",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {heavy!r} if name in sys.modules]]))
+"""
+
+
+def _measure(statement: str) -> tuple[float, list[str]]:
+    """Run a statement in a fresh interpreter and return its time and the heavy modules loaded."""
+    probe = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    elapsed, loaded = json.loads(output.strip().splitlines()[-1])
+    return elapsed, loaded
+
+
+def main() -> None:
+    """Run the benchmark and print the median time of each statement."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per statement")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="fail if `import cdp` is slower"
+    )
+    args = parser.parse_args()
+
+    import_cdp = None
+    for name, statement in STATEMENTS.items():
+        runs = [_measure(statement) for _ in range(args.repeat)]
+        median = statistics.median(elapsed for elapsed, _ in runs)
+        loaded = ", ".join(runs[-1][1]) or "-"
+        print(f"  {name:<22} {median * 1e3:9.1f} ms   heavy modules: {loaded}")
+        if statement == "import cdp":
+            import_cdp = median
+
+    if args.max_seconds is not None and import_cdp > args.max_seconds:
+        sys.exit(f"`import cdp` took {import_cdp:.3f}s, over the {args.max_seconds:.3f}s budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark JWT construction for CDP API requests.
+
+Compares the previous per-request path, which parsed the private key and derived the signing
+algorithm for every request, with `JwtSigner` with and without its token cache.
+
+Usage:
+    poetry run python benchmarks/jwt_signer_benchmark.py [--number N]
+"""
+
+import argparse
+import base64
+import random
+import time
+import timeit
+from urllib.parse import urlparse
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from cdp.api_key_utils import _parse_private_key
+from cdp.jwt_signer import JwtSigner
+
+URL = "https://api.cdp.coinbase.com/platform/v1/wallets/wallet-id/addresses/0xaddress/balances"
+
+
+def _keys() -> dict[str, str]:
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    ed_key = ed25519.Ed25519PrivateKey.generate()
+    return {
+        "ecdsa": ec_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode(),
+        "ed25519": base64.b64encode(
+            ed_key.private_bytes(
+                serialization.Encoding.Raw,
+                serialization.PrivateFormat.Raw,
+                serialization.NoEncryption(),
+            )
+        ).decode(),
+    }
+
+
+def _legacy_build_jwt(api_key: str, private_key: str, url: str, method: str = "GET") -> str:
+    """Build a JWT the way `CdpApiClient._build_jwt` did before `JwtSigner`."""
+    private_key_obj = _parse_private_key(private_key)
+    alg = "ES256" if isinstance(private_key_obj, ec.EllipticCurvePrivateKey) else "EdDSA"
+    header = {
+        "alg": alg,
+        "kid": api_key,
+        "typ": "JWT",
+        "nonce": "".join(random.choices("0123456789", k=16)),
+    }
+    parsed_url = urlparse(url)
+    claims = {
+        "sub": api_key,
+        "iss": "cdp",
+        "aud": ["cdp_service"],
+        "nbf": int(time.time()),
+        "exp": int(time.time()) + 60,
+        "uris": [f"{method} {parsed_url.netloc}{parsed_url.path}"],
+    }
+    return jwt.encode(claims, private_key_obj, algorithm=alg, headers=header)
+
+
+def main() -> None:
+    """Run the benchmark and print per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args()
+
+    for key_type, private_key in _keys().items():
+        signer = JwtSigner("api-key", private_key)
+        cached_signer = JwtSigner("api-key", private_key, token_cache_min_validity_seconds=10)
+
+        cases = {
+            "legacy (parse per request)": lambda pk=private_key: _legacy_build_jwt(
+                "api-key", pk, URL
+            ),
+            "JwtSigner": lambda s=signer: s.sign(URL),
+            "JwtSigner + token cache": lambda s=cached_signer: s.sign(URL),
+        }
+
+        print(f"{key_type}:")
+        for name, fn in cases.items():
+            fn()
+            best = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number
+            print(f"  {name:<28} {best * 1e6:9.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
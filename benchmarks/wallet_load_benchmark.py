@@ -0,0 +1,60 @@
+"""Benchmark deriving the address keys of wallets loaded from seeds.
+
+Compares the previous path, which derived every address key from the master node along the full
+BIP-44 path, with deriving from a cached account node, in one process and on a process pool.
+
+Usage:
+    poetry run python benchmarks/wallet_load_benchmark.py [--addresses N] [--workers N]
+"""
+
+import argparse
+import os
+import timeit
+
+from bip_utils import Bip32Slip10Secp256k1
+
+from cdp.hd_derivation import ACCOUNT_PATH, derive_private_keys, derive_private_keys_many
+
+
+def _legacy_derive_private_keys(seed: str, indices: list[int]) -> list[str]:
+    """Derive keys the way `Wallet._derive_key` did before the account node was cached."""
+    master = Bip32Slip10Secp256k1.FromSeed(bytes.fromhex(seed))
+    return [
+        master.DerivePath(f"{ACCOUNT_PATH}/{index}").PrivateKey().Raw().ToHex() for index in indices
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print per-load timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--addresses", type=int, default=5, help="addresses per wallet")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="process pool workers"
+    )
+    args = parser.parse_args()
+
+    indices = list(range(args.addresses))
+
+    for wallet_count in (1, 20, 1000):
+        requests = [(os.urandom(64).hex(), indices) for _ in range(wallet_count)]
+
+        cases = {
+            "legacy (full path per address)": lambda r=requests: [
+                _legacy_derive_private_keys(seed, i) for seed, i in r
+            ],
+            "cached account node": lambda r=requests: [
+                derive_private_keys(seed, i) for seed, i in r
+            ],
+            f"process pool ({args.workers} workers)": lambda r=requests: derive_private_keys_many(
+                r, max_workers=args.workers
+            ),
+        }
+
+        print(f"{wallet_count} wallet(s) x {args.addresses} address(es):")
+        for name, fn in cases.items():
+            best = min(timeit.repeat(fn, number=1, repeat=3))
+            print(f"  {name:<34} {best * 1e3:9.1f} ms/load")
+
+
+if __name__ == "__main__":
+    main()
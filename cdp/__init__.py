@@ -1,28 +1,95 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from cdp.__version__ import __version__
-from cdp.address import Address
-from cdp.asset import Asset
-from cdp.balance import Balance
-from cdp.balance_map import BalanceMap
-from cdp.cdp import Cdp
-from cdp.contract_invocation import ContractInvocation
-from cdp.evm_call_types import EncodedCall, FunctionCall
-from cdp.external_address import ExternalAddress
-from cdp.faucet_transaction import FaucetTransaction
-from cdp.hash_utils import hash_message, hash_typed_data_message
-from cdp.mnemonic_seed_phrase import MnemonicSeedPhrase
-from cdp.network import Network, SupportedChainId
-from cdp.payload_signature import PayloadSignature
-from cdp.smart_contract import SmartContract
-from cdp.smart_wallet import SmartWallet, to_smart_wallet
-from cdp.sponsored_send import SponsoredSend
-from cdp.trade import Trade
-from cdp.transaction import Transaction
-from cdp.transfer import Transfer
-from cdp.user_operation import UserOperation
-from cdp.wallet import Wallet
-from cdp.wallet_address import WalletAddress
-from cdp.wallet_data import WalletData
-from cdp.webhook import Webhook
+
+# The SDK classes are imported on first access, so that importing the package does not load
+# web3, eth_account or the generated API client until they are needed.
+_LAZY_IMPORTS = {
+    "AbiRegistry": "cdp.abi_registry",
+    "Address": "cdp.address",
+    "Asset": "cdp.asset",
+    "Balance": "cdp.balance",
+    "BalanceMap": "cdp.balance_map",
+    "Cdp": "cdp.cdp",
+    "AsyncCdpClient": "cdp.cdp_client",
+    "CdpClient": "cdp.cdp_client",
+    "CdpClientPool": "cdp.cdp_client",
+    "ContractInvocation": "cdp.contract_invocation",
+    "EncodedCall": "cdp.evm_call_types",
+    "FunctionCall": "cdp.evm_call_types",
+    "ExternalAddress": "cdp.external_address",
+    "FaucetTransaction": "cdp.faucet_transaction",
+    "hash_message": "cdp.hash_utils",
+    "hash_typed_data_message": "cdp.hash_utils",
+    "MetricsRegistry": "cdp.metrics",
+    "MnemonicSeedPhrase": "cdp.mnemonic_seed_phrase",
+    "Network": "cdp.network",
+    "SupportedChainId": "cdp.network",
+    "PayloadSignature": "cdp.payload_signature",
+    "RequestPriority": "cdp.request_priority",
+    "request_priority": "cdp.request_priority",
+    "set_request_priority": "cdp.request_priority",
+    "SigningPool": "cdp.signing_pool",
+    "SmartContract": "cdp.smart_contract",
+    "SmartWallet": "cdp.smart_wallet",
+    "to_smart_wallet": "cdp.smart_wallet",
+    "SponsoredSend": "cdp.sponsored_send",
+    "StatusWatcher": "cdp.status_watcher",
+    "OpenTelemetryTraceHook": "cdp.tracing",
+    "TraceHook": "cdp.tracing",
+    "Trade": "cdp.trade",
+    "Transaction": "cdp.transaction",
+    "CoincurveTransactionSigner": "cdp.transaction_signer",
+    "EthAccountTransactionSigner": "cdp.transaction_signer",
+    "TransactionSigner": "cdp.transaction_signer",
+    "set_transaction_signer": "cdp.transaction_signer",
+    "Transfer": "cdp.transfer",
+    "UserOperation": "cdp.user_operation",
+    "Wallet": "cdp.wallet",
+    "WalletAddress": "cdp.wallet_address",
+    "WalletData": "cdp.wallet_data",
+    "Webhook": "cdp.webhook",
+}
+
+if TYPE_CHECKING:
+    from cdp.abi_registry import AbiRegistry
+    from cdp.address import Address
+    from cdp.asset import Asset
+    from cdp.balance import Balance
+    from cdp.balance_map import BalanceMap
+    from cdp.cdp import Cdp
+    from cdp.cdp_client import AsyncCdpClient, CdpClient, CdpClientPool
+    from cdp.contract_invocation import ContractInvocation
+    from cdp.evm_call_types import EncodedCall, FunctionCall
+    from cdp.external_address import ExternalAddress
+    from cdp.faucet_transaction import FaucetTransaction
+    from cdp.hash_utils import hash_message, hash_typed_data_message
+    from cdp.metrics import MetricsRegistry
+    from cdp.mnemonic_seed_phrase import MnemonicSeedPhrase
+    from cdp.network import Network, SupportedChainId
+    from cdp.payload_signature import PayloadSignature
+    from cdp.request_priority import RequestPriority, request_priority, set_request_priority
+    from cdp.signing_pool import SigningPool
+    from cdp.smart_contract import SmartContract
+    from cdp.smart_wallet import SmartWallet, to_smart_wallet
+    from cdp.sponsored_send import SponsoredSend
+    from cdp.status_watcher import StatusWatcher
+    from cdp.tracing import OpenTelemetryTraceHook, TraceHook
+    from cdp.trade import Trade
+    from cdp.transaction import Transaction
+    from cdp.transaction_signer import (
+        CoincurveTransactionSigner,
+        EthAccountTransactionSigner,
+        TransactionSigner,
+        set_transaction_signer,
+    )
+    from cdp.transfer import Transfer
+    from cdp.user_operation import UserOperation
+    from cdp.wallet import Wallet
+    from cdp.wallet_address import WalletAddress
+    from cdp.wallet_data import WalletData
+    from cdp.webhook import Webhook
 
 __all__ = [
     "Address",
@@ -55,4 +122,34 @@ __all__ = [
     "FunctionCall",
     "UserOperation",
     "Network",
+    "RequestPriority",
+    "request_priority",
+    "set_request_priority",
+    "TraceHook",
+    "OpenTelemetryTraceHook",
+    "MetricsRegistry",
+    "CdpClient",
+    "AsyncCdpClient",
+    "CdpClientPool",
+    "TransactionSigner",
+    "CoincurveTransactionSigner",
+    "EthAccountTransactionSigner",
+    "set_transaction_signer",
+    "SigningPool",
+    "AbiRegistry",
+    "StatusWatcher",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
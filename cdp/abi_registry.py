@@ -0,0 +1,245 @@
+import copy
+import functools
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Argument types whose values the ABI codec encodes exactly as web3 would after normalizing them,
+# as long as addresses are checksummed. Calls with other types, e.g. bytes, strings, tuples or
+# arrays of addresses, are encoded by web3.
+_DIRECT_TYPE = re.compile(r"^(u?int\d*|bool)(\[\d*\])*$|^address$")
+
+
+@dataclass(frozen=True)
+class AbiRegistryStats:
+    """A snapshot of the counters of an ABI registry.
+
+    Attributes:
+        hits (int): The number of encodings that reused a parsed ABI.
+        misses (int): The number of encodings that parsed an ABI.
+        evictions (int): The number of ABIs dropped to stay within the maximum size.
+        size (int): The number of cached ABIs.
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of encodings that reused a parsed ABI.
+
+        Returns:
+            float: The hit rate, or 0 if nothing was encoded.
+
+        """
+        encodings = self.hits + self.misses
+        return self.hits / encodings if encodings else 0.0
+
+
+class _FunctionEncoder:
+    """Encodes calls to one function of an ABI, with its selector and argument types resolved."""
+
+    def __init__(self, contract: "_ContractAbi", function_abi: dict[str, Any]) -> None:
+        from eth_utils import function_abi_to_4byte_selector, get_abi_input_types
+
+        self._contract = contract
+        self._name = function_abi["name"]
+        self._selector = "0x" + function_abi_to_4byte_selector(function_abi).hex()
+        self._types = get_abi_input_types(function_abi)
+        self._direct = all(_DIRECT_TYPE.match(abi_type) for abi_type in self._types)
+        self._addresses = [
+            index for index, abi_type in enumerate(self._types) if abi_type == "address"
+        ]
+
+    def encode(self, args: list[Any]) -> str:
+        if self._direct and all(_is_checksum_address(args[index]) for index in self._addresses):
+            try:
+                return self._selector + self._contract.codec.encode(self._types, args).hex()
+            except Exception:
+                # web3 also accepts values the codec does not, e.g. ENS names for addresses, and
+                # raises its own errors for invalid values.
+                pass
+        return self._contract.factory.encode_abi(self._name, args=args)
+
+
+def _is_checksum_address(value: Any) -> bool:
+    return isinstance(value, str) and _is_checksum_address_str(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_checksum_address_str(value: str) -> bool:
+    # Recipients repeat across calls, and checking a checksum hashes the address.
+    from eth_utils import is_checksum_address
+
+    return is_checksum_address(value)
+
+
+class _ContractAbi:
+    """A parsed ABI, with a web3 contract factory and the encoders of its functions."""
+
+    def __init__(self, abi: list[dict[str, Any]]) -> None:
+        from web3 import Web3
+
+        w3 = Web3()
+        self.abi = abi
+        self.codec = w3.codec
+        self.factory = w3.eth.contract(abi=abi)
+        self._encoders: dict[tuple[str, int], _FunctionEncoder | None] = {}
+
+    def encoder(self, function_name: str, arg_count: int) -> "_FunctionEncoder | None":
+        """Return the encoder of a function, or None if its name and arity are ambiguous."""
+        key = (function_name, arg_count)
+        if key not in self._encoders:
+            candidates = [
+                element
+                for element in self.abi
+                if element.get("type") == "function"
+                and element.get("name") == function_name
+                and len(element.get("inputs", ())) == arg_count
+            ]
+            self._encoders[key] = (
+                _FunctionEncoder(self, candidates[0]) if len(candidates) == 1 else None
+            )
+        return self._encoders[key]
+
+
+class AbiRegistry:
+    """A thread-safe LRU cache of parsed contract ABIs, keyed by a fingerprint of the ABI.
+
+    Encoding a call with `Web3().eth.contract(abi=abi).encode_abi(...)` instantiates web3, parses
+    the ABI and resolves the function on every call. The registry keeps a contract factory and the
+    selector and argument types of each called function per ABI, so repeated calls, e.g. ERC-20
+    transfers, only encode their arguments. Functions overloaded with the same number of inputs
+    are resolved by web3 on every call.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        """Initialize the AbiRegistry.
+
+        Args:
+            max_size (int): The maximum number of cached ABIs. 0 disables caching. Defaults to
+                256.
+
+        Raises:
+            ValueError: If the maximum size is negative.
+
+        """
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+
+        self._max_size = max_size
+        self._entries: OrderedDict[str, _ContractAbi] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def fingerprint(abi: list[dict[str, Any]]) -> str:
+        """Return the fingerprint of an ABI.
+
+        Args:
+            abi (List[Dict[str, Any]]): The contract ABI.
+
+        Returns:
+            str: The SHA-256 hex digest of the ABI as canonical JSON, so that ABIs differing only
+            in key order share a fingerprint.
+
+        """
+        canonical = json.dumps(abi, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def encode(self, abi: list[dict[str, Any]], function_name: str, args: list[Any]) -> str:
+        """Encode a call to a contract function.
+
+        Args:
+            abi (List[Dict[str, Any]]): The contract ABI.
+            function_name (str): The name of the function to call.
+            args (List[Any]): The arguments to pass to the function.
+
+        Returns:
+            str: The hex-encoded call data, i.e. the function selector followed by the
+            ABI-encoded arguments.
+
+        Raises:
+            Web3Exception: If the function is not in the ABI, or the arguments do not match it, as
+                raised by `Contract.encode_abi`.
+
+        """
+        contract = self._contract(abi)
+        encoder = contract.encoder(function_name, len(args))
+        if encoder is None:
+            return contract.factory.encode_abi(function_name, args=args)
+        return encoder.encode(args)
+
+    def clear(self) -> None:
+        """Remove all cached ABIs and reset the counters.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @property
+    def stats(self) -> AbiRegistryStats:
+        """The hit, miss and eviction counters of the registry.
+
+        Returns:
+            AbiRegistryStats: A snapshot of the counters.
+
+        """
+        with self._lock:
+            return AbiRegistryStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def _contract(self, abi: list[dict[str, Any]]) -> _ContractAbi:
+        """Return the parsed ABI, parsing and caching it on a miss."""
+        key = self.fingerprint(abi)
+
+        with self._lock:
+            contract = self._entries.get(key)
+            if contract is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return contract
+            self._misses += 1
+
+        # The ABI is copied so that later changes to the caller's list do not affect the cache.
+        contract = _ContractAbi(copy.deepcopy(abi))
+        if self._max_size == 0:
+            return contract
+
+        with self._lock:
+            contract = self._entries.setdefault(key, contract)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return contract
+
+    def __len__(self) -> int:
+        """Return the number of cached ABIs."""
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the AbiRegistry."""
+        return f"AbiRegistry(max_size={self._max_size}, stats={self.stats})"
@@ -6,6 +6,8 @@ from cdp.asset import Asset
 from cdp.balance import Balance
 from cdp.balance_map import BalanceMap
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
+from cdp.client.models.balance import Balance as BalanceModel
 from cdp.client.models.broadcast_external_transaction200_response import (
     BroadcastExternalTransaction200Response,
 )
@@ -17,7 +19,7 @@ from cdp.historical_balance import HistoricalBalance
 from cdp.transaction import Transaction
 
 
-class Address:
+class Address(ClientBound):
     """A class representing an address."""
 
     def __init__(self, network_id: str, address_id: str) -> None:
@@ -91,11 +93,7 @@ class Address:
             Decimal: The balance of the address.
 
         """
-        model = Cdp.api_clients.external_addresses.get_external_address_balance(
-            network_id=self.network_id,
-            address_id=self.address_id,
-            asset_id=Asset.primary_denomination(asset_id),
-        )
+        model = self._fetch_balance(asset_id)
 
         return Decimal(0) if model is None else Balance.from_model(model, asset_id).amount
 
@@ -106,11 +104,7 @@ class Address:
            BalanceMap: The balances of the address, keyed by asset ID. Ether balances are denominated in ETH.
 
         """
-        response = Cdp.api_clients.external_addresses.list_external_address_balances(
-            network_id=self.network_id, address_id=self.address_id
-        )
-
-        return BalanceMap.from_models(response.data)
+        return BalanceMap.from_models(self._fetch_balances())
 
     def historical_balances(self, asset_id) -> Iterator[HistoricalBalance]:
         """List historical balances.
@@ -182,6 +176,35 @@ class Address:
             broadcast_external_transaction_request=broadcast_external_transaction_request,
         )
 
+    def _fetch_balance(self, asset_id: str) -> BalanceModel | None:
+        """Fetch the balance model of an asset.
+
+        Args:
+            asset_id (str): The asset ID.
+
+        Returns:
+            Optional[BalanceModel]: The balance model, or None if the address holds none.
+
+        """
+        return Cdp.api_clients.external_addresses.get_external_address_balance(
+            network_id=self.network_id,
+            address_id=self.address_id,
+            asset_id=Asset.primary_denomination(asset_id),
+        )
+
+    def _fetch_balances(self) -> list[BalanceModel]:
+        """Fetch the balance models of all assets held by the address.
+
+        Returns:
+            List[BalanceModel]: The balance models.
+
+        """
+        response = Cdp.api_clients.external_addresses.list_external_address_balances(
+            network_id=self.network_id, address_id=self.address_id
+        )
+
+        return response.data
+
     def __str__(self) -> str:
         """Return a string representation of the Address."""
         return f"Address: (address_id: {self.address_id}, network_id: {self.network_id})"
@@ -1,19 +1,47 @@
+from typing import TYPE_CHECKING, Any
+
 from cdp.cdp_api_client import CdpApiClient
-from cdp.client import ReputationApi
-from cdp.client.api.addresses_api import AddressesApi
-from cdp.client.api.assets_api import AssetsApi
-from cdp.client.api.balance_history_api import BalanceHistoryApi
-from cdp.client.api.contract_invocations_api import ContractInvocationsApi
-from cdp.client.api.external_addresses_api import ExternalAddressesApi
-from cdp.client.api.fund_api import FundApi
-from cdp.client.api.networks_api import NetworksApi
-from cdp.client.api.smart_contracts_api import SmartContractsApi
-from cdp.client.api.smart_wallets_api import SmartWalletsApi
-from cdp.client.api.trades_api import TradesApi
-from cdp.client.api.transaction_history_api import TransactionHistoryApi
-from cdp.client.api.transfers_api import TransfersApi
-from cdp.client.api.wallets_api import WalletsApi
-from cdp.client.api.webhooks_api import WebhooksApi
+from cdp.metrics import MetricsRegistry, record_api_call
+
+if TYPE_CHECKING:
+    from cdp.client.api.addresses_api import AddressesApi
+    from cdp.client.api.assets_api import AssetsApi
+    from cdp.client.api.balance_history_api import BalanceHistoryApi
+    from cdp.client.api.contract_invocations_api import ContractInvocationsApi
+    from cdp.client.api.external_addresses_api import ExternalAddressesApi
+    from cdp.client.api.fund_api import FundApi
+    from cdp.client.api.networks_api import NetworksApi
+    from cdp.client.api.reputation_api import ReputationApi
+    from cdp.client.api.smart_contracts_api import SmartContractsApi
+    from cdp.client.api.smart_wallets_api import SmartWalletsApi
+    from cdp.client.api.trades_api import TradesApi
+    from cdp.client.api.transaction_history_api import TransactionHistoryApi
+    from cdp.client.api.transfers_api import TransfersApi
+    from cdp.client.api.wallets_api import WalletsApi
+    from cdp.client.api.webhooks_api import WebhooksApi
+
+
+class _MeteredApi:
+    """A generated API client that records the calls of its methods in a metrics registry."""
+
+    def __init__(self, api: Any, registry: MetricsRegistry) -> None:
+        self._api = api
+        self._registry = registry
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        registry = self._registry
+
+        def call(*args, **kwargs):
+            with record_api_call(registry, name):
+                return attr(*args, **kwargs)
+
+        # Cache the wrapper, so that later calls skip `__getattr__`.
+        self.__dict__[name] = call
+        return call
 
 
 class ApiClients:
@@ -62,7 +90,32 @@ class ApiClients:
         self._reputation: ReputationApi | None = None
 
     @property
-    def wallets(self) -> WalletsApi:
+    def cdp_client(self) -> CdpApiClient:
+        """Get the CDP API client shared by the API clients.
+
+        Returns:
+            CdpApiClient: The CDP API client.
+
+        """
+        return self._cdp_client
+
+    def _metered(self, api: Any) -> Any:
+        """Wrap a generated API client to record its calls, if metrics are enabled.
+
+        Args:
+            api: The generated API client.
+
+        Returns:
+            The API client, wrapped if the CDP API client has a metrics registry.
+
+        """
+        registry = self._cdp_client.metrics
+        if registry is None:
+            return api
+        return _MeteredApi(api, registry)
+
+    @property
+    def wallets(self) -> "WalletsApi":
         """Get the WalletsApi client instance.
 
         Returns:
@@ -73,11 +126,13 @@ class ApiClients:
 
         """
         if self._wallets is None:
-            self._wallets = WalletsApi(api_client=self._cdp_client)
+            from cdp.client.api.wallets_api import WalletsApi
+
+            self._wallets = self._metered(WalletsApi(api_client=self._cdp_client))
         return self._wallets
 
     @property
-    def smart_wallets(self) -> SmartWalletsApi:
+    def smart_wallets(self) -> "SmartWalletsApi":
         """Get the SmartWalletsApi client instance.
 
         Returns:
@@ -88,11 +143,13 @@ class ApiClients:
 
         """
         if self._smart_wallets is None:
-            self._smart_wallets = SmartWalletsApi(api_client=self._cdp_client)
+            from cdp.client.api.smart_wallets_api import SmartWalletsApi
+
+            self._smart_wallets = self._metered(SmartWalletsApi(api_client=self._cdp_client))
         return self._smart_wallets
 
     @property
-    def webhooks(self) -> WebhooksApi:
+    def webhooks(self) -> "WebhooksApi":
         """Get the WebhooksApi client instance.
 
         Returns:
@@ -103,11 +160,13 @@ class ApiClients:
 
         """
         if self._webhooks is None:
-            self._webhooks = WebhooksApi(api_client=self._cdp_client)
+            from cdp.client.api.webhooks_api import WebhooksApi
+
+            self._webhooks = self._metered(WebhooksApi(api_client=self._cdp_client))
         return self._webhooks
 
     @property
-    def addresses(self) -> AddressesApi:
+    def addresses(self) -> "AddressesApi":
         """Get the AddressesApi client instance.
 
         Returns:
@@ -118,11 +177,13 @@ class ApiClients:
 
         """
         if self._addresses is None:
-            self._addresses = AddressesApi(api_client=self._cdp_client)
+            from cdp.client.api.addresses_api import AddressesApi
+
+            self._addresses = self._metered(AddressesApi(api_client=self._cdp_client))
         return self._addresses
 
     @property
-    def external_addresses(self) -> ExternalAddressesApi:
+    def external_addresses(self) -> "ExternalAddressesApi":
         """Get the ExternalAddressesApi client instance.
 
         Returns:
@@ -133,11 +194,15 @@ class ApiClients:
 
         """
         if self._external_addresses is None:
-            self._external_addresses = ExternalAddressesApi(api_client=self._cdp_client)
+            from cdp.client.api.external_addresses_api import ExternalAddressesApi
+
+            self._external_addresses = self._metered(
+                ExternalAddressesApi(api_client=self._cdp_client)
+            )
         return self._external_addresses
 
     @property
-    def transfers(self) -> TransfersApi:
+    def transfers(self) -> "TransfersApi":
         """Get the TransfersApi client instance.
 
         Returns:
@@ -148,11 +213,13 @@ class ApiClients:
 
         """
         if self._transfers is None:
-            self._transfers = TransfersApi(api_client=self._cdp_client)
+            from cdp.client.api.transfers_api import TransfersApi
+
+            self._transfers = self._metered(TransfersApi(api_client=self._cdp_client))
         return self._transfers
 
     @property
-    def networks(self) -> NetworksApi:
+    def networks(self) -> "NetworksApi":
         """Get the NetworksApi client instance.
 
         Returns:
@@ -163,11 +230,13 @@ class ApiClients:
 
         """
         if self._networks is None:
-            self._networks = NetworksApi(api_client=self._cdp_client)
+            from cdp.client.api.networks_api import NetworksApi
+
+            self._networks = self._metered(NetworksApi(api_client=self._cdp_client))
         return self._networks
 
     @property
-    def assets(self) -> AssetsApi:
+    def assets(self) -> "AssetsApi":
         """Get the AssetsApi client instance.
 
         Returns:
@@ -178,11 +247,13 @@ class ApiClients:
 
         """
         if self._assets is None:
-            self._assets = AssetsApi(api_client=self._cdp_client)
+            from cdp.client.api.assets_api import AssetsApi
+
+            self._assets = self._metered(AssetsApi(api_client=self._cdp_client))
         return self._assets
 
     @property
-    def trades(self) -> TradesApi:
+    def trades(self) -> "TradesApi":
         """Get the TradesApi client instance.
 
         Returns:
@@ -193,11 +264,13 @@ class ApiClients:
 
         """
         if self._trades is None:
-            self._trades = TradesApi(api_client=self._cdp_client)
+            from cdp.client.api.trades_api import TradesApi
+
+            self._trades = self._metered(TradesApi(api_client=self._cdp_client))
         return self._trades
 
     @property
-    def contract_invocations(self) -> ContractInvocationsApi:
+    def contract_invocations(self) -> "ContractInvocationsApi":
         """Get the ContractInvocationsApi client instance.
 
         Returns:
@@ -208,11 +281,15 @@ class ApiClients:
 
         """
         if self._contract_invocations is None:
-            self._contract_invocations = ContractInvocationsApi(api_client=self._cdp_client)
+            from cdp.client.api.contract_invocations_api import ContractInvocationsApi
+
+            self._contract_invocations = self._metered(
+                ContractInvocationsApi(api_client=self._cdp_client)
+            )
         return self._contract_invocations
 
     @property
-    def balance_history(self) -> BalanceHistoryApi:
+    def balance_history(self) -> "BalanceHistoryApi":
         """Get the BalanceHistoryApi client instance.
 
         Returns:
@@ -223,11 +300,13 @@ class ApiClients:
 
         """
         if self._balance_history is None:
-            self._balance_history = BalanceHistoryApi(api_client=self._cdp_client)
+            from cdp.client.api.balance_history_api import BalanceHistoryApi
+
+            self._balance_history = self._metered(BalanceHistoryApi(api_client=self._cdp_client))
         return self._balance_history
 
     @property
-    def smart_contracts(self) -> SmartContractsApi:
+    def smart_contracts(self) -> "SmartContractsApi":
         """Get the SmartContractsApi client instance.
 
         Returns:
@@ -238,11 +317,13 @@ class ApiClients:
 
         """
         if self._smart_contracts is None:
-            self._smart_contracts = SmartContractsApi(api_client=self._cdp_client)
+            from cdp.client.api.smart_contracts_api import SmartContractsApi
+
+            self._smart_contracts = self._metered(SmartContractsApi(api_client=self._cdp_client))
         return self._smart_contracts
 
     @property
-    def transaction_history(self) -> TransactionHistoryApi:
+    def transaction_history(self) -> "TransactionHistoryApi":
         """Get the TransactionHistoryApi client instance.
 
         Returns:
@@ -253,11 +334,15 @@ class ApiClients:
 
         """
         if self._transaction_history is None:
-            self._transaction_history = TransactionHistoryApi(api_client=self._cdp_client)
+            from cdp.client.api.transaction_history_api import TransactionHistoryApi
+
+            self._transaction_history = self._metered(
+                TransactionHistoryApi(api_client=self._cdp_client)
+            )
         return self._transaction_history
 
     @property
-    def fund(self) -> FundApi:
+    def fund(self) -> "FundApi":
         """Get the FundApi client instance.
 
         Returns:
@@ -268,11 +353,13 @@ class ApiClients:
 
         """
         if self._fund is None:
-            self._fund = FundApi(api_client=self._cdp_client)
+            from cdp.client.api.fund_api import FundApi
+
+            self._fund = self._metered(FundApi(api_client=self._cdp_client))
         return self._fund
 
     @property
-    def reputation(self) -> ReputationApi:
+    def reputation(self) -> "ReputationApi":
         """Get the ReputationApi client instance.
 
         Returns:
@@ -283,5 +370,7 @@ class ApiClients:
 
         """
         if self._reputation is None:
-            self._reputation = ReputationApi(api_client=self._cdp_client)
+            from cdp.client.api.reputation_api import ReputationApi
+
+            self._reputation = self._metered(ReputationApi(api_client=self._cdp_client))
         return self._reputation
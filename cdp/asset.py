@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+from cdp.asset_cache import AssetCache
 from cdp.cdp import Cdp
 from cdp.client.models.asset import Asset as AssetModel
 
@@ -8,7 +9,14 @@ GWEI_DECIMALS = 9
 
 
 class Asset:
-    """A class representing an asset."""
+    """A class representing an asset.
+
+    Assets fetched from the API are cached process-wide in `Asset.cache`, since their decimals
+    and contract address never change. Replace it with an `AssetCache` configured with a TTL or
+    a different size, or with `AssetCache(max_size=0)` to disable caching.
+    """
+
+    cache: AssetCache = AssetCache()
 
     def __init__(
         self, network_id: str, asset_id: str, contract_address: str, decimals: int
@@ -70,17 +78,34 @@ class Asset:
             asset_id (str): The asset ID.
 
         Returns:
-            Asset: The fetched Asset instance.
+            Asset: The fetched Asset instance, served from `Asset.cache` when possible.
 
         """
         primary_denomination_asset_id = cls.primary_denomination(asset_id)
 
-        model = Cdp.api_clients.assets.get_asset(
-            network_id=network_id, asset_id=primary_denomination_asset_id
-        )
+        model = cls.cache.get(network_id, primary_denomination_asset_id)
+        if model is None:
+            model = Cdp.api_clients.assets.get_asset(
+                network_id=network_id, asset_id=primary_denomination_asset_id
+            )
+            cls.cache.put(network_id, primary_denomination_asset_id, model)
 
         return cls.from_model(model, asset_id=asset_id)
 
+    @classmethod
+    def preload(cls, network_id: str, asset_ids: list[str]) -> list["Asset"]:
+        """Fetch assets into the cache ahead of time.
+
+        Args:
+            network_id (str): The network ID.
+            asset_ids (List[str]): The asset IDs.
+
+        Returns:
+            List[Asset]: The fetched Asset instances, in the order of the asset IDs.
+
+        """
+        return [cls.fetch(network_id, asset_id) for asset_id in asset_ids]
+
     @staticmethod
     def primary_denomination(asset_id: str) -> str:
         """Get the primary denomination for a given asset ID.
@@ -92,7 +117,7 @@ class Asset:
             str: The primary denomination of the asset.
 
         """
-        if asset_id in ["wei", "gwei"]:
+        if asset_id.lower() in ["wei", "gwei"]:
             return "eth"
         return asset_id
 
@@ -0,0 +1,174 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from cdp.client.models.asset import Asset as AssetModel
+
+
+@dataclass(frozen=True)
+class AssetCacheStats:
+    """A snapshot of the counters of an asset cache.
+
+    Attributes:
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that required an API request.
+        evictions (int): The number of entries dropped to stay within the maximum size.
+        expirations (int): The number of entries dropped because their TTL elapsed.
+        size (int): The number of cached entries.
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups served from the cache.
+
+        Returns:
+            float: The hit rate, or 0 if there were no lookups.
+
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class AssetCache:
+    """A thread-safe LRU cache of asset models, keyed by network and primary denomination.
+
+    The decimals and contract address of an asset never change, so the models returned by the
+    assets API can be reused across requests. Models are cached rather than `Asset` instances so
+    that denominations like `wei` and `gwei` are still derived from the `eth` model on every
+    lookup.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float | None = None) -> None:
+        """Initialize the AssetCache.
+
+        Args:
+            max_size (int): The maximum number of cached models. 0 disables caching. Defaults to
+                1024.
+            ttl_seconds (Optional[float]): How long a model stays cached, or None to cache it for
+                the lifetime of the process. Defaults to None.
+
+        Raises:
+            ValueError: If the maximum size or TTL is invalid.
+
+        """
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[AssetModel, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, network_id: str, primary_denomination: str) -> AssetModel | None:
+        """Return the cached model of an asset, counting the lookup as a hit or miss.
+
+        Args:
+            network_id (str): The network ID.
+            primary_denomination (str): The primary denomination of the asset, e.g. `eth`.
+
+        Returns:
+            Optional[AssetModel]: The cached model, or None if it is not cached or has expired.
+
+        """
+        key = (network_id, primary_denomination)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, network_id: str, primary_denomination: str, model: AssetModel) -> None:
+        """Cache the model of an asset, evicting the least recently used models if full.
+
+        Args:
+            network_id (str): The network ID.
+            primary_denomination (str): The primary denomination of the asset, e.g. `eth`.
+            model (AssetModel): The asset model returned by the API.
+
+        Returns:
+            None
+
+        """
+        if self._max_size == 0:
+            return
+
+        key = (network_id, primary_denomination)
+        expires_at = float("inf")
+        if self._ttl_seconds is not None:
+            expires_at = time.monotonic() + self._ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (model, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached models and reset the counters.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    @property
+    def stats(self) -> AssetCacheStats:
+        """The hit, miss and eviction counters of the cache.
+
+        Returns:
+            AssetCacheStats: A snapshot of the counters.
+
+        """
+        with self._lock:
+            return AssetCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        """Return the number of cached models."""
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the AssetCache."""
+        return (
+            f"AssetCache(max_size={self._max_size}, ttl_seconds={self._ttl_seconds}, "
+            f"stats={self.stats})"
+        )
@@ -0,0 +1,199 @@
+from functools import partial
+
+from cdp.async_cdp_api_client import AsyncCdpApiClient
+
+
+class AsyncApi:
+    """An awaitable view of a generated API class.
+
+    Every public method of the wrapped API is exposed as a coroutine function with the same
+    arguments, e.g. `await AsyncApi(client, TransfersApi).get_transfer(...)`.
+    """
+
+    def __init__(self, cdp_client: AsyncCdpApiClient, api: type) -> None:
+        """Initialize the AsyncApi.
+
+        Args:
+            cdp_client (AsyncCdpApiClient): The async CDP API client used to perform requests.
+            api (type): The generated API class to expose, e.g. `TransfersApi`.
+
+        """
+        self._cdp_client = cdp_client
+        self._api = api
+
+    def __getattr__(self, name: str):
+        """Return a coroutine function that invokes the named API method.
+
+        Args:
+            name (str): The name of the API method.
+
+        Returns:
+            Callable[..., Awaitable]: The coroutine function.
+
+        Raises:
+            AttributeError: If the API does not define a public method with the given name.
+
+        """
+        if name.startswith("_") or not callable(getattr(self._api, name, None)):
+            raise AttributeError(f"{self._api.__name__} has no method {name!r}")
+
+        return partial(self._cdp_client.request, self._api, name)
+
+
+class AsyncApiClients:
+    """A container class for all awaitable API clients used in the async Coinbase SDK.
+
+    Mirrors `ApiClients`, with each API client lazily initialized on first access.
+
+    Attributes:
+        _cdp_client (AsyncCdpApiClient): The async CDP API client used to perform requests.
+
+    """
+
+    def __init__(self, cdp_client: AsyncCdpApiClient) -> None:
+        """Initialize the AsyncApiClients instance.
+
+        Args:
+            cdp_client (AsyncCdpApiClient): The async CDP API client to use for all requests.
+
+        """
+        self._cdp_client: AsyncCdpApiClient = cdp_client
+        self._apis: dict[type, AsyncApi] = {}
+
+    @property
+    def cdp_client(self) -> AsyncCdpApiClient:
+        """Get the async CDP API client shared by the API clients.
+
+        Returns:
+            AsyncCdpApiClient: The async CDP API client.
+
+        """
+        return self._cdp_client
+
+    def _get(self, api: type) -> AsyncApi:
+        """Get or lazily create the awaitable client for the given API class.
+
+        Args:
+            api (type): The generated API class.
+
+        Returns:
+            AsyncApi: The awaitable API client.
+
+        """
+        if api not in self._apis:
+            self._apis[api] = AsyncApi(self._cdp_client, api)
+        return self._apis[api]
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session.
+
+        Returns:
+            None
+
+        """
+        await self._cdp_client.close()
+
+    @property
+    def wallets(self) -> AsyncApi:
+        """Get the awaitable WalletsApi client."""
+        from cdp.client.api.wallets_api import WalletsApi
+
+        return self._get(WalletsApi)
+
+    @property
+    def smart_wallets(self) -> AsyncApi:
+        """Get the awaitable SmartWalletsApi client."""
+        from cdp.client.api.smart_wallets_api import SmartWalletsApi
+
+        return self._get(SmartWalletsApi)
+
+    @property
+    def webhooks(self) -> AsyncApi:
+        """Get the awaitable WebhooksApi client."""
+        from cdp.client.api.webhooks_api import WebhooksApi
+
+        return self._get(WebhooksApi)
+
+    @property
+    def addresses(self) -> AsyncApi:
+        """Get the awaitable AddressesApi client."""
+        from cdp.client.api.addresses_api import AddressesApi
+
+        return self._get(AddressesApi)
+
+    @property
+    def external_addresses(self) -> AsyncApi:
+        """Get the awaitable ExternalAddressesApi client."""
+        from cdp.client.api.external_addresses_api import ExternalAddressesApi
+
+        return self._get(ExternalAddressesApi)
+
+    @property
+    def transfers(self) -> AsyncApi:
+        """Get the awaitable TransfersApi client."""
+        from cdp.client.api.transfers_api import TransfersApi
+
+        return self._get(TransfersApi)
+
+    @property
+    def networks(self) -> AsyncApi:
+        """Get the awaitable NetworksApi client."""
+        from cdp.client.api.networks_api import NetworksApi
+
+        return self._get(NetworksApi)
+
+    @property
+    def assets(self) -> AsyncApi:
+        """Get the awaitable AssetsApi client."""
+        from cdp.client.api.assets_api import AssetsApi
+
+        return self._get(AssetsApi)
+
+    @property
+    def trades(self) -> AsyncApi:
+        """Get the awaitable TradesApi client."""
+        from cdp.client.api.trades_api import TradesApi
+
+        return self._get(TradesApi)
+
+    @property
+    def contract_invocations(self) -> AsyncApi:
+        """Get the awaitable ContractInvocationsApi client."""
+        from cdp.client.api.contract_invocations_api import ContractInvocationsApi
+
+        return self._get(ContractInvocationsApi)
+
+    @property
+    def balance_history(self) -> AsyncApi:
+        """Get the awaitable BalanceHistoryApi client."""
+        from cdp.client.api.balance_history_api import BalanceHistoryApi
+
+        return self._get(BalanceHistoryApi)
+
+    @property
+    def smart_contracts(self) -> AsyncApi:
+        """Get the awaitable SmartContractsApi client."""
+        from cdp.client.api.smart_contracts_api import SmartContractsApi
+
+        return self._get(SmartContractsApi)
+
+    @property
+    def transaction_history(self) -> AsyncApi:
+        """Get the awaitable TransactionHistoryApi client."""
+        from cdp.client.api.transaction_history_api import TransactionHistoryApi
+
+        return self._get(TransactionHistoryApi)
+
+    @property
+    def fund(self) -> AsyncApi:
+        """Get the awaitable FundApi client."""
+        from cdp.client.api.fund_api import FundApi
+
+        return self._get(FundApi)
+
+    @property
+    def reputation(self) -> AsyncApi:
+        """Get the awaitable ReputationApi client."""
+        from cdp.client.api.reputation_api import ReputationApi
+
+        return self._get(ReputationApi)
@@ -0,0 +1,47 @@
+import asyncio
+
+from cdp.asset import Asset
+from cdp.async_cdp import AsyncCdp
+
+
+class AsyncAsset(Asset):
+    """A class representing an asset, fetched over the async API client."""
+
+    @classmethod
+    async def fetch(cls, network_id: str, asset_id: str) -> "AsyncAsset":
+        """Fetch an asset from the API.
+
+        Args:
+            network_id (str): The network ID.
+            asset_id (str): The asset ID.
+
+        Returns:
+            AsyncAsset: The fetched Asset instance, served from `Asset.cache` when possible.
+
+        """
+        primary_denomination_asset_id = cls.primary_denomination(asset_id)
+
+        model = cls.cache.get(network_id, primary_denomination_asset_id)
+        if model is None:
+            model = await AsyncCdp.api_clients.assets.get_asset(
+                network_id=network_id, asset_id=primary_denomination_asset_id
+            )
+            cls.cache.put(network_id, primary_denomination_asset_id, model)
+
+        return cls.from_model(model, asset_id=asset_id)
+
+    @classmethod
+    async def preload(cls, network_id: str, asset_ids: list[str]) -> list["AsyncAsset"]:
+        """Fetch assets into the cache ahead of time, concurrently.
+
+        Args:
+            network_id (str): The network ID.
+            asset_ids (List[str]): The asset IDs.
+
+        Returns:
+            List[AsyncAsset]: The fetched Asset instances, in the order of the asset IDs.
+
+        """
+        return list(
+            await asyncio.gather(*(cls.fetch(network_id, asset_id) for asset_id in asset_ids))
+        )
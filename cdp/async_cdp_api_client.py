@@ -0,0 +1,470 @@
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import Mapping, Sequence
+
+from cdp import __version__
+from cdp.cdp_api_client import CdpApiClient
+from cdp.client.api_client import ApiClient
+from cdp.client.exceptions import ApiException
+from cdp.constants import SDK_DEFAULT_SOURCE
+from cdp.metrics import MetricsRegistry, record_api_call
+from cdp.rate_limiter import parse_retry_after
+from cdp.request_priority import RequestScheduler, get_request_priority
+from cdp.tracing import Span, TraceHook, current_span
+
+
+class AsyncRESTResponse:
+    """A fully-read HTTP response returned by the async transport.
+
+    Mirrors the interface of `cdp.client.rest.RESTResponse` that the generated client uses for
+    deserialization.
+    """
+
+    def __init__(self, status: int, reason: str | None, headers, data: bytes) -> None:
+        """Initialize the AsyncRESTResponse.
+
+        Args:
+            status (int): The HTTP status code.
+            reason (Optional[str]): The HTTP reason phrase.
+            headers: The response headers.
+            data (bytes): The response body.
+
+        """
+        self.status = status
+        self.reason = reason
+        self.data = data
+        self.retries = 0
+        self._headers = headers
+
+    def read(self) -> bytes:
+        """Return the response body."""
+        return self.data
+
+    def getheaders(self):
+        """Return a dictionary of the response headers."""
+        return self._headers
+
+    def getheader(self, name: str, default=None):
+        """Return a given response header."""
+        return self._headers.get(name, default)
+
+
+class _PendingRequest(Exception):  # noqa: N818
+    """Raised by `_DeferredApiClient` to hand a serialized request back to the async client."""
+
+    def __init__(self, method, url, header_params, body, post_params, request_timeout) -> None:
+        super().__init__(f"{method} {url}")
+        self.method = method
+        self.url = url
+        self.header_params = header_params
+        self.body = body
+        self.post_params = post_params
+        self.request_timeout = request_timeout
+
+
+class _DeferredApiClient:
+    """An ApiClient stand-in that lets generated API methods run without a synchronous transport.
+
+    On the first pass `call_api` raises `_PendingRequest` with the serialized request. On the
+    second pass it returns the response that the async transport already fetched, so the
+    generated method can deserialize it exactly as it would a synchronous response.
+    """
+
+    def __init__(self, client: "AsyncCdpApiClient", response: AsyncRESTResponse | None = None):
+        self._client = client
+        self._response = response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def param_serialize(self, *args, **kwargs):
+        if self._response is None:
+            return self._client.param_serialize(*args, **kwargs)
+        # The span of the call was started when the request was serialized on the first pass.
+        return ApiClient.param_serialize(self._client, *args, **kwargs)
+
+    def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        if self._response is None:
+            raise _PendingRequest(method, url, header_params, body, post_params, _request_timeout)
+        return self._response
+
+
+class AsyncCdpApiClient(CdpApiClient):
+    """CDP API Client that performs API calls over a pooled asyncio HTTP transport.
+
+    Authentication, request serialization and response deserialization are shared with
+    `CdpApiClient`; only the network I/O is asynchronous.
+    """
+
+    RETRY_STATUSES = (500, 502, 503, 504)
+
+    def __init__(
+        self,
+        api_key: str,
+        private_key: str,
+        host: str = "https://api.cdp.coinbase.com/platform",
+        debugging: bool = False,
+        max_network_retries: int = 3,
+        source: str = SDK_DEFAULT_SOURCE,
+        source_version: str = __version__,
+        token_cache_min_validity_seconds: int | None = None,
+        connection_pool_maxsize: int = 100,
+        connection_pool_maxsize_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        fast_deserialization: bool = False,
+        validate_responses: bool = True,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        idempotency_keys: bool = False,
+        rate_limit: float | None = None,
+        rate_limits: Mapping[str, float] | None = None,
+        rate_limit_burst: int | None = None,
+        reserved_connections: int | None = None,
+        trace_hooks: Sequence[TraceHook] | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """Initialize the async CDP API Client.
+
+        Args:
+            api_key (str): The API key for authentication.
+            private_key (str): The private key for authentication.
+            host (str, optional): The base URL for the API. Defaults to "https://api.cdp.coinbase.com/platform".
+            debugging (bool): Whether debugging is enabled.
+            max_network_retries (int): The maximum number of network retries. Defaults to 3.
+            source (str): Specifies whether the sdk is being used directly or if it's an Agentkit extension.
+            source_version (str): The version of the source package.
+            token_cache_min_validity_seconds (Optional[int]): When set, JWTs are reused per request method and path while they have more than this many seconds of validity left. Defaults to None.
+            connection_pool_maxsize (int): The maximum number of pooled connections. Defaults to 100.
+            connection_pool_maxsize_per_host (int): The maximum number of pooled connections per host, 0 for no limit. Defaults to 0.
+            keepalive_timeout (float): Seconds an idle pooled connection is kept open. Defaults to 15.
+            fast_deserialization (bool): Whether to validate JSON responses straight into models with `ResponseDeserializer` instead of the generated client's deserializer. Defaults to False.
+            validate_responses (bool): Whether to validate responses against their models. When False, models are constructed without validation, falling back to validation for responses that do not match. Defaults to True.
+            connect_timeout (Optional[float]): Seconds to wait for a connection to be established, or None to wait indefinitely. Defaults to None.
+            read_timeout (Optional[float]): Seconds to wait for response data, or None to wait indefinitely. Defaults to None.
+            idempotency_keys (bool): Whether to attach an `X-Idempotency-Key` header to every mutating request and retry those requests on transient failures like GET requests. Only enable it for a server that honors the header, as a retried request that the server processed twice, like `create_transfer` or `broadcast_transfer`, can move funds twice. Defaults to False, which retries only GET requests.
+            rate_limit (Optional[float]): The maximum number of requests per second, or None for no limit. Requests beyond it wait for their turn, and 429 responses lower the rate, pause requests for their `Retry-After` and are retried up to `max_network_retries` times. Defaults to None.
+            rate_limits (Optional[Mapping[str, float]]): The maximum number of requests per second of endpoint groups, keyed by the resource following the API version in the path, e.g. `{"webhooks": 2}`. Each group is limited separately from `rate_limit`. Defaults to None.
+            rate_limit_burst (Optional[int]): The number of requests of a group that may be sent at once after it was idle. Defaults to one second worth of requests.
+            reserved_connections (Optional[int]): When set, requests are scheduled by priority onto the pooled connections, and this many connections are reserved for high priority requests, such as broadcasts. Set the priority of other requests with `request_priority`. Defaults to None, which sends requests as they are made.
+            trace_hooks (Optional[Sequence[TraceHook]]): Hooks that receive a span for every API call, with the time spent signing, serializing, waiting, on the network and deserializing. Defaults to None, which disables tracing.
+            metrics (Optional[MetricsRegistry]): The registry that counts the calls, latencies, retries and errors of each generated API method. Defaults to None, which disables metrics.
+
+        """
+        super().__init__(
+            api_key,
+            private_key,
+            host,
+            debugging,
+            max_network_retries,
+            source,
+            source_version,
+            token_cache_min_validity_seconds,
+            fast_deserialization,
+            validate_responses,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            idempotency_keys=idempotency_keys,
+            rate_limit=rate_limit,
+            rate_limits=rate_limits,
+            rate_limit_burst=rate_limit_burst,
+            trace_hooks=trace_hooks,
+            metrics=metrics,
+        )
+        self._connection_pool_maxsize = connection_pool_maxsize
+        self._connection_pool_maxsize_per_host = connection_pool_maxsize_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._session = None
+        self._request_scheduler = (
+            RequestScheduler(connection_pool_maxsize, reserved_connections)
+            if reserved_connections is not None
+            else None
+        )
+
+    async def __aenter__(self) -> "AsyncCdpApiClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the underlying HTTP session when leaving the async context manager."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session.
+
+        Returns:
+            None
+
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        """Return the pooled aiohttp session, creating it on first use.
+
+        The session must be created from within a running event loop, so it is built lazily.
+
+        Returns:
+            aiohttp.ClientSession: The pooled session.
+
+        """
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_pool_maxsize,
+                limit_per_host=self._connection_pool_maxsize_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def request(self, api, method_name: str, *args, **kwargs):
+        """Invoke a generated API method asynchronously.
+
+        The generated method is executed twice: first to serialize the request, which is then sent
+        over the async transport, and again to deserialize the fetched response.
+
+        Args:
+            api: The generated API class, e.g. `TransfersApi`.
+            method_name (str): The name of the API method to call, e.g. `get_transfer`.
+            *args: Positional arguments for the API method.
+            **kwargs: Keyword arguments for the API method.
+
+        Returns:
+            The deserialized result of the API method.
+
+        """
+        if self._metrics is None:
+            return await self._request(api, method_name, *args, **kwargs)
+
+        with record_api_call(self._metrics, method_name):
+            return await self._request(api, method_name, *args, **kwargs)
+
+    async def _request(self, api, method_name: str, *args, **kwargs):
+        try:
+            getattr(api(api_client=_DeferredApiClient(self)), method_name)(*args, **kwargs)
+        except _PendingRequest as pending:
+            response = await self.call_api_async(
+                pending.method,
+                pending.url,
+                pending.header_params,
+                pending.body,
+                pending.post_params,
+                pending.request_timeout,
+            )
+        else:
+            raise RuntimeError(f"{method_name} did not issue an API request")
+
+        return getattr(api(api_client=_DeferredApiClient(self, response)), method_name)(
+            *args, **kwargs
+        )
+
+    async def call_api_async(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        """Make the HTTP request over the pooled async transport.
+
+        Args:
+            method: Method to call.
+            url: Path to method endpoint.
+            header_params: Header parameters to be
+            placed in the request header.
+            body: Request body.
+            post_params (dict): Request post form parameters,
+                for `application/x-www-form-urlencoded`, `multipart/form-data`.
+            _request_timeout: timeout setting for this request.
+
+        Returns:
+            AsyncRESTResponse
+
+        """
+        if self.debugging is True:
+            print(f"CDP API REQUEST: {method} {url}")
+
+        if header_params is None:
+            header_params = {}
+
+        data = None
+        if body is not None:
+            data = json.dumps(body)
+        elif post_params:
+            data = dict(post_params)
+
+        if _request_timeout is None:
+            _request_timeout = self._default_request_timeout
+        timeout = self._timeout(_request_timeout)
+
+        span = current_span() if self._tracer is not None else None
+        if span is None:
+            return await self._send_limited_async(method, url, header_params, data, timeout)
+
+        span.set_attribute("cdp.priority", get_request_priority(method, url).name)
+        try:
+            return await self._send_limited_async(method, url, header_params, data, timeout, span)
+        except BaseException as e:
+            self._tracer.end_span(span, e)
+            raise
+
+    async def _send_limited_async(
+        self, method, url, header_params, data, timeout, span: Span | None = None
+    ) -> AsyncRESTResponse:
+        """Send a request through the rate limiter and the request scheduler.
+
+        Args:
+            method: Method to call.
+            url: Path to method endpoint.
+            header_params: Header parameters to be placed in the request header.
+            data: The serialized request body.
+            timeout: The aiohttp timeout of the request.
+            span (Optional[Span]): The span of the call, if it is traced.
+
+        Returns:
+            AsyncRESTResponse
+
+        """
+        bucket = self._rate_limiter.bucket(url) if self._rate_limiter is not None else None
+        throttled = 0
+        queued = time.perf_counter() if span is not None else 0.0
+        async with self._request_slot_async(method, url):
+            if span is not None:
+                span.add_phase("queue", time.perf_counter() - queued)
+            while True:
+                if bucket is not None:
+                    waited = await bucket.acquire_async()
+                    if span is not None:
+                        span.add_phase("queue", waited)
+
+                # Headers are applied after waiting, so that the JWT is fresh when it is sent.
+                self._apply_headers(url, method, header_params)
+                if span is None:
+                    result = await self._send_async(method, url, header_params, data, timeout)
+                else:
+                    with span.phase("network"):
+                        result = await self._send_async(method, url, header_params, data, timeout)
+                    span.set_attribute("http.status_code", result.status)
+
+                if bucket is None or result.status != 429 or throttled >= self._max_network_retries:
+                    if span is not None or self._metrics is not None:
+                        self._record_retries(span, throttled + result.retries)
+                    return result
+
+                bucket.throttle(parse_retry_after(result.getheader("Retry-After")))
+                throttled += 1
+
+    def _request_slot_async(self, method: str, url: str):
+        """Return an async context manager that holds a pooled connection slot for a request.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The request URL.
+
+        Returns:
+            An async context manager that waits for the turn of the request by its priority, or
+            does nothing if requests are not scheduled by priority.
+
+        """
+        if self._request_scheduler is None:
+            return contextlib.nullcontext()
+        return self._request_scheduler.slot_async(get_request_priority(method, url))
+
+    async def _send_async(self, method, url, header_params, data, timeout) -> AsyncRESTResponse:
+        """Send a request, retrying connection errors and 5xx responses with backoff.
+
+        Args:
+            method: Method to call.
+            url: Path to method endpoint.
+            header_params: Header parameters to be placed in the request header.
+            data: The serialized request body.
+            timeout: The aiohttp timeout of the request.
+
+        Returns:
+            AsyncRESTResponse
+
+        """
+        import aiohttp
+
+        attempt = 0
+        while True:
+            try:
+                async with self._get_session().request(
+                    method, url, headers=header_params, data=data, timeout=timeout
+                ) as response:
+                    response_data = await response.read()
+                    result = AsyncRESTResponse(
+                        response.status, response.reason, response.headers, response_data
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not self._should_retry(method, attempt):
+                    raise ApiException(status=0, reason=f"{type(e).__name__}: {e}") from e
+            else:
+                if result.status not in self.RETRY_STATUSES or not self._should_retry(
+                    method, attempt
+                ):
+                    result.retries = attempt
+                    return result
+
+            attempt += 1
+            await asyncio.sleep(self._backoff_seconds(attempt))
+
+    def _should_retry(self, method: str, attempt: int) -> bool:
+        """Return whether a failed request should be retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of retries already performed.
+
+        Returns:
+            bool: Whether to retry.
+
+        """
+        return method.upper() in self.retry_methods and attempt < self._max_network_retries
+
+    def _backoff_seconds(self, attempt: int) -> float:
+        """Return the backoff before the given retry, matching the synchronous retry strategy.
+
+        Args:
+            attempt (int): The 1-based retry number.
+
+        Returns:
+            float: The number of seconds to wait.
+
+        """
+        if attempt <= 1:
+            return 0
+        return float(2 ** (attempt - 1))
+
+    def _timeout(self, request_timeout):
+        """Convert a generated-client request timeout into an aiohttp timeout.
+
+        Args:
+            request_timeout: Either a total timeout or a (connect, read) tuple.
+
+        Returns:
+            Optional[aiohttp.ClientTimeout]: The timeout, or None for the session default.
+
+        """
+        if not request_timeout:
+            return None
+
+        import aiohttp
+
+        if isinstance(request_timeout, tuple):
+            return aiohttp.ClientTimeout(connect=request_timeout[0], sock_read=request_timeout[1])
+        return aiohttp.ClientTimeout(total=request_timeout)
@@ -0,0 +1,203 @@
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from cdp.async_cdp import AsyncCdp
+from cdp.client.models.deploy_smart_contract_request import DeploySmartContractRequest
+from cdp.client.models.read_contract_request import ReadContractRequest
+from cdp.paginator import AsyncPaginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
+from cdp.smart_contract import SmartContract
+
+
+class AsyncSmartContract(SmartContract):
+    """A representation of a SmartContract on the blockchain, managed over the async API client."""
+
+    @classmethod
+    async def create(
+        cls,
+        wallet_id: str,
+        address_id: str,
+        type: SmartContract.Type,
+        options: SmartContract.TokenContractOptions
+        | SmartContract.NFTContractOptions
+        | SmartContract.MultiTokenContractOptions
+        | str,
+        compiled_smart_contract_id: str | None = None,
+    ) -> "AsyncSmartContract":
+        """Create a new SmartContract object.
+
+        Args:
+            wallet_id: The ID of the wallet that will deploy the smart contract.
+            address_id: The ID of the address that will deploy the smart contract.
+            type: The type of the smart contract (ERC20, ERC721, or ERC1155).
+            options: The options of the smart contract.
+            compiled_smart_contract_id: The ID of the compiled smart contract. This must be set for custom contracts.
+
+        Returns:
+            The created smart contract.
+
+        Raises:
+            ValueError: If the options type is unsupported.
+
+        """
+        create_smart_contract_request = cls._create_smart_contract_request(
+            type, options, compiled_smart_contract_id
+        )
+
+        model = await AsyncCdp.api_clients.smart_contracts.create_smart_contract(
+            wallet_id=wallet_id,
+            address_id=address_id,
+            create_smart_contract_request=create_smart_contract_request,
+        )
+
+        return cls(model)
+
+    @classmethod
+    async def read(
+        cls,
+        network_id: str,
+        contract_address: str,
+        method: str,
+        abi: list[dict] | None = None,
+        args: dict | None = None,
+    ) -> Any:
+        """Read data from a smart contract.
+
+        Args:
+            network_id: The ID of the network.
+            contract_address: The address of the smart contract.
+            method: The method to call on the smart contract.
+            abi: The ABI of the smart contract.
+            args: The arguments to pass to the method.
+
+        Returns:
+            The data read from the smart contract.
+
+        """
+        abi_json = None
+
+        if abi:
+            abi_json = json.dumps(abi, separators=(",", ":"))
+
+        read_contract_request = ReadContractRequest(
+            method=method,
+            abi=abi_json,
+            args=json.dumps(args or {}, separators=(",", ":")),
+        )
+
+        model = await AsyncCdp.api_clients.smart_contracts.read_contract(
+            network_id=network_id,
+            contract_address=contract_address,
+            read_contract_request=read_contract_request,
+        )
+        return cls._convert_solidity_value(model)
+
+    @classmethod
+    def list(cls, **pagination_options) -> AsyncIterator["AsyncSmartContract"]:
+        """List smart contracts.
+
+        Args:
+            **pagination_options: Options forwarded to `AsyncPaginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
+        Returns:
+            AsyncIterator[AsyncSmartContract]: An async iterator of smart contract objects.
+
+        """
+        return AsyncPaginator(
+            lambda page, _limit: AsyncCdp.api_clients.smart_contracts.list_smart_contracts(
+                page=page
+            ),
+            cls,
+            **pagination_options,
+        )
+
+    async def broadcast(self) -> "AsyncSmartContract":
+        """Broadcast the smart contract deployment to the network.
+
+        Returns:
+            The broadcasted SmartContract object.
+
+        Raises:
+            ValueError: If the smart contract deployment is not signed.
+
+        """
+        if self.is_external:
+            raise ValueError("Cannot broadcast an external SmartContract")
+
+        if not self.transaction.signed:
+            raise ValueError("Cannot broadcast unsigned SmartContract deployment")
+
+        deploy_smart_contract_request = DeploySmartContractRequest(
+            signed_payload=self.transaction.signature
+        )
+
+        model = await AsyncCdp.api_clients.smart_contracts.deploy_smart_contract(
+            wallet_id=self.wallet_id,
+            address_id=self.deployer_address,
+            smart_contract_id=self.smart_contract_id,
+            deploy_smart_contract_request=deploy_smart_contract_request,
+        )
+        self._model = model
+        return self
+
+    async def reload(self) -> "AsyncSmartContract":
+        """Reload the SmartContract model with the latest data from the server.
+
+        Returns:
+            The updated SmartContract object.
+
+        """
+        if self.is_external:
+            raise ValueError("Cannot reload an external SmartContract")
+        model = await AsyncCdp.api_clients.smart_contracts.get_smart_contract(
+            wallet_id=self.wallet_id,
+            address_id=self.deployer_address,
+            smart_contract_id=self.smart_contract_id,
+        )
+        self._model = model
+        self._update_transaction(model)
+        return self
+
+    async def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 10,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "AsyncSmartContract":
+        """Wait until the smart contract deployment is confirmed on the network or fails onchain.
+
+        Args:
+            interval_seconds: A fixed interval between reloads. Defaults to the
+                polling policy of the network.
+            timeout_seconds: The maximum time to wait for the smart contract deployment to be confirmed.
+            polling_policy: The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
+
+        Returns:
+            The SmartContract object in a terminal state.
+
+        Raises:
+            TimeoutError: If the smart contract deployment times out.
+
+        """
+        if self.is_external:
+            raise ValueError("Cannot wait for an external SmartContract")
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "smart_contract"
+        )
+        start_time = time.time()
+        while self.transaction is not None and not self.transaction.terminal_state:
+            await self.reload()
+
+            if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
+                raise TimeoutError("SmartContract deployment timed out")
+
+            await asyncio.sleep(schedule.next_interval())
+
+        schedule.record()
+
+        return self
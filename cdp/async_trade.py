@@ -0,0 +1,166 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from decimal import Decimal
+from numbers import Number
+
+from cdp.async_asset import AsyncAsset
+from cdp.async_cdp import AsyncCdp
+from cdp.client.models.broadcast_trade_request import BroadcastTradeRequest
+from cdp.client.models.create_trade_request import CreateTradeRequest
+from cdp.errors import TransactionNotSignedError
+from cdp.paginator import AsyncPaginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
+from cdp.trade import Trade
+
+
+class AsyncTrade(Trade):
+    """A class representing a trade, managed over the async API client."""
+
+    @classmethod
+    async def create(
+        cls,
+        address_id: str,
+        from_asset_id: str,
+        to_asset_id: str,
+        amount: Number | Decimal | str,
+        network_id: str,
+        wallet_id: str,
+    ) -> "AsyncTrade":
+        """Create a new trade.
+
+        Args:
+            address_id (str): The ID of the address to use for the trade.
+            from_asset_id (str): The ID of the asset to trade.
+            to_asset_id (str): The ID of the asset to receive from the trade.
+            amount (Decimal): The amount to trade.
+            network_id (str): The ID of the network to use for the trade.
+            wallet_id (str): The ID of the wallet to use for the trade.
+
+        Returns:
+            AsyncTrade: The created trade.
+
+        """
+        from_asset, to_asset = await asyncio.gather(
+            AsyncAsset.fetch(network_id, from_asset_id),
+            AsyncAsset.fetch(network_id, to_asset_id),
+        )
+
+        create_trade_request = CreateTradeRequest(
+            amount=str(int(from_asset.to_atomic_amount(amount))),
+            from_asset_id=AsyncAsset.primary_denomination(from_asset.asset_id),
+            to_asset_id=AsyncAsset.primary_denomination(to_asset.asset_id),
+        )
+
+        model = await AsyncCdp.api_clients.trades.create_trade(
+            wallet_id=wallet_id,
+            address_id=address_id,
+            create_trade_request=create_trade_request,
+        )
+
+        return cls(model)
+
+    @classmethod
+    def list(
+        cls, wallet_id: str, address_id: str, **pagination_options
+    ) -> AsyncIterator["AsyncTrade"]:
+        """List all trades for an address.
+
+        Args:
+            wallet_id (str): The ID of the wallet to list trades for.
+            address_id (str): The ID of the address to list trades for.
+            **pagination_options: Options forwarded to `AsyncPaginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
+        Returns:
+            AsyncIterator[AsyncTrade]: An async iterator of trade objects.
+
+        """
+        return AsyncPaginator(
+            lambda page, limit: AsyncCdp.api_clients.trades.list_trades(
+                wallet_id=wallet_id, address_id=address_id, limit=limit, page=page
+            ),
+            cls,
+            **pagination_options,
+        )
+
+    async def broadcast(self) -> "AsyncTrade":
+        """Broadcast the trade.
+
+        Returns:
+            AsyncTrade: The broadcasted trade.
+
+        Raises:
+            TransactionNotSignedError: If the trade is not signed.
+
+        """
+        if not self.transaction.signed:
+            raise TransactionNotSignedError("Trade is not signed")
+
+        if self.approve_transaction and not self.approve_transaction.signed:
+            raise TransactionNotSignedError("Trade is not signed")
+
+        broadcast_trade_request = BroadcastTradeRequest(
+            signed_payload=self.transaction.signature,
+        )
+
+        if self.approve_transaction is not None:
+            broadcast_trade_request.approve_transaction_signed_payload = (
+                self.approve_transaction.signature
+            )
+
+        model = await AsyncCdp.api_clients.trades.broadcast_trade(
+            wallet_id=self.wallet_id,
+            address_id=self.address_id,
+            trade_id=self.trade_id,
+            broadcast_trade_request=broadcast_trade_request,
+        )
+
+        self._model = model
+        self._update_transactions(model)
+
+        return self
+
+    async def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "AsyncTrade":
+        """Wait for the trade to complete without blocking the event loop.
+
+        Args:
+            interval_seconds (Optional[float]): A fixed interval between reloads. Defaults to the
+                polling policy of the network.
+            timeout_seconds (float): The timeout seconds.
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
+
+        Returns:
+            AsyncTrade: The trade.
+
+        """
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "trade"
+        )
+        start_time = time.time()
+
+        while not self.transaction.terminal_state:
+            await self.reload()
+
+            if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
+                raise TimeoutError("Timed out waiting for Trade to land onchain")
+
+            await asyncio.sleep(schedule.next_interval())
+
+        schedule.record()
+
+        return self
+
+    async def reload(self) -> None:
+        """Reload the trade."""
+        model = await AsyncCdp.api_clients.trades.get_trade(
+            wallet_id=self.wallet_id, address_id=self.address_id, trade_id=self.trade_id
+        )
+        self._model = model
+        self._update_transactions(model)
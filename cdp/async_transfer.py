@@ -0,0 +1,169 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from decimal import Decimal
+
+from cdp.asset import Asset
+from cdp.async_asset import AsyncAsset
+from cdp.async_cdp import AsyncCdp
+from cdp.client.models.broadcast_transfer_request import BroadcastTransferRequest
+from cdp.errors import TransactionNotSignedError
+from cdp.paginator import AsyncPaginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
+from cdp.transfer import Transfer
+
+
+class AsyncTransfer(Transfer):
+    """A class representing a transfer, managed over the async API client."""
+
+    @classmethod
+    async def create(
+        cls,
+        address_id: str,
+        amount: Decimal,
+        asset_id: str,
+        destination,
+        network_id: str,
+        wallet_id: str,
+        gasless: bool = False,
+        skip_batching: bool = False,
+        asset: Asset | None = None,
+    ) -> "AsyncTransfer":
+        """Create a transfer.
+
+        Args:
+            address_id (str): The address ID.
+            amount (Decimal): The amount.
+            asset_id (str): The asset ID.
+            destination (Union[Address, Wallet, str]): The destination.
+            network_id (str): The network ID.
+            wallet_id (str): The wallet ID.
+            gasless (bool): Whether to use gasless.
+            skip_batching (bool): When True, the Transfer will be submitted immediately. Otherwise, the Transfer will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            asset (Optional[Asset]): The asset to transfer, if already fetched. Defaults to fetching it by asset ID.
+
+        Returns:
+            AsyncTransfer: The transfer.
+
+        """
+        if skip_batching and not gasless:
+            raise ValueError("skip_batching requires gasless to be True")
+
+        if asset is None:
+            asset = await AsyncAsset.fetch(network_id, asset_id)
+
+        create_transfer_request = cls._create_transfer_request(
+            asset, amount, destination, network_id, gasless, skip_batching
+        )
+
+        model = await AsyncCdp.api_clients.transfers.create_transfer(
+            wallet_id=wallet_id,
+            address_id=address_id,
+            create_transfer_request=create_transfer_request,
+        )
+
+        return cls(model)
+
+    @classmethod
+    def list(
+        cls, wallet_id: str, address_id: str, **pagination_options
+    ) -> AsyncIterator["AsyncTransfer"]:
+        """List transfers.
+
+        Args:
+            wallet_id (str): The wallet ID.
+            address_id (str): The address ID.
+            **pagination_options: Options forwarded to `AsyncPaginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
+        Returns:
+            AsyncIterator[AsyncTransfer]: An async iterator of transfer objects.
+
+        """
+        return AsyncPaginator(
+            lambda page, limit: AsyncCdp.api_clients.transfers.list_transfers(
+                wallet_id=wallet_id, address_id=address_id, limit=limit, page=page
+            ),
+            cls,
+            **pagination_options,
+        )
+
+    async def broadcast(self) -> "AsyncTransfer":
+        """Broadcast the Transfer to the Network.
+
+        Returns:
+            AsyncTransfer: The Transfer object.
+
+        Raises:
+            TransactionNotSignedError: If the Transfer is not signed.
+
+        """
+        if not self.send_tx_delegate.signed:
+            raise TransactionNotSignedError("Transfer is not signed")
+
+        broadcast_transfer_request = BroadcastTransferRequest(
+            signed_payload=self.send_tx_delegate.signature
+        )
+
+        model = await AsyncCdp.api_clients.transfers.broadcast_transfer(
+            wallet_id=self.wallet_id,
+            address_id=self.from_address_id,
+            transfer_id=self.transfer_id,
+            broadcast_transfer_request=broadcast_transfer_request,
+        )
+
+        self._model = model
+        self._update_transaction(model)
+        self._update_sponsored_send(model)
+
+        return self
+
+    async def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "AsyncTransfer":
+        """Wait for the transfer to complete without blocking the event loop.
+
+        Args:
+            interval_seconds (Optional[float]): A fixed interval between reloads. Defaults to the
+                polling policy of the network.
+            timeout_seconds (float): The timeout seconds.
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
+
+        Returns:
+            AsyncTransfer: The transfer.
+
+        """
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "transfer"
+        )
+        start_time = time.time()
+
+        while not self.terminal_state:
+            await self.reload()
+
+            if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
+                raise TimeoutError("Timed out waiting for Transfer to land onchain")
+
+            await asyncio.sleep(schedule.next_interval())
+
+        schedule.record()
+
+        return self
+
+    async def reload(self) -> None:
+        """Reload the transfer.
+
+        Returns:
+            None
+
+        """
+        model = await AsyncCdp.api_clients.transfers.get_transfer(
+            self.wallet_id, self.from_address_id, self.transfer_id
+        )
+        self._model = model
+        self._update_transaction(model)
+        self._update_sponsored_send(model)
@@ -0,0 +1,552 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from decimal import Decimal
+from numbers import Number
+from typing import Union
+
+from cdp.address import Address
+from cdp.async_cdp import AsyncCdp
+from cdp.async_smart_contract import AsyncSmartContract
+from cdp.async_trade import AsyncTrade
+from cdp.async_transfer import AsyncTransfer
+from cdp.async_wallet_address import AsyncWalletAddress
+from cdp.async_webhook import AsyncWebhook
+from cdp.balance_map import BalanceMap
+from cdp.batch_transfer import BatchTransferItem, BatchTransferReport, BatchTransferResult
+from cdp.client.models.address import Address as AddressModel
+from cdp.client.models.create_address_request import CreateAddressRequest
+from cdp.client.models.create_wallet_request import (
+    CreateWalletRequest,
+    CreateWalletRequestWallet,
+)
+from cdp.client.models.create_wallet_webhook_request import CreateWalletWebhookRequest
+from cdp.client.models.wallet import Wallet as WalletModel
+from cdp.faucet_transaction import FaucetTransaction
+from cdp.paginator import AsyncPaginator
+from cdp.wallet import Wallet
+from cdp.wallet_data import WalletData
+from cdp.wallet_summary import WalletSummary
+
+
+class AsyncWallet(Wallet):
+    """A class representing a wallet, managed over the async API client.
+
+    The addresses of an AsyncWallet are loaded when it is created, fetched or imported, or on
+    demand with `load_addresses()`.
+    """
+
+    def __init__(self, model: WalletModel, seed: str | None = None) -> None:
+        """Initialize the AsyncWallet class.
+
+        Args:
+            model (WalletModel): The WalletModel object representing the wallet.
+            seed (Optional[str]): The seed for the wallet. Defaults to None.
+
+        """
+        self._model = model
+        self._addresses: list[AsyncWalletAddress] | None = None
+        self._seed = seed
+        self._master_seed: bytes | None = None
+        self._master_node = None
+        self._account_node = None
+        self._private_keys: dict[int, str] = {}
+
+        if not AsyncCdp.uses_server_signer():
+            self._set_master_node()
+
+    @property
+    def addresses(self) -> list[AsyncWalletAddress]:
+        """Get the addresses of the wallet.
+
+        Returns:
+            List[AsyncWalletAddress]: The addresses of the wallet.
+
+        Raises:
+            ValueError: If the addresses have not been loaded.
+
+        """
+        if self._addresses is None:
+            raise ValueError("Wallet addresses are not loaded, call load_addresses() first")
+
+        return self._addresses
+
+    @classmethod
+    async def create(
+        cls,
+        network_id: str = "base-sepolia",
+        interval_seconds: float = 0.2,
+        timeout_seconds: float = 20,
+    ) -> "AsyncWallet":
+        """Create a new wallet with a random seed.
+
+        Args:
+            network_id (str): The network ID of the wallet. Defaults to "base-sepolia".
+            interval_seconds (float): The interval between checks in seconds. Defaults to 0.2.
+            timeout_seconds (float): The maximum time to wait for the server signer to be active. Defaults to 20.
+
+        Returns:
+            AsyncWallet: The created wallet object.
+
+        """
+        return await cls.create_with_seed(
+            seed=None,
+            network_id=network_id,
+            interval_seconds=interval_seconds,
+            timeout_seconds=timeout_seconds,
+        )
+
+    @classmethod
+    async def create_with_seed(
+        cls,
+        seed: str | None = None,
+        network_id: str = "base-sepolia",
+        interval_seconds: float = 0.2,
+        timeout_seconds: float = 20,
+    ) -> "AsyncWallet":
+        """Create a new wallet with the given seed.
+
+        Args:
+            seed (str): The seed to use for the wallet. If None, a random seed will be generated.
+            network_id (str): The network ID of the wallet. Defaults to "base-sepolia".
+            interval_seconds (float): The interval between checks in seconds. Defaults to 0.2.
+            timeout_seconds (float): The maximum time to wait for the server signer to be active. Defaults to 20.
+
+        Returns:
+            AsyncWallet: The created wallet object.
+
+        """
+        create_wallet_request = CreateWalletRequest(
+            wallet=CreateWalletRequestWallet(
+                network_id=network_id, use_server_signer=AsyncCdp.uses_server_signer()
+            )
+        )
+
+        model = await AsyncCdp.api_clients.wallets.create_wallet(create_wallet_request)
+        wallet = cls(model, seed)
+        wallet._addresses = []
+
+        if AsyncCdp.uses_server_signer():
+            await wallet._wait_for_signer(interval_seconds, timeout_seconds)
+
+        await wallet.create_address()
+
+        return wallet
+
+    async def _wait_for_signer(
+        self, interval_seconds: float, timeout_seconds: float
+    ) -> "AsyncWallet":
+        """Wait for the server signer to be active.
+
+        Args:
+            interval_seconds (float): The interval between checks in seconds.
+            timeout_seconds (float): The maximum time to wait for the server signer to be active.
+
+        Returns:
+            AsyncWallet: The current wallet instance.
+
+        Raises:
+            TimeoutError: If the wallet creation times out.
+
+        """
+        start_time = time.time()
+
+        while self.server_signer_status != "active_seed":
+            await self.reload()
+
+            if time.time() - start_time > timeout_seconds:
+                raise TimeoutError("Wallet creation timed out. Check status of your Server-Signer")
+
+            await asyncio.sleep(interval_seconds)
+
+        return self
+
+    async def reload(self) -> None:
+        """Reload the wallet model from the API.
+
+        Returns:
+            None
+
+        """
+        self._model = await AsyncCdp.api_clients.wallets.get_wallet(self.id)
+
+    @classmethod
+    async def fetch(cls, wallet_id: str) -> "AsyncWallet":
+        """Fetch a wallet by its ID.
+
+        Args:
+            wallet_id (str): The ID of the wallet to retrieve.
+
+        Returns:
+            AsyncWallet: The retrieved wallet object.
+
+        """
+        model = await AsyncCdp.api_clients.wallets.get_wallet(wallet_id)
+
+        wallet = cls(model, "")
+        await wallet.load_addresses()
+
+        return wallet
+
+    @classmethod
+    def list(
+        cls, lightweight: bool = False, **pagination_options
+    ) -> AsyncIterator["AsyncWallet"] | AsyncIterator[WalletSummary]:
+        """List wallets.
+
+        The addresses of listed wallets are not loaded.
+
+        Args:
+            lightweight (bool): Whether to yield `WalletSummary` records instead of wallet objects,
+                for read-only listings of many wallets. Defaults to False.
+            **pagination_options: Options forwarded to `AsyncPaginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
+        Returns:
+            Union[AsyncIterator[AsyncWallet], AsyncIterator[WalletSummary]]: An async iterator of
+            wallet objects, or of wallet summaries if `lightweight` is True.
+
+        """
+        return AsyncPaginator(
+            lambda page, limit: AsyncCdp.api_clients.wallets.list_wallets(limit=limit, page=page),
+            WalletSummary.from_model if lightweight else lambda model: cls(model, ""),
+            **pagination_options,
+        )
+
+    @classmethod
+    async def import_data(cls, data: WalletData) -> "AsyncWallet":
+        """Import a wallet from previously exported wallet data.
+
+        Args:
+            data (WalletData): The wallet data to import.
+
+        Returns:
+            AsyncWallet: The imported wallet.
+
+        Raises:
+            ValueError: If data is not a WalletData instance.
+
+        """
+        if not isinstance(data, WalletData):
+            raise ValueError("Data must be a WalletData instance")
+
+        model = await AsyncCdp.api_clients.wallets.get_wallet(data.wallet_id)
+        wallet = cls(model, data.seed)
+        await wallet.load_addresses()
+
+        return wallet
+
+    async def load_addresses(self) -> "list[AsyncWalletAddress]":
+        """Load the addresses of the wallet from the API.
+
+        Returns:
+            List[AsyncWalletAddress]: The addresses of the wallet.
+
+        """
+        addresses = await AsyncCdp.api_clients.addresses.list_addresses(
+            self.id, limit=self.MAX_ADDRESSES
+        )
+
+        self._addresses = [
+            self._build_wallet_address(model, model.index) for model in addresses.data
+        ]
+
+        return self._addresses
+
+    async def create_address(self) -> AsyncWalletAddress:
+        """Create a new address for the wallet.
+
+        Returns:
+            AsyncWalletAddress: The created address object.
+
+        """
+        if self._addresses is None:
+            await self.load_addresses()
+
+        index = None
+
+        create_address_request = CreateAddressRequest()
+        if self.can_sign:
+            index = len(self._addresses)
+            derived_key = self._derive_key(index)
+            public_key_hex = derived_key.PublicKey().RawCompressed().ToHex()
+            attestation = self._create_attestation(derived_key, public_key_hex)
+
+            create_address_request = CreateAddressRequest(
+                public_key=public_key_hex, attestation=attestation, address_index=index
+            )
+
+        model = await AsyncCdp.api_clients.addresses.create_address(
+            wallet_id=self.id, create_address_request=create_address_request
+        )
+
+        if self._model.default_address is None:
+            await self.reload()
+
+        wallet_address = self._build_wallet_address(model, index)
+        self._addresses.append(wallet_address)
+
+        return wallet_address
+
+    async def create_webhook(self, notification_uri: str) -> AsyncWebhook:
+        """Create a new webhook for the wallet.
+
+        Args:
+            notification_uri (str): The notification URI of the webhook.
+
+        Returns:
+            AsyncWebhook: The created webhook object.
+
+        """
+        create_wallet_webhook_request = CreateWalletWebhookRequest(
+            notification_uri=notification_uri
+        )
+        model = await AsyncCdp.api_clients.webhooks.create_wallet_webhook(
+            wallet_id=self.id, create_wallet_webhook_request=create_wallet_webhook_request
+        )
+
+        return AsyncWebhook(model)
+
+    async def faucet(self, asset_id: str | None = None) -> FaucetTransaction:
+        """Request faucet funds.
+
+        Args:
+            asset_id (Optional[str]): The asset ID. Defaults to None.
+
+        Returns:
+            FaucetTransaction: The faucet transaction object.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().faucet(asset_id)
+
+    async def balance(self, asset_id: str) -> Decimal:
+        """Get the balance of a specific asset for the default address.
+
+        Args:
+            asset_id (str): The ID of the asset to check the balance for.
+
+        Returns:
+            Decimal: The balance of the specified asset.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().balance(asset_id)
+
+    async def balances(self) -> BalanceMap:
+        """List balances of the default address.
+
+        Returns:
+           BalanceMap: The balances of the address, keyed by asset ID. Ether balances are denominated in ETH.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().balances()
+
+    async def transfer(
+        self,
+        amount: Number | Decimal | str,
+        asset_id: str,
+        destination: Union[Address, "AsyncWallet", str],
+        gasless: bool = False,
+        skip_batching: bool = False,
+        skip_balance_check: bool = False,
+    ) -> AsyncTransfer:
+        """Transfer funds from the wallet.
+
+        Args:
+            amount (Union[Number, Decimal, str]): The amount of funds to transfer.
+            asset_id (str): The ID of the asset to transfer.
+            destination (Union[Address, 'AsyncWallet', str]): The destination for the transfer.
+            gasless (bool): Whether the transfer should be gasless. Defaults to False.
+            skip_batching (bool): When True, the Transfer will be submitted immediately. Otherwise, the Transfer will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the default address is not checked before creating the Transfer. Defaults to False.
+
+        Returns:
+            AsyncTransfer: The created transfer object.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().transfer(
+            amount, asset_id, destination, gasless, skip_batching, skip_balance_check
+        )
+
+    async def batch_transfer(
+        self,
+        transfers: Iterable[BatchTransferItem | tuple],
+        gasless: bool = False,
+        skip_batching: bool = False,
+        skip_balance_check: bool = False,
+        max_concurrency: int = 8,
+        on_result: Callable[[BatchTransferResult], None] | None = None,
+    ) -> BatchTransferReport:
+        """Transfer funds from the default address to many destinations concurrently.
+
+        Args:
+            transfers (Iterable[Union[BatchTransferItem, tuple]]): The transfers, as `BatchTransferItem` instances or `(amount, asset_id, destination)` tuples.
+            gasless (bool): Whether to use gasless transfers. Defaults to False.
+            skip_batching (bool): When True, the Transfers will be submitted immediately. Otherwise, the Transfers will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the default address is not checked before creating the Transfers. Defaults to False.
+            max_concurrency (int): The maximum number of transfers in flight. Defaults to 8.
+            on_result (Optional[Callable[[BatchTransferResult], None]]): Called with the result of each transfer as it completes. Exceptions it raises are collected in `BatchTransferReport.callback_errors` and do not stop the batch.
+
+        Returns:
+            BatchTransferReport: The result of each transfer, in the order they were given.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().batch_transfer(
+            transfers,
+            gasless=gasless,
+            skip_batching=skip_batching,
+            skip_balance_check=skip_balance_check,
+            max_concurrency=max_concurrency,
+            on_result=on_result,
+        )
+
+    async def trade(
+        self,
+        amount: Number | Decimal | str,
+        from_asset_id: str,
+        to_asset_id: str,
+        skip_balance_check: bool = False,
+    ) -> AsyncTrade:
+        """Trade funds from the wallet address.
+
+        Args:
+            amount (Union[Number, Decimal, str]): The amount to trade.
+            from_asset_id (str): The asset ID to trade from.
+            to_asset_id (str): The asset ID to trade to.
+            skip_balance_check (bool): When True, the balance of the default address is not checked before creating the Trade. Defaults to False.
+
+        Returns:
+            AsyncTrade: The trade object.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().trade(
+            amount, from_asset_id, to_asset_id, skip_balance_check
+        )
+
+    async def deploy_token(
+        self, name: str, symbol: str, total_supply: Number | Decimal | str
+    ) -> AsyncSmartContract:
+        """Deploy a token smart contract.
+
+        Args:
+            name (str): The name of the token.
+            symbol (str): The symbol of the token.
+            total_supply (Union[Number, Decimal, str]): The total supply of the token.
+
+        Returns:
+            AsyncSmartContract: The deployed smart contract.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().deploy_token(name, symbol, total_supply)
+
+    async def deploy_nft(self, name: str, symbol: str, base_uri: str) -> AsyncSmartContract:
+        """Deploy an NFT smart contract.
+
+        Args:
+            name (str): The name of the NFT.
+            symbol (str): The symbol of the NFT.
+            base_uri (str): The base URI for the NFT.
+
+        Returns:
+            AsyncSmartContract: The deployed smart contract.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().deploy_nft(name, symbol, base_uri)
+
+    async def deploy_multi_token(self, uri: str) -> AsyncSmartContract:
+        """Deploy a multi-token smart contract.
+
+        Args:
+            uri (str): The URI for the multi-token contract.
+
+        Returns:
+            AsyncSmartContract: The deployed smart contract.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        return await self._default_address_or_raise().deploy_multi_token(uri)
+
+    def _default_address_or_raise(self) -> AsyncWalletAddress:
+        """Get the default address of the wallet.
+
+        Returns:
+            AsyncWalletAddress: The default address.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        if self.default_address is None:
+            raise ValueError("Default address does not exist")
+
+        return self.default_address
+
+    def _build_wallet_address(
+        self, model: AddressModel, index: int | None = None
+    ) -> AsyncWalletAddress:
+        """Build a wallet address object.
+
+        Args:
+            model (AddressModel): The address model.
+            index (Optional[int]): The index of the address. Defaults to None.
+
+        Returns:
+            AsyncWalletAddress: The created address object.
+
+        Raises:
+            ValueError: If the derived key does not match the wallet.
+
+        """
+        if not self.can_sign:
+            return AsyncWalletAddress(model)
+
+        from eth_account import Account
+
+        account = Account.from_key(self._private_key(index))
+
+        if account.address != model.address_id:
+            raise ValueError("Derived key does not match wallet")
+
+        return AsyncWalletAddress(model, account)
+
+    def _api_private_key(self) -> str | None:
+        """Get the private key of the API key of the async client the wallet uses.
+
+        Returns:
+            Optional[str]: The private key, or None if no async client is configured.
+
+        """
+        return AsyncCdp.api_private_key()
+
+    def __str__(self) -> str:
+        """Return a string representation of the AsyncWallet object.
+
+        Returns:
+            str: A string representation of the AsyncWallet.
+
+        """
+        return f"AsyncWallet: (id: {self.id}, network_id: {self.network_id}, server_signer_status: {self.server_signer_status})"
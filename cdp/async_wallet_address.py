@@ -0,0 +1,479 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+from decimal import Decimal
+from numbers import Number
+from typing import TYPE_CHECKING, Union
+
+from cdp.address import Address
+from cdp.asset import Asset
+from cdp.async_asset import AsyncAsset
+from cdp.async_cdp import AsyncCdp
+from cdp.async_smart_contract import AsyncSmartContract
+from cdp.async_trade import AsyncTrade
+from cdp.async_transfer import AsyncTransfer
+from cdp.balance import Balance
+from cdp.balance_ledger import BalanceReservation
+from cdp.balance_map import BalanceMap
+from cdp.batch_transfer import (
+    BatchTransferItem,
+    BatchTransferReport,
+    BatchTransferResult,
+    denomination_key,
+    totals_by_asset,
+)
+from cdp.errors import InsufficientFundsError
+from cdp.faucet_transaction import FaucetTransaction
+from cdp.smart_contract import SmartContract
+from cdp.wallet_address import WalletAddress
+
+if TYPE_CHECKING:
+    from cdp.async_wallet import AsyncWallet
+
+
+class AsyncWalletAddress(WalletAddress):
+    """A class representing a wallet address, managed over the async API client."""
+
+    async def faucet(self, asset_id=None) -> FaucetTransaction:
+        """Request faucet funds.
+
+        Args:
+            asset_id (str): The asset ID.
+
+        Returns:
+            FaucetTransaction: The faucet transaction object.
+
+        """
+        model = await AsyncCdp.api_clients.external_addresses.request_external_faucet_funds(
+            network_id=self.network_id,
+            address_id=self.address_id,
+            asset_id=asset_id,
+            skip_wait=True,
+        )
+
+        return FaucetTransaction(model)
+
+    async def balance(self, asset_id) -> Decimal:
+        """Get the balance of the address.
+
+        Args:
+            asset_id (str): The asset ID.
+
+        Returns:
+            Decimal: The balance of the address.
+
+        """
+        model = await AsyncCdp.api_clients.external_addresses.get_external_address_balance(
+            network_id=self.network_id,
+            address_id=self.address_id,
+            asset_id=Asset.primary_denomination(asset_id),
+        )
+
+        if model is None:
+            self._balance_ledger.invalidate(asset_id)
+            return Decimal(0)
+
+        self._balance_ledger.seed([model])
+
+        return Balance.from_model(model, asset_id).amount
+
+    async def balances(self) -> BalanceMap:
+        """List balances of the address.
+
+        Returns:
+           BalanceMap: The balances of the address, keyed by asset ID. Ether balances are denominated in ETH.
+
+        """
+        response = await AsyncCdp.api_clients.external_addresses.list_external_address_balances(
+            network_id=self.network_id, address_id=self.address_id
+        )
+        self._balance_ledger.seed(response.data)
+
+        return BalanceMap.from_models(response.data)
+
+    async def transfer(
+        self,
+        amount: Number | Decimal | str,
+        asset_id: str,
+        destination: Union[Address, "AsyncWallet", str],
+        gasless: bool = False,
+        skip_batching: bool = False,
+        skip_balance_check: bool = False,
+    ) -> AsyncTransfer:
+        """Transfer funds from the wallet address.
+
+        Args:
+            amount (Union[Number, Decimal, str]): The amount to transfer.
+            asset_id (str): The asset ID.
+            destination (Union[Address, 'AsyncWallet', str]): The transfer destination.
+            gasless (bool): Whether to use gasless transfer.
+            skip_batching (bool): When True, the Transfer will be submitted immediately. Otherwise, the Transfer will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the address is not checked before creating the Transfer. Defaults to False.
+
+        Returns:
+            AsyncTransfer: The created transfer object.
+
+        """
+        normalized_amount = Decimal(amount)
+
+        reservation = None
+        if not skip_balance_check:
+            reservation = await self._reserve_balance(normalized_amount, asset_id)
+
+        return await self._send_transfer(
+            normalized_amount, asset_id, destination, gasless, skip_batching, reservation
+        )
+
+    async def batch_transfer(
+        self,
+        transfers: Iterable[BatchTransferItem | tuple],
+        gasless: bool = False,
+        skip_batching: bool = False,
+        skip_balance_check: bool = False,
+        max_concurrency: int = 8,
+        on_result: Callable[[BatchTransferResult], None] | None = None,
+    ) -> BatchTransferReport:
+        """Transfer funds from the wallet address to many destinations concurrently.
+
+        The balance is checked once per asset for the total of the batch, with amounts in other
+        denominations of the asset, e.g. `gwei` and `eth`, converted to a common unit, and each
+        asset is fetched once. At most `max_concurrency` transfers are created, signed and
+        broadcast at a time. A failing transfer does not stop the rest of the batch.
+
+        Args:
+            transfers (Iterable[Union[BatchTransferItem, tuple]]): The transfers, as `BatchTransferItem` instances or `(amount, asset_id, destination)` tuples.
+            gasless (bool): Whether to use gasless transfers.
+            skip_batching (bool): When True, the Transfers will be submitted immediately. Otherwise, the Transfers will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the address is not checked before creating the Transfers. Defaults to False.
+            max_concurrency (int): The maximum number of transfers in flight. Defaults to 8.
+            on_result (Optional[Callable[[BatchTransferResult], None]]): Called with the result of each transfer as it completes. Exceptions it raises are collected in `BatchTransferReport.callback_errors` and do not stop the batch.
+
+        Returns:
+            BatchTransferReport: The result of each transfer, in the order they were given.
+
+        Raises:
+            InsufficientFundsError: If the balance of an asset does not cover its total in the batch. No transfer is created in that case.
+            ValueError: If skip_batching is set without gasless or max_concurrency is not positive.
+
+        """
+        if skip_batching and not gasless:
+            raise ValueError("skip_batching requires gasless to be True")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        items = [BatchTransferItem.coerce(item) for item in transfers]
+        asset_ids = list(dict.fromkeys(item.asset_id for item in items))
+        fetched = await asyncio.gather(
+            *(AsyncAsset.fetch(self.network_id, asset_id) for asset_id in asset_ids)
+        )
+        assets = dict(zip(asset_ids, fetched, strict=True))
+        totals = totals_by_asset(items, assets)
+
+        reservations: dict[str, BalanceReservation | None] = {}
+        if not skip_balance_check:
+            try:
+                for asset_id, total in totals.items():
+                    reservations[denomination_key(asset_id)] = await self._reserve_balance(
+                        total, asset_id
+                    )
+            except Exception:
+                for reservation in reservations.values():
+                    if reservation is not None:
+                        self._balance_ledger.release(reservation)
+                raise
+
+        report = BatchTransferReport()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(index: int, item: BatchTransferItem) -> BatchTransferResult:
+            async with semaphore:
+                result = await self._send_batch_item(
+                    index,
+                    item,
+                    assets[item.asset_id],
+                    reservations.get(denomination_key(item.asset_id)),
+                    gasless,
+                    skip_batching,
+                )
+            if on_result is not None:
+                try:
+                    on_result(result)
+                except Exception as e:
+                    report.callback_errors.append(e)
+            return result
+
+        report.results = list(
+            await asyncio.gather(*(send(index, item) for index, item in enumerate(items)))
+        )
+
+        return report
+
+    async def _send_batch_item(
+        self,
+        index: int,
+        item: BatchTransferItem,
+        asset: Asset,
+        reservation: BalanceReservation | None,
+        gasless: bool,
+        skip_batching: bool,
+    ) -> BatchTransferResult:
+        """Create, sign and broadcast a single transfer of a batch.
+
+        Args:
+            index (int): The position of the transfer in the batch.
+            item (BatchTransferItem): The transfer.
+            asset (Asset): The asset to transfer.
+            reservation (Optional[BalanceReservation]): The reservation of the batch total of
+                the asset, if the balance was checked.
+            gasless (bool): Whether to use gasless transfer.
+            skip_batching (bool): Whether to skip batching.
+
+        Returns:
+            BatchTransferResult: The result of the transfer.
+
+        """
+        try:
+            transfer = await self._send_transfer(
+                item.amount,
+                item.asset_id,
+                item.destination,
+                gasless,
+                skip_batching,
+                reservation,
+                asset,
+            )
+        except Exception as e:
+            return BatchTransferResult(index, item, error=e)
+
+        return BatchTransferResult(index, item, transfer=transfer)
+
+    async def _send_transfer(
+        self,
+        amount: Decimal,
+        asset_id: str,
+        destination: Union[Address, "AsyncWallet", str],
+        gasless: bool,
+        skip_batching: bool,
+        reservation: BalanceReservation | None,
+        asset: Asset | None = None,
+    ) -> AsyncTransfer:
+        """Create, sign and broadcast a transfer, and record it in the balance ledger.
+
+        Args:
+            amount (Decimal): The amount to transfer.
+            asset_id (str): The asset ID.
+            destination (Union[Address, 'AsyncWallet', str]): The transfer destination.
+            gasless (bool): Whether to use gasless transfer.
+            skip_batching (bool): Whether to skip batching.
+            reservation (Optional[BalanceReservation]): The balance reserved for the transfer, if
+                the balance was checked.
+            asset (Optional[Asset]): The asset to transfer, if it was already fetched.
+
+        Returns:
+            AsyncTransfer: The created transfer object.
+
+        """
+        try:
+            transfer = await AsyncTransfer.create(
+                address_id=self.address_id,
+                amount=amount,
+                asset_id=asset_id,
+                destination=destination,
+                network_id=self.network_id,
+                wallet_id=self.wallet_id,
+                gasless=gasless,
+                skip_batching=skip_batching,
+                asset=asset,
+            )
+
+            if not AsyncCdp.uses_server_signer():
+                transfer.sign(self.key)
+                await transfer.broadcast()
+        except Exception:
+            self._release_balance(reservation, amount, asset_id)
+            raise
+
+        self._settle_balance(reservation, amount, asset_id)
+
+        return transfer
+
+    async def trade(
+        self,
+        amount: Number | Decimal | str,
+        from_asset_id: str,
+        to_asset_id: str,
+        skip_balance_check: bool = False,
+    ) -> AsyncTrade:
+        """Trade funds from the wallet address.
+
+        Args:
+            amount (Union[Number, Decimal, str]): The amount to trade.
+            from_asset_id (str): The source asset ID.
+            to_asset_id (str): The destination asset ID.
+            skip_balance_check (bool): When True, the balance of the address is not checked before creating the Trade. Defaults to False.
+
+        Returns:
+            AsyncTrade: The created trade object.
+
+        """
+        normalized_amount = Decimal(amount)
+
+        reservation = None
+        if not skip_balance_check:
+            reservation = await self._reserve_balance(normalized_amount, from_asset_id)
+
+        try:
+            trade = await AsyncTrade.create(
+                address_id=self.address_id,
+                from_asset_id=from_asset_id,
+                to_asset_id=to_asset_id,
+                amount=normalized_amount,
+                network_id=self.network_id,
+                wallet_id=self.wallet_id,
+            )
+
+            if not AsyncCdp.uses_server_signer():
+                trade.transaction.sign(self.key)
+
+                if trade.approve_transaction is not None:
+                    trade.approve_transaction.sign(self.key)
+
+                await trade.broadcast()
+        except Exception:
+            self._release_balance(reservation, normalized_amount, from_asset_id)
+            raise
+
+        self._settle_balance(reservation, normalized_amount, from_asset_id)
+        self._balance_ledger.invalidate(to_asset_id)
+
+        return trade
+
+    async def deploy_token(
+        self, name: str, symbol: str, total_supply: Number | Decimal | str
+    ) -> AsyncSmartContract:
+        """Deploy a token smart contract.
+
+        Args:
+            name (str): The name of the token.
+            symbol (str): The symbol of the token.
+            total_supply (Union[Number, Decimal, str]): The total supply of the token.
+
+        Returns:
+            AsyncSmartContract: The deployed smart contract.
+
+        """
+        return await self._deploy(
+            SmartContract.Type.ERC20,
+            SmartContract.TokenContractOptions(
+                name=name, symbol=symbol, total_supply=str(total_supply)
+            ),
+        )
+
+    async def deploy_nft(self, name: str, symbol: str, base_uri: str) -> AsyncSmartContract:
+        """Deploy an NFT smart contract.
+
+        Args:
+            name (str): The name of the NFT.
+            symbol (str): The symbol of the NFT.
+            base_uri (str): The base URI for the NFT.
+
+        Returns:
+            AsyncSmartContract: The deployed smart contract.
+
+        """
+        return await self._deploy(
+            SmartContract.Type.ERC721,
+            SmartContract.NFTContractOptions(name=name, symbol=symbol, base_uri=base_uri),
+        )
+
+    async def deploy_multi_token(self, uri: str) -> AsyncSmartContract:
+        """Deploy a multi-token smart contract.
+
+        Args:
+            uri (str): The URI for the multi-token contract.
+
+        Returns:
+            AsyncSmartContract: The deployed smart contract.
+
+        """
+        return await self._deploy(
+            SmartContract.Type.ERC1155, SmartContract.MultiTokenContractOptions(uri=uri)
+        )
+
+    def transfers(self) -> AsyncIterator[AsyncTransfer]:
+        """List transfers for this wallet address.
+
+        Returns:
+            AsyncIterator[AsyncTransfer]: Async iterator of transfer objects.
+
+        """
+        return AsyncTransfer.list(wallet_id=self.wallet_id, address_id=self.address_id)
+
+    def trades(self) -> AsyncIterator[AsyncTrade]:
+        """List trades for this wallet address.
+
+        Returns:
+            AsyncIterator[AsyncTrade]: Async iterator of trade objects.
+
+        """
+        return AsyncTrade.list(wallet_id=self.wallet_id, address_id=self.address_id)
+
+    async def _deploy(self, type: SmartContract.Type, options) -> AsyncSmartContract:
+        """Create, sign and broadcast a smart contract deployment.
+
+        Args:
+            type (SmartContract.Type): The type of the smart contract.
+            options: The options of the smart contract.
+
+        Returns:
+            AsyncSmartContract: The deployed smart contract.
+
+        """
+        smart_contract = await AsyncSmartContract.create(
+            wallet_id=self.wallet_id,
+            address_id=self.address_id,
+            type=type,
+            options=options,
+        )
+
+        if AsyncCdp.uses_server_signer():
+            return smart_contract
+
+        smart_contract.sign(self.key)
+        await smart_contract.broadcast()
+
+        return smart_contract
+
+    async def _reserve_balance(self, amount: Decimal, asset_id: str) -> BalanceReservation | None:
+        """Ensure the wallet address has sufficient balance, and reserve it for a send.
+
+        Args:
+            amount (Decimal): The amount to check.
+            asset_id (str): The asset ID.
+
+        Returns:
+            Optional[BalanceReservation]: The reservation, or None if the address holds none of
+            the asset and the amount is zero.
+
+        Raises:
+            InsufficientFundsError: If there are insufficient funds.
+
+        """
+        try:
+            reservation = self._balance_ledger.reserve(asset_id, amount)
+        except InsufficientFundsError:
+            reservation = None
+
+        if reservation is not None:
+            return reservation
+
+        current_balance = await self.balance(asset_id)
+        reservation = self._balance_ledger.reserve(asset_id, amount)
+
+        if reservation is None and amount > current_balance:
+            raise InsufficientFundsError(expected=amount, exact=current_balance)
+
+        return reservation
+
+    def __str__(self) -> str:
+        """Return a string representation of the AsyncWalletAddress."""
+        return f"AsyncWalletAddress: (address_id: {self.address_id}, wallet_id: {self.wallet_id}, network_id: {self.network_id})"
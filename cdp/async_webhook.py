@@ -0,0 +1,111 @@
+from collections.abc import AsyncIterator
+
+from cdp.async_cdp import AsyncCdp
+from cdp.client.models.create_webhook_request import CreateWebhookRequest
+from cdp.client.models.update_webhook_request import UpdateWebhookRequest
+from cdp.client.models.webhook import (
+    WebhookEventFilter,
+    WebhookEventType,
+    WebhookEventTypeFilter,
+)
+from cdp.paginator import AsyncPaginator
+from cdp.webhook import Webhook
+
+
+class AsyncWebhook(Webhook):
+    """A class representing a webhook, managed over the async API client."""
+
+    @classmethod
+    async def create(
+        cls,
+        notification_uri: str,
+        event_type: WebhookEventType,
+        event_type_filter: WebhookEventTypeFilter | None = None,
+        event_filters: list[WebhookEventFilter] | None = None,
+        network_id: str = "base-sepolia",
+    ) -> "AsyncWebhook":
+        """Create a new webhook.
+
+        Args:
+            notification_uri (str): The URI where notifications should be sent.
+            event_type (WebhookEventType): The type of event that the webhook listens to.
+            event_type_filter (WebhookEventTypeFilter): Filter specifically for wallet or contract activity event type.
+            event_filters (List[WebhookEventTypeFilter]): Filters applied to the events that determine which specific address(es) trigger.
+            network_id (str): The network ID of the wallet. Defaults to "base-sepolia".
+
+        Returns:
+            AsyncWebhook: The created webhook object.
+
+        """
+        create_webhook_request = CreateWebhookRequest(
+            network_id=network_id,
+            event_type=event_type,
+            event_type_filter=event_type_filter,
+            event_filters=event_filters,
+            notification_uri=notification_uri,
+        )
+
+        model = await AsyncCdp.api_clients.webhooks.create_webhook(create_webhook_request)
+
+        return cls(model)
+
+    @classmethod
+    def list(cls, **pagination_options) -> AsyncIterator["AsyncWebhook"]:
+        """List webhooks.
+
+        Args:
+            **pagination_options: Options forwarded to `AsyncPaginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
+        Returns:
+            AsyncIterator[AsyncWebhook]: An async iterator of webhook objects.
+
+        """
+        return AsyncPaginator(
+            lambda page, limit: AsyncCdp.api_clients.webhooks.list_webhooks(limit=limit, page=page),
+            cls,
+            **pagination_options,
+        )
+
+    async def delete_webhook(self) -> None:
+        """Delete this webhook.
+
+        This method deletes the current webhook instance from the system.
+        """
+        await AsyncCdp.api_clients.webhooks.delete_webhook(self.id)
+
+    async def update(
+        self,
+        notification_uri: str | None = None,
+        event_type_filter: WebhookEventTypeFilter | None = None,
+    ) -> "AsyncWebhook":
+        """Update the webhook with a new notification URI, and/or a new list of addresses to monitor.
+
+        Args:
+            notification_uri (str): The new URI for webhook notifications.
+            event_type_filter (WebhookEventTypeFilter): The new eventTypeFilter that contains a new list (replacement) of addresses to monitor for the webhook.
+
+        Returns:
+            AsyncWebhook: The updated webhook object.
+
+        """
+        final_notification_uri = notification_uri or self.notification_uri
+        final_event_type_filter = event_type_filter or self.event_type_filter
+
+        # wallet ID is required for wallet activity event type filter, but we do not support updating it just yet, this will be added in the future
+        if self.event_type == WebhookEventType.WALLET_ACTIVITY:
+            final_event_type_filter.actual_instance.wallet_id = (
+                self.event_type_filter.actual_instance.wallet_id
+            )
+
+        update_webhook_request = UpdateWebhookRequest(
+            event_type_filter=final_event_type_filter,
+            event_filters=self.event_filters,
+            notification_uri=final_notification_uri,
+        )
+
+        self._model = await AsyncCdp.api_clients.webhooks.update_webhook(
+            self.id,
+            update_webhook_request,
+        )
+
+        return self
@@ -0,0 +1,313 @@
+import threading
+import time
+from decimal import Decimal
+
+from cdp.asset import Asset
+from cdp.client.models.asset import Asset as AssetModel
+from cdp.client.models.balance import Balance as BalanceModel
+from cdp.errors import InsufficientFundsError
+
+
+class BalanceReservation:
+    """An amount of an asset held back in a BalanceLedger for a send in flight.
+
+    Reservations are created by `BalanceLedger.reserve`, and consumed by `BalanceLedger.settle`
+    once the send succeeds or returned by `BalanceLedger.release` if it fails.
+    """
+
+    def __init__(self, key: str, asset_id: str, asset: AssetModel, atomic_amount: Decimal) -> None:
+        """Initialize the BalanceReservation.
+
+        Args:
+            key (str): The ledger key of the asset.
+            asset_id (str): The asset ID the amount was reserved in.
+            asset (AssetModel): The model of the primary denomination of the asset.
+            atomic_amount (Decimal): The reserved amount in atomic units.
+
+        """
+        self._key = key
+        self._asset_id = asset_id
+        self._asset = asset
+        self._atomic_amount = atomic_amount
+
+    @property
+    def asset_id(self) -> str:
+        """Get the asset ID the amount was reserved in.
+
+        Returns:
+            str: The asset ID.
+
+        """
+        return self._asset_id
+
+    @property
+    def amount(self) -> Decimal:
+        """Get the amount that is still reserved.
+
+        Returns:
+            Decimal: The amount in whole units of the asset.
+
+        """
+        return Asset.from_model(self._asset, asset_id=self._asset_id).from_atomic_amount(
+            self._atomic_amount
+        )
+
+    def __str__(self) -> str:
+        """Return a string representation of the BalanceReservation."""
+        return f"BalanceReservation: (asset_id: {self.asset_id}, amount: {self.amount})"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the BalanceReservation."""
+        return str(self)
+
+
+class BalanceLedger:
+    """A local, optimistic view of the balances of an address.
+
+    The ledger is seeded from balances fetched from the API and debited as the address sends
+    funds, so that balance sufficiency checks can be answered without a network call. Entries
+    expire after `ttl_seconds` and are invalidated whenever a send fails. Network fees are not
+    tracked, so the ledger may overstate native asset balances until it is re-seeded.
+
+    Senders reserve the amount they send with `reserve`, which checks and holds back the funds
+    under the ledger lock, so that concurrent sends cannot spend the same balance. Reserved
+    amounts are excluded from `available` until they are settled or released, and survive
+    re-seeding and invalidation of the balance they were reserved from.
+    """
+
+    def __init__(self, ttl_seconds: float | None = 30) -> None:
+        """Initialize the BalanceLedger.
+
+        Args:
+            ttl_seconds (Optional[float]): How long a seeded balance is trusted, or None to trust
+                it until invalidated. Defaults to 30.
+
+        Raises:
+            ValueError: If the TTL is invalid.
+
+        """
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self._ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[BalanceModel, Decimal, float]] = {}
+        self._reserved: dict[str, Decimal] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(asset_id: str) -> str:
+        return Asset.primary_denomination(asset_id).lower()
+
+    def _fresh_entry(self, key: str) -> tuple[BalanceModel, Decimal, float] | None:
+        """Return the entry of a ledger key if it has not expired. Must hold the lock."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        return entry
+
+    def seed(self, models: list[BalanceModel]) -> None:
+        """Record balances fetched from the API, replacing the entries of their assets.
+
+        Args:
+            models (List[BalanceModel]): The balance models.
+
+        Returns:
+            None
+
+        """
+        expires_at = float("inf")
+        if self._ttl_seconds is not None:
+            expires_at = time.monotonic() + self._ttl_seconds
+
+        with self._lock:
+            for model in models:
+                self._entries[self._key(model.asset.asset_id)] = (
+                    model,
+                    Decimal(model.amount),
+                    expires_at,
+                )
+
+    def available(self, asset_id: str) -> Decimal | None:
+        """Return the balance of an asset according to the ledger.
+
+        Args:
+            asset_id (str): The asset ID, e.g. `eth`, `wei` or `usdc`.
+
+        Returns:
+            Optional[Decimal]: The balance in whole units of the asset, less the amounts reserved
+            for sends in flight, or None if the ledger has no fresh balance for it.
+
+        """
+        key = self._key(asset_id)
+
+        with self._lock:
+            entry = self._fresh_entry(key)
+            if entry is None:
+                return None
+
+            model, atomic_amount, _ = entry
+            atomic_amount -= self._reserved.get(key, Decimal(0))
+
+        return Asset.from_model(model.asset, asset_id=asset_id).from_atomic_amount(atomic_amount)
+
+    def reserve(self, asset_id: str, amount: Decimal) -> BalanceReservation | None:
+        """Check that an amount of an asset is available and hold it back for a send.
+
+        The check and the reservation happen under the ledger lock, so concurrent sends cannot
+        both pass the check for the same funds.
+
+        Args:
+            asset_id (str): The asset ID, e.g. `eth`, `wei` or `usdc`.
+            amount (Decimal): The amount in whole units of the asset.
+
+        Returns:
+            Optional[BalanceReservation]: The reservation, or None if the ledger has no fresh
+            balance for the asset.
+
+        Raises:
+            InsufficientFundsError: If the amount exceeds the balance less the amounts already
+                reserved.
+
+        """
+        key = self._key(asset_id)
+
+        with self._lock:
+            entry = self._fresh_entry(key)
+            if entry is None:
+                return None
+
+            model, atomic_amount, _ = entry
+            asset = Asset.from_model(model.asset, asset_id=asset_id)
+            reserved = self._reserved.get(key, Decimal(0))
+            requested = asset.to_atomic_amount(amount)
+
+            if requested > atomic_amount - reserved:
+                raise InsufficientFundsError(
+                    expected=amount, exact=asset.from_atomic_amount(atomic_amount - reserved)
+                )
+
+            self._reserved[key] = reserved + requested
+
+        return BalanceReservation(key, asset_id, model.asset, requested)
+
+    def release(
+        self,
+        reservation: BalanceReservation,
+        amount: Decimal | None = None,
+        asset_id: str | None = None,
+    ) -> None:
+        """Return reserved funds to the available balance, e.g. after a send failed.
+
+        Args:
+            reservation (BalanceReservation): The reservation.
+            amount (Optional[Decimal]): The amount to release, or None for all that is left of
+                the reservation.
+            asset_id (Optional[str]): The asset ID of the amount. Defaults to the asset ID of the
+                reservation.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._release(reservation, self._to_atomic(reservation, amount, asset_id))
+
+    def settle(
+        self,
+        reservation: BalanceReservation,
+        amount: Decimal | None = None,
+        asset_id: str | None = None,
+    ) -> None:
+        """Consume reserved funds for a send that succeeded, debiting them from the balance.
+
+        Args:
+            reservation (BalanceReservation): The reservation.
+            amount (Optional[Decimal]): The amount sent, or None for all that is left of the
+                reservation.
+            asset_id (Optional[str]): The asset ID of the amount. Defaults to the asset ID of the
+                reservation.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            atomic_amount = self._to_atomic(reservation, amount, asset_id)
+            self._release(reservation, atomic_amount)
+            self._debit(reservation._key, atomic_amount)
+
+    def debit(self, asset_id: str, amount: Decimal) -> None:
+        """Subtract an amount sent by the address from the balance of an asset.
+
+        Assets without an entry are left untracked. An entry that would become negative is
+        invalidated, since the ledger is evidently out of date.
+
+        Args:
+            asset_id (str): The asset ID, e.g. `eth`, `wei` or `usdc`.
+            amount (Decimal): The amount in whole units of the asset.
+
+        Returns:
+            None
+
+        """
+        key = self._key(asset_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                asset = Asset.from_model(entry[0].asset, asset_id=asset_id)
+                self._debit(key, asset.to_atomic_amount(amount))
+
+    def invalidate(self, asset_id: str | None = None) -> None:
+        """Forget the balance of an asset, or of all assets.
+
+        Args:
+            asset_id (Optional[str]): The asset ID, or None to clear the ledger.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            if asset_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(asset_id), None)
+
+    @staticmethod
+    def _to_atomic(
+        reservation: BalanceReservation, amount: Decimal | None, asset_id: str | None
+    ) -> Decimal:
+        """Convert an amount of a reservation to atomic units."""
+        if amount is None:
+            return reservation._atomic_amount
+
+        asset = Asset.from_model(reservation._asset, asset_id=asset_id or reservation.asset_id)
+        return asset.to_atomic_amount(amount)
+
+    def _release(self, reservation: BalanceReservation, atomic_amount: Decimal) -> None:
+        """Remove an atomic amount from a reservation. Must hold the lock."""
+        released = min(atomic_amount, reservation._atomic_amount)
+        reservation._atomic_amount -= released
+
+        reserved = self._reserved.get(reservation._key, Decimal(0)) - released
+        if reserved > 0:
+            self._reserved[reservation._key] = reserved
+        else:
+            self._reserved.pop(reservation._key, None)
+
+    def _debit(self, key: str, atomic_amount: Decimal) -> None:
+        """Subtract an atomic amount from the entry of a ledger key. Must hold the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+
+        model, balance, expires_at = entry
+        remaining = balance - atomic_amount
+
+        if remaining < 0:
+            del self._entries[key]
+        else:
+            self._entries[key] = (model, remaining, expires_at)
@@ -0,0 +1,190 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from cdp.asset import Asset
+from cdp.transfer import Transfer
+
+
+@dataclass(frozen=True)
+class BatchTransferItem:
+    """A single transfer of a batch.
+
+    Attributes:
+        amount (Decimal): The amount to transfer.
+        asset_id (str): The asset ID.
+        destination (Union[Address, Wallet, str]): The transfer destination.
+
+    """
+
+    amount: Decimal
+    asset_id: str
+    destination: Any
+
+    @classmethod
+    def coerce(cls, item: "BatchTransferItem | tuple") -> "BatchTransferItem":
+        """Create a BatchTransferItem from an `(amount, asset_id, destination)` tuple.
+
+        Args:
+            item (Union[BatchTransferItem, tuple]): The item or tuple.
+
+        Returns:
+            BatchTransferItem: The item, with its amount normalized to a Decimal.
+
+        """
+        if isinstance(item, BatchTransferItem):
+            amount, asset_id, destination = item.amount, item.asset_id, item.destination
+        else:
+            amount, asset_id, destination = item
+
+        return cls(amount=Decimal(amount), asset_id=asset_id, destination=destination)
+
+
+@dataclass(frozen=True)
+class BatchTransferResult:
+    """The outcome of a single transfer of a batch.
+
+    Attributes:
+        index (int): The position of the transfer in the batch.
+        item (BatchTransferItem): The requested transfer.
+        transfer (Optional[Transfer]): The created transfer, if it succeeded.
+        error (Optional[Exception]): The error raised while creating, signing or broadcasting
+            the transfer, if it failed.
+
+    """
+
+    index: int
+    item: BatchTransferItem
+    transfer: Transfer | None = None
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the transfer was created and, with a local signer, broadcast.
+
+        Returns:
+            bool: Whether the transfer succeeded.
+
+        """
+        return self.error is None
+
+
+@dataclass
+class BatchTransferReport:
+    """The outcome of a batch of transfers, in the order they were requested.
+
+    Attributes:
+        results (List[BatchTransferResult]): The result of each transfer.
+        callback_errors (List[Exception]): The exceptions raised by the `on_result` callback.
+
+    """
+
+    results: list[BatchTransferResult] = field(default_factory=list)
+    callback_errors: list[Exception] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[BatchTransferResult]:
+        """The results of the transfers that succeeded.
+
+        Returns:
+            List[BatchTransferResult]: The successful results.
+
+        """
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> list[BatchTransferResult]:
+        """The results of the transfers that failed.
+
+        Returns:
+            List[BatchTransferResult]: The failed results.
+
+        """
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def transfers(self) -> list[Transfer]:
+        """The transfers that succeeded.
+
+        Returns:
+            List[Transfer]: The created transfers.
+
+        """
+        return [result.transfer for result in self.succeeded]
+
+    @property
+    def all_succeeded(self) -> bool:
+        """Whether every transfer of the batch succeeded.
+
+        Returns:
+            bool: Whether there were no failures.
+
+        """
+        return all(result.succeeded for result in self.results)
+
+    def __len__(self) -> int:
+        """Return the number of transfers in the batch."""
+        return len(self.results)
+
+    def __str__(self) -> str:
+        """Return a string representation of the BatchTransferReport."""
+        return (
+            f"BatchTransferReport: (succeeded: {len(self.succeeded)}, failed: {len(self.failed)})"
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the BatchTransferReport."""
+        return str(self)
+
+
+def denomination_key(asset_id: str) -> str:
+    """Return the key shared by the denominations of an asset.
+
+    Args:
+        asset_id (str): The asset ID, e.g. `ETH`, `gwei` or `usdc`.
+
+    Returns:
+        str: The lowercase primary denomination of the asset, e.g. `eth` for `ETH` and `gwei`.
+
+    """
+    return Asset.primary_denomination(asset_id).lower()
+
+
+def totals_by_asset(
+    items: Iterable[BatchTransferItem], assets: Mapping[str, Asset] | None = None
+) -> dict[str, Decimal]:
+    """Sum the amounts of a batch per asset.
+
+    Amounts in different denominations of an asset, e.g. `eth` and `gwei`, or in asset IDs that
+    differ only in case, are summed in the denomination of the first of them in the batch.
+
+    Args:
+        items (Iterable[BatchTransferItem]): The transfers of the batch.
+        assets (Optional[Mapping[str, Asset]]): The assets of the batch keyed by asset ID, used to
+            convert between denominations.
+
+    Returns:
+        Dict[str, Decimal]: The total amount per asset, keyed by the asset ID of its first
+        transfer, in order of first appearance.
+
+    Raises:
+        ValueError: If the batch has several denominations of an asset and no assets are given.
+
+    """
+    asset_ids: dict[str, str] = {}
+    totals: dict[str, Decimal] = {}
+    for item in items:
+        asset_id = asset_ids.setdefault(denomination_key(item.asset_id), item.asset_id)
+        amount = item.amount
+
+        if item.asset_id != asset_id:
+            if assets is None:
+                raise ValueError(
+                    f"Converting {item.asset_id} to {asset_id} requires the assets of the batch"
+                )
+            atomic_amount = assets[item.asset_id].to_atomic_amount(amount)
+            amount = assets[asset_id].from_atomic_amount(atomic_amount)
+
+        totals[asset_id] = totals.get(asset_id, Decimal(0)) + amount
+    return totals
@@ -0,0 +1,287 @@
+"""Load test the SDK end to end against a local stand-in of the CDP API.
+
+Runs realistic flows, e.g. create, sign, broadcast and wait for transfers, from concurrent threads
+through the real transport, JWT signing, deserialization and resource classes, against a
+`LocalCdpServer` with configurable latency and error injection, and reports the throughput and
+latency percentiles of each flow.
+
+Usage:
+    python -m cdp.bench [--flows transfer trade ...] [--operations N] [--concurrency N]
+        [--latency-ms MS] [--error-rate RATE] [--json] [--max-p99-ms MS]
+"""
+
+import argparse
+import base64
+import json
+import math
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+from cdp.cdp_client import CdpClient
+from cdp.local_server import LocalCdpServer
+from cdp.polling_policy import FixedPollingPolicy
+
+DESTINATION = "0x000000000000000000000000000000000000dEaD"
+PERCENTILES = (50, 90, 99)
+
+# Stand-in transactions complete on the first reload, so waits poll without sleeping.
+_POLLING_POLICY = FixedPollingPolicy(0)
+
+
+@dataclass(frozen=True)
+class FlowResult:
+    """The outcome of running a flow under load.
+
+    Attributes:
+        flow (str): The name of the flow.
+        operations (int): The number of operations run.
+        errors (int): The number of operations that raised.
+        seconds (float): The wall-clock time of the run.
+        latencies (Tuple[float, ...]): The duration of each successful operation in seconds, sorted.
+
+    """
+
+    flow: str
+    operations: int
+    errors: int
+    seconds: float
+    latencies: tuple[float, ...]
+
+    @property
+    def throughput(self) -> float:
+        """The number of successful operations per second."""
+        return len(self.latencies) / self.seconds if self.seconds else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return a latency percentile of the successful operations.
+
+        Args:
+            percent (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The latency in seconds, using the nearest-rank method, or 0 if every operation
+            failed.
+
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * len(self.latencies)))
+        return self.latencies[rank - 1]
+
+    def summary(self) -> dict:
+        """Return the throughput and latency percentiles, in milliseconds, as a dict.
+
+        Returns:
+            Dict: The summary of the result.
+
+        """
+        summary = {key: value for key, value in asdict(self).items() if key != "latencies"}
+        summary["seconds"] = round(self.seconds, 3)
+        summary["throughput"] = round(self.throughput, 2)
+        for percent in PERCENTILES:
+            summary[f"p{percent}_ms"] = round(self.percentile(percent) * 1e3, 2)
+        summary["max_ms"] = round(self.percentile(100) * 1e3, 2)
+        return summary
+
+
+def _wallet_flow() -> Callable[[], object]:
+    from cdp.wallet import Wallet
+
+    return Wallet.create
+
+
+def _transfer_flow() -> Callable[[], object]:
+    from cdp.wallet import Wallet
+
+    wallet = Wallet.create()
+    return lambda: wallet.transfer(0.0001, "eth", DESTINATION).wait(polling_policy=_POLLING_POLICY)
+
+
+def _trade_flow() -> Callable[[], object]:
+    from cdp.wallet import Wallet
+
+    wallet = Wallet.create()
+    return lambda: wallet.trade(0.0001, "eth", "usdc").wait(polling_policy=_POLLING_POLICY)
+
+
+def _user_operation_flow() -> Callable[[], object]:
+    from eth_account import Account
+
+    from cdp.evm_call_types import EncodedCall
+    from cdp.smart_wallet import SmartWallet
+
+    smart_wallet = SmartWallet.create(Account.create()).use_network(84532)
+    call = EncodedCall(to=DESTINATION, value=1, data="0x")
+    return lambda: smart_wallet.send_user_operation([call]).wait(polling_policy=_POLLING_POLICY)
+
+
+def _webhook_flow() -> Callable[[], object]:
+    from cdp.client.models.webhook_event_type import WebhookEventType
+    from cdp.webhook import Webhook
+
+    def create_and_delete() -> None:
+        webhook = Webhook.create("https://example.com/cdp", WebhookEventType.WALLET_ACTIVITY)
+        webhook.delete_webhook()
+
+    return create_and_delete
+
+
+FLOWS: dict[str, Callable[[], Callable[[], object]]] = {
+    "wallet": _wallet_flow,
+    "transfer": _transfer_flow,
+    "trade": _trade_flow,
+    "user_operation": _user_operation_flow,
+    "webhook": _webhook_flow,
+}
+
+
+def run_flow(client: CdpClient, flow: str, operations: int, concurrency: int) -> FlowResult:
+    """Run a flow a number of times from concurrent threads, using the given client.
+
+    Args:
+        client (CdpClient): The client to run the flow with.
+        flow (str): The name of the flow, one of `FLOWS`.
+        operations (int): The number of times to run the flow.
+        concurrency (int): The number of threads running the flow.
+
+    Returns:
+        FlowResult: The outcome of the run.
+
+    """
+    with client.use():
+        operation = FLOWS[flow]()
+
+    def timed() -> float | None:
+        start = time.perf_counter()
+        try:
+            with client.use():
+                operation()
+        except Exception:
+            return None
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cdp-bench") as executor:
+        durations = list(executor.map(lambda _: timed(), range(operations)))
+    seconds = time.perf_counter() - start
+
+    latencies = sorted(duration for duration in durations if duration is not None)
+    return FlowResult(flow, operations, operations - len(latencies), seconds, tuple(latencies))
+
+
+def generate_api_key(key_type: str = "ecdsa") -> str:
+    """Generate a private key in the format of CDP API keys.
+
+    Args:
+        key_type (str): "ecdsa" for an ES256 PEM key, or "ed25519" for a base64 EdDSA key.
+
+    Returns:
+        str: The private key.
+
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+    if key_type == "ed25519":
+        key = ed25519.Ed25519PrivateKey.generate()
+        return base64.b64encode(
+            key.private_bytes(
+                serialization.Encoding.Raw,
+                serialization.PrivateFormat.Raw,
+                serialization.NoEncryption(),
+            )
+        ).decode()
+
+    return (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        .decode()
+    )
+
+
+def format_report(results: Sequence[FlowResult]) -> str:
+    """Format results as a table of throughput and latency percentiles.
+
+    Args:
+        results (Sequence[FlowResult]): The results to format.
+
+    Returns:
+        str: The report.
+
+    """
+    header = f"{'flow':<16}{'ops':>7}{'errors':>8}{'ops/s':>10}"
+    header += "".join(f"{f'p{percent} ms':>10}" for percent in PERCENTILES) + f"{'max ms':>10}"
+    lines = [header]
+    for result in results:
+        summary = result.summary()
+        line = f"{result.flow:<16}{result.operations:>7}{result.errors:>8}{summary['throughput']:>10.1f}"
+        line += "".join(f"{summary[f'p{percent}_ms']:>10.1f}" for percent in PERCENTILES)
+        lines.append(line + f"{summary['max_ms']:>10.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the load test and print its report.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments. Defaults to `sys.argv`.
+
+    Returns:
+        int: The exit code, 1 if any flow failed an operation or exceeded `--max-p99-ms`.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m cdp.bench", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--flows", nargs="+", choices=list(FLOWS), default=list(FLOWS))
+    parser.add_argument("--operations", type=int, default=200, help="operations per flow")
+    parser.add_argument("--concurrency", type=int, default=8, help="threads per flow")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="server latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random extra latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="injected error rate")
+    parser.add_argument("--error-status", type=int, default=503, help="injected error status")
+    parser.add_argument("--key-type", choices=["ecdsa", "ed25519"], default="ecdsa")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the injection")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument(
+        "--max-p99-ms", type=float, default=None, help="fail if a flow's p99 is above this"
+    )
+    args = parser.parse_args(argv)
+
+    server = LocalCdpServer(
+        latency_seconds=args.latency_ms / 1e3,
+        latency_jitter_seconds=args.jitter_ms / 1e3,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    with server:
+        client = CdpClient(
+            "bench-api-key",
+            generate_api_key(args.key_type),
+            base_path=server.base_path,
+            connection_pool_maxsize=args.concurrency,
+        )
+        results = [run_flow(client, flow, args.operations, args.concurrency) for flow in args.flows]
+
+    if args.json:
+        print(json.dumps([result.summary() for result in results], indent=2))
+    else:
+        print(format_report(results))
+        print(f"injected errors: {server.injected_errors}")
+
+    failed = any(result.errors for result in results)
+    if args.max_p99_ms is not None:
+        failed |= any(result.percentile(99) * 1e3 > args.max_p99_ms for result in results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
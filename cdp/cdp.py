@@ -1,11 +1,16 @@
 import json
 import os
+from collections.abc import Mapping, Sequence
 
 from cdp import __version__
-from cdp.api_clients import ApiClients
-from cdp.cdp_api_client import CdpApiClient
+from cdp.cdp_client import CdpClient, active_client
+from cdp.connection_pool import ConnectionPoolStats
 from cdp.constants import SDK_DEFAULT_SOURCE
 from cdp.errors import InvalidConfigurationError, UninitializedSDKError
+from cdp.metrics import MetricsRegistry, set_metrics_registry
+from cdp.rate_limiter import RateLimiterStats
+from cdp.request_priority import RequestSchedulerStats
+from cdp.tracing import TraceHook
 
 
 class Cdp:
@@ -13,12 +18,15 @@ class Cdp:
 
     Attributes:
         api_key_name (Optional[str]): The API key name.
-        private_key (Optional[str]): The private key associated with the API key.
-        use_server_signer (bool): Whether to use the server signer.
+        private_key (Optional[str]): The private key of the default client, see `api_private_key`.
+        use_server_signer (bool): Whether the default client uses the server signer, see
+            `uses_server_signer`.
         debugging (bool): Whether debugging is enabled.
         base_path (str): The base URL for the Platform API.
         max_network_retries (int): The maximum number of network retries.
-        api_clients: The Platform API clients instance.
+        default_client (Optional[CdpClient]): The client configured with `configure`.
+        api_clients: The Platform API clients of the client in use, see `CdpClient.use()`, or
+            of the default client.
 
     """
 
@@ -32,12 +40,28 @@ class Cdp:
     max_network_retries = 3
 
     class ApiClientsWrapper:
-        """Wrapper that raises a helpful error when SDK is not initialized."""
+        """Routes API calls to the client in use, and raises a helpful error when SDK is not initialized."""
 
-        def __getattr__(self, _name):
-            """Raise an error when accessing an attribute of the ApiClientsWrapper."""
-            raise UninitializedSDKError()
+        def __init__(self, default_client: CdpClient | None = None) -> None:
+            """Initialize the ApiClientsWrapper.
 
+            Args:
+                default_client (Optional[CdpClient]): The client that API calls go to outside of
+                    `CdpClient.use()` blocks, or None if the SDK has not been configured.
+
+            """
+            self._default_client = default_client
+
+        def __getattr__(self, name):
+            """Return an API client of the client in use, or raise an error if there is none."""
+            client = active_client()
+            if client is None:
+                client = self._default_client
+            if client is None:
+                raise UninitializedSDKError()
+            return getattr(client.api_clients, name)
+
+    default_client: CdpClient | None = None
     api_clients = ApiClientsWrapper()
 
     def __new__(cls):
@@ -66,6 +90,22 @@ class Cdp:
         max_network_retries: int = 3,
         source: str = SDK_DEFAULT_SOURCE,
         source_version: str = __version__,
+        token_cache_min_validity_seconds: int | None = None,
+        fast_deserialization: bool = False,
+        validate_responses: bool = True,
+        connection_pool_maxsize: int | None = None,
+        connection_pool_block: bool = False,
+        keepalive_timeout: float | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        warm_up_connections: int = 0,
+        idempotency_keys: bool = False,
+        rate_limit: float | None = None,
+        rate_limits: Mapping[str, float] | None = None,
+        rate_limit_burst: int | None = None,
+        reserved_connections: int | None = None,
+        trace_hooks: Sequence[TraceHook] | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         """Configure the CDP SDK.
 
@@ -78,6 +118,22 @@ class Cdp:
             max_network_retries (int): The maximum number of network retries. Defaults to 3.
             source (Optional[str]): Specifies whether the sdk is being used directly or if it's an Agentkit extension.
             source_version (Optional[str]): The version of the source package.
+            token_cache_min_validity_seconds (Optional[int]): When set, API request JWTs are reused per request method and path while they have more than this many seconds of validity left. Defaults to None.
+            fast_deserialization (bool): Whether to validate JSON responses straight into models instead of using the generated client's deserializer. Defaults to False.
+            validate_responses (bool): Whether to validate API responses against their models. When False, trusted responses are constructed without validation, which is much faster for large scans, and responses that do not match their model fall back to validation. Defaults to True.
+            connection_pool_maxsize (Optional[int]): The maximum number of connections kept open to each host. Size it to the number of threads making API calls, or calls beyond it open connections that are discarded afterwards. Defaults to five per CPU.
+            connection_pool_block (bool): Whether API calls wait for a free connection when all pooled connections are in use, instead of opening extra ones. Defaults to False.
+            keepalive_timeout (Optional[float]): Seconds an idle pooled connection is reused for before it is reopened, or None to reuse it until the server closes it. Defaults to None.
+            connect_timeout (Optional[float]): Seconds to wait for a connection to the API to be established, or None to wait indefinitely. Defaults to None.
+            read_timeout (Optional[float]): Seconds to wait for API response data, or None to wait indefinitely. Defaults to None.
+            warm_up_connections (int): The number of connections to open to the API while configuring, so that the first concurrent calls skip the TLS handshake. Defaults to 0.
+            idempotency_keys (bool): Whether to attach an `X-Idempotency-Key` header to every mutating API request, such as creating or broadcasting a transfer, and retry those requests on transient failures. The key stays the same across retries. Only enable it for a server that honors the header, as a retried request that the server processed twice can move funds twice. Defaults to False, which retries only GET requests.
+            rate_limit (Optional[float]): The maximum number of API requests per second, or None for no limit. Calls beyond it wait for their turn instead of failing, and 429 responses lower the rate, pause calls for their `Retry-After` and are retried up to `max_network_retries` times. Defaults to None.
+            rate_limits (Optional[Mapping[str, float]]): The maximum number of API requests per second of endpoint groups, keyed by the resource following the API version in the path, e.g. `{"webhooks": 2, "networks": 20}`. Each group is limited separately from `rate_limit`. Defaults to None.
+            rate_limit_burst (Optional[int]): The number of requests of a group that may be sent at once after it was idle. Defaults to one second worth of requests.
+            reserved_connections (Optional[int]): When set, API requests are scheduled by priority onto the pooled connections, and this many connections are reserved for high priority requests. Broadcasts are high priority by default; set the priority of other calls with `request_priority` or `set_request_priority`. Defaults to None, which sends requests as they are made.
+            trace_hooks (Optional[Sequence[TraceHook]]): Hooks that receive a span for every API call, with the time spent serializing, waiting, signing, on the network, deserializing and building SDK objects, tagged with the endpoint, status, retry count and error correlation id. Use `OpenTelemetryTraceHook` to export them. Defaults to None, which disables tracing.
+            metrics (Optional[MetricsRegistry]): The registry that counts API calls, latencies and retries per generated API method, API errors by code, reloads per `wait()` and asset cache hits. `wait()` loops report to the registry of the most recent `configure` call. Defaults to None, which disables metrics.
 
         """
         cls.api_key_name = api_key_name
@@ -87,16 +143,106 @@ class Cdp:
         cls.base_path = base_path
         cls.max_network_retries = max_network_retries
 
-        cdp_client = CdpApiClient(
+        cls.default_client = CdpClient(
             api_key_name,
             private_key,
             base_path,
-            debugging,
-            max_network_retries,
-            source,
-            source_version,
+            warm_up_connections,
+            use_server_signer,
+            debugging=debugging,
+            max_network_retries=max_network_retries,
+            source=source,
+            source_version=source_version,
+            token_cache_min_validity_seconds=token_cache_min_validity_seconds,
+            fast_deserialization=fast_deserialization,
+            validate_responses=validate_responses,
+            connection_pool_maxsize=connection_pool_maxsize,
+            connection_pool_block=connection_pool_block,
+            keepalive_timeout=keepalive_timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            idempotency_keys=idempotency_keys,
+            rate_limit=rate_limit,
+            rate_limits=rate_limits,
+            rate_limit_burst=rate_limit_burst,
+            reserved_connections=reserved_connections,
+            trace_hooks=trace_hooks,
+            metrics=metrics,
         )
-        cls.api_clients = ApiClients(cdp_client)
+        cls.api_clients = cls.ApiClientsWrapper(cls.default_client)
+
+        set_metrics_registry(metrics)
+        if metrics is not None:
+            metrics.register_cache("asset", _asset_cache_stats)
+
+    @classmethod
+    def connection_pool_stats(cls) -> ConnectionPoolStats:
+        """Get the connection counters of the HTTP connection pool of the configured client.
+
+        Returns:
+            ConnectionPoolStats: A snapshot of the counters.
+
+        Raises:
+            UninitializedSDKError: If the SDK has not been configured.
+
+        """
+        return cls.api_clients.cdp_client.connection_pool_stats
+
+    @classmethod
+    def uses_server_signer(cls) -> bool:
+        """Return whether resources sign with the server signer in the current thread or task.
+
+        Returns:
+            bool: The `use_server_signer` option of the client in use, see `CdpClient.use()`,
+            or the one passed to `configure` otherwise.
+
+        """
+        client = active_client()
+        if client is None:
+            return cls.use_server_signer
+        return client.use_server_signer
+
+    @classmethod
+    def api_private_key(cls) -> str | None:
+        """Return the private key of the API key in use in the current thread or task.
+
+        Returns:
+            Optional[str]: The private key of the client in use, see `CdpClient.use()`, or the
+            one passed to `configure` otherwise, or None if there is neither.
+
+        """
+        client = active_client()
+        if client is None:
+            return cls.private_key
+        return client.private_key
+
+    @classmethod
+    def rate_limiter_stats(cls) -> dict[str, RateLimiterStats]:
+        """Get the current rate, queue depth and counters of each rate limited endpoint group.
+
+        Returns:
+            Dict[str, RateLimiterStats]: A snapshot of each group, keyed by group name, or an
+            empty dict if API requests are not rate limited.
+
+        Raises:
+            UninitializedSDKError: If the SDK has not been configured.
+
+        """
+        return cls.api_clients.cdp_client.rate_limiter_stats
+
+    @classmethod
+    def request_scheduler_stats(cls) -> RequestSchedulerStats | None:
+        """Get the API requests in flight and queued by priority.
+
+        Returns:
+            Optional[RequestSchedulerStats]: A snapshot of the scheduler, or None if requests are
+            not scheduled by priority.
+
+        Raises:
+            UninitializedSDKError: If the SDK has not been configured.
+
+        """
+        return cls.api_clients.cdp_client.request_scheduler_stats
 
     @classmethod
     def configure_from_json(
@@ -108,6 +254,22 @@ class Cdp:
         max_network_retries: int = 3,
         source: str = SDK_DEFAULT_SOURCE,
         source_version: str = __version__,
+        token_cache_min_validity_seconds: int | None = None,
+        fast_deserialization: bool = False,
+        validate_responses: bool = True,
+        connection_pool_maxsize: int | None = None,
+        connection_pool_block: bool = False,
+        keepalive_timeout: float | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        warm_up_connections: int = 0,
+        idempotency_keys: bool = False,
+        rate_limit: float | None = None,
+        rate_limits: Mapping[str, float] | None = None,
+        rate_limit_burst: int | None = None,
+        reserved_connections: int | None = None,
+        trace_hooks: Sequence[TraceHook] | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         """Configure the CDP SDK from a JSON file.
 
@@ -119,6 +281,22 @@ class Cdp:
             max_network_retries (int): The maximum number of network retries. Defaults to 3.
             source (Optional[str]): Specifies whether the sdk is being used directly or if it's an Agentkit extension.
             source_version (Optional[str]): The version of the source package.
+            token_cache_min_validity_seconds (Optional[int]): When set, API request JWTs are reused per request method and path while they have more than this many seconds of validity left. Defaults to None.
+            fast_deserialization (bool): Whether to validate JSON responses straight into models instead of using the generated client's deserializer. Defaults to False.
+            validate_responses (bool): Whether to validate API responses against their models. When False, trusted responses are constructed without validation, which is much faster for large scans, and responses that do not match their model fall back to validation. Defaults to True.
+            connection_pool_maxsize (Optional[int]): The maximum number of connections kept open to each host. Size it to the number of threads making API calls, or calls beyond it open connections that are discarded afterwards. Defaults to five per CPU.
+            connection_pool_block (bool): Whether API calls wait for a free connection when all pooled connections are in use, instead of opening extra ones. Defaults to False.
+            keepalive_timeout (Optional[float]): Seconds an idle pooled connection is reused for before it is reopened, or None to reuse it until the server closes it. Defaults to None.
+            connect_timeout (Optional[float]): Seconds to wait for a connection to the API to be established, or None to wait indefinitely. Defaults to None.
+            read_timeout (Optional[float]): Seconds to wait for API response data, or None to wait indefinitely. Defaults to None.
+            warm_up_connections (int): The number of connections to open to the API while configuring, so that the first concurrent calls skip the TLS handshake. Defaults to 0.
+            idempotency_keys (bool): Whether to attach an `X-Idempotency-Key` header to every mutating API request, such as creating or broadcasting a transfer, and retry those requests on transient failures. The key stays the same across retries. Only enable it for a server that honors the header, as a retried request that the server processed twice can move funds twice. Defaults to False, which retries only GET requests.
+            rate_limit (Optional[float]): The maximum number of API requests per second, or None for no limit. Calls beyond it wait for their turn instead of failing, and 429 responses lower the rate, pause calls for their `Retry-After` and are retried up to `max_network_retries` times. Defaults to None.
+            rate_limits (Optional[Mapping[str, float]]): The maximum number of API requests per second of endpoint groups, keyed by the resource following the API version in the path, e.g. `{"webhooks": 2, "networks": 20}`. Each group is limited separately from `rate_limit`. Defaults to None.
+            rate_limit_burst (Optional[int]): The number of requests of a group that may be sent at once after it was idle. Defaults to one second worth of requests.
+            reserved_connections (Optional[int]): When set, API requests are scheduled by priority onto the pooled connections, and this many connections are reserved for high priority requests. Broadcasts are high priority by default; set the priority of other calls with `request_priority` or `set_request_priority`. Defaults to None, which sends requests as they are made.
+            trace_hooks (Optional[Sequence[TraceHook]]): Hooks that receive a span for every API call, with the time spent serializing, waiting, signing, on the network, deserializing and building SDK objects, tagged with the endpoint, status, retry count and error correlation id. Use `OpenTelemetryTraceHook` to export them. Defaults to None, which disables tracing.
+            metrics (Optional[MetricsRegistry]): The registry that counts API calls, latencies and retries per generated API method, API errors by code, reloads per `wait()` and asset cache hits. `wait()` loops report to the registry of the most recent `configure` call. Defaults to None, which disables metrics.
 
         Raises:
             InvalidConfigurationError: If the JSON file is missing the 'api_key_name' or 'private_key'.
@@ -141,4 +319,28 @@ class Cdp:
                 max_network_retries,
                 source,
                 source_version,
+                token_cache_min_validity_seconds,
+                fast_deserialization=fast_deserialization,
+                validate_responses=validate_responses,
+                connection_pool_maxsize=connection_pool_maxsize,
+                connection_pool_block=connection_pool_block,
+                keepalive_timeout=keepalive_timeout,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                warm_up_connections=warm_up_connections,
+                idempotency_keys=idempotency_keys,
+                rate_limit=rate_limit,
+                rate_limits=rate_limits,
+                rate_limit_burst=rate_limit_burst,
+                reserved_connections=reserved_connections,
+                trace_hooks=trace_hooks,
+                metrics=metrics,
             )
+
+
+def _asset_cache_stats():
+    """Return the counters of the process-wide asset cache."""
+    # Imported on use, as the asset module depends on this one.
+    from cdp.asset import Asset
+
+    return Asset.cache.stats
@@ -1,21 +1,31 @@
-import random
+import contextlib
 import time
-from urllib.parse import urlparse
+import uuid
+from collections.abc import Mapping, Sequence
 
-import jwt
-from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from pydantic import ValidationError
 from urllib3.util import Retry
 
 from cdp import __version__
-from cdp.api_key_utils import _parse_private_key
 from cdp.client import rest
 from cdp.client.api_client import ApiClient
 from cdp.client.api_response import ApiResponse
 from cdp.client.api_response import T as ApiResponseT  # noqa: N811
 from cdp.client.configuration import Configuration
 from cdp.client.exceptions import ApiException
-from cdp.constants import SDK_DEFAULT_SOURCE
-from cdp.errors import ApiError, InvalidAPIKeyFormatError
+from cdp.connection_pool import ConnectionPoolMonitor, ConnectionPoolStats
+from cdp.constants import IDEMPOTENCY_KEY_HEADER, MUTATING_METHODS, SDK_DEFAULT_SOURCE
+from cdp.errors import ApiError
+from cdp.jwt_signer import JwtSigner
+from cdp.metrics import UNKNOWN_METHOD, MetricsRegistry, current_api_method
+from cdp.rate_limiter import RateLimiter, RateLimiterStats, parse_retry_after
+from cdp.request_priority import (
+    RequestScheduler,
+    RequestSchedulerStats,
+    get_request_priority,
+)
+from cdp.response_deserializer import ResponseDeserializer, is_json_content_type
+from cdp.tracing import Span, TraceHook, Tracer, current_span
 
 
 class CdpApiClient(ApiClient):
@@ -30,6 +40,21 @@ class CdpApiClient(ApiClient):
         max_network_retries: int = 3,
         source: str = SDK_DEFAULT_SOURCE,
         source_version: str = __version__,
+        token_cache_min_validity_seconds: int | None = None,
+        fast_deserialization: bool = False,
+        validate_responses: bool = True,
+        connection_pool_maxsize: int | None = None,
+        connection_pool_block: bool = False,
+        keepalive_timeout: float | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        idempotency_keys: bool = False,
+        rate_limit: float | None = None,
+        rate_limits: Mapping[str, float] | None = None,
+        rate_limit_burst: int | None = None,
+        reserved_connections: int | None = None,
+        trace_hooks: Sequence[TraceHook] | None = None,
+        metrics: MetricsRegistry | None = None,
     ):
         """Initialize the CDP API Client.
 
@@ -41,16 +66,61 @@ class CdpApiClient(ApiClient):
             max_network_retries (int): The maximum number of network retries. Defaults to 3.
             source (str): Specifies whether the sdk is being used directly or if it's an Agentkit extension.
             source_version (str): The version of the source package.
+            token_cache_min_validity_seconds (Optional[int]): When set, JWTs are reused per request method and path while they have more than this many seconds of validity left. Defaults to None.
+            fast_deserialization (bool): Whether to validate JSON responses straight into models with `ResponseDeserializer` instead of the generated client's deserializer. Defaults to False.
+            validate_responses (bool): Whether to validate responses against their models. When False, models are constructed without validation, falling back to validation for responses that do not match. Defaults to True.
+            connection_pool_maxsize (Optional[int]): The maximum number of connections kept open to each host. Size it to the number of threads sharing the client, or requests beyond it open connections that are discarded afterwards. Defaults to five per CPU.
+            connection_pool_block (bool): Whether requests wait for a free connection when all pooled connections are in use, instead of opening extra ones. Defaults to False.
+            keepalive_timeout (Optional[float]): Seconds an idle pooled connection is reused for before it is reopened, or None to reuse it until the server closes it. Defaults to None.
+            connect_timeout (Optional[float]): Seconds to wait for a connection to be established, or None to wait indefinitely. Defaults to None.
+            read_timeout (Optional[float]): Seconds to wait for response data, or None to wait indefinitely. Defaults to None.
+            idempotency_keys (bool): Whether to attach an `X-Idempotency-Key` header to every mutating request and retry those requests on transient failures like GET requests. Only enable it for a server that honors the header, as a retried request that the server processed twice, like `create_transfer` or `broadcast_transfer`, can move funds twice. Defaults to False, which retries only GET requests.
+            rate_limit (Optional[float]): The maximum number of requests per second, or None for no limit. Requests beyond it wait for their turn, and 429 responses lower the rate, pause requests for their `Retry-After` and are retried up to `max_network_retries` times. Defaults to None.
+            rate_limits (Optional[Mapping[str, float]]): The maximum number of requests per second of endpoint groups, keyed by the resource following the API version in the path, e.g. `{"webhooks": 2}`. Each group is limited separately from `rate_limit`. Defaults to None.
+            rate_limit_burst (Optional[int]): The number of requests of a group that may be sent at once after it was idle. Defaults to one second worth of requests.
+            reserved_connections (Optional[int]): When set, requests are scheduled by priority onto the pooled connections, and this many connections are reserved for high priority requests, such as broadcasts. Set the priority of other requests with `request_priority`. Defaults to None, which sends requests as they are made.
+            trace_hooks (Optional[Sequence[TraceHook]]): Hooks that receive a span for every API call, with the time spent signing, serializing, waiting, on the network and deserializing. Defaults to None, which disables tracing.
+            metrics (Optional[MetricsRegistry]): The registry that counts the calls, latencies, retries and errors of each generated API method. Defaults to None, which disables metrics.
 
         """
+        self._max_network_retries = max_network_retries
+        self._idempotency_keys = idempotency_keys
         retry_strategy = self._get_retry_strategy(max_network_retries)
         configuration = Configuration(host=host, retries=retry_strategy)
+        if connection_pool_maxsize is not None:
+            configuration.connection_pool_maxsize = connection_pool_maxsize
         super().__init__(configuration)
+        pool_manager = self.rest_client.pool_manager
+        pool_manager.connection_pool_kw["block"] = connection_pool_block
+        self._pool_monitor = ConnectionPoolMonitor(pool_manager, keepalive_timeout)
+        self._default_request_timeout = (
+            (connect_timeout, read_timeout)
+            if connect_timeout is not None or read_timeout is not None
+            else None
+        )
         self._api_key = api_key
         self._private_key = private_key
         self._debugging = debugging
         self._source = source
         self._source_version = source_version
+        self._signer = JwtSigner(api_key, private_key, token_cache_min_validity_seconds)
+        self._response_deserializer = (
+            ResponseDeserializer(validate=validate_responses)
+            if fast_deserialization or not validate_responses
+            else None
+        )
+        self._rate_limiter = (
+            RateLimiter(rate_limit, rate_limits, rate_limit_burst)
+            if rate_limit is not None or rate_limits
+            else None
+        )
+        self._request_scheduler = (
+            RequestScheduler(configuration.connection_pool_maxsize, reserved_connections)
+            if reserved_connections is not None
+            else None
+        )
+        self._tracer = Tracer(trace_hooks) if trace_hooks else None
+        self._metrics = metrics
 
     @property
     def api_key(self) -> str:
@@ -82,6 +152,96 @@ class CdpApiClient(ApiClient):
         """
         return self._debugging
 
+    @property
+    def connection_pool_stats(self) -> ConnectionPoolStats:
+        """The connection counters of the HTTP connection pool.
+
+        Returns:
+            ConnectionPoolStats: A snapshot of the counters.
+
+        """
+        return self._pool_monitor.stats
+
+    @property
+    def rate_limiter_stats(self) -> dict[str, RateLimiterStats]:
+        """The current rate, queue depth and counters of each rate limited endpoint group.
+
+        Returns:
+            Dict[str, RateLimiterStats]: A snapshot of each group, keyed by group name, or an
+            empty dict if requests are not rate limited.
+
+        """
+        if self._rate_limiter is None:
+            return {}
+        return self._rate_limiter.stats
+
+    @property
+    def request_scheduler_stats(self) -> RequestSchedulerStats | None:
+        """The requests in flight and queued by priority.
+
+        Returns:
+            Optional[RequestSchedulerStats]: A snapshot of the scheduler, or None if requests are
+            not scheduled by priority.
+
+        """
+        if self._request_scheduler is None:
+            return None
+        return self._request_scheduler.stats
+
+    @property
+    def tracer(self) -> Tracer | None:
+        """The tracer that reports the spans of API calls.
+
+        Returns:
+            Optional[Tracer]: The tracer, or None if tracing is disabled.
+
+        """
+        return self._tracer
+
+    @property
+    def metrics(self) -> MetricsRegistry | None:
+        """The registry that counts the API calls made through this client.
+
+        Returns:
+            Optional[MetricsRegistry]: The registry, or None if metrics are disabled.
+
+        """
+        return self._metrics
+
+    def warm_up(self, connections: int) -> int:
+        """Open pooled connections to the API host ahead of the first requests.
+
+        Args:
+            connections (int): The number of connections to open, at most the pool size.
+
+        Returns:
+            int: The number of connections that were opened.
+
+        """
+        return self._pool_monitor.warm_up(self.configuration.host, connections)
+
+    def param_serialize(self, method, resource_path, *args, **kwargs):
+        """Serialize the request of an API call, starting its span when tracing is enabled.
+
+        Args:
+            method: The HTTP method of the request.
+            resource_path: The path template of the endpoint, e.g. `/v1/wallets/{wallet_id}`.
+            *args: The remaining positional arguments of `ApiClient.param_serialize`.
+            **kwargs: The remaining keyword arguments of `ApiClient.param_serialize`.
+
+        Returns:
+            RequestSerialized: The method, URL, headers, body and post parameters.
+
+        """
+        if self._tracer is None:
+            return super().param_serialize(method, resource_path, *args, **kwargs)
+
+        span = self._tracer.start_span(
+            f"{method} {resource_path}", {"http.method": method, "cdp.endpoint": resource_path}
+        )
+        with span.phase("serialize"):
+            return super().param_serialize(method, resource_path, *args, **kwargs)
+
     def call_api(
         self,
         method,
@@ -113,9 +273,117 @@ class CdpApiClient(ApiClient):
         if header_params is None:
             header_params = {}
 
-        self._apply_headers(url, method, header_params)
+        if _request_timeout is None:
+            _request_timeout = self._default_request_timeout
 
-        return super().call_api(method, url, header_params, body, post_params, _request_timeout)
+        span = current_span() if self._tracer is not None else None
+        if span is None:
+            return self._send(method, url, header_params, body, post_params, _request_timeout)
+
+        span.set_attribute("cdp.priority", get_request_priority(method, url).name)
+        try:
+            return self._send(method, url, header_params, body, post_params, _request_timeout, span)
+        except BaseException as e:
+            self._tracer.end_span(span, e)
+            raise
+
+    def _send(
+        self,
+        method,
+        url,
+        header_params,
+        body,
+        post_params,
+        _request_timeout,
+        span: Span | None = None,
+    ) -> rest.RESTResponse:
+        """Send a request through the rate limiter and the request scheduler.
+
+        Args:
+            method: Method to call.
+            url: Path to method endpoint.
+            header_params: Header parameters to be placed in the request header.
+            body: Request body.
+            post_params (dict): Request post form parameters.
+            _request_timeout: timeout setting for this request.
+            span (Optional[Span]): The span of the call, if it is traced.
+
+        Returns:
+            RESTResponse
+
+        """
+        bucket = self._rate_limiter.bucket(url) if self._rate_limiter is not None else None
+        throttled = 0
+        queued = time.perf_counter() if span is not None else 0.0
+        with self._request_slot(method, url):
+            if span is not None:
+                span.add_phase("queue", time.perf_counter() - queued)
+            while True:
+                if bucket is not None:
+                    waited = bucket.acquire()
+                    if span is not None:
+                        span.add_phase("queue", waited)
+
+                # Headers are applied after waiting, so that the JWT is fresh when it is sent.
+                self._apply_headers(url, method, header_params)
+                if span is None:
+                    response = super().call_api(
+                        method, url, header_params, body, post_params, _request_timeout
+                    )
+                else:
+                    with span.phase("network"):
+                        response = super().call_api(
+                            method, url, header_params, body, post_params, _request_timeout
+                        )
+                        response.read()
+                    span.set_attribute("http.status_code", response.status)
+
+                if (
+                    bucket is None
+                    or response.status != 429
+                    or throttled >= self._max_network_retries
+                ):
+                    if self._request_scheduler is not None:
+                        # The connection returns to the pool once the body is read, so it is read
+                        # while the slot is held.
+                        response.read()
+                    if span is not None or self._metrics is not None:
+                        self._record_retries(span, throttled + _urllib3_retries(response))
+                    return response
+
+                # Reading the body returns the connection of the throttled request to the pool.
+                response.read()
+                bucket.throttle(parse_retry_after(response.getheader("Retry-After")))
+                throttled += 1
+
+    def _record_retries(self, span: Span | None, retries: int) -> None:
+        """Record the retries of a request on its span and in the metrics registry.
+
+        Args:
+            span (Optional[Span]): The span of the call, if it is traced.
+            retries (int): The number of times the request was retried.
+
+        """
+        if span is not None:
+            span.set_attribute("cdp.retry_count", retries)
+        if self._metrics is not None and retries:
+            self._metrics.record_retries(current_api_method() or UNKNOWN_METHOD, retries)
+
+    def _request_slot(self, method: str, url: str):
+        """Return a context manager that holds a pooled connection slot for a request.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The request URL.
+
+        Returns:
+            A context manager that waits for the turn of the request by its priority, or does
+            nothing if requests are not scheduled by priority.
+
+        """
+        if self._request_scheduler is None:
+            return contextlib.nullcontext()
+        return self._request_scheduler.slot(get_request_priority(method, url))
 
     def response_deserialize(
         self,
@@ -135,10 +403,56 @@ class CdpApiClient(ApiClient):
         if self.debugging is True:
             print(f"CDP API RESPONSE: Status: {response_data.status}, Data: {response_data.data}")
 
+        span = current_span() if self._tracer is not None else None
+        if span is None:
+            try:
+                return super().response_deserialize(response_data, response_types_map)
+            except ApiException as e:
+                raise ApiError.from_error(e) from None
+
         try:
-            return super().response_deserialize(response_data, response_types_map)
+            with span.phase("deserialize"):
+                result = super().response_deserialize(response_data, response_types_map)
         except ApiException as e:
-            raise ApiError.from_error(e) from None
+            error = ApiError.from_error(e)
+            span.set_attribute("cdp.error_code", error.api_code)
+            span.set_attribute("cdp.correlation_id", error.correlation_id)
+            self._tracer.end_span(span, error)
+            raise error from None
+        except BaseException as e:
+            self._tracer.end_span(span, e)
+            raise
+
+        self._tracer.end_span(span)
+        return result
+
+    def deserialize(self, response_text: str, response_type: str, content_type: str | None):
+        """Deserialize a response body into an object.
+
+        With fast deserialization enabled, JSON responses of model types are validated straight
+        into models, or constructed without validation if `validate_responses` is False. Anything
+        else, and any response the fast path rejects, is deserialized and validated by the
+        generated client, so errors are reported exactly as before.
+
+        Args:
+            response_text (str): The response body.
+            response_type (str): The response type name.
+            content_type (Optional[str]): The content type of the response.
+
+        Returns:
+            The deserialized object.
+
+        """
+        deserializer = self._response_deserializer
+        if deserializer is not None and response_text and is_json_content_type(content_type):
+            plan = deserializer.plan(response_type)
+            if plan is not None:
+                try:
+                    return plan(response_text)
+                except (ValidationError, ValueError):
+                    pass
+
+        return super().deserialize(response_text, response_type, content_type)
 
     def _apply_headers(self, url: str, method: str, header_params: dict[str, str]) -> None:
         """Apply authentication to the configuration.
@@ -152,7 +466,12 @@ class CdpApiClient(ApiClient):
             None
 
         """
-        token = self._build_jwt(url, method)
+        span = current_span() if self._tracer is not None else None
+        if span is None:
+            token = self._build_jwt(url, method)
+        else:
+            with span.phase("sign"):
+                token = self._build_jwt(url, method)
 
         # Add the JWT token to the headers
         header_params["Authorization"] = f"Bearer {token}"
@@ -161,51 +480,13 @@ class CdpApiClient(ApiClient):
         header_params["Content-Type"] = "application/json"
         header_params["Correlation-Context"] = self._get_correlation_data()
 
+        # The key is generated once per call, so that every retry of the request carries it.
+        if self._idempotency_keys and method.upper() in MUTATING_METHODS:
+            header_params.setdefault(IDEMPOTENCY_KEY_HEADER, str(uuid.uuid4()))
+
     def _build_jwt(self, url: str, method: str = "GET") -> str:
         """Build the JWT for the given API endpoint URL."""
-        # Parse the private key using our helper function.
-        private_key_obj = _parse_private_key(self.private_key)
-
-        # Determine signing algorithm based on the key type.
-        if isinstance(private_key_obj, ec.EllipticCurvePrivateKey):
-            alg = "ES256"
-        elif isinstance(private_key_obj, ed25519.Ed25519PrivateKey):
-            alg = "EdDSA"
-        else:
-            raise InvalidAPIKeyFormatError("Unsupported key type")
-
-        header = {
-            "alg": alg,
-            "kid": self.api_key,
-            "typ": "JWT",
-            "nonce": self._nonce(),
-        }
-
-        parsed_url = urlparse(url)
-        uri = f"{method} {parsed_url.netloc}{parsed_url.path}"
-        claims = {
-            "sub": self.api_key,
-            "iss": "cdp",
-            "aud": ["cdp_service"],
-            "nbf": int(time.time()),
-            "exp": int(time.time()) + 60,  # Token valid for 1 minute
-            "uris": [uri],
-        }
-
-        try:
-            return jwt.encode(claims, private_key_obj, algorithm=alg, headers=header)
-        except Exception as e:
-            print(f"Error during JWT signing: {e!s}")
-            raise InvalidAPIKeyFormatError("Could not sign the JWT") from e
-
-    def _nonce(self) -> str:
-        """Generate a random nonce for the JWT.
-
-        Returns:
-            str: The nonce.
-
-        """
-        return "".join(random.choices("0123456789", k=16))
+        return self._signer.sign(url, method)
 
     def _get_correlation_data(self) -> str:
         """Return encoded correlation data including the SDK version, language, and source.
@@ -222,6 +503,23 @@ class CdpApiClient(ApiClient):
         }
         return ",".join(f"{key}={value}" for key, value in data.items())
 
+    @property
+    def retry_methods(self) -> frozenset[str]:
+        """The HTTP methods that are retried on transient failures.
+
+        Mutating requests are only retried when `idempotency_keys` is enabled, so that they carry
+        an idempotency key. The generated client and API specification do not declare the
+        `X-Idempotency-Key` header, so by default only GET requests are retried, and mutating
+        requests like `create_transfer` are never sent twice.
+
+        Returns:
+            FrozenSet[str]: The retried HTTP methods.
+
+        """
+        if self._idempotency_keys:
+            return frozenset({"GET"}) | MUTATING_METHODS
+        return frozenset({"GET"})
+
     def _get_retry_strategy(self, max_network_retries: int) -> Retry:
         """Return the retry strategy for the CDP API Client.
 
@@ -235,6 +533,20 @@ class CdpApiClient(ApiClient):
         return Retry(
             total=max_network_retries,  # Number of total retries
             status_forcelist=[500, 502, 503, 504],  # Retry on HTTP status code 500
-            allowed_methods=["GET"],  # Retry only on GET requests
+            allowed_methods=self.retry_methods,  # Retry GET, and mutating requests with a key
             backoff_factor=1,  # Exponential backoff factor
         )
+
+
+def _urllib3_retries(response: rest.RESTResponse) -> int:
+    """Return the number of retries urllib3 made before receiving a response.
+
+    Args:
+        response (RESTResponse): The response.
+
+    Returns:
+        int: The number of retries, recorded in the retry history of the response.
+
+    """
+    retries = getattr(response.response, "retries", None)
+    return len(retries.history) if retries is not None else 0
@@ -0,0 +1,457 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import itertools
+from collections.abc import Iterator, Sequence
+from typing import Any, Union
+
+from cdp.api_clients import ApiClients
+from cdp.async_api_clients import AsyncApiClients
+from cdp.async_cdp_api_client import AsyncCdpApiClient
+from cdp.cdp_api_client import CdpApiClient
+
+DEFAULT_BASE_PATH = "https://api.cdp.coinbase.com/platform"
+
+_active_client: contextvars.ContextVar[Union["CdpClient", "CdpClientPool", None]] = (
+    contextvars.ContextVar("cdp_active_client", default=None)
+)
+_active_async_client: contextvars.ContextVar[Union["AsyncCdpClient", "CdpClientPool", None]] = (
+    contextvars.ContextVar("cdp_active_async_client", default=None)
+)
+
+
+def active_client() -> Union["CdpClient", "CdpClientPool", None]:
+    """Return the client that `Cdp` API calls in the current thread or task are routed to.
+
+    Returns:
+        Optional[Union[CdpClient, CdpClientPool]]: The client or pool in use, or None if calls go
+        to the client configured with `Cdp.configure`.
+
+    """
+    return _active_client.get()
+
+
+def active_async_client() -> Union["AsyncCdpClient", "CdpClientPool", None]:
+    """Return the client that `AsyncCdp` API calls in the current task are routed to.
+
+    Returns:
+        Optional[Union[AsyncCdpClient, CdpClientPool]]: The client or pool in use, or None if
+        calls go to the client configured with `AsyncCdp.configure`.
+
+    """
+    return _active_async_client.get()
+
+
+class _ClientScope:
+    """Routes the API calls of resources made within a block to a client."""
+
+    _context_var: contextvars.ContextVar
+
+    @contextlib.contextmanager
+    def use(self) -> Iterator[Any]:
+        """Route the API calls of the resources used within a block to this client.
+
+        The client is held in a context variable, so it applies to the current thread or asyncio
+        task only, and to the page prefetches and status polls started from it. Blocks can be
+        nested, the innermost one wins.
+
+        Yields:
+            The client itself.
+
+        Examples:
+            >>> with tenant_client.use():
+            ...     wallet = Wallet.create()
+            ...     transfer = wallet.transfer(0.001, "eth", destination).wait()
+
+        """
+        token = self._context_var.set(self)
+        try:
+            yield self
+        finally:
+            self._context_var.reset(token)
+
+
+class ClientBound:
+    """Base class of resources that keep using the client they were created with.
+
+    A resource created within a `use()` block is bound to that client, or pool, and the public
+    methods and properties of its class run with the client in use, so that its API calls, its
+    signer mode and the key that encrypts its seed follow the resource out of the block. Resources
+    created outside of any block are not bound, and use the client in use wherever they are used.
+    Methods that return lazy iterators only bind the calls made before they return.
+    """
+
+    _bound_client: Union["CdpClient", "CdpClientPool", None] = None
+    _bound_async_client: Union["AsyncCdpClient", "CdpClientPool", None] = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "ClientBound":
+        """Create the resource, bound to the clients in use."""
+        resource = super().__new__(cls)
+        resource._bound_client = _active_client.get()
+        resource._bound_async_client = _active_async_client.get()
+        return resource
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Make the public methods and properties of the subclass run with its bound client."""
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name.startswith("_"):
+                continue
+            if isinstance(value, property):
+                setattr(
+                    cls,
+                    name,
+                    property(
+                        _bound(value.fget) if value.fget else None,
+                        _bound(value.fset) if value.fset else None,
+                        _bound(value.fdel) if value.fdel else None,
+                        value.__doc__,
+                    ),
+                )
+            elif inspect.isfunction(value) and not (
+                inspect.isgeneratorfunction(value) or inspect.isasyncgenfunction(value)
+            ):
+                setattr(cls, name, _bound(value))
+
+    @property
+    def bound_client(self) -> Union["CdpClient", "AsyncCdpClient", "CdpClientPool", None]:
+        """The client the resource was created with.
+
+        Returns:
+            Optional[Union[CdpClient, AsyncCdpClient, CdpClientPool]]: The client or pool, or None
+            if the resource was created outside of a `use()` block.
+
+        """
+        return self._bound_client or self._bound_async_client
+
+
+@contextlib.contextmanager
+def _resource_scope(resource: ClientBound) -> Iterator[None]:
+    """Use the clients a resource is bound to for a block."""
+    tokens = []
+    if resource._bound_client is not None:
+        tokens.append((_active_client, _active_client.set(resource._bound_client)))
+    if resource._bound_async_client is not None:
+        tokens.append(
+            (_active_async_client, _active_async_client.set(resource._bound_async_client))
+        )
+    try:
+        yield
+    finally:
+        for context_var, token in reversed(tokens):
+            context_var.reset(token)
+
+
+def _bound(function: Any) -> Any:
+    """Wrap a method of a ClientBound subclass to run with the bound client of its resource."""
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(self, *args, **kwargs):
+            if self._bound_client is None and self._bound_async_client is None:
+                return await function(self, *args, **kwargs)
+            with _resource_scope(self):
+                return await function(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if self._bound_client is None and self._bound_async_client is None:
+            return function(self, *args, **kwargs)
+        with _resource_scope(self):
+            return function(self, *args, **kwargs)
+
+    return wrapper
+
+
+class CdpClient(_ClientScope):
+    """A connection to the CDP API with its own API key and client options.
+
+    Resources like `Wallet` and `Transfer` call the API through `Cdp.api_clients`, which routes
+    each call to the client in use in the current thread or task, and to the client configured
+    with `Cdp.configure` otherwise. Create a client per API key to run tenants side by side in one
+    process, and use one for a block with `use()`. Resources created within the block stay bound
+    to the client, and sign with the server signer if the client was created with
+    `use_server_signer`.
+    """
+
+    _context_var = _active_client
+
+    def __init__(
+        self,
+        api_key_name: str,
+        private_key: str,
+        base_path: str = DEFAULT_BASE_PATH,
+        warm_up_connections: int = 0,
+        use_server_signer: bool = False,
+        **client_options: Any,
+    ) -> None:
+        """Initialize the CdpClient.
+
+        Args:
+            api_key_name (str): The API key name.
+            private_key (str): The private key associated with the API key.
+            base_path (str): The base URL for the CDP API. Defaults to "https://api.cdp.coinbase.com/platform".
+            warm_up_connections (int): The number of connections to open to the API up front. Defaults to 0.
+            use_server_signer (bool): Whether resources of the client sign with the server signer. Defaults to False.
+            **client_options: The options of `CdpApiClient`, e.g. `rate_limit` or `max_network_retries`.
+
+        """
+        cdp_client = CdpApiClient(api_key_name, private_key, host=base_path, **client_options)
+        if warm_up_connections:
+            cdp_client.warm_up(warm_up_connections)
+
+        self._api_key_name = api_key_name
+        self._private_key = private_key
+        self._use_server_signer = use_server_signer
+        self._api_clients = ApiClients(cdp_client)
+
+    @property
+    def api_key_name(self) -> str:
+        """The API key name of the client.
+
+        Returns:
+            str: The API key name.
+
+        """
+        return self._api_key_name
+
+    @property
+    def private_key(self) -> str:
+        """The private key of the API key, from which the encryption key of saved seeds is derived.
+
+        Returns:
+            str: The private key.
+
+        """
+        return self._private_key
+
+    @property
+    def use_server_signer(self) -> bool:
+        """Whether resources of the client sign with the server signer.
+
+        Returns:
+            bool: Whether the server signer is used.
+
+        """
+        return self._use_server_signer
+
+    @property
+    def api_clients(self) -> ApiClients:
+        """The Platform API clients of the client.
+
+        Returns:
+            ApiClients: The API clients.
+
+        """
+        return self._api_clients
+
+    @property
+    def cdp_client(self) -> CdpApiClient:
+        """The CDP API client that signs and sends the requests of the client.
+
+        Returns:
+            CdpApiClient: The CDP API client.
+
+        """
+        return self._api_clients.cdp_client
+
+    def __repr__(self) -> str:
+        """Return a string representation of the client."""
+        return f"CdpClient(api_key_name={self._api_key_name!r})"
+
+
+class AsyncCdpClient(_ClientScope):
+    """The asyncio counterpart of `CdpClient`, used by `AsyncCdp.api_clients`."""
+
+    _context_var = _active_async_client
+
+    def __init__(
+        self,
+        api_key_name: str,
+        private_key: str,
+        base_path: str = DEFAULT_BASE_PATH,
+        use_server_signer: bool = False,
+        **client_options: Any,
+    ) -> None:
+        """Initialize the AsyncCdpClient.
+
+        Args:
+            api_key_name (str): The API key name.
+            private_key (str): The private key associated with the API key.
+            base_path (str): The base URL for the CDP API. Defaults to "https://api.cdp.coinbase.com/platform".
+            use_server_signer (bool): Whether resources of the client sign with the server signer. Defaults to False.
+            **client_options: The options of `AsyncCdpApiClient`, e.g. `rate_limit` or `connection_pool_maxsize`.
+
+        """
+        self._api_key_name = api_key_name
+        self._private_key = private_key
+        self._use_server_signer = use_server_signer
+        self._api_clients = AsyncApiClients(
+            AsyncCdpApiClient(api_key_name, private_key, host=base_path, **client_options)
+        )
+
+    @property
+    def api_key_name(self) -> str:
+        """The API key name of the client.
+
+        Returns:
+            str: The API key name.
+
+        """
+        return self._api_key_name
+
+    @property
+    def private_key(self) -> str:
+        """The private key of the API key, from which the encryption key of saved seeds is derived.
+
+        Returns:
+            str: The private key.
+
+        """
+        return self._private_key
+
+    @property
+    def use_server_signer(self) -> bool:
+        """Whether resources of the client sign with the server signer.
+
+        Returns:
+            bool: Whether the server signer is used.
+
+        """
+        return self._use_server_signer
+
+    @property
+    def api_clients(self) -> AsyncApiClients:
+        """The awaitable Platform API clients of the client.
+
+        Returns:
+            AsyncApiClients: The API clients.
+
+        """
+        return self._api_clients
+
+    @property
+    def cdp_client(self) -> AsyncCdpApiClient:
+        """The async CDP API client that signs and sends the requests of the client.
+
+        Returns:
+            AsyncCdpApiClient: The async CDP API client.
+
+        """
+        return self._api_clients.cdp_client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session of the client.
+
+        Returns:
+            None
+
+        """
+        await self.cdp_client.close()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the client."""
+        return f"AsyncCdpClient(api_key_name={self._api_key_name!r})"
+
+
+class CdpClientPool(_ClientScope):
+    """Spreads API calls across the clients of several API keys of the same project.
+
+    Each API call made through the pool goes to the next client in turn, so the load, and the
+    rate limit of each key, is shared evenly. Use the pool for a block with `use()`, like a single
+    client. All keys must have access to the same resources, e.g. belong to the same project.
+    Seeds saved with encryption within the pool are encrypted with the key of its first client.
+
+    Example:
+        >>> pool = CdpClientPool([CdpClient(name, key, rate_limit=10) for name, key in keys])
+        >>> with pool.use():
+        ...     balances = [address.balances() for address in addresses]
+
+    """
+
+    def __init__(self, clients: Sequence[CdpClient] | Sequence[AsyncCdpClient]) -> None:
+        """Initialize the CdpClientPool.
+
+        Args:
+            clients (Union[Sequence[CdpClient], Sequence[AsyncCdpClient]]): The clients to spread
+                calls across, either all sync or all async.
+
+        Raises:
+            ValueError: If there are no clients, sync and async clients are mixed, or only some
+                clients use the server signer.
+
+        """
+        if not clients:
+            raise ValueError("clients must not be empty")
+        kinds = {type(client) for client in clients}
+        if len(kinds) > 1:
+            raise ValueError("clients must all be CdpClient or all be AsyncCdpClient instances")
+        if len({client.use_server_signer for client in clients}) > 1:
+            raise ValueError("clients must all use the server signer or all sign locally")
+
+        self._clients = tuple(clients)
+        self._context_var = clients[0]._context_var
+        self._turn = itertools.count()
+
+    @property
+    def clients(self) -> tuple[CdpClient | AsyncCdpClient, ...]:
+        """The clients of the pool.
+
+        Returns:
+            Tuple[Union[CdpClient, AsyncCdpClient], ...]: The clients.
+
+        """
+        return self._clients
+
+    @property
+    def private_key(self) -> str:
+        """The private key of the first client, from which the encryption key of saved seeds is derived.
+
+        Returns:
+            str: The private key.
+
+        """
+        return self._clients[0].private_key
+
+    @property
+    def use_server_signer(self) -> bool:
+        """Whether resources of the pool sign with the server signer.
+
+        Returns:
+            bool: Whether the server signer is used.
+
+        """
+        return self._clients[0].use_server_signer
+
+    def next_client(self) -> CdpClient | AsyncCdpClient:
+        """Return the client that the next API call goes to.
+
+        Returns:
+            Union[CdpClient, AsyncCdpClient]: The client whose turn it is.
+
+        """
+        return self._clients[next(self._turn) % len(self._clients)]
+
+    @property
+    def api_clients(self) -> ApiClients | AsyncApiClients:
+        """The API clients of the client whose turn it is.
+
+        Every access moves on to the next client, and every API call through `Cdp.api_clients`
+        accesses it once.
+
+        Returns:
+            Union[ApiClients, AsyncApiClients]: The API clients.
+
+        """
+        return self.next_client().api_clients
+
+    def __len__(self) -> int:
+        """Return the number of clients in the pool."""
+        return len(self._clients)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pool."""
+        return f"CdpClientPool(clients={list(self._clients)!r})"
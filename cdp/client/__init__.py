@@ -16,169 +16,353 @@
 
 __version__ = "1.0.0"
 
-# import apis into sdk package
-from cdp.client.api.addresses_api import AddressesApi
-from cdp.client.api.assets_api import AssetsApi
-from cdp.client.api.balance_history_api import BalanceHistoryApi
-from cdp.client.api.contract_events_api import ContractEventsApi
-from cdp.client.api.contract_invocations_api import ContractInvocationsApi
-from cdp.client.api.external_addresses_api import ExternalAddressesApi
-from cdp.client.api.fund_api import FundApi
-from cdp.client.api.mpc_wallet_stake_api import MPCWalletStakeApi
-from cdp.client.api.networks_api import NetworksApi
-from cdp.client.api.onchain_identity_api import OnchainIdentityApi
-from cdp.client.api.reputation_api import ReputationApi
-from cdp.client.api.server_signers_api import ServerSignersApi
-from cdp.client.api.smart_contracts_api import SmartContractsApi
-from cdp.client.api.smart_wallets_api import SmartWalletsApi
-from cdp.client.api.stake_api import StakeApi
-from cdp.client.api.trades_api import TradesApi
-from cdp.client.api.transaction_history_api import TransactionHistoryApi
-from cdp.client.api.transfers_api import TransfersApi
-from cdp.client.api.users_api import UsersApi
-from cdp.client.api.wallets_api import WalletsApi
-from cdp.client.api.webhooks_api import WebhooksApi
-
-# import ApiClient
-from cdp.client.api_response import ApiResponse
-from cdp.client.api_client import ApiClient
-from cdp.client.configuration import Configuration
-from cdp.client.exceptions import OpenApiException
-from cdp.client.exceptions import ApiTypeError
-from cdp.client.exceptions import ApiValueError
-from cdp.client.exceptions import ApiKeyError
-from cdp.client.exceptions import ApiAttributeError
-from cdp.client.exceptions import ApiException
-
-# import models into sdk package
-from cdp.client.models.address import Address
-from cdp.client.models.address_balance_list import AddressBalanceList
-from cdp.client.models.address_historical_balance_list import AddressHistoricalBalanceList
-from cdp.client.models.address_list import AddressList
-from cdp.client.models.address_reputation import AddressReputation
-from cdp.client.models.address_reputation_metadata import AddressReputationMetadata
-from cdp.client.models.address_transaction_list import AddressTransactionList
-from cdp.client.models.asset import Asset
-from cdp.client.models.balance import Balance
-from cdp.client.models.broadcast_contract_invocation_request import BroadcastContractInvocationRequest
-from cdp.client.models.broadcast_external_transaction200_response import BroadcastExternalTransaction200Response
-from cdp.client.models.broadcast_external_transaction_request import BroadcastExternalTransactionRequest
-from cdp.client.models.broadcast_external_transfer_request import BroadcastExternalTransferRequest
-from cdp.client.models.broadcast_staking_operation_request import BroadcastStakingOperationRequest
-from cdp.client.models.broadcast_trade_request import BroadcastTradeRequest
-from cdp.client.models.broadcast_transfer_request import BroadcastTransferRequest
-from cdp.client.models.broadcast_user_operation_request import BroadcastUserOperationRequest
-from cdp.client.models.build_staking_operation_request import BuildStakingOperationRequest
-from cdp.client.models.call import Call
-from cdp.client.models.compile_smart_contract_request import CompileSmartContractRequest
-from cdp.client.models.compiled_smart_contract import CompiledSmartContract
-from cdp.client.models.contract_event import ContractEvent
-from cdp.client.models.contract_event_list import ContractEventList
-from cdp.client.models.contract_invocation import ContractInvocation
-from cdp.client.models.contract_invocation_list import ContractInvocationList
-from cdp.client.models.create_address_request import CreateAddressRequest
-from cdp.client.models.create_contract_invocation_request import CreateContractInvocationRequest
-from cdp.client.models.create_external_transfer_request import CreateExternalTransferRequest
-from cdp.client.models.create_fund_operation_request import CreateFundOperationRequest
-from cdp.client.models.create_fund_quote_request import CreateFundQuoteRequest
-from cdp.client.models.create_payload_signature_request import CreatePayloadSignatureRequest
-from cdp.client.models.create_server_signer_request import CreateServerSignerRequest
-from cdp.client.models.create_smart_contract_request import CreateSmartContractRequest
-from cdp.client.models.create_smart_wallet_request import CreateSmartWalletRequest
-from cdp.client.models.create_staking_operation_request import CreateStakingOperationRequest
-from cdp.client.models.create_trade_request import CreateTradeRequest
-from cdp.client.models.create_transfer_request import CreateTransferRequest
-from cdp.client.models.create_user_operation_request import CreateUserOperationRequest
-from cdp.client.models.create_wallet_request import CreateWalletRequest
-from cdp.client.models.create_wallet_request_wallet import CreateWalletRequestWallet
-from cdp.client.models.create_wallet_webhook_request import CreateWalletWebhookRequest
-from cdp.client.models.create_webhook_request import CreateWebhookRequest
-from cdp.client.models.crypto_amount import CryptoAmount
-from cdp.client.models.deploy_smart_contract_request import DeploySmartContractRequest
-from cdp.client.models.erc20_transfer_event import ERC20TransferEvent
-from cdp.client.models.erc721_transfer_event import ERC721TransferEvent
-from cdp.client.models.error import Error
-from cdp.client.models.ethereum_token_transfer import EthereumTokenTransfer
-from cdp.client.models.ethereum_transaction import EthereumTransaction
-from cdp.client.models.ethereum_transaction_access import EthereumTransactionAccess
-from cdp.client.models.ethereum_transaction_access_list import EthereumTransactionAccessList
-from cdp.client.models.ethereum_transaction_flattened_trace import EthereumTransactionFlattenedTrace
-from cdp.client.models.ethereum_validator_metadata import EthereumValidatorMetadata
-from cdp.client.models.faucet_transaction import FaucetTransaction
-from cdp.client.models.feature_set import FeatureSet
-from cdp.client.models.fetch_historical_staking_balances200_response import FetchHistoricalStakingBalances200Response
-from cdp.client.models.fetch_staking_rewards200_response import FetchStakingRewards200Response
-from cdp.client.models.fetch_staking_rewards_request import FetchStakingRewardsRequest
-from cdp.client.models.fiat_amount import FiatAmount
-from cdp.client.models.fund_operation import FundOperation
-from cdp.client.models.fund_operation_fees import FundOperationFees
-from cdp.client.models.fund_operation_list import FundOperationList
-from cdp.client.models.fund_quote import FundQuote
-from cdp.client.models.get_staking_context_request import GetStakingContextRequest
-from cdp.client.models.historical_balance import HistoricalBalance
-from cdp.client.models.multi_token_contract_options import MultiTokenContractOptions
-from cdp.client.models.nft_contract_options import NFTContractOptions
-from cdp.client.models.network import Network
-from cdp.client.models.network_identifier import NetworkIdentifier
-from cdp.client.models.onchain_name import OnchainName
-from cdp.client.models.onchain_name_list import OnchainNameList
-from cdp.client.models.payload_signature import PayloadSignature
-from cdp.client.models.payload_signature_list import PayloadSignatureList
-from cdp.client.models.read_contract_request import ReadContractRequest
-from cdp.client.models.register_smart_contract_request import RegisterSmartContractRequest
-from cdp.client.models.seed_creation_event import SeedCreationEvent
-from cdp.client.models.seed_creation_event_result import SeedCreationEventResult
-from cdp.client.models.server_signer import ServerSigner
-from cdp.client.models.server_signer_event import ServerSignerEvent
-from cdp.client.models.server_signer_event_event import ServerSignerEventEvent
-from cdp.client.models.server_signer_event_list import ServerSignerEventList
-from cdp.client.models.server_signer_list import ServerSignerList
-from cdp.client.models.signature_creation_event import SignatureCreationEvent
-from cdp.client.models.signature_creation_event_result import SignatureCreationEventResult
-from cdp.client.models.signed_voluntary_exit_message_metadata import SignedVoluntaryExitMessageMetadata
-from cdp.client.models.smart_contract import SmartContract
-from cdp.client.models.smart_contract_activity_event import SmartContractActivityEvent
-from cdp.client.models.smart_contract_list import SmartContractList
-from cdp.client.models.smart_contract_options import SmartContractOptions
-from cdp.client.models.smart_contract_type import SmartContractType
-from cdp.client.models.smart_wallet import SmartWallet
-from cdp.client.models.smart_wallet_list import SmartWalletList
-from cdp.client.models.solidity_value import SolidityValue
-from cdp.client.models.sponsored_send import SponsoredSend
-from cdp.client.models.staking_balance import StakingBalance
-from cdp.client.models.staking_context import StakingContext
-from cdp.client.models.staking_context_context import StakingContextContext
-from cdp.client.models.staking_operation import StakingOperation
-from cdp.client.models.staking_operation_metadata import StakingOperationMetadata
-from cdp.client.models.staking_reward import StakingReward
-from cdp.client.models.staking_reward_format import StakingRewardFormat
-from cdp.client.models.staking_reward_usd_value import StakingRewardUSDValue
-from cdp.client.models.token_contract_options import TokenContractOptions
-from cdp.client.models.token_transfer_type import TokenTransferType
-from cdp.client.models.trade import Trade
-from cdp.client.models.trade_list import TradeList
-from cdp.client.models.transaction import Transaction
-from cdp.client.models.transaction_content import TransactionContent
-from cdp.client.models.transaction_log import TransactionLog
-from cdp.client.models.transaction_receipt import TransactionReceipt
-from cdp.client.models.transaction_type import TransactionType
-from cdp.client.models.transfer import Transfer
-from cdp.client.models.transfer_list import TransferList
-from cdp.client.models.update_smart_contract_request import UpdateSmartContractRequest
-from cdp.client.models.update_webhook_request import UpdateWebhookRequest
-from cdp.client.models.user import User
-from cdp.client.models.user_operation import UserOperation
-from cdp.client.models.validator import Validator
-from cdp.client.models.validator_details import ValidatorDetails
-from cdp.client.models.validator_list import ValidatorList
-from cdp.client.models.validator_status import ValidatorStatus
-from cdp.client.models.wallet import Wallet
-from cdp.client.models.wallet_list import WalletList
-from cdp.client.models.webhook import Webhook
-from cdp.client.models.webhook_event_filter import WebhookEventFilter
-from cdp.client.models.webhook_event_type import WebhookEventType
-from cdp.client.models.webhook_event_type_filter import WebhookEventTypeFilter
-from cdp.client.models.webhook_list import WebhookList
-from cdp.client.models.webhook_smart_contract_event_filter import WebhookSmartContractEventFilter
-from cdp.client.models.webhook_status import WebhookStatus
-from cdp.client.models.webhook_wallet_activity_filter import WebhookWalletActivityFilter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Names are imported on first access so that importing the package does not load every
+# module of the generated client.
+_LAZY_IMPORTS = {
+    "AddressesApi": "cdp.client.api.addresses_api",
+    "AssetsApi": "cdp.client.api.assets_api",
+    "BalanceHistoryApi": "cdp.client.api.balance_history_api",
+    "ContractEventsApi": "cdp.client.api.contract_events_api",
+    "ContractInvocationsApi": "cdp.client.api.contract_invocations_api",
+    "ExternalAddressesApi": "cdp.client.api.external_addresses_api",
+    "FundApi": "cdp.client.api.fund_api",
+    "MPCWalletStakeApi": "cdp.client.api.mpc_wallet_stake_api",
+    "NetworksApi": "cdp.client.api.networks_api",
+    "OnchainIdentityApi": "cdp.client.api.onchain_identity_api",
+    "ReputationApi": "cdp.client.api.reputation_api",
+    "ServerSignersApi": "cdp.client.api.server_signers_api",
+    "SmartContractsApi": "cdp.client.api.smart_contracts_api",
+    "SmartWalletsApi": "cdp.client.api.smart_wallets_api",
+    "StakeApi": "cdp.client.api.stake_api",
+    "TradesApi": "cdp.client.api.trades_api",
+    "TransactionHistoryApi": "cdp.client.api.transaction_history_api",
+    "TransfersApi": "cdp.client.api.transfers_api",
+    "UsersApi": "cdp.client.api.users_api",
+    "WalletsApi": "cdp.client.api.wallets_api",
+    "WebhooksApi": "cdp.client.api.webhooks_api",
+    "ApiResponse": "cdp.client.api_response",
+    "ApiClient": "cdp.client.api_client",
+    "Configuration": "cdp.client.configuration",
+    "OpenApiException": "cdp.client.exceptions",
+    "ApiTypeError": "cdp.client.exceptions",
+    "ApiValueError": "cdp.client.exceptions",
+    "ApiKeyError": "cdp.client.exceptions",
+    "ApiAttributeError": "cdp.client.exceptions",
+    "ApiException": "cdp.client.exceptions",
+    "Address": "cdp.client.models.address",
+    "AddressBalanceList": "cdp.client.models.address_balance_list",
+    "AddressHistoricalBalanceList": "cdp.client.models.address_historical_balance_list",
+    "AddressList": "cdp.client.models.address_list",
+    "AddressReputation": "cdp.client.models.address_reputation",
+    "AddressReputationMetadata": "cdp.client.models.address_reputation_metadata",
+    "AddressTransactionList": "cdp.client.models.address_transaction_list",
+    "Asset": "cdp.client.models.asset",
+    "Balance": "cdp.client.models.balance",
+    "BroadcastContractInvocationRequest": "cdp.client.models.broadcast_contract_invocation_request",
+    "BroadcastExternalTransaction200Response": "cdp.client.models.broadcast_external_transaction200_response",
+    "BroadcastExternalTransactionRequest": "cdp.client.models.broadcast_external_transaction_request",
+    "BroadcastExternalTransferRequest": "cdp.client.models.broadcast_external_transfer_request",
+    "BroadcastStakingOperationRequest": "cdp.client.models.broadcast_staking_operation_request",
+    "BroadcastTradeRequest": "cdp.client.models.broadcast_trade_request",
+    "BroadcastTransferRequest": "cdp.client.models.broadcast_transfer_request",
+    "BroadcastUserOperationRequest": "cdp.client.models.broadcast_user_operation_request",
+    "BuildStakingOperationRequest": "cdp.client.models.build_staking_operation_request",
+    "Call": "cdp.client.models.call",
+    "CompileSmartContractRequest": "cdp.client.models.compile_smart_contract_request",
+    "CompiledSmartContract": "cdp.client.models.compiled_smart_contract",
+    "ContractEvent": "cdp.client.models.contract_event",
+    "ContractEventList": "cdp.client.models.contract_event_list",
+    "ContractInvocation": "cdp.client.models.contract_invocation",
+    "ContractInvocationList": "cdp.client.models.contract_invocation_list",
+    "CreateAddressRequest": "cdp.client.models.create_address_request",
+    "CreateContractInvocationRequest": "cdp.client.models.create_contract_invocation_request",
+    "CreateExternalTransferRequest": "cdp.client.models.create_external_transfer_request",
+    "CreateFundOperationRequest": "cdp.client.models.create_fund_operation_request",
+    "CreateFundQuoteRequest": "cdp.client.models.create_fund_quote_request",
+    "CreatePayloadSignatureRequest": "cdp.client.models.create_payload_signature_request",
+    "CreateServerSignerRequest": "cdp.client.models.create_server_signer_request",
+    "CreateSmartContractRequest": "cdp.client.models.create_smart_contract_request",
+    "CreateSmartWalletRequest": "cdp.client.models.create_smart_wallet_request",
+    "CreateStakingOperationRequest": "cdp.client.models.create_staking_operation_request",
+    "CreateTradeRequest": "cdp.client.models.create_trade_request",
+    "CreateTransferRequest": "cdp.client.models.create_transfer_request",
+    "CreateUserOperationRequest": "cdp.client.models.create_user_operation_request",
+    "CreateWalletRequest": "cdp.client.models.create_wallet_request",
+    "CreateWalletRequestWallet": "cdp.client.models.create_wallet_request_wallet",
+    "CreateWalletWebhookRequest": "cdp.client.models.create_wallet_webhook_request",
+    "CreateWebhookRequest": "cdp.client.models.create_webhook_request",
+    "CryptoAmount": "cdp.client.models.crypto_amount",
+    "DeploySmartContractRequest": "cdp.client.models.deploy_smart_contract_request",
+    "ERC20TransferEvent": "cdp.client.models.erc20_transfer_event",
+    "ERC721TransferEvent": "cdp.client.models.erc721_transfer_event",
+    "Error": "cdp.client.models.error",
+    "EthereumTokenTransfer": "cdp.client.models.ethereum_token_transfer",
+    "EthereumTransaction": "cdp.client.models.ethereum_transaction",
+    "EthereumTransactionAccess": "cdp.client.models.ethereum_transaction_access",
+    "EthereumTransactionAccessList": "cdp.client.models.ethereum_transaction_access_list",
+    "EthereumTransactionFlattenedTrace": "cdp.client.models.ethereum_transaction_flattened_trace",
+    "EthereumValidatorMetadata": "cdp.client.models.ethereum_validator_metadata",
+    "FaucetTransaction": "cdp.client.models.faucet_transaction",
+    "FeatureSet": "cdp.client.models.feature_set",
+    "FetchHistoricalStakingBalances200Response": "cdp.client.models.fetch_historical_staking_balances200_response",
+    "FetchStakingRewards200Response": "cdp.client.models.fetch_staking_rewards200_response",
+    "FetchStakingRewardsRequest": "cdp.client.models.fetch_staking_rewards_request",
+    "FiatAmount": "cdp.client.models.fiat_amount",
+    "FundOperation": "cdp.client.models.fund_operation",
+    "FundOperationFees": "cdp.client.models.fund_operation_fees",
+    "FundOperationList": "cdp.client.models.fund_operation_list",
+    "FundQuote": "cdp.client.models.fund_quote",
+    "GetStakingContextRequest": "cdp.client.models.get_staking_context_request",
+    "HistoricalBalance": "cdp.client.models.historical_balance",
+    "MultiTokenContractOptions": "cdp.client.models.multi_token_contract_options",
+    "NFTContractOptions": "cdp.client.models.nft_contract_options",
+    "Network": "cdp.client.models.network",
+    "NetworkIdentifier": "cdp.client.models.network_identifier",
+    "OnchainName": "cdp.client.models.onchain_name",
+    "OnchainNameList": "cdp.client.models.onchain_name_list",
+    "PayloadSignature": "cdp.client.models.payload_signature",
+    "PayloadSignatureList": "cdp.client.models.payload_signature_list",
+    "ReadContractRequest": "cdp.client.models.read_contract_request",
+    "RegisterSmartContractRequest": "cdp.client.models.register_smart_contract_request",
+    "SeedCreationEvent": "cdp.client.models.seed_creation_event",
+    "SeedCreationEventResult": "cdp.client.models.seed_creation_event_result",
+    "ServerSigner": "cdp.client.models.server_signer",
+    "ServerSignerEvent": "cdp.client.models.server_signer_event",
+    "ServerSignerEventEvent": "cdp.client.models.server_signer_event_event",
+    "ServerSignerEventList": "cdp.client.models.server_signer_event_list",
+    "ServerSignerList": "cdp.client.models.server_signer_list",
+    "SignatureCreationEvent": "cdp.client.models.signature_creation_event",
+    "SignatureCreationEventResult": "cdp.client.models.signature_creation_event_result",
+    "SignedVoluntaryExitMessageMetadata": "cdp.client.models.signed_voluntary_exit_message_metadata",
+    "SmartContract": "cdp.client.models.smart_contract",
+    "SmartContractActivityEvent": "cdp.client.models.smart_contract_activity_event",
+    "SmartContractList": "cdp.client.models.smart_contract_list",
+    "SmartContractOptions": "cdp.client.models.smart_contract_options",
+    "SmartContractType": "cdp.client.models.smart_contract_type",
+    "SmartWallet": "cdp.client.models.smart_wallet",
+    "SmartWalletList": "cdp.client.models.smart_wallet_list",
+    "SolidityValue": "cdp.client.models.solidity_value",
+    "SponsoredSend": "cdp.client.models.sponsored_send",
+    "StakingBalance": "cdp.client.models.staking_balance",
+    "StakingContext": "cdp.client.models.staking_context",
+    "StakingContextContext": "cdp.client.models.staking_context_context",
+    "StakingOperation": "cdp.client.models.staking_operation",
+    "StakingOperationMetadata": "cdp.client.models.staking_operation_metadata",
+    "StakingReward": "cdp.client.models.staking_reward",
+    "StakingRewardFormat": "cdp.client.models.staking_reward_format",
+    "StakingRewardUSDValue": "cdp.client.models.staking_reward_usd_value",
+    "TokenContractOptions": "cdp.client.models.token_contract_options",
+    "TokenTransferType": "cdp.client.models.token_transfer_type",
+    "Trade": "cdp.client.models.trade",
+    "TradeList": "cdp.client.models.trade_list",
+    "Transaction": "cdp.client.models.transaction",
+    "TransactionContent": "cdp.client.models.transaction_content",
+    "TransactionLog": "cdp.client.models.transaction_log",
+    "TransactionReceipt": "cdp.client.models.transaction_receipt",
+    "TransactionType": "cdp.client.models.transaction_type",
+    "Transfer": "cdp.client.models.transfer",
+    "TransferList": "cdp.client.models.transfer_list",
+    "UpdateSmartContractRequest": "cdp.client.models.update_smart_contract_request",
+    "UpdateWebhookRequest": "cdp.client.models.update_webhook_request",
+    "User": "cdp.client.models.user",
+    "UserOperation": "cdp.client.models.user_operation",
+    "Validator": "cdp.client.models.validator",
+    "ValidatorDetails": "cdp.client.models.validator_details",
+    "ValidatorList": "cdp.client.models.validator_list",
+    "ValidatorStatus": "cdp.client.models.validator_status",
+    "Wallet": "cdp.client.models.wallet",
+    "WalletList": "cdp.client.models.wallet_list",
+    "Webhook": "cdp.client.models.webhook",
+    "WebhookEventFilter": "cdp.client.models.webhook_event_filter",
+    "WebhookEventType": "cdp.client.models.webhook_event_type",
+    "WebhookEventTypeFilter": "cdp.client.models.webhook_event_type_filter",
+    "WebhookList": "cdp.client.models.webhook_list",
+    "WebhookSmartContractEventFilter": "cdp.client.models.webhook_smart_contract_event_filter",
+    "WebhookStatus": "cdp.client.models.webhook_status",
+    "WebhookWalletActivityFilter": "cdp.client.models.webhook_wallet_activity_filter",
+}
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from cdp.client.api.addresses_api import AddressesApi
+    from cdp.client.api.assets_api import AssetsApi
+    from cdp.client.api.balance_history_api import BalanceHistoryApi
+    from cdp.client.api.contract_events_api import ContractEventsApi
+    from cdp.client.api.contract_invocations_api import ContractInvocationsApi
+    from cdp.client.api.external_addresses_api import ExternalAddressesApi
+    from cdp.client.api.fund_api import FundApi
+    from cdp.client.api.mpc_wallet_stake_api import MPCWalletStakeApi
+    from cdp.client.api.networks_api import NetworksApi
+    from cdp.client.api.onchain_identity_api import OnchainIdentityApi
+    from cdp.client.api.reputation_api import ReputationApi
+    from cdp.client.api.server_signers_api import ServerSignersApi
+    from cdp.client.api.smart_contracts_api import SmartContractsApi
+    from cdp.client.api.smart_wallets_api import SmartWalletsApi
+    from cdp.client.api.stake_api import StakeApi
+    from cdp.client.api.trades_api import TradesApi
+    from cdp.client.api.transaction_history_api import TransactionHistoryApi
+    from cdp.client.api.transfers_api import TransfersApi
+    from cdp.client.api.users_api import UsersApi
+    from cdp.client.api.wallets_api import WalletsApi
+    from cdp.client.api.webhooks_api import WebhooksApi
+
+    # import ApiClient
+    from cdp.client.api_response import ApiResponse
+    from cdp.client.api_client import ApiClient
+    from cdp.client.configuration import Configuration
+    from cdp.client.exceptions import OpenApiException
+    from cdp.client.exceptions import ApiTypeError
+    from cdp.client.exceptions import ApiValueError
+    from cdp.client.exceptions import ApiKeyError
+    from cdp.client.exceptions import ApiAttributeError
+    from cdp.client.exceptions import ApiException
+
+    # import models into sdk package
+    from cdp.client.models.address import Address
+    from cdp.client.models.address_balance_list import AddressBalanceList
+    from cdp.client.models.address_historical_balance_list import AddressHistoricalBalanceList
+    from cdp.client.models.address_list import AddressList
+    from cdp.client.models.address_reputation import AddressReputation
+    from cdp.client.models.address_reputation_metadata import AddressReputationMetadata
+    from cdp.client.models.address_transaction_list import AddressTransactionList
+    from cdp.client.models.asset import Asset
+    from cdp.client.models.balance import Balance
+    from cdp.client.models.broadcast_contract_invocation_request import BroadcastContractInvocationRequest
+    from cdp.client.models.broadcast_external_transaction200_response import BroadcastExternalTransaction200Response
+    from cdp.client.models.broadcast_external_transaction_request import BroadcastExternalTransactionRequest
+    from cdp.client.models.broadcast_external_transfer_request import BroadcastExternalTransferRequest
+    from cdp.client.models.broadcast_staking_operation_request import BroadcastStakingOperationRequest
+    from cdp.client.models.broadcast_trade_request import BroadcastTradeRequest
+    from cdp.client.models.broadcast_transfer_request import BroadcastTransferRequest
+    from cdp.client.models.broadcast_user_operation_request import BroadcastUserOperationRequest
+    from cdp.client.models.build_staking_operation_request import BuildStakingOperationRequest
+    from cdp.client.models.call import Call
+    from cdp.client.models.compile_smart_contract_request import CompileSmartContractRequest
+    from cdp.client.models.compiled_smart_contract import CompiledSmartContract
+    from cdp.client.models.contract_event import ContractEvent
+    from cdp.client.models.contract_event_list import ContractEventList
+    from cdp.client.models.contract_invocation import ContractInvocation
+    from cdp.client.models.contract_invocation_list import ContractInvocationList
+    from cdp.client.models.create_address_request import CreateAddressRequest
+    from cdp.client.models.create_contract_invocation_request import CreateContractInvocationRequest
+    from cdp.client.models.create_external_transfer_request import CreateExternalTransferRequest
+    from cdp.client.models.create_fund_operation_request import CreateFundOperationRequest
+    from cdp.client.models.create_fund_quote_request import CreateFundQuoteRequest
+    from cdp.client.models.create_payload_signature_request import CreatePayloadSignatureRequest
+    from cdp.client.models.create_server_signer_request import CreateServerSignerRequest
+    from cdp.client.models.create_smart_contract_request import CreateSmartContractRequest
+    from cdp.client.models.create_smart_wallet_request import CreateSmartWalletRequest
+    from cdp.client.models.create_staking_operation_request import CreateStakingOperationRequest
+    from cdp.client.models.create_trade_request import CreateTradeRequest
+    from cdp.client.models.create_transfer_request import CreateTransferRequest
+    from cdp.client.models.create_user_operation_request import CreateUserOperationRequest
+    from cdp.client.models.create_wallet_request import CreateWalletRequest
+    from cdp.client.models.create_wallet_request_wallet import CreateWalletRequestWallet
+    from cdp.client.models.create_wallet_webhook_request import CreateWalletWebhookRequest
+    from cdp.client.models.create_webhook_request import CreateWebhookRequest
+    from cdp.client.models.crypto_amount import CryptoAmount
+    from cdp.client.models.deploy_smart_contract_request import DeploySmartContractRequest
+    from cdp.client.models.erc20_transfer_event import ERC20TransferEvent
+    from cdp.client.models.erc721_transfer_event import ERC721TransferEvent
+    from cdp.client.models.error import Error
+    from cdp.client.models.ethereum_token_transfer import EthereumTokenTransfer
+    from cdp.client.models.ethereum_transaction import EthereumTransaction
+    from cdp.client.models.ethereum_transaction_access import EthereumTransactionAccess
+    from cdp.client.models.ethereum_transaction_access_list import EthereumTransactionAccessList
+    from cdp.client.models.ethereum_transaction_flattened_trace import EthereumTransactionFlattenedTrace
+    from cdp.client.models.ethereum_validator_metadata import EthereumValidatorMetadata
+    from cdp.client.models.faucet_transaction import FaucetTransaction
+    from cdp.client.models.feature_set import FeatureSet
+    from cdp.client.models.fetch_historical_staking_balances200_response import FetchHistoricalStakingBalances200Response
+    from cdp.client.models.fetch_staking_rewards200_response import FetchStakingRewards200Response
+    from cdp.client.models.fetch_staking_rewards_request import FetchStakingRewardsRequest
+    from cdp.client.models.fiat_amount import FiatAmount
+    from cdp.client.models.fund_operation import FundOperation
+    from cdp.client.models.fund_operation_fees import FundOperationFees
+    from cdp.client.models.fund_operation_list import FundOperationList
+    from cdp.client.models.fund_quote import FundQuote
+    from cdp.client.models.get_staking_context_request import GetStakingContextRequest
+    from cdp.client.models.historical_balance import HistoricalBalance
+    from cdp.client.models.multi_token_contract_options import MultiTokenContractOptions
+    from cdp.client.models.nft_contract_options import NFTContractOptions
+    from cdp.client.models.network import Network
+    from cdp.client.models.network_identifier import NetworkIdentifier
+    from cdp.client.models.onchain_name import OnchainName
+    from cdp.client.models.onchain_name_list import OnchainNameList
+    from cdp.client.models.payload_signature import PayloadSignature
+    from cdp.client.models.payload_signature_list import PayloadSignatureList
+    from cdp.client.models.read_contract_request import ReadContractRequest
+    from cdp.client.models.register_smart_contract_request import RegisterSmartContractRequest
+    from cdp.client.models.seed_creation_event import SeedCreationEvent
+    from cdp.client.models.seed_creation_event_result import SeedCreationEventResult
+    from cdp.client.models.server_signer import ServerSigner
+    from cdp.client.models.server_signer_event import ServerSignerEvent
+    from cdp.client.models.server_signer_event_event import ServerSignerEventEvent
+    from cdp.client.models.server_signer_event_list import ServerSignerEventList
+    from cdp.client.models.server_signer_list import ServerSignerList
+    from cdp.client.models.signature_creation_event import SignatureCreationEvent
+    from cdp.client.models.signature_creation_event_result import SignatureCreationEventResult
+    from cdp.client.models.signed_voluntary_exit_message_metadata import SignedVoluntaryExitMessageMetadata
+    from cdp.client.models.smart_contract import SmartContract
+    from cdp.client.models.smart_contract_activity_event import SmartContractActivityEvent
+    from cdp.client.models.smart_contract_list import SmartContractList
+    from cdp.client.models.smart_contract_options import SmartContractOptions
+    from cdp.client.models.smart_contract_type import SmartContractType
+    from cdp.client.models.smart_wallet import SmartWallet
+    from cdp.client.models.smart_wallet_list import SmartWalletList
+    from cdp.client.models.solidity_value import SolidityValue
+    from cdp.client.models.sponsored_send import SponsoredSend
+    from cdp.client.models.staking_balance import StakingBalance
+    from cdp.client.models.staking_context import StakingContext
+    from cdp.client.models.staking_context_context import StakingContextContext
+    from cdp.client.models.staking_operation import StakingOperation
+    from cdp.client.models.staking_operation_metadata import StakingOperationMetadata
+    from cdp.client.models.staking_reward import StakingReward
+    from cdp.client.models.staking_reward_format import StakingRewardFormat
+    from cdp.client.models.staking_reward_usd_value import StakingRewardUSDValue
+    from cdp.client.models.token_contract_options import TokenContractOptions
+    from cdp.client.models.token_transfer_type import TokenTransferType
+    from cdp.client.models.trade import Trade
+    from cdp.client.models.trade_list import TradeList
+    from cdp.client.models.transaction import Transaction
+    from cdp.client.models.transaction_content import TransactionContent
+    from cdp.client.models.transaction_log import TransactionLog
+    from cdp.client.models.transaction_receipt import TransactionReceipt
+    from cdp.client.models.transaction_type import TransactionType
+    from cdp.client.models.transfer import Transfer
+    from cdp.client.models.transfer_list import TransferList
+    from cdp.client.models.update_smart_contract_request import UpdateSmartContractRequest
+    from cdp.client.models.update_webhook_request import UpdateWebhookRequest
+    from cdp.client.models.user import User
+    from cdp.client.models.user_operation import UserOperation
+    from cdp.client.models.validator import Validator
+    from cdp.client.models.validator_details import ValidatorDetails
+    from cdp.client.models.validator_list import ValidatorList
+    from cdp.client.models.validator_status import ValidatorStatus
+    from cdp.client.models.wallet import Wallet
+    from cdp.client.models.wallet_list import WalletList
+    from cdp.client.models.webhook import Webhook
+    from cdp.client.models.webhook_event_filter import WebhookEventFilter
+    from cdp.client.models.webhook_event_type import WebhookEventType
+    from cdp.client.models.webhook_event_type_filter import WebhookEventTypeFilter
+    from cdp.client.models.webhook_list import WebhookList
+    from cdp.client.models.webhook_smart_contract_event_filter import WebhookSmartContractEventFilter
+    from cdp.client.models.webhook_status import WebhookStatus
+    from cdp.client.models.webhook_wallet_activity_filter import WebhookWalletActivityFilter
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
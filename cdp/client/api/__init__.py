@@ -1,25 +1,68 @@
 # flake8: noqa
 
-# import apis into api package
-from cdp.client.api.addresses_api import AddressesApi
-from cdp.client.api.assets_api import AssetsApi
-from cdp.client.api.balance_history_api import BalanceHistoryApi
-from cdp.client.api.contract_events_api import ContractEventsApi
-from cdp.client.api.contract_invocations_api import ContractInvocationsApi
-from cdp.client.api.external_addresses_api import ExternalAddressesApi
-from cdp.client.api.fund_api import FundApi
-from cdp.client.api.mpc_wallet_stake_api import MPCWalletStakeApi
-from cdp.client.api.networks_api import NetworksApi
-from cdp.client.api.onchain_identity_api import OnchainIdentityApi
-from cdp.client.api.reputation_api import ReputationApi
-from cdp.client.api.server_signers_api import ServerSignersApi
-from cdp.client.api.smart_contracts_api import SmartContractsApi
-from cdp.client.api.smart_wallets_api import SmartWalletsApi
-from cdp.client.api.stake_api import StakeApi
-from cdp.client.api.trades_api import TradesApi
-from cdp.client.api.transaction_history_api import TransactionHistoryApi
-from cdp.client.api.transfers_api import TransfersApi
-from cdp.client.api.users_api import UsersApi
-from cdp.client.api.wallets_api import WalletsApi
-from cdp.client.api.webhooks_api import WebhooksApi
+import importlib
+from typing import TYPE_CHECKING, Any
 
+# Names are imported on first access so that importing the package does not load every
+# module of the generated client.
+_LAZY_IMPORTS = {
+    "AddressesApi": "cdp.client.api.addresses_api",
+    "AssetsApi": "cdp.client.api.assets_api",
+    "BalanceHistoryApi": "cdp.client.api.balance_history_api",
+    "ContractEventsApi": "cdp.client.api.contract_events_api",
+    "ContractInvocationsApi": "cdp.client.api.contract_invocations_api",
+    "ExternalAddressesApi": "cdp.client.api.external_addresses_api",
+    "FundApi": "cdp.client.api.fund_api",
+    "MPCWalletStakeApi": "cdp.client.api.mpc_wallet_stake_api",
+    "NetworksApi": "cdp.client.api.networks_api",
+    "OnchainIdentityApi": "cdp.client.api.onchain_identity_api",
+    "ReputationApi": "cdp.client.api.reputation_api",
+    "ServerSignersApi": "cdp.client.api.server_signers_api",
+    "SmartContractsApi": "cdp.client.api.smart_contracts_api",
+    "SmartWalletsApi": "cdp.client.api.smart_wallets_api",
+    "StakeApi": "cdp.client.api.stake_api",
+    "TradesApi": "cdp.client.api.trades_api",
+    "TransactionHistoryApi": "cdp.client.api.transaction_history_api",
+    "TransfersApi": "cdp.client.api.transfers_api",
+    "UsersApi": "cdp.client.api.users_api",
+    "WalletsApi": "cdp.client.api.wallets_api",
+    "WebhooksApi": "cdp.client.api.webhooks_api",
+}
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from cdp.client.api.addresses_api import AddressesApi
+    from cdp.client.api.assets_api import AssetsApi
+    from cdp.client.api.balance_history_api import BalanceHistoryApi
+    from cdp.client.api.contract_events_api import ContractEventsApi
+    from cdp.client.api.contract_invocations_api import ContractInvocationsApi
+    from cdp.client.api.external_addresses_api import ExternalAddressesApi
+    from cdp.client.api.fund_api import FundApi
+    from cdp.client.api.mpc_wallet_stake_api import MPCWalletStakeApi
+    from cdp.client.api.networks_api import NetworksApi
+    from cdp.client.api.onchain_identity_api import OnchainIdentityApi
+    from cdp.client.api.reputation_api import ReputationApi
+    from cdp.client.api.server_signers_api import ServerSignersApi
+    from cdp.client.api.smart_contracts_api import SmartContractsApi
+    from cdp.client.api.smart_wallets_api import SmartWalletsApi
+    from cdp.client.api.stake_api import StakeApi
+    from cdp.client.api.trades_api import TradesApi
+    from cdp.client.api.transaction_history_api import TransactionHistoryApi
+    from cdp.client.api.transfers_api import TransfersApi
+    from cdp.client.api.users_api import UsersApi
+    from cdp.client.api.wallets_api import WalletsApi
+    from cdp.client.api.webhooks_api import WebhooksApi
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
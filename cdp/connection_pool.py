@@ -0,0 +1,178 @@
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+import urllib3
+from urllib3.exceptions import HTTPError
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """A snapshot of the connections of an HTTP connection pool.
+
+    Attributes:
+        in_use (int): The number of connections currently checked out by requests.
+        idle (int): The number of open connections waiting in the pool.
+        created (int): The number of connections opened, each costing a TCP and TLS handshake.
+        discarded (int): The number of connections closed because the pool was already full
+            when they were returned.
+        expired (int): The number of idle connections closed because they were idle for longer
+            than the keep-alive timeout.
+
+    """
+
+    in_use: int = 0
+    idle: int = 0
+    created: int = 0
+    discarded: int = 0
+    expired: int = 0
+
+
+class _MonitoredPool:
+    """Mixin for urllib3 connection pools that reports connection lifecycle events."""
+
+    _monitor: "ConnectionPoolMonitor"
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._put_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+        self._monitor._pools.add(self)
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        self._monitor._checked_out(conn)
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        with self._put_lock:
+            discarded = conn is not None and self.pool is not None and self.pool.full()
+            self._monitor._checked_in(conn, discarded)
+            super()._put_conn(conn)
+
+
+class ConnectionPoolMonitor:
+    """Instruments the connection pools of a urllib3 pool manager.
+
+    The pool classes of the manager are replaced by subclasses that count connections as they are
+    opened, checked out, returned and discarded. With a keep-alive timeout, connections that sat
+    idle for longer are closed when they are checked out, so that they are reopened instead of
+    failing on a socket the server or a load balancer has silently dropped.
+    """
+
+    def __init__(self, pool_manager: urllib3.PoolManager, keepalive_timeout: float | None = None):
+        """Initialize the ConnectionPoolMonitor.
+
+        Args:
+            pool_manager (urllib3.PoolManager): The pool manager to instrument.
+            keepalive_timeout (Optional[float]): Seconds an idle connection is reused for, or None
+                to reuse it until the server closes it. Defaults to None.
+
+        Raises:
+            ValueError: If the keep-alive timeout is invalid.
+
+        """
+        if keepalive_timeout is not None and keepalive_timeout <= 0:
+            raise ValueError("keepalive_timeout must be positive")
+
+        self._pool_manager = pool_manager
+        self._keepalive_timeout = keepalive_timeout
+        self._pools: weakref.WeakSet = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._created = 0
+        self._discarded = 0
+        self._expired = 0
+
+        pool_manager.pool_classes_by_scheme = {
+            scheme: type(
+                f"Monitored{pool_class.__name__}", (_MonitoredPool, pool_class), {"_monitor": self}
+            )
+            for scheme, pool_class in pool_manager.pool_classes_by_scheme.items()
+        }
+        # Pools created before instrumentation would not be counted.
+        pool_manager.clear()
+
+    @property
+    def stats(self) -> ConnectionPoolStats:
+        """The connection counters of the pools.
+
+        Returns:
+            ConnectionPoolStats: A snapshot of the counters.
+
+        """
+        idle = 0
+        for pool in list(self._pools):
+            queue = pool.pool
+            if queue is not None:
+                with queue.mutex:
+                    idle += sum(1 for conn in queue.queue if conn is not None and conn.sock)
+
+        with self._lock:
+            return ConnectionPoolStats(
+                in_use=self._in_use,
+                idle=idle,
+                created=self._created,
+                discarded=self._discarded,
+                expired=self._expired,
+            )
+
+    def warm_up(self, url: str, connections: int) -> int:
+        """Open connections to a host ahead of the first requests.
+
+        Connections are opened one after another and returned to the pool idle, so that
+        concurrent requests do not all pay for a TLS handshake at once. At most the maximum size
+        of the pool is opened, and warming up stops at the first connection that fails.
+
+        Args:
+            url (str): A URL of the host, e.g. the API base path.
+            connections (int): The number of connections to open.
+
+        Returns:
+            int: The number of connections that were opened.
+
+        """
+        pool = self._pool_manager.connection_from_url(url)
+        connections = min(connections, pool.pool.maxsize if pool.pool is not None else 0)
+
+        checked_out = []
+        opened = 0
+        try:
+            for _ in range(connections):
+                conn = pool._get_conn(timeout=0)
+                checked_out.append(conn)
+                if conn.sock is None:
+                    conn.connect()
+                    opened += 1
+        except (OSError, HTTPError):
+            pass
+        finally:
+            for conn in checked_out:
+                pool._put_conn(conn)
+
+        return opened
+
+    def _checked_out(self, conn) -> None:
+        expired = False
+        released_at = getattr(conn, "_cdp_released_at", None)
+        if (
+            self._keepalive_timeout is not None
+            and released_at is not None
+            and conn.sock is not None
+            and time.monotonic() - released_at > self._keepalive_timeout
+        ):
+            conn.close()
+            expired = True
+
+        with self._lock:
+            self._in_use += 1
+            self._expired += int(expired)
+            self._created += int(conn.sock is None)
+
+    def _checked_in(self, conn, discarded: bool) -> None:
+        if conn is not None:
+            conn._cdp_released_at = time.monotonic()
+
+        with self._lock:
+            self._in_use = max(0, self._in_use - 1)
+            self._discarded += int(discarded)
@@ -2,3 +2,10 @@
 
 # SDK_DEFAULT_SOURCE (str): Denotes the default source for the Python SDK.
 SDK_DEFAULT_SOURCE = "sdk"
+
+# IDEMPOTENCY_KEY_HEADER (str): The request header carrying the idempotency key of a mutating
+# request. A server that honors it recognizes a retried request and returns the original result.
+IDEMPOTENCY_KEY_HEADER = "X-Idempotency-Key"
+
+# MUTATING_METHODS (frozenset): The HTTP methods that change state on the server.
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
@@ -2,22 +2,26 @@ import json
 import time
 from collections.abc import Iterator
 from decimal import Decimal
-from typing import Any
-
-from eth_account.signers.local import LocalAccount
+from typing import TYPE_CHECKING, Any
 
 from cdp.asset import Asset
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.broadcast_contract_invocation_request import (
     BroadcastContractInvocationRequest,
 )
 from cdp.client.models.contract_invocation import ContractInvocation as ContractInvocationModel
 from cdp.client.models.create_contract_invocation_request import CreateContractInvocationRequest
 from cdp.errors import TransactionNotSignedError
+from cdp.paginator import Paginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
 from cdp.transaction import Transaction
 
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+
 
-class ContractInvocation:
+class ContractInvocation(ClientBound):
     """A class representing a contract invocation."""
 
     def __init__(self, model: ContractInvocationModel) -> None:
@@ -162,7 +166,12 @@ class ContractInvocation:
         """
         return self.transaction.status if self.transaction else None
 
-    def sign(self, key: LocalAccount) -> "ContractInvocation":
+    @property
+    def terminal_state(self) -> bool:
+        """Check if the Contract Invocation is in a terminal state."""
+        return self.transaction.terminal_state
+
+    def sign(self, key: "LocalAccount") -> "ContractInvocation":
         """Sign the contract invocation transaction with the given key.
 
         Args:
@@ -175,6 +184,8 @@ class ContractInvocation:
             ValueError: If the key is not a LocalAccount.
 
         """
+        from eth_account.signers.local import LocalAccount
+
         if not isinstance(key, LocalAccount):
             raise ValueError("key must be a LocalAccount")
 
@@ -226,13 +237,19 @@ class ContractInvocation:
         return self
 
     def wait(
-        self, interval_seconds: float = 0.2, timeout_seconds: float = 20
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
     ) -> "ContractInvocation":
         """Wait until the contract invocation is signed or fails by polling the server.
 
         Args:
-            interval_seconds: The interval at which to poll the server.
+            interval_seconds: A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds: The maximum time to wait before timing out.
+            polling_policy: The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             ContractInvocation: The completed contract invocation.
@@ -241,14 +258,20 @@ class ContractInvocation:
             TimeoutError: If the invocation takes longer than the given timeout.
 
         """
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "contract_invocation"
+        )
         start_time = time.time()
         while not self.transaction.terminal_state:
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("Contract Invocation timed out")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
@@ -309,29 +332,27 @@ class ContractInvocation:
         return cls(model)
 
     @classmethod
-    def list(cls, wallet_id: str, address_id: str) -> Iterator["ContractInvocation"]:
+    def list(
+        cls, wallet_id: str, address_id: str, **pagination_options
+    ) -> Iterator["ContractInvocation"]:
         """List Contract Invocations.
 
         Args:
             wallet_id (str): The wallet ID.
             address_id (str): The address ID.
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
 
         Returns:
             Iterator[ContractInvocation]: An iterator of ContractInvocation objects.
 
         """
-        page = None
-        while True:
-            response = Cdp.api_clients.contract_invocations.list_contract_invocations(
-                wallet_id=wallet_id, address_id=address_id, limit=100, page=page
-            )
-            for contract_invocation in response.data:
-                yield cls(contract_invocation)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.contract_invocations.list_contract_invocations(
+                wallet_id=wallet_id, address_id=address_id, limit=limit, page=page
+            ),
+            cls,
+            **pagination_options,
+        )
 
     def _update_transaction(self, model: ContractInvocationModel) -> None:
         """Update the transaction with the new model."""
@@ -1,8 +1,13 @@
-from typing import Any
+from typing import Any, ClassVar, NewType
 
-from eth_typing import HexAddress
+from eth_typing import HexAddress, HexStr
 from pydantic import BaseModel, Field
-from web3.types import HexStr, Wei
+
+from cdp.abi_registry import AbiRegistry
+
+# The same definition as `web3.types.Wei`, which is not imported so that web3 is only loaded
+# when a call is encoded.
+Wei = NewType("Wei", int)
 
 
 class EncodedCall(BaseModel):
@@ -14,7 +19,14 @@ class EncodedCall(BaseModel):
 
 
 class FunctionCall(BaseModel):
-    """Represents a call to a smart contract that needs to be encoded using the ABI."""
+    """Represents a call to a smart contract that needs to be encoded using the ABI.
+
+    Parsed ABIs are cached process-wide in `FunctionCall.abi_registry`, keyed by a fingerprint of
+    the ABI. Replace it with an `AbiRegistry` of a different size, or with `AbiRegistry(max_size=0)`
+    to disable caching.
+    """
+
+    abi_registry: ClassVar[AbiRegistry] = AbiRegistry()
 
     to: HexAddress = Field(..., description="Target contract address")
     value: Wei | None = Field(None, description="Amount of native currency to send")
@@ -22,5 +34,15 @@ class FunctionCall(BaseModel):
     function_name: str = Field(..., description="Name of the function to call")
     args: list[Any] = Field(..., description="Arguments to pass to the function")
 
+    def encode(self) -> EncodedCall:
+        """Encode the call using the ABI.
+
+        Returns:
+            EncodedCall: The call with its function selector and ABI-encoded arguments as data.
+
+        """
+        data = self.abi_registry.encode(self.abi, self.function_name, self.args)
+        return EncodedCall(to=self.to, value=self.value, data=data)
+
 
 ContractCall = EncodedCall | FunctionCall
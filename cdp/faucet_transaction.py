@@ -1,13 +1,15 @@
 import time
 
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.faucet_transaction import (
     FaucetTransaction as FaucetTransactionModel,
 )
+from cdp.polling_policy import PollingPolicy, get_polling_policy
 from cdp.transaction import Transaction
 
 
-class FaucetTransaction:
+class FaucetTransaction(ClientBound):
     """A class representing a faucet transaction."""
 
     def __init__(self, model: FaucetTransactionModel) -> None:
@@ -79,28 +81,45 @@ class FaucetTransaction:
         """
         return self.transaction.status
 
+    @property
+    def terminal_state(self) -> bool:
+        """Check if the FaucetTransaction is in a terminal state."""
+        return self.transaction.terminal_state
+
     def wait(
-        self, interval_seconds: float = 0.2, timeout_seconds: float = 20
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
     ) -> "FaucetTransaction":
         """Wait for the faucet transaction to complete.
 
         Args:
-            interval_seconds (float): The interval seconds.
+            interval_seconds (Optional[float]): A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds (float): The timeout seconds.
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             FaucetTransaction: The faucet transaction.
 
         """
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "faucet_transaction"
+        )
         start_time = time.time()
 
         while not self.transaction.terminal_state:
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("Timed out waiting for FaucetTransaction to land onchain")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
@@ -5,13 +5,16 @@ from enum import Enum
 
 from cdp.asset import Asset
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models import FundOperation as FundOperationModel
 from cdp.crypto_amount import CryptoAmount
 from cdp.fiat_amount import FiatAmount
 from cdp.fund_quote import FundQuote
+from cdp.paginator import Paginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
 
 
-class FundOperation:
+class FundOperation(ClientBound):
     """A representation of a Fund Operation."""
 
     class Status(Enum):
@@ -93,33 +96,30 @@ class FundOperation:
         return cls(model)
 
     @classmethod
-    def list(cls, wallet_id: str, address_id: str) -> Iterator["FundOperation"]:
+    def list(
+        cls, wallet_id: str, address_id: str, **pagination_options
+    ) -> Iterator["FundOperation"]:
         """List fund operations.
 
         Args:
             wallet_id (str): The wallet ID
             address_id (str): The address ID
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
 
         Returns:
             Iterator[FundOperation]: An iterator of fund operation objects
 
         """
-        page = None
-        while True:
-            response = Cdp.api_clients.fund.list_fund_operations(
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.fund.list_fund_operations(
                 wallet_id=wallet_id,
                 address_id=address_id,
-                limit=100,
+                limit=limit,
                 page=page,
-            )
-
-            for operation_model in response.data:
-                yield cls(operation_model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+            ),
+            cls,
+            **pagination_options,
+        )
 
     @property
     def id(self) -> str:
@@ -203,12 +203,20 @@ class FundOperation:
         )
         return self
 
-    def wait(self, interval_seconds: float = 0.2, timeout_seconds: float = 20) -> "FundOperation":
+    def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "FundOperation":
         """Wait for the fund operation to complete.
 
         Args:
-            interval_seconds (float): The interval between checks
+            interval_seconds (Optional[float]): A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds (float): The maximum time to wait
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             FundOperation: The completed fund operation
@@ -217,15 +225,21 @@ class FundOperation:
             TimeoutError: If the operation takes too long
 
         """
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "fund_operation"
+        )
         start_time = time.time()
 
         while not self.terminal_state():
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("Fund operation timed out")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
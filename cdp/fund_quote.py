@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 from cdp.asset import Asset
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.crypto_amount import CryptoAmount
 from cdp.fiat_amount import FiatAmount
 
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
 from cdp.client.models import FundQuote as FundQuoteModel
 
 
-class FundQuote:
+class FundQuote(ClientBound):
     """A representation of a Fund Operation Quote."""
 
     def __init__(self, model: FundQuoteModel) -> None:
@@ -1,8 +1,5 @@
 from typing import Any
 
-from eth_account.messages import _hash_eip191_message, encode_defunct, encode_typed_data
-from eth_utils import to_hex
-
 
 def hash_message(message_text: str) -> str:
     """Hashes a message according to EIP-191 and returns the hash as a 0x-prefixed hexadecimal string.
@@ -16,6 +13,9 @@ def hash_message(message_text: str) -> str:
         str: The 0x-prefixed hexadecimal string of the message hash.
 
     """
+    from eth_account.messages import _hash_eip191_message, encode_defunct
+    from eth_utils import to_hex
+
     message = encode_defunct(text=message_text)
     message_hash = _hash_eip191_message(message)
 
@@ -34,6 +34,9 @@ def hash_typed_data_message(typed_data: dict[str, Any]) -> str:
         str: The 0x-prefixed hexadecimal string of the typed data hash.
 
     """
+    from eth_account.messages import _hash_eip191_message, encode_typed_data
+    from eth_utils import to_hex
+
     typed_data_message = encode_typed_data(full_message=typed_data)
     typed_data_message_hash = _hash_eip191_message(typed_data_message)
 
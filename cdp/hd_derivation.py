@@ -0,0 +1,75 @@
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bip_utils import Bip32Slip10Secp256k1
+
+ACCOUNT_PATH = "m/44'/60'/0'/0"
+"""The BIP-44 path of the Ethereum account node. Address keys are its non-hardened children."""
+
+
+def derive_account_node(master: "Bip32Slip10Secp256k1") -> "Bip32Slip10Secp256k1":
+    """Derive the account node from a master node.
+
+    Args:
+        master (Bip32Slip10Secp256k1): The master node of a wallet.
+
+    Returns:
+        Bip32Slip10Secp256k1: The node at `ACCOUNT_PATH`.
+
+    """
+    return master.DerivePath(ACCOUNT_PATH)
+
+
+def derive_private_keys(seed: str, indices: Iterable[int]) -> list[str]:
+    """Derive the private keys of the addresses of a wallet from its seed.
+
+    The account node is derived once and every address key is derived from it.
+
+    Args:
+        seed (str): The hex-encoded wallet seed.
+        indices (Iterable[int]): The address indices.
+
+    Returns:
+        List[str]: The hex-encoded private keys, in the order of the indices.
+
+    """
+    from bip_utils import Bip32Slip10Secp256k1
+
+    account_node = derive_account_node(Bip32Slip10Secp256k1.FromSeed(bytes.fromhex(seed)))
+
+    return [account_node.ChildKey(index).PrivateKey().Raw().ToHex() for index in indices]
+
+
+def derive_private_keys_many(
+    requests: list[tuple[str, list[int]]], max_workers: int | None = None
+) -> list[list[str]]:
+    """Derive the address private keys of many wallets, fanning out to a process pool.
+
+    Key derivation is CPU-bound, so loading thousands of wallets benefits from using every core.
+    Small batches, or `max_workers=1`, are derived in the calling process.
+
+    Args:
+        requests (List[Tuple[str, List[int]]]): The hex-encoded seed and address indices of each
+            wallet.
+        max_workers (Optional[int]): The number of worker processes. Defaults to the number of
+            CPUs.
+
+    Returns:
+        List[List[str]]: The hex-encoded private keys of each wallet, in the order of the
+        requests.
+
+    """
+    if max_workers == 1 or len(requests) < 2:
+        return [derive_private_keys(seed, indices) for seed, indices in requests]
+
+    seeds = [seed for seed, _ in requests]
+    indices = [list(indices) for _, indices in requests]
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(requests) // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(derive_private_keys, seeds, indices, chunksize=chunksize))
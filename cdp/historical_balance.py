@@ -3,8 +3,8 @@ from decimal import Decimal
 
 from cdp.asset import Asset
 from cdp.cdp import Cdp
-from cdp.client.models.address_historical_balance_list import AddressHistoricalBalanceList
 from cdp.client.models.historical_balance import HistoricalBalance as HistoricalBalanceModel
+from cdp.paginator import Paginator
 
 
 class HistoricalBalance:
@@ -47,13 +47,16 @@ class HistoricalBalance:
         )
 
     @classmethod
-    def list(cls, network_id: str, address_id: str, asset_id: str) -> Iterator["HistoricalBalance"]:
+    def list(
+        cls, network_id: str, address_id: str, asset_id: str, **pagination_options
+    ) -> Iterator["HistoricalBalance"]:
         """List historical balances of an address of an asset.
 
         Args:
             network_id (str): The ID of the network to list historical balance for.
             address_id (str): The ID of the address to list historical balance for.
             asset_id(str): The asset ID to list historical balance.
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
 
         Returns:
             Iterator[Transaction]: An iterator of HistoricalBalance objects.
@@ -62,25 +65,17 @@ class HistoricalBalance:
             Exception: If there's an error listing the historical_balances.
 
         """
-        page = None
-        while True:
-            response: AddressHistoricalBalanceList = (
-                Cdp.api_clients.balance_history.list_address_historical_balance(
-                    network_id=network_id,
-                    address_id=address_id,
-                    asset_id=Asset.primary_denomination(asset_id),
-                    limit=100,
-                    page=page,
-                )
-            )
-
-            for model in response.data:
-                yield cls.from_model(model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.balance_history.list_address_historical_balance(
+                network_id=network_id,
+                address_id=address_id,
+                asset_id=Asset.primary_denomination(asset_id),
+                limit=limit,
+                page=page,
+            ),
+            cls.from_model,
+            **pagination_options,
+        )
 
     @property
     def amount(self) -> Decimal:
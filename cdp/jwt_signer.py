@@ -0,0 +1,196 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from cdp.api_key_utils import _parse_private_key
+from cdp.errors import InvalidAPIKeyFormatError
+
+
+class JwtSigner:
+    """Builds the JWTs used to authenticate CDP API requests.
+
+    The private key is parsed once, on first use, and the signing algorithm and the static header
+    and claim fields are derived from it. Optionally, signed tokens are cached per
+    `(method, host+path)` and reused while they remain valid for longer than
+    `token_cache_min_validity_seconds`. The cache holds at most `TOKEN_CACHE_MAX_SIZE` tokens:
+    when it is full, tokens that can no longer be reused are dropped, then the oldest ones.
+    """
+
+    TOKEN_LIFETIME_SECONDS = 60
+    TOKEN_CACHE_MAX_SIZE = 1024
+
+    def __init__(
+        self,
+        api_key: str,
+        private_key: str,
+        token_cache_min_validity_seconds: int | None = None,
+    ) -> None:
+        """Initialize the JwtSigner.
+
+        Args:
+            api_key (str): The API key name, used as the key ID and subject of the JWT.
+            private_key (str): The PEM-encoded ECDSA or base64-encoded Ed25519 private key.
+            token_cache_min_validity_seconds (Optional[int]): When set, signed tokens are reused
+                while they have more than this many seconds of validity left. Defaults to None,
+                which signs a fresh token for every request.
+
+        Raises:
+            ValueError: If the minimum validity is not shorter than the token lifetime.
+
+        """
+        if token_cache_min_validity_seconds is not None and not (
+            0 <= token_cache_min_validity_seconds < self.TOKEN_LIFETIME_SECONDS
+        ):
+            raise ValueError(
+                f"token_cache_min_validity_seconds must be between 0 and {self.TOKEN_LIFETIME_SECONDS - 1}"
+            )
+
+        self._api_key = api_key
+        self._private_key = private_key
+        self._token_cache_min_validity_seconds = token_cache_min_validity_seconds
+        self._key = None
+        self._alg = None
+        self._header = None
+        self._claims = None
+        self._tokens: dict[tuple[str, str], tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def alg(self) -> str:
+        """The JWT signing algorithm of the private key.
+
+        Returns:
+            str: Either "ES256" or "EdDSA".
+
+        """
+        self._load_key()
+        return self._alg
+
+    def sign(self, url: str, method: str = "GET") -> str:
+        """Return a JWT authorizing a request to the given URL.
+
+        Args:
+            url (str): The URL of the request.
+            method (str): The HTTP method of the request. Defaults to "GET".
+
+        Returns:
+            str: The signed JWT.
+
+        Raises:
+            InvalidAPIKeyFormatError: If the private key type is unsupported or signing fails.
+
+        """
+        parsed_url = urlparse(url)
+        uri = f"{method} {parsed_url.netloc}{parsed_url.path}"
+
+        if self._token_cache_min_validity_seconds is None:
+            return self._sign_uri(uri, int(time.time()))[0]
+
+        cache_key = (method, f"{parsed_url.netloc}{parsed_url.path}")
+        now = int(time.time())
+
+        cached = self._tokens.get(cache_key)
+        if cached is not None and cached[1] - now > self._token_cache_min_validity_seconds:
+            return cached[0]
+
+        token, expires_at = self._sign_uri(uri, now)
+        with self._lock:
+            self._tokens.pop(cache_key, None)
+            if len(self._tokens) >= self.TOKEN_CACHE_MAX_SIZE:
+                self._prune_tokens(now)
+            self._tokens[cache_key] = (token, expires_at)
+
+        return token
+
+    def clear_token_cache(self) -> None:
+        """Discard all cached tokens.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._tokens.clear()
+
+    def _prune_tokens(self, now: int) -> None:
+        """Make room in the token cache. The caller must hold the lock.
+
+        Drops the tokens that can no longer be reused, then the oldest ones until the cache has
+        room for one more.
+
+        Args:
+            now (int): The current UNIX time in seconds.
+
+        """
+        min_validity = self._token_cache_min_validity_seconds
+        for key in [
+            key for key, (_, expires_at) in self._tokens.items() if expires_at - now <= min_validity
+        ]:
+            del self._tokens[key]
+
+        while len(self._tokens) >= self.TOKEN_CACHE_MAX_SIZE:
+            del self._tokens[next(iter(self._tokens))]
+
+    def _sign_uri(self, uri: str, now: int) -> tuple[str, int]:
+        """Sign a JWT for the given request URI.
+
+        Args:
+            uri (str): The request URI claim, e.g. "GET api.cdp.coinbase.com/platform/v1/networks".
+            now (int): The current UNIX time in seconds.
+
+        Returns:
+            tuple[str, int]: The signed JWT and its expiry time.
+
+        """
+        self._load_key()
+
+        expires_at = now + self.TOKEN_LIFETIME_SECONDS
+        header = {**self._header, "nonce": self._nonce()}
+        claims = {**self._claims, "nbf": now, "exp": expires_at, "uris": [uri]}
+
+        try:
+            return jwt.encode(claims, self._key, algorithm=self._alg, headers=header), expires_at
+        except Exception as e:
+            print(f"Error during JWT signing: {e!s}")
+            raise InvalidAPIKeyFormatError("Could not sign the JWT") from e
+
+    def _load_key(self) -> None:
+        """Parse the private key and derive the static JWT fields, once.
+
+        Raises:
+            InvalidAPIKeyFormatError: If the key type is unsupported.
+
+        """
+        if self._key is not None:
+            return
+
+        with self._lock:
+            if self._key is not None:
+                return
+
+            key = _parse_private_key(self._private_key)
+
+            if isinstance(key, ec.EllipticCurvePrivateKey):
+                alg = "ES256"
+            elif isinstance(key, ed25519.Ed25519PrivateKey):
+                alg = "EdDSA"
+            else:
+                raise InvalidAPIKeyFormatError("Unsupported key type")
+
+            self._alg = alg
+            self._header = {"alg": alg, "kid": self._api_key, "typ": "JWT"}
+            self._claims = {"sub": self._api_key, "iss": "cdp", "aud": ["cdp_service"]}
+            self._key = key
+
+    def _nonce(self) -> str:
+        """Generate a random nonce for the JWT.
+
+        Returns:
+            str: The nonce.
+
+        """
+        return "".join(random.choices("0123456789", k=16))
@@ -0,0 +1,729 @@
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from cdp.network import CHAIN_ID_TO_NETWORK_ID
+
+BASE_PATH_PREFIX = "/platform"
+STARTING_BALANCE = 10**24
+
+_ASSETS = {
+    "eth": {"decimals": 18, "contract_address": None},
+    "weth": {"decimals": 18, "contract_address": "0x4200000000000000000000000000000000000006"},
+    "usdc": {"decimals": 6, "contract_address": "0x036CbD53842c5426634e7929541eC2318f3dCF7e"},
+}
+_NETWORK_TO_CHAIN_ID = {
+    network_id: chain_id for chain_id, network_id in CHAIN_ID_TO_NETWORK_ID.items()
+}
+
+Response = tuple[int, Any]
+
+
+class _ApiError(Exception):
+    """An error response of the stand-in API."""
+
+    def __init__(self, status: int, code: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _random_address() -> str:
+    from eth_utils import to_checksum_address
+
+    return to_checksum_address("0x" + uuid.uuid4().hex + uuid.uuid4().hex[:8])
+
+
+def _address_from_public_key(public_key_hex: str) -> str:
+    """Derive the onchain address of a compressed secp256k1 public key."""
+    from coincurve import PublicKey
+    from eth_utils import keccak, to_checksum_address
+
+    public_key = PublicKey(bytes.fromhex(public_key_hex)).format(compressed=False)[1:]
+    return to_checksum_address(keccak(public_key)[-20:])
+
+
+def _transaction_hash(signed_payload: str) -> str:
+    from eth_utils import keccak
+
+    return "0x" + keccak(bytes.fromhex(signed_payload.removeprefix("0x"))).hex()
+
+
+class LocalCdpServer:
+    """A stand-in of the CDP platform API served on localhost, for load and integration tests.
+
+    The server keeps wallets, addresses, transfers, trades, smart wallets, user operations and
+    webhooks in memory, and answers with the JSON the platform API returns, so requests go through
+    the real transport, JWT signing and deserialization of the SDK. Transactions are built as real
+    EIP-1559 payloads, so they can be signed by wallets created against the server. Broadcast
+    transfers, trades and user operations complete after `confirmation_polls` reloads.
+
+    Latency and failures can be injected into every response. Injected errors are answered before
+    a request is handled, so retried requests are safe.
+
+    Example:
+        >>> with LocalCdpServer(latency_seconds=0.02, error_rate=0.01) as server:
+        ...     client = CdpClient("bench-key", private_key, base_path=server.base_path)
+        ...     with client.use():
+        ...         wallet = Wallet.create()
+
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_seconds: float = 0.0,
+        latency_jitter_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        confirmation_polls: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the LocalCdpServer.
+
+        Args:
+            host (str): The host to listen on. Defaults to "127.0.0.1".
+            port (int): The port to listen on, or 0 for a free port. Defaults to 0.
+            latency_seconds (float): The time to wait before answering each request. Defaults to 0.
+            latency_jitter_seconds (float): A random extra wait of up to this many seconds per
+                request. Defaults to 0.
+            error_rate (float): The fraction of requests answered with `error_status` instead of
+                being handled. Defaults to 0.
+            error_status (int): The status of injected errors, e.g. 429, 500 or 503. 429 responses
+                carry a `Retry-After: 0` header. Defaults to 503.
+            confirmation_polls (int): The number of reloads after which a broadcast transfer,
+                trade or user operation is complete. Defaults to 1.
+            seed (Optional[int]): The seed of the random latency and error injection.
+
+        Raises:
+            ValueError: If any of the options are invalid.
+
+        """
+        if latency_seconds < 0 or latency_jitter_seconds < 0:
+            raise ValueError("latency must not be negative")
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if confirmation_polls < 0:
+            raise ValueError("confirmation_polls must not be negative")
+
+        self.latency_seconds = latency_seconds
+        self.latency_jitter_seconds = latency_jitter_seconds
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.confirmation_polls = confirmation_polls
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_counts: Counter[str] = Counter()
+        self._injected_errors = 0
+
+        self._wallets: dict[str, dict] = {}
+        self._addresses: dict[str, list[dict]] = {}
+        self._nonces: Counter[str] = Counter()
+        self._transfers: dict[str, dict] = {}
+        self._trades: dict[str, dict] = {}
+        self._smart_wallets: dict[str, dict] = {}
+        self._user_operations: dict[str, dict] = {}
+        self._webhooks: dict[str, dict] = {}
+        self._polls: Counter[str] = Counter()
+
+        self._routes: list[tuple[str, str, re.Pattern, Callable[..., Response]]] = [
+            (method, template, _route_pattern(template), handler)
+            for method, template, handler in [
+                ("GET", "/v1/networks/{network_id}/assets/{asset_id}", self._get_asset),
+                ("POST", "/v1/wallets", self._create_wallet),
+                ("GET", "/v1/wallets", self._list_wallets),
+                ("GET", "/v1/wallets/{wallet_id}", self._get_wallet),
+                ("POST", "/v1/wallets/{wallet_id}/addresses", self._create_address),
+                ("GET", "/v1/wallets/{wallet_id}/addresses", self._list_addresses),
+                ("GET", "/v1/wallets/{wallet_id}/addresses/{address_id}", self._get_address),
+                ("GET", "/v1/wallets/{wallet_id}/addresses/{address_id}/balances/{asset_id}", self._get_balance),
+                ("GET", "/v1/wallets/{wallet_id}/addresses/{address_id}/balances", self._list_balances),
+                ("GET", "/v1/networks/{network_id}/addresses/{address_id}/balances/{asset_id}", self._get_balance),
+                ("GET", "/v1/networks/{network_id}/addresses/{address_id}/balances", self._list_balances),
+                ("POST", "/v1/wallets/{wallet_id}/addresses/{address_id}/transfers", self._create_transfer),
+                ("GET", "/v1/wallets/{wallet_id}/addresses/{address_id}/transfers", self._list_transfers),
+                ("GET", "/v1/wallets/{wallet_id}/addresses/{address_id}/transfers/{transfer_id}", self._get_transfer),
+                ("POST", "/v1/wallets/{wallet_id}/addresses/{address_id}/transfers/{transfer_id}/broadcast", self._broadcast_transfer),
+                ("POST", "/v1/wallets/{wallet_id}/addresses/{address_id}/trades", self._create_trade),
+                ("GET", "/v1/wallets/{wallet_id}/addresses/{address_id}/trades/{trade_id}", self._get_trade),
+                ("POST", "/v1/wallets/{wallet_id}/addresses/{address_id}/trades/{trade_id}/broadcast", self._broadcast_trade),
+                ("POST", "/v1/smart_wallets", self._create_smart_wallet),
+                ("GET", "/v1/smart_wallets/{smart_wallet_address}", self._get_smart_wallet),
+                ("POST", "/v1/smart_wallets/{smart_wallet_address}/networks/{network_id}/user_operations", self._create_user_operation),
+                ("GET", "/v1/smart_wallets/{smart_wallet_address}/user_operations/{user_op_hash}", self._get_user_operation),
+                ("POST", "/v1/smart_wallets/{smart_wallet_address}/user_operations/{user_op_hash}/broadcast", self._broadcast_user_operation),
+                ("POST", "/v1/webhooks", self._create_webhook),
+                ("POST", "/v1/wallets/{wallet_id}/webhooks", self._create_wallet_webhook),
+                ("GET", "/v1/webhooks", self._list_webhooks),
+                ("PUT", "/v1/webhooks/{webhook_id}", self._update_webhook),
+                ("DELETE", "/v1/webhooks/{webhook_id}", self._delete_webhook),
+            ]
+        ]  # fmt: skip
+
+        self._server = ThreadingHTTPServer((host, port), _handler_class(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_path(self) -> str:
+        """The base path to configure SDK clients with, e.g. "http://127.0.0.1:8080/platform".
+
+        Returns:
+            str: The base path.
+
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH_PREFIX}"
+
+    @property
+    def request_counts(self) -> dict[str, int]:
+        """The number of requests handled per endpoint, e.g. "POST /v1/wallets".
+
+        Returns:
+            Dict[str, int]: The request counts, keyed by method and path template.
+
+        """
+        with self._lock:
+            return dict(self._request_counts)
+
+    @property
+    def injected_errors(self) -> int:
+        """The number of requests answered with an injected error.
+
+        Returns:
+            int: The number of injected errors.
+
+        """
+        with self._lock:
+            return self._injected_errors
+
+    def start(self) -> "LocalCdpServer":
+        """Serve requests on a background thread.
+
+        Returns:
+            LocalCdpServer: The server itself.
+
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="cdp-local-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving requests and close the listening socket.
+
+        Returns:
+            None
+
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalCdpServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def handle(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], Any]:
+        """Answer a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path, including the query string.
+            headers (Dict[str, str]): The request headers.
+            body (bytes): The request body.
+
+        Returns:
+            Tuple[int, Dict[str, str], Any]: The status, extra headers and JSON body of the response.
+
+        """
+        delay = self.latency_seconds
+        if self.latency_jitter_seconds:
+            delay += self._uniform(0, self.latency_jitter_seconds)
+        if delay:
+            time.sleep(delay)
+
+        if self.error_rate and self._uniform(0, 1) < self.error_rate:
+            with self._lock:
+                self._injected_errors += 1
+            extra_headers = {"Retry-After": "0"} if self.error_status == 429 else {}
+            return self.error_status, extra_headers, _error_body("injected_error", "injected error")
+
+        url = urlsplit(path)
+        route_path = url.path.removeprefix(BASE_PATH_PREFIX)
+
+        try:
+            self._authenticate(method, headers, url.path)
+            for route_method, template, pattern, handler in self._routes:
+                match = pattern.match(route_path)
+                if route_method == method and match is not None:
+                    with self._lock:
+                        self._request_counts[f"{method} {template}"] += 1
+                        payload = json.loads(body) if body else {}
+                        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                        status, response = handler(payload, query, **match.groupdict())
+                    return status, {}, response
+            raise _ApiError(404, "not_found", f"no route for {method} {route_path}")
+        except _ApiError as e:
+            return e.status, {}, _error_body(e.code, e.message)
+
+    def _uniform(self, low: float, high: float) -> float:
+        with self._lock:
+            return self._random.uniform(low, high)
+
+    @staticmethod
+    def _authenticate(method: str, headers: dict[str, str], path: str) -> None:
+        """Check that the request carries a JWT for its method and path."""
+        import jwt
+
+        authorization = headers.get("authorization", "")
+        if not authorization.startswith("Bearer "):
+            raise _ApiError(401, "unauthorized", "missing bearer token")
+        try:
+            claims = jwt.decode(
+                authorization.removeprefix("Bearer "), options={"verify_signature": False}
+            )
+        except jwt.PyJWTError as e:
+            raise _ApiError(401, "unauthorized", f"invalid bearer token: {e}") from e
+
+        uri = f"{method} {headers.get('host', '')}{path}"
+        if uri not in claims.get("uris", []):
+            raise _ApiError(401, "unauthorized", f"token is not valid for {uri}")
+
+    # Assets
+
+    @staticmethod
+    def _asset(network_id: str, asset_id: str) -> dict:
+        if asset_id in ("wei", "gwei"):
+            asset_id = "eth"
+        asset = _ASSETS.get(asset_id)
+        if asset is None:
+            raise _ApiError(404, "not_found", f"asset {asset_id} not found")
+        return {"network_id": network_id, "asset_id": asset_id, **asset}
+
+    def _get_asset(
+        self, payload: dict, query: dict, network_id: str, asset_id: str, **_: str
+    ) -> Response:
+        return 200, self._asset(network_id, asset_id)
+
+    # Wallets and addresses
+
+    def _wallet(self, wallet_id: str) -> dict:
+        wallet = self._wallets.get(wallet_id)
+        if wallet is None:
+            raise _ApiError(404, "not_found", f"wallet {wallet_id} not found")
+        return wallet
+
+    def _address(self, wallet_id: str, address_id: str) -> dict:
+        for address in self._addresses.get(wallet_id, []):
+            if address["address_id"] == address_id:
+                return address
+        raise _ApiError(404, "not_found", f"address {address_id} not found")
+
+    def _create_wallet(self, payload: dict, query: dict, **_: str) -> Response:
+        request = payload.get("wallet", {})
+        wallet_id = str(uuid.uuid4())
+        use_server_signer = bool(request.get("use_server_signer"))
+        wallet = {
+            "id": wallet_id,
+            "network_id": request.get("network_id", "base-sepolia"),
+            "feature_set": {
+                "faucet": True,
+                "server_signer": True,
+                "transfer": True,
+                "trade": True,
+                "stake": True,
+                "gasless_send": True,
+            },
+        }
+        if use_server_signer:
+            wallet["server_signer_status"] = "active_seed"
+        self._wallets[wallet_id] = wallet
+        self._addresses[wallet_id] = []
+        return 200, wallet
+
+    def _get_wallet(self, payload: dict, query: dict, wallet_id: str, **_: str) -> Response:
+        return 200, self._wallet(wallet_id)
+
+    def _list_wallets(self, payload: dict, query: dict, **_: str) -> Response:
+        return 200, _page(list(self._wallets.values()), query)
+
+    def _create_address(self, payload: dict, query: dict, wallet_id: str, **_: str) -> Response:
+        wallet = self._wallet(wallet_id)
+        addresses = self._addresses[wallet_id]
+        public_key = payload.get("public_key")
+        address = {
+            "wallet_id": wallet_id,
+            "network_id": wallet["network_id"],
+            "public_key": public_key or "",
+            "address_id": (
+                _address_from_public_key(public_key) if public_key else _random_address()
+            ),
+            "index": payload.get("address_index", len(addresses)),
+        }
+        addresses.append(address)
+        wallet.setdefault("default_address", address)
+        return 200, address
+
+    def _get_address(
+        self, payload: dict, query: dict, wallet_id: str, address_id: str, **_: str
+    ) -> Response:
+        return 200, self._address(wallet_id, address_id)
+
+    def _list_addresses(self, payload: dict, query: dict, wallet_id: str, **_: str) -> Response:
+        self._wallet(wallet_id)
+        return 200, _page(self._addresses[wallet_id], query)
+
+    def _get_balance(
+        self, payload: dict, query: dict, address_id: str, asset_id: str, **_: str
+    ) -> Response:
+        return 200, {
+            "amount": str(STARTING_BALANCE),
+            "asset": self._asset("base-sepolia", asset_id),
+        }
+
+    def _list_balances(self, payload: dict, query: dict, address_id: str, **_: str) -> Response:
+        balances = [
+            {"amount": str(STARTING_BALANCE), "asset": self._asset("base-sepolia", asset_id)}
+            for asset_id in _ASSETS
+        ]
+        return 200, _page(balances, query)
+
+    # Transactions
+
+    def _transaction(self, network_id: str, from_address_id: str, to: str, value: int) -> dict:
+        nonce = self._nonces[from_address_id]
+        self._nonces[from_address_id] += 1
+        unsigned = {
+            "chainId": hex(_NETWORK_TO_CHAIN_ID.get(network_id, 84532)),
+            "nonce": hex(nonce),
+            "maxPriorityFeePerGas": hex(10**6),
+            "maxFeePerGas": hex(10**9),
+            "gas": hex(21000 if value else 100000),
+            "value": hex(value),
+            "input": "0x",
+            "to": to,
+        }
+        return {
+            "network_id": network_id,
+            "from_address_id": from_address_id,
+            "to_address_id": to,
+            "unsigned_payload": json.dumps(unsigned).encode().hex(),
+            "status": "pending",
+        }
+
+    def _confirm(self, key: str, resource: dict, *transactions: dict | None) -> None:
+        """Complete a broadcast resource once it has been reloaded often enough."""
+        if resource.get("status", "broadcast") != "broadcast":
+            return
+        self._polls[key] += 1
+        if self._polls[key] < self.confirmation_polls:
+            return
+        for transaction in transactions:
+            if transaction is not None and transaction["status"] == "broadcast":
+                transaction["status"] = "complete"
+                transaction["block_height"] = str(self._polls.total())
+        if "status" in resource:
+            resource["status"] = "complete"
+
+    @staticmethod
+    def _broadcast(transaction: dict, signed_payload: str) -> None:
+        if transaction["status"] != "pending":
+            raise _ApiError(400, "already_broadcast", "transaction has already been broadcast")
+        transaction["signed_payload"] = signed_payload.removeprefix("0x")
+        transaction["transaction_hash"] = _transaction_hash(signed_payload)
+        transaction["status"] = "broadcast"
+
+    # Transfers
+
+    def _create_transfer(
+        self, payload: dict, query: dict, wallet_id: str, address_id: str, **_: str
+    ) -> Response:
+        self._address(wallet_id, address_id)
+        network_id = payload["network_id"]
+        asset = self._asset(network_id, payload["asset_id"])
+        amount = int(payload["amount"])
+        destination = payload["destination"]
+        to = asset["contract_address"] or destination
+        transfer = {
+            "network_id": network_id,
+            "wallet_id": wallet_id,
+            "address_id": address_id,
+            "destination": destination,
+            "amount": str(amount),
+            "asset_id": asset["asset_id"],
+            "asset": asset,
+            "transfer_id": str(uuid.uuid4()),
+            "transaction": self._transaction(
+                network_id, address_id, to, 0 if asset["contract_address"] else amount
+            ),
+            "gasless": bool(payload.get("gasless")),
+        }
+        self._transfers[transfer["transfer_id"]] = transfer
+        return 200, _with_status(transfer)
+
+    def _transfer(self, transfer_id: str) -> dict:
+        transfer = self._transfers.get(transfer_id)
+        if transfer is None:
+            raise _ApiError(404, "not_found", f"transfer {transfer_id} not found")
+        return transfer
+
+    def _get_transfer(self, payload: dict, query: dict, transfer_id: str, **_: str) -> Response:
+        transfer = self._transfer(transfer_id)
+        self._confirm(transfer_id, transfer["transaction"], transfer["transaction"])
+        return 200, _with_status(transfer)
+
+    def _list_transfers(self, payload: dict, query: dict, address_id: str, **_: str) -> Response:
+        transfers = [
+            _with_status(transfer)
+            for transfer in self._transfers.values()
+            if transfer["address_id"] == address_id
+        ]
+        return 200, _page(transfers, query)
+
+    def _broadcast_transfer(
+        self, payload: dict, query: dict, transfer_id: str, **_: str
+    ) -> Response:
+        transfer = self._transfer(transfer_id)
+        self._broadcast(transfer["transaction"], payload["signed_payload"])
+        return 200, _with_status(transfer)
+
+    # Trades
+
+    def _create_trade(
+        self, payload: dict, query: dict, wallet_id: str, address_id: str, **_: str
+    ) -> Response:
+        wallet = self._wallet(wallet_id)
+        self._address(wallet_id, address_id)
+        network_id = wallet["network_id"]
+        from_asset = self._asset(network_id, payload["from_asset_id"])
+        to_asset = self._asset(network_id, payload["to_asset_id"])
+        from_amount = int(payload["amount"])
+        # Trades one whole unit of the from asset for one whole unit of the to asset.
+        to_amount = from_amount * 10 ** to_asset["decimals"] // 10 ** from_asset["decimals"]
+        router = _random_address()
+        trade = {
+            "network_id": network_id,
+            "wallet_id": wallet_id,
+            "address_id": address_id,
+            "trade_id": str(uuid.uuid4()),
+            "from_amount": str(from_amount),
+            "from_asset": from_asset,
+            "to_amount": str(to_amount),
+            "to_asset": to_asset,
+            "transaction": self._transaction(
+                network_id, address_id, router, 0 if from_asset["contract_address"] else from_amount
+            ),
+        }
+        if from_asset["contract_address"]:
+            trade["approve_transaction"] = self._transaction(
+                network_id, address_id, from_asset["contract_address"], 0
+            )
+        self._trades[trade["trade_id"]] = trade
+        return 200, trade
+
+    def _trade(self, trade_id: str) -> dict:
+        trade = self._trades.get(trade_id)
+        if trade is None:
+            raise _ApiError(404, "not_found", f"trade {trade_id} not found")
+        return trade
+
+    def _get_trade(self, payload: dict, query: dict, trade_id: str, **_: str) -> Response:
+        trade = self._trade(trade_id)
+        self._confirm(
+            trade_id, trade["transaction"], trade["transaction"], trade.get("approve_transaction")
+        )
+        return 200, trade
+
+    def _broadcast_trade(self, payload: dict, query: dict, trade_id: str, **_: str) -> Response:
+        trade = self._trade(trade_id)
+        if "approve_transaction" in trade:
+            approve_payload = payload.get("approve_transaction_signed_payload")
+            if not approve_payload:
+                raise _ApiError(400, "invalid_request", "approve transaction is not signed")
+            self._broadcast(trade["approve_transaction"], approve_payload)
+        self._broadcast(trade["transaction"], payload["signed_payload"])
+        return 200, trade
+
+    # Smart wallets and user operations
+
+    def _create_smart_wallet(self, payload: dict, query: dict, **_: str) -> Response:
+        smart_wallet = {"address": _random_address(), "owners": [payload["owner"]]}
+        self._smart_wallets[smart_wallet["address"]] = smart_wallet
+        return 200, smart_wallet
+
+    def _get_smart_wallet(
+        self, payload: dict, query: dict, smart_wallet_address: str, **_: str
+    ) -> Response:
+        smart_wallet = self._smart_wallets.get(smart_wallet_address)
+        if smart_wallet is None:
+            raise _ApiError(404, "not_found", f"smart wallet {smart_wallet_address} not found")
+        return 200, smart_wallet
+
+    def _create_user_operation(
+        self, payload: dict, query: dict, smart_wallet_address: str, network_id: str, **_: str
+    ) -> Response:
+        self._get_smart_wallet(payload, query, smart_wallet_address)
+        user_op_hash = "0x" + uuid.uuid4().hex + uuid.uuid4().hex
+        user_operation = {
+            "id": str(uuid.uuid4()),
+            "network_id": network_id,
+            "calls": payload["calls"],
+            "user_op_hash": user_op_hash,
+            "unsigned_payload": user_op_hash,
+            "status": "pending",
+        }
+        self._user_operations[user_op_hash] = user_operation
+        return 200, user_operation
+
+    def _user_operation(self, user_op_hash: str) -> dict:
+        user_operation = self._user_operations.get(user_op_hash)
+        if user_operation is None:
+            raise _ApiError(404, "not_found", f"user operation {user_op_hash} not found")
+        return user_operation
+
+    def _get_user_operation(
+        self, payload: dict, query: dict, user_op_hash: str, **_: str
+    ) -> Response:
+        user_operation = self._user_operation(user_op_hash)
+        self._confirm(user_op_hash, user_operation)
+        return 200, user_operation
+
+    def _broadcast_user_operation(
+        self, payload: dict, query: dict, user_op_hash: str, **_: str
+    ) -> Response:
+        user_operation = self._user_operation(user_op_hash)
+        if user_operation["status"] != "pending":
+            raise _ApiError(400, "already_broadcast", "user operation has already been broadcast")
+        user_operation["signature"] = payload["signature"]
+        user_operation["transaction_hash"] = _transaction_hash(payload["signature"])
+        user_operation["status"] = "broadcast"
+        return 200, user_operation
+
+    # Webhooks
+
+    def _webhook(self, webhook_id: str) -> dict:
+        webhook = self._webhooks.get(webhook_id)
+        if webhook is None:
+            raise _ApiError(404, "not_found", f"webhook {webhook_id} not found")
+        return webhook
+
+    def _create_webhook(self, payload: dict, query: dict, **_: str) -> Response:
+        now = datetime.now(timezone.utc).isoformat()
+        webhook = {
+            **payload,
+            "id": str(uuid.uuid4()),
+            "created_at": now,
+            "updated_at": now,
+            "status": "active",
+        }
+        self._webhooks[webhook["id"]] = webhook
+        return 200, webhook
+
+    def _create_wallet_webhook(
+        self, payload: dict, query: dict, wallet_id: str, **_: str
+    ) -> Response:
+        wallet = self._wallet(wallet_id)
+        return self._create_webhook(
+            {
+                "network_id": wallet["network_id"],
+                "event_type": "wallet_activity",
+                "event_type_filter": {"wallet_id": wallet_id, "addresses": []},
+                **payload,
+            },
+            query,
+        )
+
+    def _list_webhooks(self, payload: dict, query: dict, **_: str) -> Response:
+        return 200, _page(list(self._webhooks.values()), query)
+
+    def _update_webhook(self, payload: dict, query: dict, webhook_id: str, **_: str) -> Response:
+        webhook = self._webhook(webhook_id)
+        webhook.update(payload, updated_at=datetime.now(timezone.utc).isoformat())
+        return 200, webhook
+
+    def _delete_webhook(self, payload: dict, query: dict, webhook_id: str, **_: str) -> Response:
+        self._webhook(webhook_id)
+        del self._webhooks[webhook_id]
+        return 200, {}
+
+
+def _route_pattern(template: str) -> re.Pattern:
+    """Compile a path template like "/v1/wallets/{wallet_id}" into a pattern matching its paths."""
+    return re.compile("^" + re.sub(r"{(\w+)}", r"(?P<\1>[^/]+)", template) + "$")
+
+
+def _with_status(transfer: dict) -> dict:
+    """Return a transfer with the status of its transaction."""
+    return {**transfer, "status": transfer["transaction"]["status"]}
+
+
+def _page(items: list[dict], query: dict) -> dict:
+    """Return a page of items in the format of the platform API list endpoints."""
+    start = int(query.get("page") or 0)
+    limit = int(query.get("limit") or 10)
+    end = start + limit
+    return {
+        "data": items[start:end],
+        "has_more": end < len(items),
+        "next_page": str(end) if end < len(items) else "",
+        "total_count": len(items),
+    }
+
+
+def _error_body(code: str, message: str) -> dict:
+    return {"code": code, "message": message, "correlation_id": str(uuid.uuid4())}
+
+
+def _handler_class(server: LocalCdpServer) -> type[BaseHTTPRequestHandler]:
+    """Return a request handler class that answers requests with the given server."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _respond(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            headers = {key.lower(): value for key, value in self.headers.items()}
+            status, extra_headers, response = server.handle(self.command, self.path, headers, body)
+
+            data = json.dumps(response).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in extra_headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _respond  # noqa: N815
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return _Handler
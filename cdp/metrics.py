@@ -0,0 +1,473 @@
+import bisect
+import contextlib
+import contextvars
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# The default buckets of Prometheus client libraries, in seconds.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNKNOWN_METHOD = "unknown"
+
+# The variants of each generated API method are counted as the method itself.
+_METHOD_SUFFIXES = ("_with_http_info", "_without_preload_content")
+
+_api_method: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "cdp_api_method", default=None
+)
+
+
+def current_api_method() -> str | None:
+    """Return the name of the generated API method being called in the current thread or task.
+
+    Returns:
+        Optional[str]: The method name, e.g. `get_transfer`, or None outside of a metered call.
+
+    """
+    return _api_method.get()
+
+
+@contextlib.contextmanager
+def record_api_call(registry: "MetricsRegistry", method: str) -> Iterator[None]:
+    """Record the call of a generated API method made within a block.
+
+    The duration of the block is recorded, along with the `api_code` of the `ApiError` it raises,
+    if any. Requests made within the block count their retries towards the method.
+
+    Args:
+        registry (MetricsRegistry): The registry to record the call in.
+        method (str): The API method name, e.g. `get_transfer`.
+
+    Yields:
+        None
+
+    """
+    for suffix in _METHOD_SUFFIXES:
+        method = method.removesuffix(suffix)
+
+    token = _api_method.set(method)
+    start = time.perf_counter()
+    error_code = None
+    try:
+        yield
+    except BaseException as e:
+        error_code = getattr(e, "api_code", None) or ""
+        raise
+    finally:
+        registry.record_call(method, time.perf_counter() - start, error_code)
+        _api_method.reset(token)
+
+
+@dataclass(frozen=True)
+class MethodMetrics:
+    """A snapshot of the counters of a generated API method.
+
+    Attributes:
+        count (int): The number of calls, including failed ones.
+        errors (int): The number of calls that raised an exception.
+        retries (int): The number of requests retried on transient failures and 429 responses.
+        latency_sum (float): The total duration of the calls, in seconds.
+        latency_buckets (Tuple[Tuple[float, int], ...]): The cumulative number of calls that took
+            at most each bucket bound, in seconds, ending with the `inf` bucket.
+
+    """
+
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    latency_sum: float = 0.0
+    latency_buckets: tuple[tuple[float, int], ...] = ()
+
+    @property
+    def mean_latency(self) -> float:
+        """The mean duration of the calls.
+
+        Returns:
+            float: The mean duration in seconds, or 0 if there were no calls.
+
+        """
+        return self.latency_sum / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class WaitMetrics:
+    """A snapshot of the `wait()` counters of a resource type.
+
+    Attributes:
+        waits (int): The number of completed waits, including timed out ones.
+        reloads (int): The total number of reloads across all waits.
+        timeouts (int): The number of waits that timed out.
+
+    """
+
+    waits: int = 0
+    reloads: int = 0
+    timeouts: int = 0
+
+    @property
+    def average_reloads(self) -> float:
+        """The average number of reloads per wait.
+
+        Returns:
+            float: The average number of reloads, or 0 if no wait has completed.
+
+        """
+        return self.reloads / self.waits if self.waits else 0.0
+
+
+@dataclass(frozen=True)
+class CacheMetrics:
+    """A snapshot of the lookup counters of a cache.
+
+    Attributes:
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that required an API request.
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups served from the cache.
+
+        Returns:
+            float: The hit rate, or 0 if there were no lookups.
+
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """A snapshot of the metrics of a registry.
+
+    Attributes:
+        methods (Dict[str, MethodMetrics]): The counters of each generated API method, keyed by
+            method name, e.g. `get_transfer`.
+        errors (Dict[str, int]): The number of API errors, keyed by `ApiError.api_code`.
+        waits (Dict[str, WaitMetrics]): The `wait()` counters, keyed by resource type, e.g.
+            `transfer`.
+        caches (Dict[str, CacheMetrics]): The lookup counters of each registered cache.
+
+    """
+
+    methods: dict[str, MethodMetrics] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    waits: dict[str, WaitMetrics] = field(default_factory=dict)
+    caches: dict[str, CacheMetrics] = field(default_factory=dict)
+
+
+class _MethodCounters:
+    """The mutable counters of an API method, guarded by the registry lock."""
+
+    __slots__ = ("bucket_counts", "count", "errors", "latency_sum", "retries")
+
+    def __init__(self, buckets: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.latency_sum = 0.0
+        self.bucket_counts = [0] * (buckets + 1)
+
+
+class MetricsRegistry:
+    """Aggregates in-process metrics of API calls, retries, waits and caches.
+
+    Updating the registry takes a lock and a few additions, so it is cheap enough to leave
+    enabled in production. Read it with `snapshot()`, or export it with `prometheus_text()`.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> Cdp.configure(api_key_name, private_key, metrics=registry)
+        >>> registry.snapshot().methods["get_transfer"].mean_latency
+
+    """
+
+    def __init__(self, latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize the MetricsRegistry.
+
+        Args:
+            latency_buckets (Tuple[float, ...]): The upper bounds of the latency histogram
+                buckets, in seconds. Defaults to the Prometheus default buckets.
+
+        Raises:
+            ValueError: If the buckets are empty or not increasing.
+
+        """
+        if not latency_buckets or any(
+            lower >= upper for lower, upper in itertools.pairwise(latency_buckets)
+        ):
+            raise ValueError("latency_buckets must be non-empty and increasing")
+
+        self._latency_buckets = tuple(latency_buckets)
+        self._lock = threading.Lock()
+        self._methods: dict[str, _MethodCounters] = {}
+        self._errors: dict[str, int] = {}
+        self._waits: dict[str, WaitMetrics] = {}
+        self._caches: dict[str, Callable[[], Any]] = {}
+
+    def record_call(self, method: str, seconds: float, error_code: str | None = None) -> None:
+        """Record a call of a generated API method.
+
+        Args:
+            method (str): The API method name.
+            seconds (float): The duration of the call.
+            error_code (Optional[str]): The `ApiError.api_code` the call failed with, or None if
+                it succeeded. Use an empty string for failures without an API error code.
+
+        """
+        bucket = bisect.bisect_left(self._latency_buckets, seconds)
+        with self._lock:
+            counters = self._counters(method)
+            counters.count += 1
+            counters.latency_sum += seconds
+            counters.bucket_counts[bucket] += 1
+            if error_code is not None:
+                counters.errors += 1
+                if error_code:
+                    self._errors[error_code] = self._errors.get(error_code, 0) + 1
+
+    def record_retries(self, method: str, retries: int) -> None:
+        """Record the retries of a request.
+
+        Args:
+            method (str): The API method name.
+            retries (int): The number of times the request was retried.
+
+        """
+        with self._lock:
+            self._counters(method).retries += retries
+
+    def record_wait(self, resource: str, reloads: int, timed_out: bool = False) -> None:
+        """Record a completed `wait()` call.
+
+        Args:
+            resource (str): The resource type, e.g. `transfer`.
+            reloads (int): The number of reloads used by the wait.
+            timed_out (bool): Whether the wait timed out. Defaults to False.
+
+        """
+        with self._lock:
+            waits = self._waits.get(resource, WaitMetrics())
+            self._waits[resource] = WaitMetrics(
+                waits=waits.waits + 1,
+                reloads=waits.reloads + reloads,
+                timeouts=waits.timeouts + int(timed_out),
+            )
+
+    def register_cache(self, name: str, stats: Callable[[], Any]) -> None:
+        """Report the hit rate of a cache in the snapshots of the registry.
+
+        The counters are read when a snapshot is taken, so lookups cost nothing extra.
+
+        Args:
+            name (str): The cache name, e.g. `asset`.
+            stats (Callable[[], Any]): Returns the current counters of the cache, with `hits`
+                and `misses` attributes, such as `AssetCache.stats`.
+
+        """
+        with self._lock:
+            self._caches[name] = stats
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return the current metrics.
+
+        Returns:
+            MetricsSnapshot: A snapshot of the metrics.
+
+        """
+        with self._lock:
+            methods = {name: self._method_metrics(c) for name, c in self._methods.items()}
+            errors = dict(self._errors)
+            waits = dict(self._waits)
+            caches = dict(self._caches)
+
+        cache_metrics = {}
+        for name, stats in caches.items():
+            current = stats()
+            cache_metrics[name] = CacheMetrics(hits=current.hits, misses=current.misses)
+
+        return MetricsSnapshot(methods=methods, errors=errors, waits=waits, caches=cache_metrics)
+
+    def reset(self) -> None:
+        """Reset the counters. Registered caches stay registered.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._methods.clear()
+            self._errors.clear()
+            self._waits.clear()
+
+    def prometheus_text(self) -> str:
+        """Return the current metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, ready to be served from a `/metrics` endpoint.
+
+        """
+        return prometheus_text(self.snapshot())
+
+    def _counters(self, method: str) -> _MethodCounters:
+        counters = self._methods.get(method)
+        if counters is None:
+            counters = self._methods[method] = _MethodCounters(len(self._latency_buckets))
+        return counters
+
+    def _method_metrics(self, counters: _MethodCounters) -> MethodMetrics:
+        cumulative = 0
+        buckets = []
+        for bound, count in zip(
+            (*self._latency_buckets, float("inf")), counters.bucket_counts, strict=True
+        ):
+            cumulative += count
+            buckets.append((bound, cumulative))
+
+        return MethodMetrics(
+            count=counters.count,
+            errors=counters.errors,
+            retries=counters.retries,
+            latency_sum=counters.latency_sum,
+            latency_buckets=tuple(buckets),
+        )
+
+
+_metrics_registry: MetricsRegistry | None = None
+
+
+def get_metrics_registry() -> MetricsRegistry | None:
+    """Return the registry that the `wait()` loops of resources report to.
+
+    Returns:
+        Optional[MetricsRegistry]: The registry configured with `Cdp.configure` or
+        `AsyncCdp.configure`, or None if metrics are disabled.
+
+    """
+    return _metrics_registry
+
+
+def set_metrics_registry(registry: MetricsRegistry | None) -> None:
+    """Set the registry that the `wait()` loops of resources report to.
+
+    Args:
+        registry (Optional[MetricsRegistry]): The registry, or None to disable wait metrics.
+
+    """
+    global _metrics_registry
+    _metrics_registry = registry
+
+
+def prometheus_text(snapshot: MetricsSnapshot, prefix: str = "cdp") -> str:
+    """Format a metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot (MetricsSnapshot): The metrics to format.
+        prefix (str): The prefix of the metric names. Defaults to `cdp`.
+
+    Returns:
+        str: The formatted metrics.
+
+    """
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str, samples: Mapping[str, float]) -> None:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for labels, value in samples.items():
+            lines.append(f"{prefix}_{name}{labels} {_format_value(value)}")
+
+    methods = snapshot.methods
+    family(
+        "api_requests_total",
+        "counter",
+        "API calls by generated API method.",
+        {_labels(method=m): metrics.count for m, metrics in methods.items()},
+    )
+    family(
+        "api_request_errors_total",
+        "counter",
+        "Failed API calls by generated API method.",
+        {_labels(method=m): metrics.errors for m, metrics in methods.items()},
+    )
+    family(
+        "api_request_retries_total",
+        "counter",
+        "Retried API requests by generated API method.",
+        {_labels(method=m): metrics.retries for m, metrics in methods.items()},
+    )
+
+    histogram: dict[str, float] = {}
+    for method, metrics in methods.items():
+        for bound, count in metrics.latency_buckets:
+            histogram[f"_bucket{_labels(method=method, le=_format_value(bound))}"] = count
+        histogram[f"_sum{_labels(method=method)}"] = metrics.latency_sum
+        histogram[f"_count{_labels(method=method)}"] = metrics.count
+    family(
+        "api_request_duration_seconds",
+        "histogram",
+        "Duration of API calls by generated API method.",
+        histogram,
+    )
+
+    family(
+        "api_errors_total",
+        "counter",
+        "API errors by error code.",
+        {_labels(code=code): count for code, count in snapshot.errors.items()},
+    )
+    family(
+        "waits_total",
+        "counter",
+        "Completed wait() calls by resource type.",
+        {_labels(resource=r): waits.waits for r, waits in snapshot.waits.items()},
+    )
+    family(
+        "wait_reloads_total",
+        "counter",
+        "Reloads made by wait() calls by resource type.",
+        {_labels(resource=r): waits.reloads for r, waits in snapshot.waits.items()},
+    )
+    family(
+        "wait_timeouts_total",
+        "counter",
+        "Timed out wait() calls by resource type.",
+        {_labels(resource=r): waits.timeouts for r, waits in snapshot.waits.items()},
+    )
+    family(
+        "cache_hits_total",
+        "counter",
+        "Cache lookups served from the cache.",
+        {_labels(cache=c): cache.hits for c, cache in snapshot.caches.items()},
+    )
+    family(
+        "cache_misses_total",
+        "counter",
+        "Cache lookups that required an API request.",
+        {_labels(cache=c): cache.misses for c, cache in snapshot.caches.items()},
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    escaped = (f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value)
@@ -0,0 +1,332 @@
+import asyncio
+import contextvars
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from cdp.tracing import Span, defer_spans, finish_spans
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PageInfo:
+    """Size and timing information about a page fetched by a paginator.
+
+    Attributes:
+        page_number (int): The 1-based number of the page.
+        item_count (int): The number of items on the page.
+        has_more (bool): Whether the paginator will fetch another page.
+        fetch_seconds (float): The time spent requesting the page.
+        wait_seconds (float): The time the consumer was blocked waiting for the page. With
+            prefetching this is lower than `fetch_seconds`.
+
+    """
+
+    page_number: int
+    item_count: int
+    has_more: bool
+    fetch_seconds: float
+    wait_seconds: float
+
+
+class _PaginatorOptions:
+    """Validated options shared by `Paginator` and `AsyncPaginator`."""
+
+    def __init__(
+        self,
+        page_size: int,
+        prefetch: bool,
+        max_items: int | None,
+        max_pages: int | None,
+        on_page: Callable[[PageInfo], None] | None,
+    ) -> None:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if max_items is not None and max_items < 0:
+            raise ValueError("max_items must not be negative")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.max_items = max_items
+        self.max_pages = max_pages
+        self.on_page = on_page
+
+    def limit(self, items: int) -> int:
+        """Return the page size to request given the number of items already returned."""
+        if self.max_items is None:
+            return self.page_size
+        return max(1, min(self.page_size, self.max_items - items))
+
+    def has_more(self, response: Any, pages: int, items: int) -> bool:
+        """Return whether another page should be fetched after the given response."""
+        if not response.has_more:
+            return False
+        if self.max_pages is not None and pages >= self.max_pages:
+            return False
+        return self.max_items is None or items < self.max_items
+
+    def report(self, pages: int, response: Any, has_more: bool, fetch: float, wait: float) -> None:
+        """Call the `on_page` hook, if any."""
+        if self.on_page is not None:
+            self.on_page(PageInfo(pages, len(response.data), has_more, fetch, wait))
+
+
+class Paginator(Iterator[T], Generic[T]):
+    """Iterates over the items of a paginated CDP API list endpoint.
+
+    Pages are fetched lazily. With `prefetch` enabled, the next page is requested on a background
+    thread while the caller consumes the current one.
+
+    Example:
+        >>> transfers = Paginator(
+        ...     lambda page, limit: Cdp.api_clients.transfers.list_transfers(
+        ...         wallet_id=wallet_id, address_id=address_id, limit=limit, page=page
+        ...     ),
+        ...     Transfer,
+        ...     prefetch=True,
+        ... )
+
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[str | None, int], Any],
+        build: Callable[[Any], T],
+        page_size: int = 100,
+        prefetch: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        on_page: Callable[[PageInfo], None] | None = None,
+    ) -> None:
+        """Initialize the Paginator.
+
+        Args:
+            fetch_page (Callable[[Optional[str], int], Any]): Fetches a page given the page token
+                and page size. The result must have `data`, `has_more` and `next_page` fields.
+            build (Callable[[Any], T]): Builds an item from a model on the page.
+            page_size (int): The number of items to request per page. Defaults to 100.
+            prefetch (bool): Whether to fetch the next page in the background. Defaults to False.
+            max_items (Optional[int]): The maximum number of items to return. Defaults to None.
+            max_pages (Optional[int]): The maximum number of pages to fetch. Defaults to None.
+            on_page (Optional[Callable[[PageInfo], None]]): Called after each page is fetched.
+
+        Raises:
+            ValueError: If any of the limits are invalid.
+
+        """
+        self._fetch_page = fetch_page
+        self._build = build
+        self._options = _PaginatorOptions(page_size, prefetch, max_items, max_pages, on_page)
+        self._items = self._iterate()
+
+    def __iter__(self) -> "Paginator[T]":
+        """Return the paginator itself."""
+        return self
+
+    def __next__(self) -> T:
+        """Return the next item, fetching the next page if needed."""
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop iterating and cancel any prefetch in flight.
+
+        Returns:
+            None
+
+        """
+        self._items.close()
+
+    def _fetch(self, page: str | None, limit: int) -> tuple[Any, float, list[Span]]:
+        start = time.perf_counter()
+        # The spans of traced calls end once the items of the page are built, to time the wrap.
+        with defer_spans() as spans:
+            response = self._fetch_page(page, limit)
+        return response, time.perf_counter() - start, spans
+
+    def _build_page(self, models: list[Any], spans: list[Span]) -> list[T]:
+        # Build the whole page before yielding any item, so that the spans end when the page is
+        # built rather than when the consumer gets to its last item.
+        start = time.perf_counter()
+        try:
+            return [self._build(model) for model in models]
+        finally:
+            finish_spans(spans, time.perf_counter() - start)
+
+    def _iterate(self) -> Iterator[T]:
+        options = self._options
+        executor = None
+        if options.prefetch:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cdp-paginator")
+
+        try:
+            pending = None
+            page = None
+            pages = 0
+            items = 0
+
+            while True:
+                wait_start = time.perf_counter()
+                if pending is None:
+                    response, fetch_seconds, spans = self._fetch(page, options.limit(items))
+                else:
+                    response, fetch_seconds, spans = pending.result()
+                    pending = None
+                wait_seconds = time.perf_counter() - wait_start
+                pages += 1
+
+                page_items = len(response.data)
+                if options.max_items is not None:
+                    page_items = min(page_items, options.max_items - items)
+                has_more = options.has_more(response, pages, items + page_items)
+                page = response.next_page
+
+                if has_more and executor is not None:
+                    # Copy the context so the background fetch sees the caller's context variables.
+                    pending = executor.submit(
+                        contextvars.copy_context().run,
+                        self._fetch,
+                        page,
+                        options.limit(items + page_items),
+                    )
+
+                options.report(pages, response, has_more, fetch_seconds, wait_seconds)
+
+                if not spans:
+                    for model in response.data[:page_items]:
+                        items += 1
+                        yield self._build(model)
+                else:
+                    for item in self._build_page(response.data[:page_items], spans):
+                        items += 1
+                        yield item
+
+                if not has_more:
+                    return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncPaginator(AsyncIterator[T], Generic[T]):
+    """Asynchronously iterates over the items of a paginated CDP API list endpoint.
+
+    The asyncio counterpart of `Paginator`. With `prefetch` enabled, the next page is requested in
+    a background task while the caller consumes the current one.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[str | None, int], Awaitable[Any]],
+        build: Callable[[Any], T],
+        page_size: int = 100,
+        prefetch: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        on_page: Callable[[PageInfo], None] | None = None,
+    ) -> None:
+        """Initialize the AsyncPaginator.
+
+        Args:
+            fetch_page (Callable[[Optional[str], int], Awaitable[Any]]): Fetches a page given the
+                page token and page size. The result must have `data`, `has_more` and `next_page`
+                fields.
+            build (Callable[[Any], T]): Builds an item from a model on the page.
+            page_size (int): The number of items to request per page. Defaults to 100.
+            prefetch (bool): Whether to fetch the next page in the background. Defaults to False.
+            max_items (Optional[int]): The maximum number of items to return. Defaults to None.
+            max_pages (Optional[int]): The maximum number of pages to fetch. Defaults to None.
+            on_page (Optional[Callable[[PageInfo], None]]): Called after each page is fetched.
+
+        Raises:
+            ValueError: If any of the limits are invalid.
+
+        """
+        self._fetch_page = fetch_page
+        self._build = build
+        self._options = _PaginatorOptions(page_size, prefetch, max_items, max_pages, on_page)
+        self._items = self._iterate()
+
+    def __aiter__(self) -> "AsyncPaginator[T]":
+        """Return the paginator itself."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Return the next item, fetching the next page if needed."""
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop iterating and cancel any prefetch in flight.
+
+        Returns:
+            None
+
+        """
+        await self._items.aclose()
+
+    async def _fetch(self, page: str | None, limit: int) -> tuple[Any, float, list[Span]]:
+        start = time.perf_counter()
+        # The spans of traced calls end once the items of the page are built, to time the wrap.
+        with defer_spans() as spans:
+            response = await self._fetch_page(page, limit)
+        return response, time.perf_counter() - start, spans
+
+    def _build_page(self, models: list[Any], spans: list[Span]) -> list[T]:
+        # Build the whole page before yielding any item, so that the spans end when the page is
+        # built rather than when the consumer gets to its last item.
+        start = time.perf_counter()
+        try:
+            return [self._build(model) for model in models]
+        finally:
+            finish_spans(spans, time.perf_counter() - start)
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        options = self._options
+        pending = None
+
+        try:
+            page = None
+            pages = 0
+            items = 0
+
+            while True:
+                wait_start = time.perf_counter()
+                if pending is None:
+                    response, fetch_seconds, spans = await self._fetch(page, options.limit(items))
+                else:
+                    response, fetch_seconds, spans = await pending
+                    pending = None
+                wait_seconds = time.perf_counter() - wait_start
+                pages += 1
+
+                page_items = len(response.data)
+                if options.max_items is not None:
+                    page_items = min(page_items, options.max_items - items)
+                has_more = options.has_more(response, pages, items + page_items)
+                page = response.next_page
+
+                if has_more and options.prefetch:
+                    pending = asyncio.ensure_future(
+                        self._fetch(page, options.limit(items + page_items))
+                    )
+
+                options.report(pages, response, has_more, fetch_seconds, wait_seconds)
+
+                if not spans:
+                    for model in response.data[:page_items]:
+                        items += 1
+                        yield self._build(model)
+                else:
+                    for item in self._build_page(response.data[:page_items], spans):
+                        items += 1
+                        yield item
+
+                if not has_more:
+                    return
+        finally:
+            if pending is not None:
+                pending.cancel()
@@ -3,12 +3,14 @@ from collections.abc import Iterator
 from enum import Enum
 
 from cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.create_payload_signature_request import CreatePayloadSignatureRequest
 from cdp.client.models.payload_signature import PayloadSignature as PayloadSignatureModel
-from cdp.client.models.payload_signature_list import PayloadSignatureList
+from cdp.paginator import Paginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
 
 
-class PayloadSignature:
+class PayloadSignature(ClientBound):
     """A representation of a Payload Signature."""
 
     class Status(Enum):
@@ -126,27 +128,39 @@ class PayloadSignature:
         self._model = model
 
     def wait(
-        self, interval_seconds: float = 0.2, timeout_seconds: float = 20
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
     ) -> "PayloadSignature":
         """Wait for the payload signature to complete.
 
         Args:
-            interval_seconds (float): The interval seconds.
+            interval_seconds (Optional[float]): A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds (float): The timeout seconds.
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             PayloadSignature: The payload signature.
 
         """
+        schedule = get_polling_policy(None, interval_seconds, polling_policy).schedule(
+            "payload_signature"
+        )
         start_time = time.time()
 
         while not self.terminal_state:
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("Timed out waiting for PayloadSignature to be signed")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
@@ -187,12 +201,15 @@ class PayloadSignature:
         return cls(model)
 
     @classmethod
-    def list(cls, wallet_id: str, address_id: str) -> Iterator["PayloadSignature"]:
+    def list(
+        cls, wallet_id: str, address_id: str, **pagination_options
+    ) -> Iterator["PayloadSignature"]:
         """List payload signatures.
 
         Args:
             wallet_id (str): The wallet ID.
             address_id (str): The address ID.
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
 
         Returns:
             Iterator[Payload]: An iterator of payload signatures.
@@ -201,19 +218,13 @@ class PayloadSignature:
             Exception: If there's an error listing the payload signatures.
 
         """
-        page = None
-        while True:
-            response: PayloadSignatureList = Cdp.api_clients.addresses.list_payload_signatures(
-                wallet_id=wallet_id, address_id=address_id, limit=100, page=page
-            )
-
-            for payload_signature_model in response.data:
-                yield cls(payload_signature_model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.addresses.list_payload_signatures(
+                wallet_id=wallet_id, address_id=address_id, limit=limit, page=page
+            ),
+            cls,
+            **pagination_options,
+        )
 
     def __str__(self) -> str:
         """Get a string representation of the payload signature."""
@@ -0,0 +1,338 @@
+import random
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from cdp.metrics import get_metrics_registry
+
+
+@dataclass(frozen=True)
+class PollingStats:
+    """A snapshot of the reload counters of a polling policy.
+
+    Attributes:
+        waits (int): The number of completed `wait()` calls, including timed out ones.
+        reloads (int): The total number of reloads across all waits.
+        timeouts (int): The number of waits that timed out.
+        last_wait_reloads (int): The number of reloads used by the most recent wait.
+        max_wait_reloads (int): The largest number of reloads used by a single wait.
+
+    """
+
+    waits: int = 0
+    reloads: int = 0
+    timeouts: int = 0
+    last_wait_reloads: int = 0
+    max_wait_reloads: int = 0
+
+    @property
+    def average_wait_reloads(self) -> float:
+        """The average number of reloads per wait.
+
+        Returns:
+            float: The average number of reloads, or 0 if no wait has completed.
+
+        """
+        return self.reloads / self.waits if self.waits else 0.0
+
+
+class PollingPolicy(ABC):
+    """Decides how long `wait()` sleeps between reloads of a pending resource.
+
+    Subclasses implement `intervals()`. Every policy keeps thread-safe counters of the reloads
+    used by the waits it has driven, available from `stats`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the PollingPolicy."""
+        self._lock = threading.Lock()
+        self._stats = PollingStats()
+
+    @abstractmethod
+    def intervals(self) -> Iterator[float]:
+        """Return the sleep intervals of a single wait, in seconds.
+
+        Returns:
+            Iterator[float]: An endless iterator of intervals.
+
+        """
+
+    def schedule(self, resource: str | None = None) -> "PollingSchedule":
+        """Start the schedule of a single wait.
+
+        Args:
+            resource (Optional[str]): The type of the resource being waited for, e.g. `transfer`,
+                under which the wait is counted in the metrics registry.
+
+        Returns:
+            PollingSchedule: The schedule.
+
+        """
+        return PollingSchedule(self, resource)
+
+    @property
+    def stats(self) -> PollingStats:
+        """The reload counters of the waits driven by this policy.
+
+        Returns:
+            PollingStats: A snapshot of the counters.
+
+        """
+        with self._lock:
+            return self._stats
+
+    def reset_stats(self) -> None:
+        """Reset the reload counters.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._stats = PollingStats()
+
+    def _record(self, reloads: int, timed_out: bool) -> None:
+        with self._lock:
+            stats = self._stats
+            self._stats = PollingStats(
+                waits=stats.waits + 1,
+                reloads=stats.reloads + reloads,
+                timeouts=stats.timeouts + int(timed_out),
+                last_wait_reloads=reloads,
+                max_wait_reloads=max(stats.max_wait_reloads, reloads),
+            )
+
+
+class FixedPollingPolicy(PollingPolicy):
+    """Polls at a fixed interval."""
+
+    def __init__(self, interval_seconds: float = 0.2) -> None:
+        """Initialize the FixedPollingPolicy.
+
+        Args:
+            interval_seconds (float): The interval between reloads. Defaults to 0.2.
+
+        Raises:
+            ValueError: If the interval is negative.
+
+        """
+        if interval_seconds < 0:
+            raise ValueError("interval_seconds must not be negative")
+
+        super().__init__()
+        self.interval_seconds = interval_seconds
+
+    def intervals(self) -> Iterator[float]:
+        """Return the sleep intervals of a single wait, in seconds.
+
+        Returns:
+            Iterator[float]: An endless iterator of `interval_seconds`.
+
+        """
+        while True:
+            yield self.interval_seconds
+
+    def __repr__(self) -> str:
+        """Return a string representation of the policy."""
+        return f"FixedPollingPolicy(interval_seconds={self.interval_seconds})"
+
+
+class ExponentialPollingPolicy(PollingPolicy):
+    """Polls at an interval that grows by `multiplier` after every reload, up to a maximum."""
+
+    def __init__(
+        self,
+        initial_seconds: float = 0.2,
+        max_seconds: float = 5,
+        multiplier: float = 2,
+    ) -> None:
+        """Initialize the ExponentialPollingPolicy.
+
+        Args:
+            initial_seconds (float): The interval after the first reload. Defaults to 0.2.
+            max_seconds (float): The maximum interval. Defaults to 5.
+            multiplier (float): The factor by which the interval grows. Defaults to 2.
+
+        Raises:
+            ValueError: If any of the intervals or the multiplier are invalid.
+
+        """
+        if initial_seconds <= 0 or max_seconds < initial_seconds:
+            raise ValueError("initial_seconds must be positive and at most max_seconds")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+
+        super().__init__()
+        self.initial_seconds = initial_seconds
+        self.max_seconds = max_seconds
+        self.multiplier = multiplier
+
+    def intervals(self) -> Iterator[float]:
+        """Return the sleep intervals of a single wait, in seconds.
+
+        Returns:
+            Iterator[float]: An endless iterator of growing intervals.
+
+        """
+        interval = self.initial_seconds
+        while True:
+            yield interval
+            interval = min(interval * self.multiplier, self.max_seconds)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the policy."""
+        return (
+            f"{type(self).__name__}(initial_seconds={self.initial_seconds}, "
+            f"max_seconds={self.max_seconds}, multiplier={self.multiplier})"
+        )
+
+
+class JitteredExponentialPollingPolicy(ExponentialPollingPolicy):
+    """An exponential policy that randomly shortens each interval.
+
+    Jitter spreads out the reloads of many resources created at the same time, so they do not hit
+    the API in lockstep. Each interval is drawn uniformly between `(1 - jitter)` times and the full
+    exponential interval.
+    """
+
+    def __init__(
+        self,
+        initial_seconds: float = 0.2,
+        max_seconds: float = 5,
+        multiplier: float = 2,
+        jitter: float = 0.5,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the JitteredExponentialPollingPolicy.
+
+        Args:
+            initial_seconds (float): The interval after the first reload. Defaults to 0.2.
+            max_seconds (float): The maximum interval. Defaults to 5.
+            multiplier (float): The factor by which the interval grows. Defaults to 2.
+            jitter (float): The fraction of each interval that is randomized, between 0 and 1.
+                Defaults to 0.5.
+            rng (Optional[random.Random]): The random number generator. Defaults to the module
+                level generator.
+
+        Raises:
+            ValueError: If any of the intervals, the multiplier or the jitter are invalid.
+
+        """
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        super().__init__(initial_seconds, max_seconds, multiplier)
+        self.jitter = jitter
+        self._rng = rng or random
+
+    def intervals(self) -> Iterator[float]:
+        """Return the sleep intervals of a single wait, in seconds.
+
+        Returns:
+            Iterator[float]: An endless iterator of growing, randomized intervals.
+
+        """
+        for interval in super().intervals():
+            yield self._rng.uniform(interval * (1 - self.jitter), interval)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the policy."""
+        return f"{super().__repr__()[:-1]}, jitter={self.jitter})"
+
+
+class PollingSchedule:
+    """The intervals of a single wait, counting the reloads it uses."""
+
+    def __init__(self, policy: PollingPolicy, resource: str | None = None) -> None:
+        """Initialize the PollingSchedule.
+
+        Args:
+            policy (PollingPolicy): The policy that provides the intervals and records the counts.
+            resource (Optional[str]): The type of the resource being waited for.
+
+        """
+        self.policy = policy
+        self.resource = resource
+        self.sleeps = 0
+        self._intervals = policy.intervals()
+
+    def next_interval(self) -> float:
+        """Return how long to sleep before the next reload.
+
+        Returns:
+            float: The interval in seconds.
+
+        """
+        self.sleeps += 1
+        return next(self._intervals)
+
+    def record(self, timed_out: bool = False, reloads: int | None = None) -> int:
+        """Record the end of the wait on the policy's counters and in the metrics registry.
+
+        A wait reloads once before each sleep, and once more before it times out.
+
+        Args:
+            timed_out (bool): Whether the wait timed out. Defaults to False.
+            reloads (Optional[int]): The number of reloads, for waits that do not reload before
+                each sleep. Defaults to the count above.
+
+        Returns:
+            int: The number of reloads used by the wait.
+
+        """
+        if reloads is None:
+            reloads = self.sleeps + int(timed_out)
+        self.policy._record(reloads, timed_out)
+
+        registry = get_metrics_registry()
+        if registry is not None and self.resource is not None:
+            registry.record_wait(self.resource, reloads, timed_out)
+        return reloads
+
+
+DEFAULT_POLLING_POLICY = JitteredExponentialPollingPolicy(initial_seconds=0.2, max_seconds=2)
+
+# Defaults tuned to each network's block time: polling much faster than blocks are produced only
+# burns requests, and confirmations on slow chains take several blocks.
+NETWORK_POLLING_POLICIES: dict[str, PollingPolicy] = {
+    # ~2 second blocks.
+    "base-mainnet": JitteredExponentialPollingPolicy(initial_seconds=0.5, max_seconds=2),
+    "base-sepolia": JitteredExponentialPollingPolicy(initial_seconds=0.5, max_seconds=2),
+    "polygon-mainnet": JitteredExponentialPollingPolicy(initial_seconds=0.5, max_seconds=2),
+    # Sub-second blocks.
+    "arbitrum-mainnet": JitteredExponentialPollingPolicy(initial_seconds=0.2, max_seconds=1),
+    "arbitrum-sepolia": JitteredExponentialPollingPolicy(initial_seconds=0.2, max_seconds=1),
+    "solana-devnet": JitteredExponentialPollingPolicy(initial_seconds=0.2, max_seconds=1),
+    "solana-mainnet": JitteredExponentialPollingPolicy(initial_seconds=0.2, max_seconds=1),
+    # ~12 second blocks.
+    "ethereum-mainnet": JitteredExponentialPollingPolicy(initial_seconds=2, max_seconds=6),
+    "ethereum-sepolia": JitteredExponentialPollingPolicy(initial_seconds=2, max_seconds=6),
+    "ethereum-holesky": JitteredExponentialPollingPolicy(initial_seconds=2, max_seconds=6),
+}
+
+
+def get_polling_policy(
+    network_id: str | None = None,
+    interval_seconds: float | None = None,
+    polling_policy: PollingPolicy | None = None,
+) -> PollingPolicy:
+    """Return the polling policy a `wait()` call should use.
+
+    An explicit `polling_policy` takes precedence, followed by a fixed `interval_seconds`, and
+    finally the default policy of the network.
+
+    Args:
+        network_id (Optional[str]): The network of the resource being waited for.
+        interval_seconds (Optional[float]): A fixed interval requested by the caller.
+        polling_policy (Optional[PollingPolicy]): A policy requested by the caller.
+
+    Returns:
+        PollingPolicy: The polling policy.
+
+    """
+    if polling_policy is not None:
+        return polling_policy
+    if interval_seconds is not None:
+        return FixedPollingPolicy(interval_seconds)
+    return NETWORK_POLLING_POLICIES.get(network_id, DEFAULT_POLLING_POLICY)
@@ -0,0 +1,307 @@
+import asyncio
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+DEFAULT_GROUP = "default"
+_VERSION_SEGMENT = re.compile(r"^v\d+$")
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """A snapshot of the rate limit of an endpoint group.
+
+    Attributes:
+        rate (float): The current rate in requests per second, lowered after 429 responses and
+            recovering towards the limit.
+        limit (float): The configured rate in requests per second.
+        queue_depth (int): The number of callers currently waiting for their turn.
+        throttled (int): The number of 429 responses received.
+        waited_seconds (float): The total time callers spent waiting.
+
+    """
+
+    rate: float
+    limit: float
+    queue_depth: int = 0
+    throttled: int = 0
+    waited_seconds: float = 0.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header.
+
+    Args:
+        value (Optional[str]): The header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the header is missing or
+        invalid.
+
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """A token bucket that spaces requests out to a rate, adapting it to 429 responses.
+
+    Callers reserve their turn when they acquire a token and wait for it, so that a burst of
+    requests is queued in order instead of being rejected by the API. A 429 response halves the
+    rate and pauses the bucket for the `Retry-After` of the response. The rate then recovers
+    linearly to the limit over `recovery_seconds`, as long as no further 429 arrives.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        recovery_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the TokenBucket.
+
+        Args:
+            rate (float): The limit in requests per second.
+            burst (Optional[int]): The number of requests that may be sent at once after the
+                bucket was idle. Defaults to one second worth of requests.
+            recovery_seconds (float): Seconds the rate takes to recover from the lowest rate to
+                the limit after 429 responses. Defaults to 10.
+            clock (Callable[[], float]): The monotonic clock. Defaults to `time.monotonic`.
+
+        Raises:
+            ValueError: If the rate, burst or recovery time is invalid.
+
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        if recovery_seconds <= 0:
+            raise ValueError("recovery_seconds must be positive")
+
+        self._limit = float(rate)
+        self._rate = float(rate)
+        self._min_rate = self._limit / 100
+        self._burst = burst if burst is not None else max(1, int(rate))
+        self._recovery_seconds = recovery_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # The time at which the bucket is empty again, as in the generic cell rate algorithm.
+        self._empty_at = clock()
+        self._rate_updated_at = self._empty_at
+        self._paused_until = self._empty_at
+        # Incremented on every 429, so that queued callers reschedule after the pause.
+        self._generation = 0
+        self._queue_depth = 0
+        self._throttled = 0
+        self._waited_seconds = 0.0
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """The current rate and counters of the bucket.
+
+        Returns:
+            RateLimiterStats: A snapshot of the bucket.
+
+        """
+        with self._lock:
+            self._recover(self._clock())
+            return RateLimiterStats(
+                rate=self._rate,
+                limit=self._limit,
+                queue_depth=self._queue_depth,
+                throttled=self._throttled,
+                waited_seconds=self._waited_seconds,
+            )
+
+    def acquire(self) -> float:
+        """Wait for a token.
+
+        Returns:
+            float: The number of seconds waited.
+
+        """
+        waited = 0.0
+        with self._lock:
+            self._queue_depth += 1
+        try:
+            while True:
+                delay, generation = self._reserve()
+                if delay <= 0:
+                    return waited
+                time.sleep(delay)
+                waited += delay
+                if not self._rescheduled(generation):
+                    return waited
+        finally:
+            self._done(waited)
+
+    async def acquire_async(self) -> float:
+        """Wait for a token without blocking the event loop.
+
+        Returns:
+            float: The number of seconds waited.
+
+        """
+        waited = 0.0
+        with self._lock:
+            self._queue_depth += 1
+        try:
+            while True:
+                delay, generation = self._reserve()
+                if delay <= 0:
+                    return waited
+                await asyncio.sleep(delay)
+                waited += delay
+                if not self._rescheduled(generation):
+                    return waited
+        finally:
+            self._done(waited)
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        """Slow down after a 429 response.
+
+        Args:
+            retry_after (Optional[float]): Seconds the API asked to wait before the next request,
+                or None to wait for the next token at the lowered rate.
+
+        """
+        with self._lock:
+            now = self._clock()
+            self._recover(now)
+            self._rate = max(self._min_rate, self._rate / 2)
+            pause = retry_after if retry_after is not None else 1 / self._rate
+            self._paused_until = max(self._paused_until, now + pause)
+            # Queued callers reserve their turn again, so their earlier reservations are dropped,
+            # and sending resumes with a single request rather than a full burst.
+            self._empty_at = self._paused_until + self._tolerance
+            self._generation += 1
+            self._throttled += 1
+
+    @property
+    def _tolerance(self) -> float:
+        return (self._burst - 1) / self._rate
+
+    def _reserve(self) -> tuple[float, int]:
+        """Reserve the next token and return how long to wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._recover(now)
+            empty_at = max(self._empty_at, now)
+            send_at = max(now, empty_at - self._tolerance)
+            self._empty_at = empty_at + 1 / self._rate
+            return send_at - now, self._generation
+
+    def _rescheduled(self, generation: int) -> bool:
+        with self._lock:
+            return generation != self._generation
+
+    def _done(self, waited: float) -> None:
+        with self._lock:
+            self._queue_depth -= 1
+            self._waited_seconds += waited
+
+    def _recover(self, now: float) -> None:
+        """Raise the rate towards the limit for the time passed since the last update."""
+        elapsed = now - self._rate_updated_at
+        self._rate_updated_at = now
+        if self._rate < self._limit and elapsed > 0:
+            self._rate = min(
+                self._limit, self._rate + elapsed * self._limit / self._recovery_seconds
+            )
+
+
+class RateLimiter:
+    """Limits the request rate of an API client per endpoint group.
+
+    An endpoint group is the resource that follows the API version in the request path, e.g.
+    `wallets` for `/v1/wallets/{wallet_id}/addresses` or `networks` for
+    `/v1/networks/{network_id}/addresses/{address_id}/balance_history`. Groups with their own
+    limit get their own token bucket, and all other requests share the default bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        group_rates: Mapping[str, float] | None = None,
+        burst: int | None = None,
+        recovery_seconds: float = 10.0,
+    ):
+        """Initialize the RateLimiter.
+
+        Args:
+            rate (Optional[float]): The limit in requests per second shared by requests outside
+                the groups in `group_rates`, or None to leave them unlimited.
+            group_rates (Optional[Mapping[str, float]]): Limits in requests per second of
+                endpoint groups, e.g. `{"webhooks": 2}`.
+            burst (Optional[int]): The number of requests of a group that may be sent at once
+                after it was idle. Defaults to one second worth of requests.
+            recovery_seconds (float): Seconds a rate takes to recover from the lowest rate to
+                its limit after 429 responses. Defaults to 10.
+
+        """
+        self._buckets: dict[str, TokenBucket] = {
+            group: TokenBucket(group_rate, burst, recovery_seconds)
+            for group, group_rate in (group_rates or {}).items()
+        }
+        if rate is not None:
+            self._buckets[DEFAULT_GROUP] = TokenBucket(rate, burst, recovery_seconds)
+
+    @property
+    def stats(self) -> dict[str, RateLimiterStats]:
+        """The current rate and counters of each endpoint group.
+
+        Returns:
+            Dict[str, RateLimiterStats]: A snapshot of each group, keyed by group name.
+
+        """
+        return {group: bucket.stats for group, bucket in self._buckets.items()}
+
+    def bucket(self, url: str) -> TokenBucket | None:
+        """Return the token bucket of a request.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            Optional[TokenBucket]: The bucket of the endpoint group of the URL, or None if the
+            request is not limited.
+
+        """
+        bucket = self._buckets.get(endpoint_group(url))
+        if bucket is None:
+            bucket = self._buckets.get(DEFAULT_GROUP)
+        return bucket
+
+
+def endpoint_group(url: str) -> str:
+    """Return the endpoint group of a request URL.
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        str: The path segment following the API version, or `default` if there is none.
+
+    """
+    segments = [segment for segment in urlparse(url).path.split("/") if segment]
+    for index, segment in enumerate(segments[:-1]):
+        if _VERSION_SEGMENT.match(segment):
+            return segments[index + 1]
+    return DEFAULT_GROUP
@@ -0,0 +1,265 @@
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from enum import IntEnum
+from urllib.parse import urlparse
+
+
+class RequestPriority(IntEnum):
+    """The priority class of an API request, lower values being scheduled first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+_request_priority: contextvars.ContextVar[RequestPriority | None] = contextvars.ContextVar(
+    "cdp_request_priority", default=None
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Set the priority of the API requests made within a block.
+
+    The priority is held in a context variable, so it applies to the current thread or asyncio
+    task only, and to the page prefetches and status polls started from it.
+
+    Args:
+        priority (RequestPriority): The priority of the requests.
+
+    Yields:
+        None
+
+    Examples:
+        >>> with request_priority(RequestPriority.LOW):
+        ...     balances = list(address.historical_balances("eth"))
+
+    """
+    token = _request_priority.set(RequestPriority(priority))
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def set_request_priority(priority: RequestPriority | None) -> None:
+    """Set the priority of the API requests made by the current thread or task from now on.
+
+    Args:
+        priority (Optional[RequestPriority]): The priority of the requests, or None to use the
+            default priority of each request again.
+
+    """
+    _request_priority.set(None if priority is None else RequestPriority(priority))
+
+
+def get_request_priority(method: str, url: str) -> RequestPriority:
+    """Return the priority of a request.
+
+    The priority set with `request_priority` or `set_request_priority` wins. Otherwise,
+    broadcasts of signed transfers, trades, contract invocations, staking operations and user
+    operations are high priority, as their latency is seen by users, and everything else is
+    normal priority.
+
+    Args:
+        method (str): The HTTP method of the request.
+        url (str): The request URL.
+
+    Returns:
+        RequestPriority: The priority of the request.
+
+    """
+    priority = _request_priority.get()
+    if priority is not None:
+        return priority
+
+    if method.upper() == "POST" and urlparse(url).path.endswith("/broadcast"):
+        return RequestPriority.HIGH
+    return RequestPriority.NORMAL
+
+
+@dataclass(frozen=True)
+class RequestSchedulerStats:
+    """A snapshot of the requests of a request scheduler.
+
+    Attributes:
+        in_flight (int): The number of requests currently being sent.
+        queued_high (int): The number of high priority requests waiting for a connection.
+        queued_normal (int): The number of normal priority requests waiting for a connection.
+        queued_low (int): The number of low priority requests waiting for a connection.
+        reserved (int): The number of connections only high priority requests may use.
+
+    """
+
+    in_flight: int = 0
+    queued_high: int = 0
+    queued_normal: int = 0
+    queued_low: int = 0
+    reserved: int = 0
+
+
+class RequestScheduler:
+    """Schedules API requests onto a fixed number of connections by priority.
+
+    At most `connections` requests are in flight at once. Waiting requests are started strictly
+    by priority, then in the order they arrived, so that a latency-critical request overtakes a
+    queue of bulk requests. The last `reserved` connections are only used by high priority
+    requests, so that one can start immediately even while bulk requests occupy every other
+    connection.
+    """
+
+    def __init__(self, connections: int, reserved: int = 0):
+        """Initialize the RequestScheduler.
+
+        Args:
+            connections (int): The maximum number of requests in flight, usually the size of the
+                connection pool.
+            reserved (int): The number of connections reserved for high priority requests.
+                Defaults to 0.
+
+        Raises:
+            ValueError: If the number of connections or reserved connections is invalid.
+
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        if not 0 <= reserved < connections:
+            raise ValueError("reserved must be at least 0 and less than connections")
+
+        self._connections = connections
+        self._reserved = reserved
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, _Waiter]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def stats(self) -> RequestSchedulerStats:
+        """The requests in flight and waiting.
+
+        Returns:
+            RequestSchedulerStats: A snapshot of the scheduler.
+
+        """
+        with self._lock:
+            queued = dict.fromkeys(RequestPriority, 0)
+            for _, _, waiter in self._waiters:
+                queued[waiter.priority] += 1
+            return RequestSchedulerStats(
+                in_flight=self._in_flight,
+                queued_high=queued[RequestPriority.HIGH],
+                queued_normal=queued[RequestPriority.NORMAL],
+                queued_low=queued[RequestPriority.LOW],
+                reserved=self._reserved,
+            )
+
+    @contextlib.contextmanager
+    def slot(self, priority: RequestPriority) -> Iterator[None]:
+        """Hold a connection slot for the duration of a request.
+
+        Args:
+            priority (RequestPriority): The priority of the request.
+
+        Yields:
+            None
+
+        """
+        event = threading.Event()
+        if self._start_or_enqueue(priority, event.set) is not True:
+            event.wait()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold a connection slot for the duration of a request without blocking the event loop.
+
+        Args:
+            priority (RequestPriority): The priority of the request.
+
+        Yields:
+            None
+
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = self._start_or_enqueue(
+            priority, lambda: loop.call_soon_threadsafe(_resolve, future)
+        )
+        if waiter is not True:
+            try:
+                await future
+            except asyncio.CancelledError:
+                self._cancel(waiter)
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _can_start(self, priority: RequestPriority) -> bool:
+        if priority == RequestPriority.HIGH:
+            return self._in_flight < self._connections
+        return self._in_flight < self._connections - self._reserved
+
+    def _start_or_enqueue(
+        self, priority: RequestPriority, wake: Callable[[], None]
+    ) -> "_Waiter | bool":
+        """Start a request, or queue it if it cannot start or others of its priority wait.
+
+        Returns:
+            Union[_Waiter, bool]: True if the request started, or its waiter if it was queued.
+
+        """
+        with self._lock:
+            queue_ahead = self._waiters and self._waiters[0][0] <= priority
+            if not queue_ahead and self._can_start(priority):
+                self._in_flight += 1
+                return True
+
+            waiter = _Waiter(RequestPriority(priority), wake)
+            heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+            return waiter
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            # A slot is handed over to the waiter it starts, which releases it when done.
+            while self._waiters and self._can_start(self._waiters[0][2].priority):
+                _, _, waiter = heapq.heappop(self._waiters)
+                waiter.started = True
+                self._in_flight += 1
+                waiter.wake()
+
+    def _cancel(self, waiter: "_Waiter") -> None:
+        """Withdraw a cancelled waiter, releasing the slot if it was already handed over."""
+        with self._lock:
+            if not waiter.started:
+                self._waiters = [entry for entry in self._waiters if entry[2] is not waiter]
+                heapq.heapify(self._waiters)
+                return
+        self._release()
+
+
+class _Waiter:
+    """A request waiting for a slot."""
+
+    __slots__ = ("priority", "started", "wake")
+
+    def __init__(self, priority: RequestPriority, wake: Callable[[], None]) -> None:
+        self.priority = priority
+        self.wake = wake
+        self.started = False
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,346 @@
+import enum
+import re
+import threading
+import types
+import typing
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+
+import cdp.client.models
+
+_LIST_TYPE = re.compile(r"List\[(.*)]")
+_DICT_TYPE = re.compile(r"Dict\[([^,]*), (.*)]")
+# Marks a field that a trusted response must contain.
+_REQUIRED = object()
+# Defaults that can be shared between models instead of being copied for each one.
+_IMMUTABLE = (type(None), str, int, float, bool, enum.Enum)
+_JSON_CONTENT_TYPE = re.compile(r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+
+
+def is_json_content_type(content_type: str | None) -> bool:
+    """Check whether a response content type is JSON.
+
+    Args:
+        content_type (Optional[str]): The content type header of the response.
+
+    Returns:
+        bool: True if the content type is JSON or missing, False otherwise.
+
+    """
+    return content_type is None or _JSON_CONTENT_TYPE.match(content_type) is not None
+
+
+def _is_one_of(klass: type[BaseModel]) -> bool:
+    """Check whether a model is a generated oneOf/anyOf wrapper around other models."""
+    return "actual_instance" in klass.model_fields
+
+
+def _model_factory(
+    klass: type[BaseModel],
+) -> Callable[[dict[str, Any], set[str]], BaseModel]:
+    """Return a function that creates a model from complete field values without validation.
+
+    `model_construct` resolves aliases and defaults for every instance, which makes it slower
+    than validation for models with many optional fields. The deserializer has already resolved
+    both, so plain models are created the way `model_construct` creates them, without that work.
+    """
+    if (
+        klass.__pydantic_root_model__
+        or klass.__pydantic_post_init__
+        or klass.model_config.get("extra") == "allow"
+    ):
+        return lambda values, fields_set: klass.model_construct(fields_set, **values)
+
+    def new_model(values: dict[str, Any], fields_set: set[str]) -> BaseModel:
+        model = klass.__new__(klass)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+    return new_model
+
+
+def _models_in(annotation: Any) -> list[type[BaseModel]]:
+    """Return the model classes referenced by a field annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+
+    return [model for arg in typing.get_args(annotation) for model in _models_in(arg)]
+
+
+class ResponseDeserializer:
+    """Deserializes JSON API responses straight into models.
+
+    The generated client parses a response with `json.loads`, dispatches on the type name with
+    regular expressions at every level of the payload and builds each nested model with its own
+    `from_dict`, which validates it again. Instead, this deserializer compiles a plan once per
+    response type. Models made only of plain fields are validated from the raw JSON by
+    pydantic-core in a single pass. Models that contain generated oneOf wrappers, which pydantic
+    cannot validate directly, are parsed once and only the wrapped values are built with
+    `from_dict`.
+
+    With `validate=False`, responses are trusted: models are built with `model_construct`, and
+    only fields whose JSON form differs from their Python type, such as datetimes, are converted.
+    Payloads missing a required field are rejected so that callers can fall back to validation.
+    """
+
+    def __init__(self, validate: bool = True) -> None:
+        """Initialize the ResponseDeserializer.
+
+        Args:
+            validate (bool): Whether to validate responses against their models. Defaults to
+                True.
+
+        """
+        self._validate = validate
+        self._plans: dict[str, Callable[[str | bytes], Any] | None] = {}
+        self._direct: dict[type[BaseModel], bool] = {}
+        self._constructors: dict[type[BaseModel], Callable[[Any], Any]] = {}
+        self._lock = threading.Lock()
+
+    def deserialize(self, response_text: str | bytes, response_type: str) -> Any:
+        """Deserialize a JSON response.
+
+        Args:
+            response_text (Union[str, bytes]): The response body.
+            response_type (str): The response type name used by the generated client, e.g.
+                `TransferList` or `List[Asset]`.
+
+        Returns:
+            Any: The deserialized model.
+
+        Raises:
+            pydantic.ValidationError: If the response is not valid JSON or does not match the
+                response type.
+            ValueError: If the response type is not supported by the fast path, or a trusted
+                response is missing required fields.
+
+        """
+        plan = self.plan(response_type)
+        if plan is None:
+            raise ValueError(f"Unsupported response type: {response_type}")
+
+        return plan(response_text)
+
+    def supports(self, response_type: str) -> bool:
+        """Check whether a response type can be deserialized by the fast path.
+
+        Args:
+            response_type (str): The response type name.
+
+        Returns:
+            bool: True if the response type resolves to models or lists and dicts of models.
+
+        """
+        return self.plan(response_type) is not None
+
+    def plan(self, response_type: str) -> Callable[[str | bytes], Any] | None:
+        """Return the compiled plan of a response type, compiling it on first use.
+
+        Args:
+            response_type (str): The response type name.
+
+        Returns:
+            Optional[Callable[[Union[str, bytes]], Any]]: The plan, or None if the response type
+            is not supported by the fast path.
+
+        """
+        try:
+            return self._plans[response_type]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if response_type not in self._plans:
+                self._plans[response_type] = self._compile_plan(response_type)
+            return self._plans[response_type]
+
+    def _compile_plan(self, response_type: str) -> Callable[[str | bytes], Any] | None:
+        annotation = self._resolve(response_type)
+        if annotation is None:
+            return None
+
+        if self._validate and all(self._is_direct(model) for model in _models_in(annotation)):
+            return TypeAdapter(annotation).validate_json
+
+        convert = self._converter(annotation)
+        return lambda response_text: convert(pydantic_core.from_json(response_text))
+
+    def _resolve(self, response_type: str) -> Any:
+        """Resolve a response type name to a model annotation, or None for other types."""
+        if response_type.startswith("List["):
+            match = _LIST_TYPE.match(response_type)
+            item = self._resolve(match.group(1)) if match else None
+            return None if item is None else list[item]
+
+        if response_type.startswith("Dict["):
+            match = _DICT_TYPE.match(response_type)
+            value = self._resolve(match.group(2)) if match else None
+            return None if value is None else dict[str, value]
+
+        klass = getattr(cdp.client.models, response_type, None)
+        if isinstance(klass, type) and issubclass(klass, BaseModel):
+            return klass
+
+        return None
+
+    def _is_direct(self, klass: type[BaseModel], visiting: tuple[type, ...] = ()) -> bool:
+        """Check whether a model and every model nested in it can be validated by pydantic."""
+        if klass in self._direct:
+            return self._direct[klass]
+        if klass in visiting:
+            # A recursive reference is direct if the rest of the model is.
+            return True
+
+        direct = not _is_one_of(klass) and all(
+            self._is_direct(model, (*visiting, klass))
+            for field in klass.model_fields.values()
+            for model in _models_in(field.annotation)
+        )
+        if not visiting:
+            self._direct[klass] = direct
+        return direct
+
+    def _converter(self, annotation: Any) -> Callable[[Any], Any]:
+        """Compile a function that builds a value of a type from parsed JSON."""
+        origin = typing.get_origin(annotation)
+
+        if origin in (typing.Union, types.UnionType):
+            models = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if len(models) == 1:
+                return self._converter(models[0])
+            return lambda data: data
+
+        if origin is list:
+            convert = self._converter(typing.get_args(annotation)[0])
+            return lambda data: [convert(item) for item in data]
+
+        if origin is dict:
+            convert = self._converter(typing.get_args(annotation)[1])
+            return lambda data: {key: convert(value) for key, value in data.items()}
+
+        if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+            return lambda data: data
+
+        if _is_one_of(annotation):
+            wrapped = [
+                arg
+                for arg in typing.get_args(annotation.model_fields["actual_instance"].annotation)
+                if arg is not type(None)
+            ]
+            if len(wrapped) != 1 or _models_in(wrapped[0]) != wrapped:
+                return annotation.from_dict
+
+            # A wrapper around a single model needs no trial deserialization.
+            convert_wrapped = self._converter(wrapped[0])
+            return lambda data: annotation.model_construct(actual_instance=convert_wrapped(data))
+
+        if not self._validate:
+            return self._constructor(annotation)
+
+        if self._is_direct(annotation):
+            return annotation.model_validate
+
+        fields = [
+            (field.alias or name, self._converter(field.annotation))
+            for name, field in annotation.model_fields.items()
+            if not all(self._is_direct(model) for model in _models_in(field.annotation))
+        ]
+
+        def convert_model(data: Any) -> Any:
+            if isinstance(data, dict):
+                data = dict(data)
+                for key, convert in fields:
+                    if data.get(key) is not None:
+                        data[key] = convert(data[key])
+
+            return annotation.model_validate(data)
+
+        return convert_model
+
+    def _constructor(self, klass: type[BaseModel]) -> Callable[[Any], Any]:
+        """Compile a function that builds a model from parsed JSON without validating it."""
+        if klass in self._constructors:
+            return self._constructors[klass]
+
+        # Register an indirection first so that recursive references resolve to this constructor.
+        self._constructors[klass] = lambda data: construct(data)
+
+        fields = []
+        for name, field in klass.model_fields.items():
+            if field.is_required():
+                default = _REQUIRED
+            elif field.default_factory is None and isinstance(field.default, _IMMUTABLE):
+                default = field.default
+            else:
+                default = field
+            fields.append(
+                (field.alias or name, name, self._field_converter(field.annotation), default)
+            )
+        new_model = _model_factory(klass)
+
+        def construct(data: Any) -> Any:
+            if not isinstance(data, dict):
+                raise ValueError(f"Response does not match {klass.__name__}")
+
+            values = {}
+            fields_set = set()
+            for key, name, convert, default in fields:
+                if key in data:
+                    value = data[key]
+                    values[name] = value if convert is None or value is None else convert(value)
+                    fields_set.add(name)
+                elif default is _REQUIRED:
+                    raise ValueError(f"Response does not match {klass.__name__}")
+                elif isinstance(default, FieldInfo):
+                    values[name] = default.get_default(call_default_factory=True)
+                else:
+                    values[name] = default
+
+            return new_model(values, fields_set)
+
+        self._constructors[klass] = construct
+        return construct
+
+    def _field_converter(self, annotation: Any) -> Callable[[Any], Any] | None:
+        """Compile a function that converts a JSON value to a field type, or None if not needed."""
+        if annotation in (str, int, bool, Any, object) or annotation is type(None):
+            return None
+
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return self._converter(annotation)
+
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+
+        if origin is typing.Annotated:
+            return self._field_converter(args[0])
+
+        if origin is typing.Literal:
+            return None
+
+        if origin in (typing.Union, types.UnionType):
+            members = [arg for arg in args if arg is not type(None)]
+            if len(members) == 1:
+                return self._field_converter(members[0])
+            if all(self._field_converter(member) is None for member in members):
+                return None
+
+        elif origin is list:
+            convert = self._field_converter(args[0]) if args else None
+            return None if convert is None else lambda data: [convert(item) for item in data]
+
+        elif origin is dict:
+            convert = self._field_converter(args[1]) if args else None
+            if convert is None:
+                return None
+            return lambda data: {key: convert(value) for key, value in data.items()}
+
+        # Datetimes, enums, decimals, floats and the like differ from their JSON form.
+        return TypeAdapter(annotation).validate_python
@@ -0,0 +1,411 @@
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import TYPE_CHECKING, Any
+
+from cdp.transaction_signer import CoincurveTransactionSigner, TransactionSigner
+
+if TYPE_CHECKING:
+    from eth_account.signers.base import BaseAccount
+    from eth_account.signers.local import LocalAccount
+
+    from cdp.wallet import Wallet
+
+_REGISTER = "register"
+_SIGN_TRANSACTIONS = "sign_transactions"
+_SIGN_HASHES = "sign_hashes"
+
+
+def _worker_main(requests: Connection, results: Connection) -> None:
+    """Serve signing requests in a worker process until the stop sentinel is received.
+
+    Args:
+        requests (Connection): The pipe to receive the requests of this worker on, as
+            `(request_id, operation, address, payload)` tuples.
+        results (Connection): The pipe of this worker to return `(request_id, error, value)`
+            tuples on.
+
+    """
+    from eth_account import Account
+
+    signer = CoincurveTransactionSigner()
+    accounts: dict[str, LocalAccount] = {}
+
+    while True:
+        try:
+            request = requests.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        request_id, operation, address, payload = request
+        try:
+            if operation == _REGISTER:
+                for private_key in payload:
+                    account = Account.from_key(private_key)
+                    accounts[account.address] = account
+                value = None
+            elif operation == _SIGN_TRANSACTIONS:
+                account = accounts[address]
+                value = [signer.sign_transaction(account, transaction) for transaction in payload]
+            else:
+                account = accounts[address]
+                value = [signer.sign_hash(account, message_hash) for message_hash in payload]
+        except Exception as e:
+            results.send((request_id, e, None))
+        else:
+            results.send((request_id, None, value))
+
+
+@dataclass
+class _Worker:
+    """A worker process and the parent's ends of its pipes."""
+
+    process: BaseProcess
+    requests: Connection
+    results: Connection
+    send_lock: threading.Lock
+
+
+class SigningPool(TransactionSigner):
+    """Signs transactions and message hashes of registered keys in a pool of worker processes.
+
+    Signing is CPU-bound and holds the GIL, so signing on many threads of one process is capped at
+    a single core. Keys registered with the pool are sent once to every worker process, and
+    signatures are then computed by the workers, so concurrent transfers, trades and contract
+    invocations, e.g. from `WalletAddress.batch_transfer`, sign on every core.
+
+    Set the pool as the transaction signer with `set_transaction_signer(pool)` to sign
+    `Transaction.sign`, `SponsoredSend.sign`, `UserOperation.sign` and
+    `WalletAddress.sign_payload` with it, which covers transfers, trades, contract invocations
+    and payload signatures. Wallet address attestations are signed in the calling process, as the
+    key of a new address cannot be registered before the address is created. Keys that are not
+    registered are signed in the calling process with `CoincurveTransactionSigner`. Use
+    `sign_transactions` and `sign_hashes` to sign batches of payloads of one address across the
+    workers.
+
+    Each worker returns its results on its own pipe. If a worker exits, the requests pending on
+    it fail with a RuntimeError and new requests go to the remaining workers.
+    """
+
+    def __init__(self, max_workers: int | None = None, timeout: float | None = 60) -> None:
+        """Initialize the SigningPool and start its worker processes.
+
+        Args:
+            max_workers (Optional[int]): The number of worker processes. Defaults to the number of
+                CPUs.
+            timeout (Optional[float]): The number of seconds to wait for the result of a request
+                before raising a TimeoutError, or None to wait indefinitely. Defaults to 60.
+
+        Raises:
+            ValueError: If the number of workers is less than 1.
+
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        # Workers are spawned rather than forked, as the parent runs threads.
+        context = multiprocessing.get_context("spawn")
+        self._workers: list[_Worker] = []
+        for index in range(workers):
+            request_reader, request_writer = context.Pipe(duplex=False)
+            result_reader, result_writer = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_worker_main,
+                args=(request_reader, result_writer),
+                name=f"cdp-signing-{index}",
+                daemon=True,
+            )
+            process.start()
+            # The worker's ends are closed in the parent, so that sending to a worker that exited
+            # raises BrokenPipeError and its result pipe reaches EOF.
+            request_reader.close()
+            result_writer.close()
+            self._workers.append(_Worker(process, request_writer, result_reader, threading.Lock()))
+
+        self._timeout = timeout
+        self._local_signer = CoincurveTransactionSigner()
+        self._addresses: set[str] = set()
+        self._pending: dict[int, tuple[Future, int]] = {}
+        self._dead: set[int] = set()
+        self._request_ids = itertools.count()
+        self._next_worker = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._collector = threading.Thread(
+            target=self._collect, name="cdp-signing-results", daemon=True
+        )
+        self._collector.start()
+
+    @property
+    def max_workers(self) -> int:
+        """The number of worker processes."""
+        return len(self._workers)
+
+    @property
+    def addresses(self) -> frozenset[str]:
+        """The addresses of the registered keys."""
+        return frozenset(self._addresses)
+
+    def register(self, *accounts: "LocalAccount") -> list[str]:
+        """Send the private keys of accounts to every running worker.
+
+        Args:
+            *accounts (LocalAccount): The accounts to sign for in the workers.
+
+        Returns:
+            List[str]: The addresses of the accounts.
+
+        Raises:
+            RuntimeError: If the pool is closed, or a worker exits while registering.
+            TimeoutError: If a worker does not register the keys within the timeout.
+
+        """
+        private_keys = [bytes(account.key) for account in accounts]
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SigningPool is closed")
+            workers = [index for index in range(self.max_workers) if index not in self._dead]
+        for future in [self._submit(index, _REGISTER, None, private_keys) for index in workers]:
+            self._result(future)
+
+        addresses = [account.address for account in accounts]
+        with self._lock:
+            self._addresses.update(addresses)
+        return addresses
+
+    def register_wallet(self, wallet: "Wallet") -> list[str]:
+        """Send the private keys of the addresses of a wallet to every worker.
+
+        Args:
+            wallet (Wallet): The wallet, which must have its seed loaded.
+
+        Returns:
+            List[str]: The registered addresses.
+
+        Raises:
+            ValueError: If the wallet cannot sign.
+
+        """
+        if not wallet.can_sign:
+            raise ValueError("Cannot register a wallet without its seed")
+
+        return self.register(*[address.key for address in wallet.addresses if address.can_sign])
+
+    def sign_transactions(
+        self, address: str, transactions: Sequence[dict[str, Any]]
+    ) -> list[bytes]:
+        """Sign a batch of EIP-1559 transactions of a registered address across the workers.
+
+        Args:
+            address (str): The registered address to sign with.
+            transactions (Sequence[Dict[str, Any]]): The transaction fields, as accepted by
+                `LocalAccount.sign_transaction`.
+
+        Returns:
+            List[bytes]: The signed transaction envelopes, in the order of the transactions.
+
+        Raises:
+            ValueError: If the address is not registered.
+            RuntimeError: If every worker has exited, or a worker exits while signing.
+            TimeoutError: If a worker does not return its signatures within the timeout.
+
+        """
+        return self._sign_batch(_SIGN_TRANSACTIONS, address, list(transactions))
+
+    def sign_hashes(self, address: str, message_hashes: Sequence[bytes]) -> list[bytes]:
+        """Sign a batch of 32-byte message hashes of a registered address across the workers.
+
+        Args:
+            address (str): The registered address to sign with.
+            message_hashes (Sequence[bytes]): The hashes to sign.
+
+        Returns:
+            List[bytes]: The 65-byte signatures, in the order of the hashes.
+
+        Raises:
+            ValueError: If the address is not registered.
+            RuntimeError: If every worker has exited, or a worker exits while signing.
+            TimeoutError: If a worker does not return its signatures within the timeout.
+
+        """
+        return self._sign_batch(_SIGN_HASHES, address, list(message_hashes))
+
+    def sign_transaction(self, key: "BaseAccount", transaction: dict[str, Any]) -> bytes:
+        """Sign an EIP-1559 transaction in a worker, if the key is registered.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            transaction (Dict[str, Any]): The transaction fields.
+
+        Returns:
+            bytes: The signed transaction envelope.
+
+        Raises:
+            RuntimeError: If every worker has exited, or the worker exits while signing.
+            TimeoutError: If the worker does not return the signature within the timeout.
+
+        """
+        if key.address not in self._addresses:
+            return self._local_signer.sign_transaction(key, transaction)
+        future = self._submit(self._worker(), _SIGN_TRANSACTIONS, key.address, [transaction])
+        return self._result(future)[0]
+
+    def sign_hash(self, key: "BaseAccount", message_hash: bytes) -> bytes:
+        """Sign a 32-byte message hash in a worker, if the key is registered.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            message_hash (bytes): The hash to sign.
+
+        Returns:
+            bytes: The 65-byte signature.
+
+        Raises:
+            RuntimeError: If every worker has exited, or the worker exits while signing.
+            TimeoutError: If the worker does not return the signature within the timeout.
+
+        """
+        if key.address not in self._addresses:
+            return self._local_signer.sign_hash(key, message_hash)
+        future = self._submit(self._worker(), _SIGN_HASHES, key.address, [message_hash])
+        return self._result(future)[0]
+
+    def close(self) -> None:
+        """Stop the worker processes.
+
+        Signatures still pending fail with a RuntimeError.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        for worker in self._workers:
+            try:
+                with worker.send_lock:
+                    worker.requests.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.requests.close()
+        # The collector returns once the result pipe of every worker reaches EOF.
+        self._collector.join()
+        for worker in self._workers:
+            worker.results.close()
+        self._fail_pending(lambda _: True, "SigningPool is closed")
+
+    def __enter__(self) -> "SigningPool":
+        """Return the pool, to be closed on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the pool."""
+        self.close()
+
+    def _sign_batch(self, operation: str, address: str, payloads: list) -> list[bytes]:
+        """Split a batch into one chunk per worker and sign the chunks concurrently."""
+        if address not in self._addresses:
+            raise ValueError(f"Address {address} is not registered")
+        if not payloads:
+            return []
+
+        chunk_size = -(-len(payloads) // self.max_workers)
+        futures = [
+            self._submit(self._worker(), operation, address, payloads[start : start + chunk_size])
+            for start in range(0, len(payloads), chunk_size)
+        ]
+        return [signature for future in futures for signature in self._result(future)]
+
+    def _worker(self) -> int:
+        """Return the index of the next running worker, round-robin."""
+        for _ in range(self.max_workers):
+            index = next(self._next_worker) % self.max_workers
+            if index not in self._dead:
+                return index
+        raise RuntimeError("Every signing worker has exited")
+
+    def _submit(self, worker: int, operation: str, address: str | None, payload: list) -> Future:
+        """Send a request to a worker and return the future of its result."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SigningPool is closed")
+            if worker in self._dead:
+                raise RuntimeError("Signing worker exited")
+            request_id = next(self._request_ids)
+            self._pending[request_id] = (future, worker)
+
+        try:
+            with self._workers[worker].send_lock:
+                self._workers[worker].requests.send((request_id, operation, address, payload))
+        except OSError:
+            # The worker exited before this request was sent.
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise RuntimeError("Signing worker exited") from None
+        return future
+
+    def _result(self, future: Future) -> Any:
+        """Wait for the result of a request, up to the timeout."""
+        try:
+            return future.result(timeout=self._timeout)
+        except concurrent.futures.TimeoutError:
+            raise TimeoutError("Signing request timed out") from None
+
+    def _collect(self) -> None:
+        """Resolve the futures of requests as workers return their results."""
+        readers = {worker.results: index for index, worker in enumerate(self._workers)}
+        while readers:
+            for reader in wait(list(readers)):
+                index = readers[reader]
+                try:
+                    request_id, error, value = reader.recv()
+                except (EOFError, OSError):
+                    # The worker exited, possibly while sending a result. Only its own pipe is
+                    # affected, so the other workers keep returning results.
+                    del readers[reader]
+                    self._worker_exited(index)
+                    continue
+
+                with self._lock:
+                    future, _ = self._pending.pop(request_id, (None, None))
+                if future is None:
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(value)
+
+    def _worker_exited(self, index: int) -> None:
+        """Mark a worker as dead and fail the requests pending on it."""
+        with self._lock:
+            # Marked under the lock, so that no request is submitted to it afterwards.
+            self._dead.add(index)
+        self._fail_pending(index.__eq__, "Signing worker exited")
+
+    def _fail_pending(self, predicate: Any, message: str) -> None:
+        """Fail the pending requests of the workers matching a predicate."""
+        with self._lock:
+            failed = [
+                request_id for request_id, (_, worker) in self._pending.items() if predicate(worker)
+            ]
+            futures = [self._pending.pop(request_id)[0] for request_id in failed]
+        for future in futures:
+            future.set_exception(RuntimeError(message))
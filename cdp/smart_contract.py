@@ -2,12 +2,10 @@ import json
 import time
 from collections.abc import Iterator
 from enum import Enum
-from typing import Any
-
-from eth_account.signers.local import LocalAccount
+from typing import TYPE_CHECKING, Any
 
 from cdp.cdp import Cdp
-from cdp.client import SmartContractList
+from cdp.cdp_client import ClientBound
 from cdp.client.models.create_smart_contract_request import CreateSmartContractRequest
 from cdp.client.models.deploy_smart_contract_request import DeploySmartContractRequest
 from cdp.client.models.multi_token_contract_options import MultiTokenContractOptions
@@ -19,10 +17,15 @@ from cdp.client.models.smart_contract_options import SmartContractOptions
 from cdp.client.models.solidity_value import SolidityValue
 from cdp.client.models.token_contract_options import TokenContractOptions
 from cdp.client.models.update_smart_contract_request import UpdateSmartContractRequest
+from cdp.paginator import Paginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
 from cdp.transaction import Transaction
 
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+
 
-class SmartContract:
+class SmartContract(ClientBound):
     """A representation of a SmartContract on the blockchain."""
 
     class Type(Enum):
@@ -234,7 +237,17 @@ class SmartContract:
             self._update_transaction(self._model)
         return self._transaction
 
-    def sign(self, key: LocalAccount) -> "SmartContract":
+    @property
+    def terminal_state(self) -> bool:
+        """Check if the SmartContract deployment is in a terminal state.
+
+        Returns:
+            bool: Whether the deployment transaction is in a terminal state, or True if there is none.
+
+        """
+        return self.transaction is None or self.transaction.terminal_state
+
+    def sign(self, key: "LocalAccount") -> "SmartContract":
         """Sign the smart contract deployment with the given key.
 
         Args:
@@ -249,6 +262,8 @@ class SmartContract:
         """
         if self.is_external:
             raise ValueError("Cannot sign an external SmartContract")
+        from eth_account.signers.local import LocalAccount
+
         if not isinstance(key, LocalAccount):
             raise ValueError("key must be a LocalAccount")
 
@@ -302,12 +317,20 @@ class SmartContract:
         self._update_transaction(model)
         return self
 
-    def wait(self, interval_seconds: float = 0.2, timeout_seconds: float = 10) -> "SmartContract":
+    def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 10,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "SmartContract":
         """Wait until the smart contract deployment is confirmed on the network or fails onchain.
 
         Args:
-            interval_seconds: The interval to check the status of the smart contract deployment.
+            interval_seconds: A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds: The maximum time to wait for the smart contract deployment to be confirmed.
+            polling_policy: The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             The SmartContract object in a terminal state.
@@ -318,14 +341,20 @@ class SmartContract:
         """
         if self.is_external:
             raise ValueError("Cannot wait for an external SmartContract")
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "smart_contract"
+        )
         start_time = time.time()
         while self.transaction is not None and not self.transaction.terminal_state:
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("SmartContract deployment timed out")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
@@ -353,6 +382,39 @@ class SmartContract:
         Raises:
             ValueError: If the options type is unsupported.
 
+        """
+        create_smart_contract_request = cls._create_smart_contract_request(
+            type, options, compiled_smart_contract_id
+        )
+
+        model = Cdp.api_clients.smart_contracts.create_smart_contract(
+            wallet_id=wallet_id,
+            address_id=address_id,
+            create_smart_contract_request=create_smart_contract_request,
+        )
+
+        return cls(model)
+
+    @classmethod
+    def _create_smart_contract_request(
+        cls,
+        type: Type,
+        options: TokenContractOptions | NFTContractOptions | MultiTokenContractOptions | str,
+        compiled_smart_contract_id: str | None = None,
+    ) -> CreateSmartContractRequest:
+        """Build the request to create a smart contract.
+
+        Args:
+            type: The type of the smart contract (ERC20, ERC721, or ERC1155).
+            options: The options of the smart contract.
+            compiled_smart_contract_id: The ID of the compiled smart contract.
+
+        Returns:
+            The request to create the smart contract.
+
+        Raises:
+            ValueError: If the options type is unsupported.
+
         """
         if isinstance(options, cls.TokenContractOptions):
             openapi_options = TokenContractOptions(**options)
@@ -367,20 +429,12 @@ class SmartContract:
 
         smart_contract_options = SmartContractOptions(actual_instance=openapi_options)
 
-        create_smart_contract_request = CreateSmartContractRequest(
+        return CreateSmartContractRequest(
             type=type.value,
             options=smart_contract_options,
             compiled_smart_contract_id=compiled_smart_contract_id,
         )
 
-        model = Cdp.api_clients.smart_contracts.create_smart_contract(
-            wallet_id=wallet_id,
-            address_id=address_id,
-            create_smart_contract_request=create_smart_contract_request,
-        )
-
-        return cls(model)
-
     @classmethod
     def read(
         cls,
@@ -494,27 +548,21 @@ class SmartContract:
         return cls(model)
 
     @classmethod
-    def list(cls) -> Iterator["SmartContract"]:
+    def list(cls, **pagination_options) -> Iterator["SmartContract"]:
         """List smart contracts.
 
+        Args:
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
         Returns:
             Iterator[SmartContract]: An iterator of smart contract objects.
 
         """
-        while True:
-            page = None
-
-            response: SmartContractList = Cdp.api_clients.smart_contracts.list_smart_contracts(
-                page=page
-            )
-
-            for smart_contract_model in response.data:
-                yield cls(smart_contract_model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, _limit: Cdp.api_clients.smart_contracts.list_smart_contracts(page=page),
+            cls,
+            **pagination_options,
+        )
 
     @classmethod
     def _convert_solidity_value(cls, solidity_value: SolidityValue) -> Any:
@@ -1,18 +1,21 @@
-from eth_account.signers.base import BaseAccount
-from web3 import Web3
+from typing import TYPE_CHECKING
 
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.call import Call
 from cdp.client.models.create_smart_wallet_request import CreateSmartWalletRequest
 from cdp.evm_call_types import ContractCall, FunctionCall
 from cdp.network import Network
 from cdp.user_operation import UserOperation
 
+if TYPE_CHECKING:
+    from eth_account.signers.base import BaseAccount
 
-class SmartWallet:
+
+class SmartWallet(ClientBound):
     """A class representing a smart wallet."""
 
-    def __init__(self, address: str, account: BaseAccount) -> None:
+    def __init__(self, address: str, account: "BaseAccount") -> None:
         """Initialize the SmartWallet class.
 
         Args:
@@ -34,7 +37,7 @@ class SmartWallet:
         return self.__address
 
     @property
-    def owners(self) -> list[BaseAccount]:
+    def owners(self) -> list["BaseAccount"]:
         """Get the wallet owners.
 
         Returns:
@@ -46,7 +49,7 @@ class SmartWallet:
     @classmethod
     def create(
         cls,
-        account: BaseAccount,
+        account: "BaseAccount",
     ) -> "SmartWallet":
         """Create a new smart wallet.
 
@@ -101,14 +104,10 @@ class SmartWallet:
         encoded_calls = []
         for call in calls:
             if isinstance(call, FunctionCall):
-                contract = Web3().eth.contract(address=call.to, abi=call.abi)
-                data = contract.encode_abi(call.function_name, args=call.args)
-                value = "0" if call.value is None else str(call.value)
-                encoded_calls.append(Call(to=str(call.to), data=data, value=value))
-            else:
-                value = "0" if call.value is None else str(call.value)
-                data = "0x" if call.data is None else call.data
-                encoded_calls.append(Call(to=str(call.to), data=data, value=value))
+                call = call.encode()
+            value = "0" if call.value is None else str(call.value)
+            data = "0x" if call.data is None else call.data
+            encoded_calls.append(Call(to=str(call.to), data=data, value=value))
 
         user_operation = UserOperation.create(
             self.__address,
@@ -147,7 +146,7 @@ class NetworkScopedSmartWallet(SmartWallet):
     def __init__(
         self,
         smart_wallet_address: str,
-        account: BaseAccount,
+        account: "BaseAccount",
         chain_id: int,
         paymaster_url: str | None = None,
     ) -> None:
@@ -223,7 +222,7 @@ class NetworkScopedSmartWallet(SmartWallet):
         return f"Network Scoped Smart Wallet: (model=SmartWalletModel(address='{self.address}'), network=Network(chain_id={self.chain_id}, paymaster_url={self.paymaster_url!r}))"
 
 
-def to_smart_wallet(smart_wallet_address: str, signer: BaseAccount) -> "SmartWallet":
+def to_smart_wallet(smart_wallet_address: str, signer: "BaseAccount") -> "SmartWallet":
     """Construct an existing smart wallet by its address and the signer.
 
     Args:
@@ -1,9 +1,11 @@
 from enum import Enum
-
-from eth_account.signers.local import LocalAccount
-from eth_utils import to_bytes, to_hex
+from typing import TYPE_CHECKING
 
 from cdp.client.models import SponsoredSend as SponsoredSendModel
+from cdp.transaction_signer import get_transaction_signer
+
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
 
 
 class SponsoredSend:
@@ -71,7 +73,7 @@ class SponsoredSend:
         """
         return self._signature or self._model.signature
 
-    def sign(self, key: LocalAccount) -> str:
+    def sign(self, key: "LocalAccount") -> str:
         """Sign the Transaction with the provided key.
 
         Args:
@@ -87,8 +89,10 @@ class SponsoredSend:
         if self.signed:
             raise ValueError("Transaction is already signed")
 
-        signed_message = key.unsafe_sign_hash(to_bytes(hexstr=self.typed_data_hash))
-        self._signature = to_hex(signed_message.signature)
+        from eth_utils import to_bytes, to_hex
+
+        signature = get_transaction_signer().sign_hash(key, to_bytes(hexstr=self.typed_data_hash))
+        self._signature = to_hex(signature)
         return self._signature
 
     @property
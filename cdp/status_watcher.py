@@ -0,0 +1,404 @@
+import contextvars
+import functools
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import as_completed as futures_as_completed
+from concurrent.futures import wait as futures_wait
+from typing import Any
+
+from cdp.polling_policy import (
+    ExponentialPollingPolicy,
+    PollingPolicy,
+    PollingSchedule,
+    get_polling_policy,
+)
+
+
+def _is_terminal(resource: Any) -> bool:
+    """Return whether a pollable resource has reached a terminal state.
+
+    Args:
+        resource: A resource with a `terminal_state` property or method and a `reload` method,
+            such as a Transfer, Trade or UserOperation.
+
+    Returns:
+        bool: Whether the resource is in a terminal state.
+
+    """
+    terminal_state = resource.terminal_state
+    if callable(terminal_state):
+        return terminal_state()
+    return terminal_state
+
+
+def _resource_name(resource: Any) -> str:
+    """Return the name a resource's waits are counted under in the metrics registry.
+
+    Args:
+        resource: The watched resource.
+
+    Returns:
+        str: The snake case name of the resource's class, e.g. `user_operation`.
+
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", type(resource).__name__).lower()
+
+
+class _Watch:
+    """A resource being watched, with its polling schedule."""
+
+    __slots__ = ("context", "deadline", "future", "interval", "next_poll", "resource", "schedule")
+
+    def __init__(
+        self, resource: Any, future: Future, deadline: float, schedule: PollingSchedule
+    ) -> None:
+        self.resource = resource
+        self.future = future
+        self.deadline = deadline
+        self.schedule = schedule
+        self.interval = schedule.next_interval()
+        self.next_poll = time.monotonic() + self.interval
+        self.context = contextvars.copy_context()
+
+
+class StatusWatcher:
+    """Polls many pending resources on a shared schedule until each reaches a terminal state.
+
+    Instead of blocking a thread per `wait()` call, resources are registered with `watch()` and
+    reloaded by a single scheduler thread and a small pool of workers. Each reload is submitted on
+    its own, so a slow reload only delays the next poll of its own resource. Resources are polled
+    with the default polling policy of their network, like `wait()`, unless a `polling_policy` or
+    the `interval_seconds`, `max_interval_seconds` and `backoff_factor` of an exponential policy
+    are given.
+
+    The futures of finished resources are kept until `wait_all` or `as_completed` returns them,
+    or dropped once they finish if they were watched with a callback, so a long-running watcher
+    does not accumulate them.
+
+    Example:
+        >>> with StatusWatcher() as watcher:
+        ...     for transfer in transfers:
+        ...         watcher.watch(transfer, timeout_seconds=60)
+        ...     for future in watcher.as_completed():
+        ...         print(future.result().status)
+
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float | None = None,
+        max_interval_seconds: float | None = None,
+        backoff_factor: float | None = None,
+        max_workers: int = 8,
+        polling_policy: PollingPolicy | None = None,
+    ) -> None:
+        """Initialize the StatusWatcher.
+
+        Args:
+            interval_seconds (Optional[float]): The initial polling interval of each resource. Defaults to 0.2 when another interval option is given.
+            max_interval_seconds (Optional[float]): The maximum polling interval of each resource. Defaults to 5 when another interval option is given.
+            backoff_factor (Optional[float]): The factor by which the polling interval grows after each poll. Defaults to 1.5 when another interval option is given.
+            max_workers (int): The maximum number of concurrent reloads. Defaults to 8.
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between reloads of every resource. Takes precedence over the interval options. Defaults to the policy of each resource's network.
+
+        Raises:
+            ValueError: If any of the intervals or the backoff factor are invalid.
+
+        """
+        if polling_policy is None and (
+            interval_seconds is not None
+            or max_interval_seconds is not None
+            or backoff_factor is not None
+        ):
+            interval_seconds = 0.2 if interval_seconds is None else interval_seconds
+            max_interval_seconds = 5 if max_interval_seconds is None else max_interval_seconds
+            backoff_factor = 1.5 if backoff_factor is None else backoff_factor
+            if interval_seconds <= 0 or max_interval_seconds < interval_seconds:
+                raise ValueError(
+                    "interval_seconds must be positive and at most max_interval_seconds"
+                )
+            if backoff_factor < 1:
+                raise ValueError("backoff_factor must be at least 1")
+            polling_policy = ExponentialPollingPolicy(
+                interval_seconds, max_interval_seconds, backoff_factor
+            )
+
+        self._polling_policy = polling_policy
+        self._max_workers = max_workers
+        self._watches: list[_Watch] = []
+        self._futures: list[Future] = []
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def __enter__(self) -> "StatusWatcher":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop the watcher when leaving the context manager."""
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """The number of watched resources that have not reached a terminal state.
+
+        Returns:
+            int: The number of pending resources.
+
+        """
+        with self._condition:
+            return sum(1 for future in self._futures if not future.done())
+
+    def watch(
+        self,
+        resource: Any,
+        timeout_seconds: float | None = 20,
+        callback: Callable[[Future], None] | None = None,
+    ) -> Future:
+        """Start watching a resource until it reaches a terminal state.
+
+        Args:
+            resource: A resource with a `terminal_state` and a `reload` method, such as a Transfer,
+                Trade, ContractInvocation, SmartContract, UserOperation, PayloadSignature or
+                FundOperation.
+            timeout_seconds (Optional[float]): The maximum time to wait for the resource, or None
+                to wait indefinitely. Defaults to 20.
+            callback (Optional[Callable[[Future], None]]): Called with the future once the
+                resource reaches a terminal state, times out, or fails to reload. The watcher
+                drops the future once it is done, so it is not returned by `wait_all` or
+                `as_completed`.
+
+        Returns:
+            Future: A future resolved with the resource once it reaches a terminal state. It fails
+            with a TimeoutError if the resource does not settle in time, or with the error raised
+            while reloading it.
+
+        Raises:
+            RuntimeError: If the watcher has been closed.
+
+        """
+        future: Future = Future()
+        deadline = float("inf") if timeout_seconds is None else time.monotonic() + timeout_seconds
+        terminal = _is_terminal(resource)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("StatusWatcher is closed")
+
+            if callback is None or not terminal:
+                self._futures.append(future)
+            if not terminal:
+                policy = get_polling_policy(
+                    getattr(resource, "network_id", None), polling_policy=self._polling_policy
+                )
+                self._watches.append(
+                    _Watch(resource, future, deadline, policy.schedule(_resource_name(resource)))
+                )
+                self._start()
+                self._condition.notify()
+
+        if callback is not None:
+            future.add_done_callback(self._forget)
+            future.add_done_callback(callback)
+        if terminal:
+            self._resolve(future, result=resource)
+        return future
+
+    def wait_all(self, timeout_seconds: float | None = None) -> list[Any]:
+        """Wait for every watched resource to reach a terminal state.
+
+        The futures are released once returned, so a later call only waits for resources watched
+        after this one.
+
+        Args:
+            timeout_seconds (Optional[float]): The maximum time to wait. Defaults to None.
+
+        Returns:
+            List[Any]: The watched resources, in the order they were registered.
+
+        Raises:
+            TimeoutError: If not all resources settle within the timeout.
+            Exception: The first error raised while waiting for any of the resources.
+
+        """
+        futures = self._collect()
+        _, not_done = futures_wait(futures, timeout_seconds)
+
+        if not_done:
+            self._restore(futures)
+            raise TimeoutError(f"{len(not_done)} watched resources did not reach a terminal state")
+
+        return [future.result() for future in futures]
+
+    def as_completed(self, timeout_seconds: float | None = None) -> Iterator[Future]:
+        """Iterate over the futures of the watched resources as they complete.
+
+        The futures are released once returned, so a later call only yields the futures of
+        resources watched after this one.
+
+        Args:
+            timeout_seconds (Optional[float]): The maximum time to wait. Defaults to None.
+
+        Returns:
+            Iterator[Future]: The futures, in the order they complete.
+
+        Raises:
+            TimeoutError: If not all resources settle within the timeout.
+
+        """
+        return futures_as_completed(self._collect(), timeout_seconds)
+
+    def close(self) -> None:
+        """Stop polling and cancel the futures of resources that are still pending.
+
+        Returns:
+            None
+
+        """
+        with self._condition:
+            self._closed = True
+            watches, self._watches = self._watches, []
+            self._condition.notify()
+
+        for watch in watches:
+            watch.future.cancel()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if self._executor is not None:
+            # Polls in flight finish, and cancel their futures instead of rescheduling.
+            self._executor.shutdown(wait=True)
+
+    def _collect(self) -> list[Future]:
+        """Take the futures of the watched resources, releasing them from the watcher."""
+        with self._condition:
+            futures, self._futures = self._futures, []
+        return futures
+
+    def _restore(self, futures: list[Future]) -> None:
+        """Return futures taken by `_collect` that have not been handed out."""
+        with self._condition:
+            self._futures[:0] = futures
+
+    def _forget(self, future: Future) -> None:
+        """Drop the future of a resource watched with a callback once it is done."""
+        with self._condition:
+            if future in self._futures:
+                self._futures.remove(future)
+
+    def _start(self) -> None:
+        """Start the scheduler thread, if not running. Must be called with the lock held."""
+        if self._thread is not None:
+            return
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="cdp-status-watcher"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="cdp-status-watcher-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Submit the polls of due resources until the watcher is closed."""
+        while True:
+            with self._condition:
+                while not self._closed and not self._watches:
+                    self._condition.wait()
+
+                if self._closed:
+                    return
+
+                now = time.monotonic()
+                due = [watch for watch in self._watches if watch.next_poll <= now]
+
+                if not due:
+                    next_poll = min(watch.next_poll for watch in self._watches)
+                    self._condition.wait(timeout=next_poll - now)
+                    continue
+
+                self._watches = [watch for watch in self._watches if watch.next_poll > now]
+
+            # Each poll is rescheduled when it finishes, independently of the others.
+            for watch in due:
+                self._executor.submit(self._poll, watch).add_done_callback(
+                    functools.partial(self._reschedule, watch)
+                )
+
+    def _reschedule(self, watch: _Watch, poll: Future) -> None:
+        """Put a resource back on the schedule if its poll left it pending."""
+        if poll.exception() is not None:
+            self._resolve(watch.future, exception=poll.exception())
+            return
+        if not poll.result():
+            return
+
+        with self._condition:
+            if not self._closed:
+                self._watches.append(watch)
+                self._condition.notify()
+                return
+        watch.future.cancel()
+
+    def _poll(self, watch: _Watch) -> bool:
+        """Reload a resource in the context it was registered from.
+
+        Args:
+            watch (_Watch): The watched resource.
+
+        Returns:
+            bool: Whether the resource should be polled again.
+
+        """
+        return watch.context.run(self._poll_in_context, watch)
+
+    def _poll_in_context(self, watch: _Watch) -> bool:
+        if watch.future.done():
+            return False
+
+        try:
+            watch.resource.reload()
+            terminal = _is_terminal(watch.resource)
+        except Exception as e:
+            watch.schedule.record(reloads=watch.schedule.sleeps)
+            self._resolve(watch.future, exception=e)
+            return False
+
+        # Every reload follows a sleep, so the wait used one reload per sleep.
+        if terminal:
+            watch.schedule.record(reloads=watch.schedule.sleeps)
+            self._resolve(watch.future, result=watch.resource)
+            return False
+
+        now = time.monotonic()
+        if now > watch.deadline:
+            watch.schedule.record(timed_out=True, reloads=watch.schedule.sleeps)
+            self._resolve(
+                watch.future,
+                exception=TimeoutError(
+                    f"Timed out waiting for {type(watch.resource).__name__} to reach a terminal state"
+                ),
+            )
+            return False
+
+        watch.interval = watch.schedule.next_interval()
+        watch.next_poll = min(now + watch.interval, watch.deadline)
+        return True
+
+    @staticmethod
+    def _resolve(
+        future: Future, result: Any = None, exception: BaseException | None = None
+    ) -> None:
+        """Resolve a future unless it has been cancelled."""
+        if not future.set_running_or_notify_cancel():
+            return
+
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
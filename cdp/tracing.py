@@ -0,0 +1,289 @@
+import contextlib
+import contextvars
+import time
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+PHASES = ("serialize", "queue", "sign", "network", "deserialize", "wrap")
+
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "cdp_current_span", default=None
+)
+_deferred_spans: contextvars.ContextVar["list[Span] | None"] = contextvars.ContextVar(
+    "cdp_deferred_spans", default=None
+)
+
+
+class Span:
+    """The timing of a single API call, broken down by phase.
+
+    The phases are `serialize` (building the request), `queue` (waiting for the rate limiter and
+    the request scheduler), `sign` (JWT signing), `network` (sending the request and reading the
+    response, including retries), `deserialize` (building the response model) and, for list
+    calls, `wrap` (building the SDK objects from the models).
+
+    Attributes:
+        name (str): The HTTP method and path template, e.g. `POST /v1/wallets`.
+        attributes (Dict[str, Any]): The endpoint, status, retry count, priority, and for errors
+            the API error code and correlation id.
+        phases (Dict[str, float]): The seconds spent in each phase.
+        start_time_ns (int): The wall clock time at which the call started, in nanoseconds.
+        error (Optional[BaseException]): The exception the call failed with, if any.
+
+    """
+
+    __slots__ = (
+        "_end",
+        "_start",
+        "_tracer",
+        "attributes",
+        "error",
+        "name",
+        "phases",
+        "start_time_ns",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.phases: dict[str, float] = {}
+        self.error: BaseException | None = None
+        self.start_time_ns = time.time_ns()
+        self._start = time.perf_counter()
+        self._end: float | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """The seconds from the start to the end of the call, or None while it is running.
+
+        Returns:
+            Optional[float]: The duration of the span.
+
+        """
+        return None if self._end is None else self._end - self._start
+
+    @property
+    def ended(self) -> bool:
+        """Whether the span has ended.
+
+        Returns:
+            bool: True once the span was ended.
+
+        """
+        return self._end is not None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span.
+
+        Args:
+            key (str): The attribute name.
+            value (Any): The attribute value.
+
+        """
+        self.attributes[key] = value
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Add time to a phase of the span.
+
+        Args:
+            phase (str): The phase name, one of `PHASES`.
+            seconds (float): The time to add.
+
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time a block as part of a phase of the span.
+
+        Args:
+            phase (str): The phase name, one of `PHASES`.
+
+        Yields:
+            None
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter() - start)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the span."""
+        return f"Span(name={self.name!r}, duration={self.duration!r}, phases={self.phases!r})"
+
+
+class TraceHook:
+    """Receives the spans of API calls.
+
+    Subclass it and override `on_start`, `on_end` or both. Hooks are called on the thread making
+    the call, so they should be quick and must not raise.
+    """
+
+    def on_start(self, span: Span) -> None:
+        """Handle the start of an API call.
+
+        Args:
+            span (Span): The span of the call, with its name and endpoint set.
+
+        """
+
+    def on_end(self, span: Span) -> None:
+        """Handle the end of an API call.
+
+        Args:
+            span (Span): The span of the call, with all of its phases and attributes.
+
+        """
+
+
+class Tracer:
+    """Creates the spans of API calls and passes them to trace hooks."""
+
+    def __init__(self, hooks: Sequence[TraceHook]) -> None:
+        """Initialize the Tracer.
+
+        Args:
+            hooks (Sequence[TraceHook]): The hooks to call for each span.
+
+        """
+        self._hooks = tuple(hooks)
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Span:
+        """Start the span of an API call and make it the current span.
+
+        A current span that was never ended, e.g. because its response was streamed instead of
+        deserialized, is ended first.
+
+        Args:
+            name (str): The name of the span.
+            attributes (Dict[str, Any]): The initial attributes of the span.
+
+        Returns:
+            Span: The started span.
+
+        """
+        stale = _current_span.get()
+        if stale is not None and not stale.ended:
+            stale._tracer.end_span(stale)
+
+        span = Span(self, name, attributes)
+        _current_span.set(span)
+        for hook in self._hooks:
+            hook.on_start(span)
+        return span
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        """End the span of an API call.
+
+        Within `defer_spans`, the span is handed to the caller instead, which ends it with
+        `finish_spans` once the SDK objects are built from the response.
+
+        Args:
+            span (Span): The span to end.
+            error (Optional[BaseException]): The exception the call failed with, if any.
+
+        """
+        if error is not None:
+            span.error = error
+        if _current_span.get() is span:
+            _current_span.set(None)
+
+        deferred = _deferred_spans.get()
+        if deferred is not None and error is None:
+            deferred.append(span)
+            return
+
+        self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        if span._end is not None:
+            return
+        span._end = time.perf_counter()
+        for hook in self._hooks:
+            hook.on_end(span)
+
+
+def current_span() -> Span | None:
+    """Return the span of the API call in progress in the current thread or task.
+
+    Returns:
+        Optional[Span]: The current span, or None if tracing is disabled or no call is running.
+
+    """
+    return _current_span.get()
+
+
+@contextlib.contextmanager
+def defer_spans() -> Iterator[list[Span]]:
+    """Collect the spans of the API calls made within a block instead of ending them.
+
+    Yields:
+        List[Span]: The spans, to be ended with `finish_spans`.
+
+    """
+    spans: list[Span] = []
+    token = _deferred_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _deferred_spans.reset(token)
+
+
+def finish_spans(spans: Sequence[Span], wrap_seconds: float = 0.0) -> None:
+    """End spans collected by `defer_spans`, recording the time spent building SDK objects.
+
+    Args:
+        spans (Sequence[Span]): The spans to end.
+        wrap_seconds (float): The time spent building SDK objects from the responses.
+
+    """
+    for span in spans:
+        span.add_phase("wrap", wrap_seconds / len(spans))
+        span._tracer._finish(span)
+
+
+class OpenTelemetryTraceHook(TraceHook):
+    """Reports API calls as OpenTelemetry spans.
+
+    Each call becomes a client span named after its endpoint, with the span attributes and the
+    seconds spent in each phase as `cdp.phase.<phase>` attributes. Requires the
+    `opentelemetry-api` package.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        """Initialize the OpenTelemetryTraceHook.
+
+        Args:
+            tracer (Optional[opentelemetry.trace.Tracer]): The tracer to create spans with.
+                Defaults to the tracer of the global tracer provider.
+
+        Raises:
+            ImportError: If no tracer is given and `opentelemetry-api` is not installed.
+
+        """
+        if tracer is None:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("cdp-sdk")
+        self._tracer = tracer
+
+    def on_end(self, span: Span) -> None:
+        """Report an API call as an OpenTelemetry span.
+
+        Args:
+            span (Span): The span of the call.
+
+        """
+        attributes = dict(span.attributes)
+        for phase, seconds in span.phases.items():
+            attributes[f"cdp.phase.{phase}"] = seconds
+
+        otel_span = self._tracer.start_span(
+            span.name, attributes=attributes, start_time=span.start_time_ns
+        )
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+        otel_span.end(end_time=span.start_time_ns + int((span.duration or 0.0) * 1e9))
@@ -5,14 +5,17 @@ from numbers import Number
 
 from cdp.asset import Asset
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.broadcast_trade_request import BroadcastTradeRequest
 from cdp.client.models.create_trade_request import CreateTradeRequest
 from cdp.client.models.trade import Trade as TradeModel
 from cdp.errors import TransactionNotSignedError
+from cdp.paginator import Paginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
 from cdp.transaction import Transaction
 
 
-class Trade:
+class Trade(ClientBound):
     """A class representing a trade."""
 
     def __init__(self, model: TradeModel) -> None:
@@ -62,30 +65,25 @@ class Trade:
         return Trade(model)
 
     @classmethod
-    def list(cls, wallet_id: str, address_id: str) -> Iterator["Trade"]:
+    def list(cls, wallet_id: str, address_id: str, **pagination_options) -> Iterator["Trade"]:
         """List all trades for an address.
 
         Args:
             wallet_id (str): The ID of the wallet to list trades for.
             address_id (str): The ID of the address to list trades for.
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
 
         Returns:
             Iterator[Trade]: An iterator of trade objects.
 
         """
-        page = None
-        while True:
-            response = Cdp.api_clients.trades.list_trades(
-                wallet_id=wallet_id, address_id=address_id, limit=100, page=page
-            )
-
-            for trade_model in response.data:
-                yield cls(trade_model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.trades.list_trades(
+                wallet_id=wallet_id, address_id=address_id, limit=limit, page=page
+            ),
+            cls,
+            **pagination_options,
+        )
 
     def broadcast(self) -> "Trade":
         """Broadcast the trade.
@@ -124,26 +122,40 @@ class Trade:
 
         return self
 
-    def wait(self, interval_seconds: float = 0.2, timeout_seconds: float = 20) -> "Trade":
+    def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "Trade":
         """Wait for the trade to complete.
 
         Args:
-            interval_seconds (float): The interval seconds.
+            interval_seconds (Optional[float]): A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds (float): The timeout seconds.
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             Trade: The trade.
 
         """
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "trade"
+        )
         start_time = time.time()
 
         while not self.transaction.terminal_state:
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("Timed out waiting for Trade to land onchain")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
@@ -237,6 +249,11 @@ class Trade:
         """
         return self.transaction.status
 
+    @property
+    def terminal_state(self) -> bool:
+        """Check if the Trade is in a terminal state."""
+        return self.transaction.terminal_state
+
     @property
     def transaction(self) -> Transaction:
         """Get the trade transaction."""
@@ -1,14 +1,16 @@
 import json
 from collections.abc import Iterator
 from enum import Enum
-
-from eth_account.signers.local import LocalAccount
-from eth_account.typed_transactions import DynamicFeeTransaction
-from web3 import Web3
+from typing import TYPE_CHECKING
 
 from cdp.cdp import Cdp
 from cdp.client.models import Transaction as TransactionModel
-from cdp.client.models.address_transaction_list import AddressTransactionList
+from cdp.paginator import Paginator
+from cdp.transaction_signer import get_transaction_signer
+
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+    from eth_account.typed_transactions import DynamicFeeTransaction
 
 
 class Transaction:
@@ -56,12 +58,15 @@ class Transaction:
         self._signature: str | None = model.signed_payload
 
     @classmethod
-    def list(cls, network_id: str, address_id: str) -> Iterator["Transaction"]:
+    def list(
+        cls, network_id: str, address_id: str, **pagination_options
+    ) -> Iterator["Transaction"]:
         """List transactions of the address.
 
         Args:
             network_id (str): The ID of the network to list transaction for.
             address_id (str): The ID of the address to list transaction for.
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
 
         Returns:
             Iterator[Transaction]: An iterator of Transaction objects.
@@ -70,24 +75,18 @@ class Transaction:
             Exception: If there's an error listing the transactions.
 
         """
-        page = None
-        while True:
-            response: AddressTransactionList = (
-                Cdp.api_clients.transaction_history.list_address_transactions(
-                    network_id=network_id,
-                    address_id=address_id,
-                    limit=1,
-                    page=page,
-                )
-            )
-
-            for model in response.data:
-                yield cls(model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        pagination_options.setdefault("page_size", 1)
+
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.transaction_history.list_address_transactions(
+                network_id=network_id,
+                address_id=address_id,
+                limit=limit,
+                page=page,
+            ),
+            cls,
+            **pagination_options,
+        )
 
     @property
     def unsigned_payload(self) -> str:
@@ -150,37 +149,46 @@ class Transaction:
         return self._model.content
 
     @property
-    def raw(self) -> DynamicFeeTransaction:
+    def raw(self) -> "DynamicFeeTransaction":
         """Get the underlying raw transaction."""
         if self._raw is not None:
             return self._raw
 
-        if self.signed_payload:
-            self._raw = DynamicFeeTransaction.from_bytes(bytes.fromhex(self.signed_payload))
+        from eth_account.typed_transactions import DynamicFeeTransaction
+        from hexbytes import HexBytes
+
+        if self._signature:
+            self._raw = DynamicFeeTransaction.from_bytes(HexBytes(self._signature))
         else:
-            raw_payload = bytes.fromhex(self.unsigned_payload).decode("utf-8")
-            parsed_payload = json.loads(raw_payload)
-
-            transaction_dict = {
-                "chainId": int(parsed_payload["chainId"], 16),
-                "nonce": int(parsed_payload["nonce"], 16),
-                "maxPriorityFeePerGas": int(parsed_payload["maxPriorityFeePerGas"], 16),
-                "maxFeePerGas": int(parsed_payload["maxFeePerGas"], 16),
-                "gas": int(parsed_payload["gas"], 16),
-                "value": int(parsed_payload["value"], 16),
-                "data": parsed_payload.get("input", ""),
-                "type": "0x2",  # EIP-1559 transaction type
-            }
-
-            # Handle 'to' field separately since smart contract deployments have an empty 'to' field
-            if parsed_payload["to"]:
-                transaction_dict["to"] = Web3.to_bytes(hexstr=parsed_payload["to"])
-            else:
-                transaction_dict["to"] = b""  # Empty bytes for contract deployment
-            self._raw = DynamicFeeTransaction(transaction_dict)
+            self._raw = DynamicFeeTransaction(self._transaction_dict())
 
         return self._raw
 
+    def _transaction_dict(self) -> dict:
+        """Parse the unsigned payload into the fields of an EIP-1559 transaction."""
+        from eth_utils import to_bytes
+
+        raw_payload = bytes.fromhex(self.unsigned_payload).decode("utf-8")
+        parsed_payload = json.loads(raw_payload)
+
+        transaction_dict = {
+            "chainId": int(parsed_payload["chainId"], 16),
+            "nonce": int(parsed_payload["nonce"], 16),
+            "maxPriorityFeePerGas": int(parsed_payload["maxPriorityFeePerGas"], 16),
+            "maxFeePerGas": int(parsed_payload["maxFeePerGas"], 16),
+            "gas": int(parsed_payload["gas"], 16),
+            "value": int(parsed_payload["value"], 16),
+            "data": parsed_payload.get("input", ""),
+            "type": "0x2",  # EIP-1559 transaction type
+        }
+
+        # Handle 'to' field separately since smart contract deployments have an empty 'to' field
+        if parsed_payload["to"]:
+            transaction_dict["to"] = to_bytes(hexstr=parsed_payload["to"])
+        else:
+            transaction_dict["to"] = b""  # Empty bytes for contract deployment
+        return transaction_dict
+
     @property
     def signature(self) -> str:
         """Get the signature of the Transaction."""
@@ -189,9 +197,11 @@ class Transaction:
 
         return self._signature
 
-    def sign(self, key: LocalAccount) -> str:
+    def sign(self, key: "LocalAccount") -> str:
         """Sign the Transaction with the provided key.
 
+        The transaction is signed with the signer set by `set_transaction_signer`.
+
         Args:
             key (LocalAccount): The Ethereum account to sign with.
 
@@ -205,9 +215,11 @@ class Transaction:
         if self.signed:
             raise ValueError("Transaction is already signed")
 
-        signed_transaction = key.sign_transaction(self.raw.as_dict())
-        self._signature = signed_transaction.raw_transaction.hex()
-        self._raw = DynamicFeeTransaction.from_bytes(signed_transaction.raw_transaction)
+        transaction = self._raw.as_dict() if self._raw is not None else self._transaction_dict()
+        signed_transaction = get_transaction_signer().sign_transaction(key, transaction)
+        self._signature = signed_transaction.hex()
+        # The signed transaction is decoded from the signature if `raw` is read again.
+        self._raw = None
 
         return self.signature
 
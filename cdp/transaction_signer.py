@@ -0,0 +1,259 @@
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from eth_account.signers.base import BaseAccount
+
+EIP1559_TRANSACTION_TYPE = 2
+
+
+class TransactionSigner(ABC):
+    """Signs EIP-1559 transactions and message hashes with local accounts.
+
+    `Transaction.sign`, `SponsoredSend.sign` and `UserOperation.sign` sign through the signer set
+    with `set_transaction_signer`.
+    """
+
+    @abstractmethod
+    def sign_transaction(self, key: "BaseAccount", transaction: dict[str, Any]) -> bytes:
+        """Sign an EIP-1559 transaction.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            transaction (Dict[str, Any]): The transaction fields, as accepted by
+                `LocalAccount.sign_transaction`.
+
+        Returns:
+            bytes: The signed transaction envelope, i.e. the type byte followed by the RLP-encoded
+            fields and signature.
+
+        """
+
+    @abstractmethod
+    def sign_hash(self, key: "BaseAccount", message_hash: bytes) -> bytes:
+        """Sign a 32-byte message hash.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            message_hash (bytes): The hash to sign.
+
+        Returns:
+            bytes: The 65-byte signature, `r || s || v` with `v` being 27 or 28.
+
+        """
+
+
+class EthAccountTransactionSigner(TransactionSigner):
+    """Signs with the account's own `eth_account` methods.
+
+    `eth_account` validates a transaction, converts it into a typed transaction and RLP-encodes it
+    once to hash it and again to sign it.
+    """
+
+    def sign_transaction(self, key: "BaseAccount", transaction: dict[str, Any]) -> bytes:
+        """Sign an EIP-1559 transaction with `BaseAccount.sign_transaction`.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            transaction (Dict[str, Any]): The transaction fields.
+
+        Returns:
+            bytes: The signed transaction envelope.
+
+        """
+        return bytes(key.sign_transaction(transaction).raw_transaction)
+
+    def sign_hash(self, key: "BaseAccount", message_hash: bytes) -> bytes:
+        """Sign a 32-byte message hash with `BaseAccount.unsafe_sign_hash`.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            message_hash (bytes): The hash to sign.
+
+        Returns:
+            bytes: The 65-byte signature.
+
+        """
+        return bytes(key.unsafe_sign_hash(message_hash).signature)
+
+
+class CoincurveTransactionSigner(EthAccountTransactionSigner):
+    """Signs with `coincurve`, hashing and encoding EIP-1559 transactions directly.
+
+    The fields are encoded once for the signing hash and once for the envelope, without the
+    validation and conversions of `eth_account`, and this signer reuses the `coincurve` key of an account
+    across signatures. The signatures are identical to those of `eth_account`, as both use
+    RFC 6979 nonces.
+
+    Only plain `LocalAccount` keys are signed directly. Other accounts, including subclasses of
+    `LocalAccount`, sign with their own methods, like with `EthAccountTransactionSigner`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the CoincurveTransactionSigner."""
+        self._private_keys: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def sign_transaction(self, key: "BaseAccount", transaction: dict[str, Any]) -> bytes:
+        """Sign an EIP-1559 transaction.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            transaction (Dict[str, Any]): The transaction fields, as accepted by
+                `LocalAccount.sign_transaction`.
+
+        Returns:
+            bytes: The signed transaction envelope, i.e. the type byte followed by the RLP-encoded
+            fields and signature.
+
+        Raises:
+            ValueError: If the transaction is not an EIP-1559 transaction.
+
+        """
+        private_key = self._private_key(key)
+        if private_key is None:
+            return super().sign_transaction(key, transaction)
+
+        from eth_hash.auto import keccak
+
+        fields = _dynamic_fee_fields(transaction)
+        signing_hash = keccak(_TYPE_PREFIX + _rlp_encode(fields))
+        signature = private_key.sign_recoverable(signing_hash, hasher=None)
+
+        fields.extend(
+            (
+                signature[64],
+                int.from_bytes(signature[:32], "big"),
+                int.from_bytes(signature[32:64], "big"),
+            )
+        )
+        return _TYPE_PREFIX + _rlp_encode(fields)
+
+    def sign_hash(self, key: "BaseAccount", message_hash: bytes) -> bytes:
+        """Sign a 32-byte message hash.
+
+        Args:
+            key (BaseAccount): The account to sign with.
+            message_hash (bytes): The hash to sign.
+
+        Returns:
+            bytes: The 65-byte signature, `r || s || v` with `v` being 27 or 28.
+
+        Raises:
+            ValueError: If the message hash is not 32 bytes long.
+
+        """
+        private_key = self._private_key(key)
+        if private_key is None:
+            return super().sign_hash(key, message_hash)
+
+        if len(message_hash) != 32:
+            raise ValueError("message_hash must be 32 bytes long")
+
+        signature = private_key.sign_recoverable(message_hash, hasher=None)
+        return signature[:64] + bytes([signature[64] + 27])
+
+    def _private_key(self, key: "BaseAccount") -> Any:
+        """Return the `coincurve` private key of a `LocalAccount`, or None for other accounts."""
+        from eth_account.signers.local import LocalAccount
+
+        if type(key) is not LocalAccount:
+            return None
+
+        private_key = self._private_keys.get(key)
+        if private_key is None:
+            from coincurve import PrivateKey
+
+            private_key = PrivateKey(bytes(key.key))
+            with self._lock:
+                self._private_keys[key] = private_key
+        return private_key
+
+
+_TYPE_PREFIX = bytes([EIP1559_TRANSACTION_TYPE])
+
+_DYNAMIC_FEE_INT_FIELDS = ("chainId", "nonce", "maxPriorityFeePerGas", "maxFeePerGas", "gas")
+
+
+def _dynamic_fee_fields(transaction: dict[str, Any]) -> list:
+    """Return the unsigned fields of an EIP-1559 transaction, in their RLP order."""
+    transaction_type = transaction.get("type", EIP1559_TRANSACTION_TYPE)
+    if isinstance(transaction_type, str):
+        transaction_type = int(transaction_type, 16)
+    if transaction_type != EIP1559_TRANSACTION_TYPE:
+        raise ValueError(f"Unsupported transaction type: {transaction_type}")
+
+    fields: list = [_to_int(transaction[name]) for name in _DYNAMIC_FEE_INT_FIELDS]
+    fields.append(_to_bytes(transaction.get("to") or b""))
+    fields.append(_to_int(transaction.get("value", 0)))
+    fields.append(_to_bytes(transaction.get("data") or b""))
+    fields.append(
+        [
+            [
+                _to_bytes(entry["address"]),
+                [_to_bytes(storage_key) for storage_key in entry["storageKeys"]],
+            ]
+            for entry in transaction.get("accessList") or ()
+        ]
+    )
+    return fields
+
+
+def _to_int(value: int | str) -> int:
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def _to_bytes(value: bytes | str) -> bytes:
+    if isinstance(value, str):
+        return bytes.fromhex(value.removeprefix("0x"))
+    return bytes(value)
+
+
+def _rlp_encode(item: bytes | int | list) -> bytes:
+    """RLP-encode nested lists of byte strings and non-negative integers."""
+    if isinstance(item, list):
+        payload = b"".join(_rlp_encode(child) for child in item)
+        return _rlp_length_prefix(len(payload), 0xC0) + payload
+
+    if isinstance(item, int):
+        if item < 0:
+            raise ValueError("RLP cannot encode negative integers")
+        item = item.to_bytes((item.bit_length() + 7) // 8, "big")
+
+    if len(item) == 1 and item[0] < 0x80:
+        return item
+    return _rlp_length_prefix(len(item), 0x80) + item
+
+
+def _rlp_length_prefix(length: int, offset: int) -> bytes:
+    if length < 56:
+        return bytes([offset + length])
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([offset + 55 + len(length_bytes)]) + length_bytes
+
+
+_transaction_signer: TransactionSigner = CoincurveTransactionSigner()
+
+
+def get_transaction_signer() -> TransactionSigner:
+    """Return the signer that transactions, sponsored sends and user operations sign with.
+
+    Returns:
+        TransactionSigner: The signer, a `CoincurveTransactionSigner` by default.
+
+    """
+    return _transaction_signer
+
+
+def set_transaction_signer(signer: TransactionSigner) -> None:
+    """Set the signer that transactions, sponsored sends and user operations sign with.
+
+    Args:
+        signer (TransactionSigner): The signer, e.g. `EthAccountTransactionSigner()` to sign with
+            `eth_account`.
+
+    """
+    global _transaction_signer
+    _transaction_signer = signer
@@ -1,21 +1,25 @@
 import time
 from collections.abc import Iterator
 from decimal import Decimal
-
-from eth_account.signers.local import LocalAccount
+from typing import TYPE_CHECKING
 
 from cdp.asset import Asset
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.broadcast_transfer_request import BroadcastTransferRequest
 from cdp.client.models.create_transfer_request import CreateTransferRequest
 from cdp.client.models.transfer import Transfer as TransferModel
-from cdp.client.models.transfer_list import TransferList
 from cdp.errors import TransactionNotSignedError
+from cdp.paginator import Paginator
+from cdp.polling_policy import PollingPolicy, get_polling_policy
 from cdp.sponsored_send import SponsoredSend
 from cdp.transaction import Transaction
 
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+
 
-class Transfer:
+class Transfer(ClientBound):
     """A class representing a transfer."""
 
     def __init__(self, model: TransferModel) -> None:
@@ -152,6 +156,7 @@ class Transfer:
         wallet_id: str,
         gasless: bool = False,
         skip_batching: bool = False,
+        asset: Asset | None = None,
     ) -> "Transfer":
         """Create a transfer.
 
@@ -164,6 +169,7 @@ class Transfer:
             wallet_id (str): The wallet ID.
             gasless (bool): Whether to use gasless.
             skip_batching (bool): When True, the Transfer will be submitted immediately. Otherwise, the Transfer will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            asset (Optional[Asset]): The asset to transfer, if already fetched. Defaults to fetching it by asset ID.
 
         Returns:
             Transfer: The transfer.
@@ -172,8 +178,47 @@ class Transfer:
         if skip_batching and not gasless:
             raise ValueError("skip_batching requires gasless to be True")
 
-        asset = Asset.fetch(network_id, asset_id)
+        if asset is None:
+            asset = Asset.fetch(network_id, asset_id)
+
+        create_transfer_request = cls._create_transfer_request(
+            asset, amount, destination, network_id, gasless, skip_batching
+        )
+
+        model = Cdp.api_clients.transfers.create_transfer(
+            wallet_id=wallet_id,
+            address_id=address_id,
+            create_transfer_request=create_transfer_request,
+        )
+
+        return cls(model)
+
+    @staticmethod
+    def _create_transfer_request(
+        asset: Asset,
+        amount: Decimal,
+        destination,
+        network_id: str,
+        gasless: bool,
+        skip_batching: bool,
+    ) -> CreateTransferRequest:
+        """Build the request to create a transfer.
+
+        Args:
+            asset (Asset): The asset to transfer.
+            amount (Decimal): The amount.
+            destination (Union[Address, Wallet, str]): The destination.
+            network_id (str): The network ID.
+            gasless (bool): Whether to use gasless.
+            skip_batching (bool): Whether to skip batching.
 
+        Returns:
+            CreateTransferRequest: The request to create the transfer.
+
+        Raises:
+            ValueError: If the destination type is invalid.
+
+        """
         if hasattr(destination, "address_id"):
             destination = destination.address_id
         elif hasattr(destination, "default_address"):
@@ -183,7 +228,7 @@ class Transfer:
         else:
             raise ValueError("Invalid destination type")
 
-        create_transfer_request = CreateTransferRequest(
+        return CreateTransferRequest(
             amount=str(int(asset.to_atomic_amount(amount))),
             asset_id=Asset.primary_denomination(asset.asset_id),
             destination=destination,
@@ -192,21 +237,14 @@ class Transfer:
             skip_batching=skip_batching,
         )
 
-        model = Cdp.api_clients.transfers.create_transfer(
-            wallet_id=wallet_id,
-            address_id=address_id,
-            create_transfer_request=create_transfer_request,
-        )
-
-        return cls(model)
-
     @classmethod
-    def list(cls, wallet_id: str, address_id: str) -> Iterator["Transfer"]:
+    def list(cls, wallet_id: str, address_id: str, **pagination_options) -> Iterator["Transfer"]:
         """List transfers.
 
         Args:
             wallet_id (str): The wallet ID.
             address_id (str): The address ID.
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
 
         Returns:
             Iterator[Transfer]: An iterator of transfer objects.
@@ -215,21 +253,15 @@ class Transfer:
             Exception: If there's an error listing the transfers.
 
         """
-        page = None
-        while True:
-            response: TransferList = Cdp.api_clients.transfers.list_transfers(
-                wallet_id=wallet_id, address_id=address_id, limit=100, page=page
-            )
-
-            for transfer_model in response.data:
-                yield cls(transfer_model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.transfers.list_transfers(
+                wallet_id=wallet_id, address_id=address_id, limit=limit, page=page
+            ),
+            cls,
+            **pagination_options,
+        )
 
-    def sign(self, key: LocalAccount) -> "Transfer":
+    def sign(self, key: "LocalAccount") -> "Transfer":
         """Sign the Transfer with the given key.
 
         Args:
@@ -242,6 +274,8 @@ class Transfer:
             ValueError: If the key is not a LocalAccount.
 
         """
+        from eth_account.signers.local import LocalAccount
+
         if not isinstance(key, LocalAccount):
             raise ValueError("key must be a LocalAccount")
 
@@ -279,26 +313,40 @@ class Transfer:
 
         return self
 
-    def wait(self, interval_seconds: float = 0.2, timeout_seconds: float = 20) -> "Transfer":
+    def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "Transfer":
         """Wait for the transfer to complete.
 
         Args:
-            interval_seconds (float): The interval seconds.
+            interval_seconds (Optional[float]): A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds (float): The timeout seconds.
+            polling_policy (Optional[PollingPolicy]): The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             Transfer: The transfer.
 
         """
+        schedule = get_polling_policy(self.network_id, interval_seconds, polling_policy).schedule(
+            "transfer"
+        )
         start_time = time.time()
 
         while not self.terminal_state:
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("Timed out waiting for Transfer to land onchain")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
@@ -1,16 +1,21 @@
 import time
 from enum import Enum
-
-from eth_account.signers.base import BaseAccount
+from typing import TYPE_CHECKING
 
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.broadcast_user_operation_request import BroadcastUserOperationRequest
 from cdp.client.models.call import Call
 from cdp.client.models.create_user_operation_request import CreateUserOperationRequest
 from cdp.client.models.user_operation import UserOperation as UserOperationModel
+from cdp.polling_policy import PollingPolicy, get_polling_policy
+from cdp.transaction_signer import get_transaction_signer
+
+if TYPE_CHECKING:
+    from eth_account.signers.base import BaseAccount
 
 
-class UserOperation:
+class UserOperation(ClientBound):
     """A class representing a user operation."""
 
     class Status(Enum):
@@ -147,15 +152,17 @@ class UserOperation:
         )
         return UserOperation(model, smart_wallet_address)
 
-    def sign(self, account: BaseAccount) -> "UserOperation":
+    def sign(self, account: "BaseAccount") -> "UserOperation":
         """Sign the user operation.
 
         Returns:
             UserOperation: The signed UserOperation.
 
         """
-        signed_message = account.unsafe_sign_hash(self.user_op_hash)
-        self._signature = "0x" + signed_message.signature.hex()
+        from eth_utils import to_bytes
+
+        signature = get_transaction_signer().sign_hash(account, to_bytes(hexstr=self.user_op_hash))
+        self._signature = "0x" + signature.hex()
         return self
 
     def broadcast(self) -> "UserOperation":
@@ -175,12 +182,20 @@ class UserOperation:
         )
         return UserOperation(model, self.smart_wallet_address)
 
-    def wait(self, interval_seconds: float = 0.2, timeout_seconds: float = 20) -> "UserOperation":
+    def wait(
+        self,
+        interval_seconds: float | None = None,
+        timeout_seconds: float = 20,
+        polling_policy: PollingPolicy | None = None,
+    ) -> "UserOperation":
         """Wait until the user operation is processed or fails by polling the server.
 
         Args:
-            interval_seconds: The interval at which to poll the server.
+            interval_seconds: A fixed interval between reloads. Defaults to the
+                polling policy of the network.
             timeout_seconds: The maximum time to wait before timing out.
+            polling_policy: The policy that decides the intervals between
+                reloads. Takes precedence over interval_seconds.
 
         Returns:
             UserOperation: The completed UserOperation.
@@ -189,14 +204,20 @@ class UserOperation:
             TimeoutError: If the user operation takes longer than the given timeout.
 
         """
+        schedule = get_polling_policy(
+            self._model.network_id, interval_seconds, polling_policy
+        ).schedule("user_operation")
         start_time = time.time()
         while not self.terminal_state:
             self.reload()
 
             if time.time() - start_time > timeout_seconds:
+                schedule.record(timed_out=True)
                 raise TimeoutError("User Operation timed out")
 
-            time.sleep(interval_seconds)
+            time.sleep(schedule.next_interval())
+
+        schedule.record()
 
         return self
 
@@ -3,22 +3,20 @@ import hashlib
 import json
 import os
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from decimal import Decimal
 from numbers import Number
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Union
 
-import coincurve
-from bip_utils import Bip32Slip10Secp256k1, Bip39MnemonicValidator, Bip39SeedGenerator
-from Crypto.Cipher import AES
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec, ed25519
-from eth_account import Account
 
 from cdp.address import Address
 from cdp.api_key_utils import _parse_private_key
 from cdp.balance_map import BalanceMap
+from cdp.batch_transfer import BatchTransferItem, BatchTransferReport, BatchTransferResult
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.address import Address as AddressModel
 from cdp.client.models.create_address_request import CreateAddressRequest
 from cdp.client.models.create_wallet_request import (
@@ -27,22 +25,28 @@ from cdp.client.models.create_wallet_request import (
 )
 from cdp.client.models.create_wallet_webhook_request import CreateWalletWebhookRequest
 from cdp.client.models.wallet import Wallet as WalletModel
-from cdp.client.models.wallet_list import WalletList
 from cdp.contract_invocation import ContractInvocation
+from cdp.errors import UninitializedSDKError
 from cdp.faucet_transaction import FaucetTransaction
 from cdp.fund_operation import FundOperation
 from cdp.fund_quote import FundQuote
+from cdp.hd_derivation import derive_account_node, derive_private_keys_many
 from cdp.mnemonic_seed_phrase import MnemonicSeedPhrase
+from cdp.paginator import Paginator
 from cdp.payload_signature import PayloadSignature
 from cdp.smart_contract import SmartContract
 from cdp.trade import Trade
 from cdp.transfer import Transfer
 from cdp.wallet_address import WalletAddress
 from cdp.wallet_data import WalletData
+from cdp.wallet_summary import WalletSummary
 from cdp.webhook import Webhook
 
+if TYPE_CHECKING:
+    from bip_utils import Bip32Slip10Secp256k1
 
-class Wallet:
+
+class Wallet(ClientBound):
     """A class representing a wallet."""
 
     MAX_ADDRESSES: int = 20
@@ -59,7 +63,13 @@ class Wallet:
         self._model = model
         self._addresses: list[WalletAddress] | None = None
         self._seed = seed
-        self._master = None if Cdp.use_server_signer else self._set_master_node()
+        self._master_seed: bytes | None = None
+        self._master_node: Bip32Slip10Secp256k1 | None = None
+        self._account_node: Bip32Slip10Secp256k1 | None = None
+        self._private_keys: dict[int, str] = {}
+
+        if not Cdp.uses_server_signer():
+            self._set_master_node()
 
     @property
     def id(self) -> str:
@@ -112,7 +122,7 @@ class Wallet:
             bool: True if the wallet can sign, False otherwise.
 
         """
-        return self._master is not None
+        return self._master_seed is not None
 
     @classmethod
     def create(
@@ -167,14 +177,14 @@ class Wallet:
         """
         create_wallet_request = CreateWalletRequest(
             wallet=CreateWalletRequestWallet(
-                network_id=network_id, use_server_signer=Cdp.use_server_signer
+                network_id=network_id, use_server_signer=Cdp.uses_server_signer()
             )
         )
 
         model = Cdp.api_clients.wallets.create_wallet(create_wallet_request)
         wallet = cls(model, seed)
 
-        if Cdp.use_server_signer:
+        if Cdp.uses_server_signer():
             wallet._wait_for_signer(interval_seconds, timeout_seconds)
 
         wallet.create_address()
@@ -237,28 +247,29 @@ class Wallet:
         return cls(model, "")
 
     @classmethod
-    def list(cls) -> Iterator["Wallet"]:
+    def list(
+        cls, lightweight: bool = False, **pagination_options
+    ) -> Iterator["Wallet"] | Iterator[WalletSummary]:
         """List wallets.
 
+        Args:
+            lightweight (bool): Whether to yield `WalletSummary` records instead of wallet objects,
+                for read-only listings of many wallets. Defaults to False.
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
         Returns:
-            Iterator[Wallet]: An iterator of wallet objects.
+            Union[Iterator[Wallet], Iterator[WalletSummary]]: An iterator of wallet objects, or of
+            wallet summaries if `lightweight` is True.
 
         Raises:
             Exception: If there's an error listing the wallets.
 
         """
-        while True:
-            page = None
-
-            response: WalletList = Cdp.api_clients.wallets.list_wallets(limit=100, page=page)
-
-            for wallet_model in response.data:
-                yield cls(wallet_model, "")
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.wallets.list_wallets(limit=limit, page=page),
+            WalletSummary.from_model if lightweight else lambda model: cls(model, ""),
+            **pagination_options,
+        )
 
     @classmethod
     def import_wallet(
@@ -286,6 +297,8 @@ class Wallet:
             if not data.mnemonic_phrase:
                 raise ValueError("BIP-39 mnemonic seed phrase must be provided")
 
+            from bip_utils import Bip39MnemonicValidator, Bip39SeedGenerator
+
             # Validate the mnemonic using bip_utils
             if not Bip39MnemonicValidator().IsValid(data.mnemonic_phrase):
                 raise ValueError("Invalid BIP-39 mnemonic seed phrase")
@@ -324,6 +337,62 @@ class Wallet:
         """
         return cls.import_wallet(data)
 
+    @classmethod
+    def import_wallets(
+        cls, data: builtins.list[WalletData], max_workers: int | None = None
+    ) -> builtins.list["Wallet"]:
+        """Import many wallets from previously exported wallet data.
+
+        The wallets and their addresses are fetched first, then the keys of every address are
+        derived together on a process pool, which makes loading thousands of wallets at startup
+        scale with the number of CPUs.
+
+        Args:
+            data (List[WalletData]): The wallet data to import.
+            max_workers (Optional[int]): The number of key derivation processes. Use 1 to derive
+                in the calling process. Defaults to the number of CPUs.
+
+        Returns:
+            List[Wallet]: The imported wallets, in the order of the data.
+
+        Raises:
+            Exception: If there's an error getting a wallet or its addresses.
+
+        """
+        wallets = []
+        address_models = []
+
+        for wallet_data in data:
+            model = Cdp.api_clients.wallets.get_wallet(wallet_data.wallet_id)
+            wallets.append(cls(model, wallet_data.seed))
+            address_models.append(
+                Cdp.api_clients.addresses.list_addresses(
+                    wallet_data.wallet_id, limit=cls.MAX_ADDRESSES
+                ).data
+            )
+
+        signing = [
+            (wallet, models)
+            for wallet, models in zip(wallets, address_models, strict=True)
+            if wallet.can_sign
+        ]
+        private_keys = derive_private_keys_many(
+            [(wallet._seed, [model.index for model in models]) for wallet, models in signing],
+            max_workers=max_workers,
+        )
+
+        for (wallet, models), keys in zip(signing, private_keys, strict=True):
+            wallet._private_keys = {
+                model.index: key for model, key in zip(models, keys, strict=True)
+            }
+
+        for wallet, models in zip(wallets, address_models, strict=True):
+            wallet._addresses = [
+                wallet._build_wallet_address(model, model.index) for model in models
+            ]
+
+        return wallets
+
     def create_address(self) -> "WalletAddress":
         """Create a new address for the wallet.
 
@@ -442,6 +511,7 @@ class Wallet:
         destination: Union[Address, "Wallet", str],
         gasless: bool = False,
         skip_batching: bool = False,
+        skip_balance_check: bool = False,
     ) -> Transfer:
         """Transfer funds from the wallet.
 
@@ -451,6 +521,7 @@ class Wallet:
             destination (Union[Address, 'Wallet', str]): The destination for the transfer.
             gasless (bool): Whether the transfer should be gasless. Defaults to False.
             skip_batching (bool): When True, the Transfer will be submitted immediately. Otherwise, the Transfer will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the default address is not checked before creating the Transfer. Defaults to False.
 
         Returns:
             Any: The result of the transfer operation.
@@ -466,15 +537,62 @@ class Wallet:
         if isinstance(amount, float | int | str):
             amount = Decimal(amount)
 
-        return self.default_address.transfer(amount, asset_id, destination, gasless, skip_batching)
+        return self.default_address.transfer(
+            amount, asset_id, destination, gasless, skip_batching, skip_balance_check
+        )
+
+    def batch_transfer(
+        self,
+        transfers: Iterable[BatchTransferItem | tuple],
+        gasless: bool = False,
+        skip_batching: bool = False,
+        skip_balance_check: bool = False,
+        max_workers: int = 8,
+        on_result: Callable[[BatchTransferResult], None] | None = None,
+    ) -> BatchTransferReport:
+        """Transfer funds from the default address to many destinations concurrently.
+
+        Args:
+            transfers (Iterable[Union[BatchTransferItem, tuple]]): The transfers, as `BatchTransferItem` instances or `(amount, asset_id, destination)` tuples.
+            gasless (bool): Whether to use gasless transfers. Defaults to False.
+            skip_batching (bool): When True, the Transfers will be submitted immediately. Otherwise, the Transfers will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the default address is not checked before creating the Transfers. Defaults to False.
+            max_workers (int): The maximum number of transfers in flight. Defaults to 8.
+            on_result (Optional[Callable[[BatchTransferResult], None]]): Called with the result of each transfer as it completes. Exceptions it raises are collected in `BatchTransferReport.callback_errors` and do not stop the batch.
+
+        Returns:
+            BatchTransferReport: The result of each transfer, in the order they were given.
+
+        Raises:
+            ValueError: If the default address does not exist.
+
+        """
+        if self.default_address is None:
+            raise ValueError("Default address does not exist")
+
+        return self.default_address.batch_transfer(
+            transfers,
+            gasless=gasless,
+            skip_batching=skip_batching,
+            skip_balance_check=skip_balance_check,
+            max_workers=max_workers,
+            on_result=on_result,
+        )
 
-    def trade(self, amount: Number | Decimal | str, from_asset_id: str, to_asset_id: str) -> Trade:
+    def trade(
+        self,
+        amount: Number | Decimal | str,
+        from_asset_id: str,
+        to_asset_id: str,
+        skip_balance_check: bool = False,
+    ) -> Trade:
         """Trade funds from the wallet address.
 
         Args:
             amount (Union[Number, Decimal, str]): The amount to trade.
             from_asset_id (str): The asset ID to trade from.
             to_asset_id (str): The asset ID to trade to.
+            skip_balance_check (bool): When True, the balance of the default address is not checked before creating the Trade. Defaults to False.
 
         Returns:
             Trade: The trade object.
@@ -486,7 +604,7 @@ class Wallet:
         if self.default_address is None:
             raise ValueError("Default address does not exist")
 
-        return self.default_address.trade(amount, from_asset_id, to_asset_id)
+        return self.default_address.trade(amount, from_asset_id, to_asset_id, skip_balance_check)
 
     def invoke_contract(
         self,
@@ -563,7 +681,7 @@ class Wallet:
             ValueError: If the wallet does not have a seed loaded.
 
         """
-        if self._master is None or self._seed is None:
+        if not self.can_sign:
             raise ValueError("Wallet does not have seed loaded")
 
         return WalletData(self.id, self._seed, self.network_id)
@@ -601,11 +719,9 @@ class Wallet:
             ValueError: If the wallet does not have a seed loaded.
 
         """
-        if self._master is None or self._seed is None:
+        if not self.can_sign:
             raise ValueError("Wallet does not have seed loaded")
 
-        key = self._encryption_key()
-
         existing_seeds = self._existing_seeds(file_path)
 
         seed_to_store = self._seed
@@ -613,7 +729,9 @@ class Wallet:
         iv = ""
 
         if encrypt:
-            cipher = AES.new(key, AES.MODE_GCM)
+            from Crypto.Cipher import AES
+
+            cipher = AES.new(self._encryption_key(), AES.MODE_GCM)
             iv = cipher.nonce.hex()
 
             encrypted_data, auth_tag_bytes = cipher.encrypt_and_digest(bytes.fromhex(self._seed))
@@ -673,6 +791,8 @@ class Wallet:
         seed = seed_data["seed"]
 
         if seed_data["encrypted"]:
+            from Crypto.Cipher import AES
+
             key = self._encryption_key()
             encrypted_seed = bytes.fromhex(seed)
             cipher = AES.new(key, AES.MODE_GCM, nonce=bytes.fromhex(seed_data["iv"]))
@@ -684,19 +804,33 @@ class Wallet:
                 raise ValueError(f"Unable to decrypt seed for wallet {self.id}") from e
 
         self._seed = seed
-        self._master = self._set_master_node()
+        self._set_master_node()
+
+    def _api_private_key(self) -> str | None:
+        """Get the private key of the API key of the client the wallet uses.
+
+        Returns:
+            Optional[str]: The private key, or None if no client is configured.
+
+        """
+        return Cdp.api_private_key()
 
     def _encryption_key(self) -> bytes:
-        """Generate an encryption key derived from the configured private key.
+        """Generate an encryption key derived from the private key of the client in use.
 
         Returns:
             bytes: A 32-byte encryption key derived via SHA-256 hashing.
 
         Raises:
+            UninitializedSDKError: If no client is configured.
             ValueError: If the private key type is not supported for encryption key derivation.
 
         """
-        key_obj = _parse_private_key(Cdp.private_key)
+        private_key = self._api_private_key()
+        if private_key is None:
+            raise UninitializedSDKError()
+
+        key_obj = _parse_private_key(private_key)
 
         if isinstance(key_obj, ec.EllipticCurvePrivateKey):
             public_key = key_obj.public_key()
@@ -760,8 +894,9 @@ class Wallet:
         if not self.can_sign:
             return WalletAddress(model)
 
-        key = self._derive_key(index)
-        account = Account.from_key(key.PrivateKey().Raw().ToHex())
+        from eth_account import Account
+
+        account = Account.from_key(self._private_key(index))
 
         if account.address != model.address_id:
             raise ValueError("Derived key does not match wallet")
@@ -783,25 +918,48 @@ class Wallet:
             None,
         )
 
-    def _set_master_node(self) -> Bip32Slip10Secp256k1 | None:
-        """Set the master node for the wallet.
+    def _set_master_node(self) -> None:
+        """Validate the seed of the wallet and reset its derived keys.
+
+        The master node itself is derived lazily by `_master`, the first time a key is needed, so
+        that read-only wallets never pay for BIP-32 master derivation.
 
         Returns:
-            Optional[Bip32Slip10Secp256k1]: The master node, or None if no seed is available.
+            None
 
         """
         if self._seed is None:
             seed = os.urandom(64)
             self._seed = seed.hex()
 
+        self._master_seed = None
+        self._master_node = None
+        self._account_node = None
+        self._private_keys = {}
+
         if self._seed == "":
-            return None
+            return
 
         seed = bytes.fromhex(self._seed)
 
         self._validate_seed(seed)
 
-        return Bip32Slip10Secp256k1.FromSeed(seed)
+        self._master_seed = seed
+
+    @property
+    def _master(self) -> "Bip32Slip10Secp256k1 | None":
+        """Get the master node of the wallet, deriving it from the seed on first use.
+
+        Returns:
+            Optional[Bip32Slip10Secp256k1]: The master node, or None if no seed is available.
+
+        """
+        if self._master_node is None and self._master_seed is not None:
+            from bip_utils import Bip32Slip10Secp256k1
+
+            self._master_node = Bip32Slip10Secp256k1.FromSeed(self._master_seed)
+
+        return self._master_node
 
     def _validate_seed(self, seed: bytes) -> None:
         """Validate the seed.
@@ -816,8 +974,11 @@ class Wallet:
         if len(seed) != 32 and len(seed) != 64:
             raise ValueError("Seed must be 32 or 64 bytes")
 
-    def _derive_key(self, index: int) -> Bip32Slip10Secp256k1:
-        """Derive a key from the master node.
+    def _derive_key(self, index: int) -> "Bip32Slip10Secp256k1":
+        """Derive an address key from the account node.
+
+        The hardened account node is derived from the master node once and cached, so each
+        address only costs a single child derivation.
 
         Args:
             index (int): The index to use for key derivation.
@@ -826,9 +987,28 @@ class Wallet:
             Bip32Slip10Secp256k1: The derived key.
 
         """
-        return self._master.DerivePath("m/44'/60'/0'/0" + f"/{index}")
+        if self._account_node is None:
+            self._account_node = derive_account_node(self._master)
 
-    def _create_attestation(self, key: Bip32Slip10Secp256k1, public_key_hex: str) -> str:
+        return self._account_node.ChildKey(index)
+
+    def _private_key(self, index: int) -> str:
+        """Get the hex-encoded private key of an address, preferring a pre-derived key.
+
+        Args:
+            index (int): The index of the address.
+
+        Returns:
+            str: The hex-encoded private key.
+
+        """
+        private_key = self._private_keys.pop(index, None)
+        if private_key is not None:
+            return private_key
+
+        return self._derive_key(index).PrivateKey().Raw().ToHex()
+
+    def _create_attestation(self, key: "Bip32Slip10Secp256k1", public_key_hex: str) -> str:
         """Create an attestation for the given private key in the format expected.
 
         Args:
@@ -843,6 +1023,8 @@ class Wallet:
             {"wallet_id": self.id, "public_key": public_key_hex}, separators=(",", ":")
         )
 
+        import coincurve
+
         signature = coincurve.PrivateKey(key.PrivateKey().Raw().ToBytes()).sign_recoverable(
             payload.encode()
         )
@@ -1,15 +1,24 @@
+import contextvars
 import json
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
 from numbers import Number
 from typing import TYPE_CHECKING, Union
 
-from eth_account.signers.local import LocalAccount
-from eth_utils import to_bytes, to_hex
-
 from cdp.address import Address
+from cdp.asset import Asset
+from cdp.balance_ledger import BalanceLedger, BalanceReservation
+from cdp.batch_transfer import (
+    BatchTransferItem,
+    BatchTransferReport,
+    BatchTransferResult,
+    denomination_key,
+    totals_by_asset,
+)
 from cdp.cdp import Cdp
 from cdp.client.models.address import Address as AddressModel
+from cdp.client.models.balance import Balance as BalanceModel
 from cdp.client.models.compile_smart_contract_request import CompileSmartContractRequest
 from cdp.contract_invocation import ContractInvocation
 from cdp.errors import InsufficientFundsError
@@ -18,16 +27,19 @@ from cdp.fund_quote import FundQuote
 from cdp.payload_signature import PayloadSignature
 from cdp.smart_contract import SmartContract
 from cdp.trade import Trade
+from cdp.transaction_signer import get_transaction_signer
 from cdp.transfer import Transfer
 
 if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+
     from cdp.wallet import Wallet
 
 
 class WalletAddress(Address):
     """A class representing a wallet address."""
 
-    def __init__(self, model: AddressModel, key: LocalAccount | None = None) -> None:
+    def __init__(self, model: AddressModel, key: "LocalAccount | None" = None) -> None:
         """Initialize the WalletAddress.
 
         Args:
@@ -37,6 +49,7 @@ class WalletAddress(Address):
         """
         self._model = model
         self._key = key
+        self._balance_ledger = BalanceLedger()
 
         super().__init__(model.network_id, model.address_id)
 
@@ -46,12 +59,12 @@ class WalletAddress(Address):
         return self._model.wallet_id
 
     @property
-    def key(self) -> LocalAccount | None:
+    def key(self) -> "LocalAccount | None":
         """Get the local account key."""
         return self._key
 
     @key.setter
-    def key(self, key: LocalAccount) -> None:
+    def key(self, key: "LocalAccount") -> None:
         """Set the private key for signing transactions.
 
         Args:
@@ -66,6 +79,29 @@ class WalletAddress(Address):
 
         self._key = key
 
+    @property
+    def balance_ledger(self) -> BalanceLedger:
+        """Get the local balance ledger used for balance sufficiency checks.
+
+        The ledger is seeded by `balance()` and `balances()` and debited by transfers, trades and
+        contract invocations sent from this address.
+
+        Returns:
+            BalanceLedger: The balance ledger.
+
+        """
+        return self._balance_ledger
+
+    @balance_ledger.setter
+    def balance_ledger(self, balance_ledger: BalanceLedger) -> None:
+        """Replace the balance ledger, e.g. with one that has a different TTL.
+
+        Args:
+            balance_ledger (BalanceLedger): The balance ledger.
+
+        """
+        self._balance_ledger = balance_ledger
+
     @property
     def can_sign(self) -> bool:
         """Get whether the address can sign.
@@ -103,6 +139,7 @@ class WalletAddress(Address):
         destination: Union[Address, "Wallet", str],
         gasless: bool = False,
         skip_batching: bool = False,
+        skip_balance_check: bool = False,
     ) -> Transfer:
         """Transfer funds from the wallet address.
 
@@ -112,6 +149,7 @@ class WalletAddress(Address):
             destination (Union[Address, 'Wallet', str]): The transfer destination.
             gasless (bool): Whether to use gasless transfer.
             skip_batching (bool): When True, the Transfer will be submitted immediately. Otherwise, the Transfer will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the address is not checked before creating the Transfer. Defaults to False.
 
         Returns:
             Transfer: The created transfer object.
@@ -119,34 +157,207 @@ class WalletAddress(Address):
         """
         normalized_amount = Decimal(amount)
 
-        self._ensure_sufficient_balance(normalized_amount, asset_id)
+        reservation = None
+        if not skip_balance_check:
+            reservation = self._reserve_balance(normalized_amount, asset_id)
 
-        transfer = Transfer.create(
-            address_id=self.address_id,
-            amount=normalized_amount,
-            asset_id=asset_id,
-            destination=destination,
-            network_id=self.network_id,
-            wallet_id=self.wallet_id,
-            gasless=gasless,
-            skip_batching=skip_batching,
+        return self._send_transfer(
+            normalized_amount, asset_id, destination, gasless, skip_batching, reservation
         )
 
-        if Cdp.use_server_signer:
-            return transfer
+    def batch_transfer(
+        self,
+        transfers: Iterable[BatchTransferItem | tuple],
+        gasless: bool = False,
+        skip_batching: bool = False,
+        skip_balance_check: bool = False,
+        max_workers: int = 8,
+        on_result: Callable[[BatchTransferResult], None] | None = None,
+    ) -> BatchTransferReport:
+        """Transfer funds from the wallet address to many destinations concurrently.
+
+        The balance is checked once per asset for the total of the batch, with amounts in other
+        denominations of the asset, e.g. `gwei` and `eth`, converted to a common unit, and each
+        asset is fetched once. Transfers are then created, signed and broadcast on a pool of up to
+        `max_workers` threads. A failing transfer does not stop the rest of the batch.
+
+        Args:
+            transfers (Iterable[Union[BatchTransferItem, tuple]]): The transfers, as `BatchTransferItem` instances or `(amount, asset_id, destination)` tuples.
+            gasless (bool): Whether to use gasless transfers.
+            skip_batching (bool): When True, the Transfers will be submitted immediately. Otherwise, the Transfers will be batched. Defaults to False. Note: requires gasless option to be set to True.
+            skip_balance_check (bool): When True, the balance of the address is not checked before creating the Transfers. Defaults to False.
+            max_workers (int): The maximum number of transfers in flight. Defaults to 8.
+            on_result (Optional[Callable[[BatchTransferResult], None]]): Called with the result of each transfer as it completes. Exceptions it raises are collected in `BatchTransferReport.callback_errors` and do not stop the batch.
+
+        Returns:
+            BatchTransferReport: The result of each transfer, in the order they were given.
+
+        Raises:
+            InsufficientFundsError: If the balance of an asset does not cover its total in the batch. No transfer is created in that case.
+            ValueError: If skip_batching is set without gasless or max_workers is not positive.
+
+        """
+        if skip_batching and not gasless:
+            raise ValueError("skip_batching requires gasless to be True")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        items = [BatchTransferItem.coerce(item) for item in transfers]
+        assets = {
+            asset_id: Asset.fetch(self.network_id, asset_id)
+            for asset_id in dict.fromkeys(item.asset_id for item in items)
+        }
+        totals = totals_by_asset(items, assets)
+
+        reservations: dict[str, BalanceReservation | None] = {}
+        if not skip_balance_check:
+            try:
+                for asset_id, total in totals.items():
+                    reservations[denomination_key(asset_id)] = self._reserve_balance(
+                        total, asset_id
+                    )
+            except Exception:
+                for reservation in reservations.values():
+                    if reservation is not None:
+                        self._balance_ledger.release(reservation)
+                raise
+
+        report = BatchTransferReport()
+        results: list[BatchTransferResult | None] = [None] * len(items)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cdp-batch-transfer"
+        ) as executor:
+            # Copy the context so workers see the caller's context variables.
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._send_batch_item,
+                    index,
+                    item,
+                    assets[item.asset_id],
+                    reservations.get(denomination_key(item.asset_id)),
+                    gasless,
+                    skip_batching,
+                )
+                for index, item in enumerate(items)
+            ]
+
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.index] = result
+                if on_result is not None:
+                    try:
+                        on_result(result)
+                    except Exception as e:
+                        report.callback_errors.append(e)
+
+        report.results = results
+        return report
+
+    def _send_batch_item(
+        self,
+        index: int,
+        item: BatchTransferItem,
+        asset: Asset,
+        reservation: BalanceReservation | None,
+        gasless: bool,
+        skip_batching: bool,
+    ) -> BatchTransferResult:
+        """Create, sign and broadcast a single transfer of a batch.
+
+        Args:
+            index (int): The position of the transfer in the batch.
+            item (BatchTransferItem): The transfer.
+            asset (Asset): The asset to transfer.
+            reservation (Optional[BalanceReservation]): The reservation of the batch total of
+                the asset, if the balance was checked.
+            gasless (bool): Whether to use gasless transfer.
+            skip_batching (bool): Whether to skip batching.
+
+        Returns:
+            BatchTransferResult: The result of the transfer.
+
+        """
+        try:
+            transfer = self._send_transfer(
+                item.amount,
+                item.asset_id,
+                item.destination,
+                gasless,
+                skip_batching,
+                reservation,
+                asset,
+            )
+        except Exception as e:
+            return BatchTransferResult(index, item, error=e)
+
+        return BatchTransferResult(index, item, transfer=transfer)
+
+    def _send_transfer(
+        self,
+        amount: Decimal,
+        asset_id: str,
+        destination: Union[Address, "Wallet", str],
+        gasless: bool,
+        skip_batching: bool,
+        reservation: BalanceReservation | None,
+        asset: Asset | None = None,
+    ) -> Transfer:
+        """Create, sign and broadcast a transfer, and record it in the balance ledger.
+
+        Args:
+            amount (Decimal): The amount to transfer.
+            asset_id (str): The asset ID.
+            destination (Union[Address, 'Wallet', str]): The transfer destination.
+            gasless (bool): Whether to use gasless transfer.
+            skip_batching (bool): Whether to skip batching.
+            reservation (Optional[BalanceReservation]): The balance reserved for the transfer, if
+                the balance was checked.
+            asset (Optional[Asset]): The asset to transfer, if it was already fetched.
+
+        Returns:
+            Transfer: The created transfer object.
+
+        """
+        try:
+            transfer = Transfer.create(
+                address_id=self.address_id,
+                amount=amount,
+                asset_id=asset_id,
+                destination=destination,
+                network_id=self.network_id,
+                wallet_id=self.wallet_id,
+                gasless=gasless,
+                skip_batching=skip_batching,
+                asset=asset,
+            )
+
+            if not Cdp.uses_server_signer():
+                transfer.sign(self.key)
+                transfer.broadcast()
+        except Exception:
+            self._release_balance(reservation, amount, asset_id)
+            raise
 
-        transfer.sign(self.key)
-        transfer.broadcast()
+        self._settle_balance(reservation, amount, asset_id)
 
         return transfer
 
-    def trade(self, amount: Number | Decimal | str, from_asset_id: str, to_asset_id: str) -> Trade:
+    def trade(
+        self,
+        amount: Number | Decimal | str,
+        from_asset_id: str,
+        to_asset_id: str,
+        skip_balance_check: bool = False,
+    ) -> Trade:
         """Trade funds from the wallet address.
 
         Args:
             amount (Union[Number, Decimal, str]): The amount to trade.
             from_asset_id (str): The source asset ID.
             to_asset_id (str): The destination asset ID.
+            skip_balance_check (bool): When True, the balance of the address is not checked before creating the Trade. Defaults to False.
 
         Returns:
             Trade: The created trade object.
@@ -154,26 +365,33 @@ class WalletAddress(Address):
         """
         normalized_amount = Decimal(amount)
 
-        self._ensure_sufficient_balance(normalized_amount, from_asset_id)
-
-        trade = Trade.create(
-            address_id=self.address_id,
-            from_asset_id=from_asset_id,
-            to_asset_id=to_asset_id,
-            amount=normalized_amount,
-            network_id=self.network_id,
-            wallet_id=self.wallet_id,
-        )
+        reservation = None
+        if not skip_balance_check:
+            reservation = self._reserve_balance(normalized_amount, from_asset_id)
+
+        try:
+            trade = Trade.create(
+                address_id=self.address_id,
+                from_asset_id=from_asset_id,
+                to_asset_id=to_asset_id,
+                amount=normalized_amount,
+                network_id=self.network_id,
+                wallet_id=self.wallet_id,
+            )
 
-        if Cdp.use_server_signer:
-            return trade
+            if not Cdp.uses_server_signer():
+                trade.transaction.sign(self.key)
 
-        trade.transaction.sign(self.key)
+                if trade.approve_transaction is not None:
+                    trade.approve_transaction.sign(self.key)
 
-        if trade.approve_transaction is not None:
-            trade.approve_transaction.sign(self.key)
+                trade.broadcast()
+        except Exception:
+            self._release_balance(reservation, normalized_amount, from_asset_id)
+            raise
 
-        trade.broadcast()
+        self._settle_balance(reservation, normalized_amount, from_asset_id)
+        self._balance_ledger.invalidate(to_asset_id)
 
         return trade
 
@@ -210,27 +428,34 @@ class WalletAddress(Address):
                 "Asset ID is required for contract invocation if an amount is provided"
             )
 
+        reservation = None
         if amount and asset_id:
-            self._ensure_sufficient_balance(normalized_amount, asset_id)
-
-        invocation = ContractInvocation.create(
-            address_id=self.address_id,
-            wallet_id=self.wallet_id,
-            network_id=self.network_id,
-            contract_address=contract_address,
-            method=method,
-            abi=abi,
-            args=args,
-            amount=normalized_amount,
-            asset_id=asset_id,
-        )
+            reservation = self._reserve_balance(normalized_amount, asset_id)
+
+        try:
+            invocation = ContractInvocation.create(
+                address_id=self.address_id,
+                wallet_id=self.wallet_id,
+                network_id=self.network_id,
+                contract_address=contract_address,
+                method=method,
+                abi=abi,
+                args=args,
+                amount=normalized_amount,
+                asset_id=asset_id,
+            )
 
-        if Cdp.use_server_signer:
-            return invocation
+            if not Cdp.uses_server_signer():
+                invocation.sign(self.key)
 
-        invocation.sign(self.key)
+                invocation.broadcast()
+        except Exception:
+            if asset_id:
+                self._release_balance(reservation, normalized_amount, asset_id)
+            raise
 
-        invocation.broadcast()
+        if amount and asset_id:
+            self._settle_balance(reservation, normalized_amount, asset_id)
 
         return invocation
 
@@ -246,9 +471,12 @@ class WalletAddress(Address):
         """
         signature = None
 
-        if not Cdp.use_server_signer:
-            signed_message = self.key.unsafe_sign_hash(to_bytes(hexstr=unsigned_payload))
-            signature = to_hex(signed_message.signature)
+        if not Cdp.uses_server_signer():
+            from eth_utils import to_bytes, to_hex
+
+            signature = to_hex(
+                get_transaction_signer().sign_hash(self.key, to_bytes(hexstr=unsigned_payload))
+            )
 
         return PayloadSignature.create(
             wallet_id=self.wallet_id,
@@ -280,7 +508,7 @@ class WalletAddress(Address):
             ),
         )
 
-        if Cdp.use_server_signer:
+        if Cdp.uses_server_signer():
             return smart_contract
 
         smart_contract.sign(self.key)
@@ -307,7 +535,7 @@ class WalletAddress(Address):
             options=SmartContract.NFTContractOptions(name=name, symbol=symbol, base_uri=base_uri),
         )
 
-        if Cdp.use_server_signer:
+        if Cdp.uses_server_signer():
             return smart_contract
 
         smart_contract.sign(self.key)
@@ -332,7 +560,7 @@ class WalletAddress(Address):
             options=SmartContract.MultiTokenContractOptions(uri=uri),
         )
 
-        if Cdp.use_server_signer:
+        if Cdp.uses_server_signer():
             return smart_contract
 
         smart_contract.sign(self.key)
@@ -376,7 +604,7 @@ class WalletAddress(Address):
             compiled_smart_contract_id=compiled_contract.compiled_smart_contract_id,
         )
 
-        if Cdp.use_server_signer:
+        if Cdp.uses_server_signer():
             return smart_contract
 
         smart_contract.sign(self.key)
@@ -444,23 +672,104 @@ class WalletAddress(Address):
             wallet_id=self.wallet_id,
         )
 
-    def _ensure_sufficient_balance(self, amount: Decimal, asset_id: str) -> None:
-        """Ensure the wallet address has sufficient balance.
+    def _reserve_balance(self, amount: Decimal, asset_id: str) -> BalanceReservation | None:
+        """Ensure the wallet address has sufficient balance, and reserve it for a send.
+
+        The amount is reserved in the balance ledger, so that concurrent sends cannot spend the
+        same funds. The API is only queried when the ledger has no fresh balance for the asset or
+        its unreserved balance is too low.
 
         Args:
             amount (Decimal): The amount to check.
             asset_id (str): The asset ID.
 
+        Returns:
+            Optional[BalanceReservation]: The reservation, or None if the address holds none of
+            the asset and the amount is zero.
+
         Raises:
             InsufficientFundsError: If there are insufficient funds.
 
         """
+        try:
+            reservation = self._balance_ledger.reserve(asset_id, amount)
+        except InsufficientFundsError:
+            reservation = None
+
+        if reservation is not None:
+            return reservation
+
         current_balance = self.balance(asset_id)
+        reservation = self._balance_ledger.reserve(asset_id, amount)
+
+        if reservation is None and amount > current_balance:
+            raise InsufficientFundsError(expected=amount, exact=current_balance)
 
-        if amount <= current_balance:
-            return
+        return reservation
+
+    def _settle_balance(
+        self, reservation: BalanceReservation | None, amount: Decimal, asset_id: str
+    ) -> None:
+        """Debit a successful send from the balance ledger, consuming its reservation.
+
+        Args:
+            reservation (Optional[BalanceReservation]): The reservation of the send, if any.
+            amount (Decimal): The amount sent.
+            asset_id (str): The asset ID.
+
+        """
+        if reservation is None:
+            self._balance_ledger.debit(asset_id, amount)
+        else:
+            self._balance_ledger.settle(reservation, amount, asset_id)
+
+    def _release_balance(
+        self, reservation: BalanceReservation | None, amount: Decimal | None, asset_id: str
+    ) -> None:
+        """Release the reservation of a failed send and invalidate the balance of its asset.
+
+        Args:
+            reservation (Optional[BalanceReservation]): The reservation of the send, if any.
+            amount (Optional[Decimal]): The amount that was not sent, or None for all that is
+                left of the reservation.
+            asset_id (str): The asset ID.
+
+        """
+        if reservation is not None:
+            self._balance_ledger.release(reservation, amount, asset_id)
+
+        self._balance_ledger.invalidate(asset_id)
+
+    def _fetch_balance(self, asset_id: str) -> BalanceModel | None:
+        """Fetch the balance model of an asset and record it in the balance ledger.
+
+        Args:
+            asset_id (str): The asset ID.
+
+        Returns:
+            Optional[BalanceModel]: The balance model, or None if the address holds none.
+
+        """
+        model = super()._fetch_balance(asset_id)
+
+        if model is None:
+            self._balance_ledger.invalidate(asset_id)
+        else:
+            self._balance_ledger.seed([model])
+
+        return model
+
+    def _fetch_balances(self) -> list[BalanceModel]:
+        """Fetch the balance models of all assets and record them in the balance ledger.
+
+        Returns:
+            List[BalanceModel]: The balance models.
+
+        """
+        models = super()._fetch_balances()
+        self._balance_ledger.seed(models)
 
-        raise InsufficientFundsError(expected=amount, exact=current_balance)
+        return models
 
     def __str__(self) -> str:
         """Return a string representation of the WalletAddress."""
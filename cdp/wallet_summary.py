@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from cdp.client.models.wallet import Wallet as WalletModel
+
+
+@dataclass(frozen=True)
+class WalletSummary:
+    """A read-only record of a wallet, returned by `Wallet.list(lightweight=True)`.
+
+    Attributes:
+        id (str): The ID of the wallet.
+        network_id (str): The network ID of the wallet.
+        server_signer_status (Optional[str]): The server signer status of the wallet.
+        default_address_id (Optional[str]): The address ID of the default address, if any.
+
+    """
+
+    id: str
+    network_id: str
+    server_signer_status: str | None = None
+    default_address_id: str | None = None
+
+    @classmethod
+    def from_model(cls, model: WalletModel) -> "WalletSummary":
+        """Create a WalletSummary from a wallet model.
+
+        Args:
+            model (WalletModel): The wallet model.
+
+        Returns:
+            WalletSummary: The summary of the wallet.
+
+        """
+        return cls(
+            id=model.id,
+            network_id=model.network_id,
+            server_signer_status=model.server_signer_status,
+            default_address_id=(
+                model.default_address.address_id if model.default_address is not None else None
+            ),
+        )
+
+    def __str__(self) -> str:
+        """Return a string representation of the WalletSummary."""
+        return (
+            f"WalletSummary: (id: {self.id}, network_id: {self.network_id}, "
+            f"default_address_id: {self.default_address_id})"
+        )
@@ -2,6 +2,7 @@ import warnings
 from collections.abc import Iterator
 
 from cdp.cdp import Cdp
+from cdp.cdp_client import ClientBound
 from cdp.client.models.create_webhook_request import CreateWebhookRequest
 from cdp.client.models.update_webhook_request import UpdateWebhookRequest
 from cdp.client.models.webhook import Webhook as WebhookModel
@@ -10,10 +11,10 @@ from cdp.client.models.webhook import (
     WebhookEventType,
     WebhookEventTypeFilter,
 )
-from cdp.client.models.webhook_list import WebhookList
+from cdp.paginator import Paginator
 
 
-class Webhook:
+class Webhook(ClientBound):
     """A class representing a webhook."""
 
     def __init__(self, model: WebhookModel) -> None:
@@ -121,25 +122,21 @@ class Webhook:
         return webhook
 
     @classmethod
-    def list(cls) -> Iterator["Webhook"]:
+    def list(cls, **pagination_options) -> Iterator["Webhook"]:
         """List webhooks.
 
+        Args:
+            **pagination_options: Options forwarded to `Paginator`, such as `page_size`, `prefetch`, `max_items`, `max_pages` and `on_page`.
+
         Returns:
             Iterator[Webhook]: An iterator of webhook objects.
 
         """
-        while True:
-            page = None
-
-            response: WebhookList = Cdp.api_clients.webhooks.list_webhooks(limit=100, page=page)
-
-            for webhook_model in response.data:
-                yield cls(webhook_model)
-
-            if not response.has_more:
-                break
-
-            page = response.next_page
+        return Paginator(
+            lambda page, limit: Cdp.api_clients.webhooks.list_webhooks(limit=limit, page=page),
+            cls,
+            **pagination_options,
+        )
 
     @staticmethod
     def delete(webhook_id: str) -> None:
@@ -0,0 +1,143 @@
+"""Rewrite the package `__init__` modules of the generated client to import their names lazily.
+
+OpenAPI Generator writes `cdp/client/__init__.py`, `cdp/client/api/__init__.py` and
+`cdp/client/models/__init__.py` with an import of every API and model class, so importing any part
+of the client loads all of them. This script turns those imports into a `_LAZY_IMPORTS` table
+resolved by a module `__getattr__`, and keeps the original imports under `TYPE_CHECKING` for type
+checkers and IDEs.
+
+Run it after every regeneration of the client, with `make lazy-client-exports`. Files that are
+already lazy are rewritten from their `TYPE_CHECKING` imports, so running it twice is harmless,
+and `--check` exits non-zero if a file is not in the lazy form.
+
+Usage:
+    python scripts/lazy_client_exports.py [--check] [PATH ...]
+
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GENERATED_PACKAGES = [
+    ROOT / "cdp" / "client" / "__init__.py",
+    ROOT / "cdp" / "client" / "api" / "__init__.py",
+    ROOT / "cdp" / "client" / "models" / "__init__.py",
+]
+
+_IMPORT = re.compile(r"^from (cdp\.client[\w.]*) import (\w+)$")
+_SECTION_START = re.compile(r"^(# import |from cdp\.client|import importlib$)")
+
+_TEMPLATE = """{header}
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Names are imported on first access so that importing the package does not load every
+# module of the generated client.
+_LAZY_IMPORTS = {{
+{table}
+}}
+
+if TYPE_CHECKING:
+{imports}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({{*globals(), *_LAZY_IMPORTS}})
+"""
+
+
+def make_lazy(source: str) -> str:
+    """Return the lazy form of a generated package `__init__` module.
+
+    Args:
+        source (str): The module source, as generated or already in the lazy form.
+
+    Returns:
+        str: The module with its imports resolved on first access.
+
+    Raises:
+        ValueError: If the module has no imports of the generated client.
+
+    """
+    lines = source.splitlines()
+    start = next(
+        (index for index, line in enumerate(lines) if _SECTION_START.match(line)), len(lines)
+    )
+    header = "\n".join(lines[:start]).rstrip()
+
+    if start < len(lines) and lines[start] == "import importlib":
+        # Already lazy: the generated imports are the body of the TYPE_CHECKING block.
+        block = lines.index("if TYPE_CHECKING:") + 1
+        end = next(
+            index
+            for index in range(block, len(lines))
+            if lines[index] and not lines[index].startswith(" ")
+        )
+        body = [line.removeprefix("    ") for line in lines[block:end]]
+    else:
+        body = lines[start:]
+
+    while body and not body[-1]:
+        body.pop()
+
+    table = []
+    for line in body:
+        match = _IMPORT.match(line)
+        if match:
+            table.append(f'    "{match.group(2)}": "{match.group(1)}",')
+    if not table:
+        raise ValueError("No imports of the generated client found")
+
+    imports = "\n".join(f"    {line}" if line else "" for line in body)
+    return _TEMPLATE.format(header=header, table="\n".join(table), imports=imports)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Rewrite or check the generated package modules.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status, 1 if `--check` found a module that is not lazy.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="only report modules that are not lazy"
+    )
+    parser.add_argument("paths", nargs="*", type=Path, default=GENERATED_PACKAGES)
+    args = parser.parse_args(argv)
+
+    status = 0
+    for path in args.paths:
+        source = path.read_text()
+        lazy = make_lazy(source)
+        if lazy == source:
+            continue
+        if args.check:
+            print(f"{path} does not import lazily, run `make lazy-client-exports`")
+            status = 1
+        else:
+            path.write_text(lazy)
+            print(f"Rewrote {path}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
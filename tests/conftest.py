@@ -5,6 +5,9 @@ import pytest
 
 from cdp import Cdp
 from cdp.api_clients import ApiClients
+from cdp.asset import Asset
+from cdp.async_api_clients import AsyncApiClients
+from cdp.async_cdp import AsyncCdp
 
 
 @pytest.fixture(autouse=True)
@@ -16,10 +19,14 @@ def initialize_cdp(request):
         return
 
     original_api_clients = Cdp.api_clients
+    original_async_api_clients = AsyncCdp.api_clients
     mock_api_clients = MagicMock(spec=ApiClients)
     Cdp.api_clients = mock_api_clients
+    AsyncCdp.api_clients = MagicMock(spec=AsyncApiClients)
+    Asset.cache.clear()
     yield
     Cdp.api_clients = original_api_clients
+    AsyncCdp.api_clients = original_async_api_clients
 
 
 factory_modules = [
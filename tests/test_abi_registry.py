@@ -0,0 +1,148 @@
+import pytest
+from web3 import Web3
+from web3.exceptions import Web3Exception
+
+from cdp.abi_registry import AbiRegistry
+
+TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+RECIPIENT = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+ABI = [
+    {
+        "type": "function",
+        "name": "transfer",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "batch",
+        "inputs": [
+            {"name": "recipients", "type": "address[]"},
+            {"name": "enabled", "type": "bool"},
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "execute",
+        "inputs": [
+            {
+                "name": "call",
+                "type": "tuple",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "data", "type": "bytes"},
+                ],
+            },
+            {"name": "memo", "type": "string"},
+        ],
+        "outputs": [],
+        "stateMutability": "payable",
+    },
+    {
+        "type": "function",
+        "name": "mint",
+        "inputs": [{"name": "amount", "type": "uint256"}],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "mint",
+        "inputs": [{"name": "to", "type": "address"}],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+]
+
+
+def _web3_encode(function_name, args):
+    return Web3().eth.contract(address=TOKEN, abi=ABI).encode_abi(function_name, args=args)
+
+
+@pytest.mark.parametrize(
+    "function_name, args",
+    [
+        ("transfer", [RECIPIENT, 10**6]),
+        ("transfer", [bytes.fromhex(RECIPIENT[2:]), 0]),
+        ("batch", [[RECIPIENT, TOKEN], True]),
+        ("execute", [(RECIPIENT, "0xdeadbeef"), "hello"]),
+        ("mint", [5]),
+        ("mint", [RECIPIENT]),
+    ],
+)
+def test_encode_matches_web3(function_name, args):
+    """Test that calls are encoded like web3, for direct, normalized and overloaded functions."""
+    registry = AbiRegistry()
+
+    assert registry.encode(ABI, function_name, args) == _web3_encode(function_name, args)
+    assert registry.encode(ABI, function_name, args) == _web3_encode(function_name, args)
+
+
+@pytest.mark.parametrize(
+    "function_name, args",
+    [
+        ("transfer", [RECIPIENT, -1]),
+        ("transfer", [RECIPIENT.lower(), 1]),
+        ("transfer", [RECIPIENT[:-1], 1]),
+        ("batch", [[RECIPIENT.lower()], True]),
+        ("approve", []),
+    ],
+)
+def test_encode_errors(function_name, args):
+    """Test that invalid calls raise the errors of web3."""
+    with pytest.raises(Web3Exception) as expected:
+        _web3_encode(function_name, args)
+
+    with pytest.raises(type(expected.value)):
+        AbiRegistry().encode(ABI, function_name, args)
+
+
+def test_fingerprint():
+    """Test that fingerprints ignore key order and identify the ABI."""
+    reordered = [dict(reversed(element.items())) for element in ABI]
+
+    assert AbiRegistry.fingerprint(reordered) == AbiRegistry.fingerprint(ABI)
+    assert AbiRegistry.fingerprint(ABI[:1]) != AbiRegistry.fingerprint(ABI)
+
+
+def test_stats_and_eviction():
+    """Test that ABIs are reused per fingerprint and evicted when the registry is full."""
+    registry = AbiRegistry(max_size=1)
+
+    registry.encode(ABI, "transfer", [RECIPIENT, 1])
+    registry.encode([dict(element) for element in ABI], "transfer", [RECIPIENT, 2])
+    registry.encode(ABI[:1], "transfer", [RECIPIENT, 3])
+
+    stats = registry.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 2, 1, 1)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.stats.misses == 0
+
+
+def test_cached_abi_is_copied():
+    """Test that changing an ABI after encoding does not change the cached ABI."""
+    abi = [dict(ABI[0])]
+    registry = AbiRegistry()
+    expected = registry.encode(abi, "transfer", [RECIPIENT, 1])
+
+    abi[0]["name"] = "renamed"
+
+    assert registry.encode(ABI[:1], "transfer", [RECIPIENT, 1]) == expected
+
+
+def test_disabled_registry():
+    """Test that a registry with a maximum size of 0 caches nothing."""
+    registry = AbiRegistry(max_size=0)
+
+    assert registry.encode(ABI, "mint", [1]) == _web3_encode("mint", [1])
+    assert len(registry) == 0
+
+    with pytest.raises(ValueError, match="max_size must not be negative"):
+        AbiRegistry(max_size=-1)
@@ -1,7 +1,16 @@
+import http.server
+import json
+import threading
+
+import pytest
+
 from cdp import __version__
 from cdp.cdp import Cdp
 from cdp.cdp_api_client import CdpApiClient
-from cdp.constants import SDK_DEFAULT_SOURCE
+from cdp.client.api.transfers_api import TransfersApi
+from cdp.client.models.create_transfer_request import CreateTransferRequest
+from cdp.constants import IDEMPOTENCY_KEY_HEADER, SDK_DEFAULT_SOURCE
+from cdp.errors import ApiError
 
 
 def test_api_client_get_correlation_data():
@@ -32,3 +41,114 @@ def test_api_client_get_correlation_data():
 
     Cdp.configure(api_key_name="test", private_key="test", source="test", source_version="test_ver")
     assert Cdp.api_clients._cdp_client._get_correlation_data() == expected_result2
+
+
+class _IdempotentTransferServer(http.server.ThreadingHTTPServer):
+    """A stand-in for the transfers API that fails once after committing each transfer."""
+
+    def __init__(self, transfer_json):
+        super().__init__(("127.0.0.1", 0), _IdempotentTransferHandler)
+        self.transfer_json = transfer_json
+        self.created = {}
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _IdempotentTransferHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        key = self.headers.get(IDEMPOTENCY_KEY_HEADER)
+        self.server.requests.append(key)
+
+        if key is not None and key in self.server.created:
+            self._respond(200, self.server.created[key])
+            return
+
+        self.server.created[key or f"request-{len(self.server.requests)}"] = (
+            self.server.transfer_json
+        )
+        # The transfer is created, but the response is lost to a transient failure.
+        self._respond(503, json.dumps({"code": "unavailable", "message": "try again"}))
+
+    def _respond(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def transfer_server(transfer_model_factory):
+    """Run the stand-in transfers API in a background thread."""
+    server = _IdempotentTransferServer(transfer_model_factory().to_json())
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _create_transfer(client):
+    return TransfersApi(client).create_transfer(
+        "test-wallet-id",
+        "0xaddressid",
+        CreateTransferRequest(
+            amount="1", network_id="base-sepolia", asset_id="eth", destination="0xdestination"
+        ),
+    )
+
+
+def test_api_client_retries_mutating_requests_with_idempotency_key(
+    transfer_server, dummy_key_factory
+):
+    """Test that a retried transfer creation reuses its idempotency key and is not duplicated."""
+    client = CdpApiClient(
+        "test", dummy_key_factory(), host=transfer_server.url, idempotency_keys=True
+    )
+
+    transfer = _create_transfer(client)
+
+    assert transfer.transfer_id
+    assert len(transfer_server.requests) == 2
+    assert transfer_server.requests[0] is not None
+    assert transfer_server.requests[0] == transfer_server.requests[1]
+    assert len(transfer_server.created) == 1
+
+    _create_transfer(client)
+    assert len(set(transfer_server.requests)) == 2
+    assert len(transfer_server.created) == 2
+
+
+def test_api_client_without_idempotency_keys(transfer_server, dummy_key_factory):
+    """Test that mutating requests are neither keyed nor retried by default."""
+    client = CdpApiClient("test", dummy_key_factory(), host=transfer_server.url)
+
+    with pytest.raises(ApiError):
+        _create_transfer(client)
+
+    assert transfer_server.requests == [None]
+    assert client.retry_methods == frozenset({"GET"})
+
+
+def test_api_client_idempotency_key_only_on_mutating_requests(dummy_key_factory):
+    """Test that only mutating requests get an idempotency key, and a given key is kept."""
+    client = CdpApiClient("test", dummy_key_factory(), idempotency_keys=True)
+    url = "https://api.cdp.coinbase.com/platform/v1/wallets"
+
+    get_headers, post_headers, keyed_headers = {}, {}, {IDEMPOTENCY_KEY_HEADER: "my-key"}
+    client._apply_headers(url, "GET", get_headers)
+    client._apply_headers(url, "POST", post_headers)
+    client._apply_headers(url, "POST", keyed_headers)
+
+    assert IDEMPOTENCY_KEY_HEADER not in get_headers
+    assert post_headers[IDEMPOTENCY_KEY_HEADER]
+    assert keyed_headers[IDEMPOTENCY_KEY_HEADER] == "my-key"
@@ -102,6 +102,64 @@ def test_asset_fetch_api_error(mock_api_clients):
         Asset.fetch("ethereum-goerli", "eth")
 
 
+@patch("cdp.Cdp.api_clients")
+def test_asset_fetch_uses_cache(mock_api_clients, asset_model_factory):
+    """Test that repeated fetches of an asset are served from the cache."""
+    mock_api_clients.assets.get_asset.return_value = asset_model_factory()
+
+    first = Asset.fetch("base-sepolia", "usdc")
+    second = Asset.fetch("base-sepolia", "usdc")
+
+    assert first.decimals == second.decimals
+    mock_api_clients.assets.get_asset.assert_called_once()
+    assert Asset.cache.stats.hits == 1
+    assert Asset.cache.stats.misses == 1
+
+
+@patch("cdp.Cdp.api_clients")
+def test_asset_fetch_cache_derives_denominations(mock_api_clients, asset_model_factory):
+    """Test that wei and gwei are derived from the cached eth model."""
+    mock_api_clients.assets.get_asset.return_value = asset_model_factory(
+        asset_id="eth", decimals=18
+    )
+
+    assets = [Asset.fetch("base-sepolia", asset_id) for asset_id in ("eth", "wei", "gwei")]
+
+    assert [asset.decimals for asset in assets] == [18, 0, 9]
+    assert [asset.asset_id for asset in assets] == ["eth", "wei", "gwei"]
+    mock_api_clients.assets.get_asset.assert_called_once_with(
+        network_id="base-sepolia", asset_id="eth"
+    )
+
+
+@patch("cdp.Cdp.api_clients")
+def test_asset_fetch_api_error_is_not_cached(mock_api_clients, asset_model_factory):
+    """Test that failed fetches are retried on the next call."""
+    mock_api_clients.assets.get_asset.side_effect = [Exception("API error"), asset_model_factory()]
+
+    with pytest.raises(Exception, match="API error"):
+        Asset.fetch("base-sepolia", "usdc")
+
+    assert Asset.fetch("base-sepolia", "usdc").asset_id == "usdc"
+    assert mock_api_clients.assets.get_asset.call_count == 2
+
+
+@patch("cdp.Cdp.api_clients")
+def test_asset_preload(mock_api_clients, asset_model_factory):
+    """Test that preloaded assets are fetched without further API calls."""
+    mock_api_clients.assets.get_asset.side_effect = [
+        asset_model_factory(asset_id="eth", decimals=18),
+        asset_model_factory(asset_id="usdc", decimals=6),
+    ]
+
+    preloaded = Asset.preload("base-sepolia", ["eth", "usdc"])
+
+    assert [asset.asset_id for asset in preloaded] == ["eth", "usdc"]
+    assert Asset.fetch("base-sepolia", "gwei").decimals == 9
+    assert Asset.fetch("base-sepolia", "usdc").decimals == 6
+    assert mock_api_clients.assets.get_asset.call_count == 2
+
+
 @pytest.mark.parametrize(
     "input_asset_id, expected_output",
     [
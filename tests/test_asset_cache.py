@@ -0,0 +1,99 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cdp.asset_cache import AssetCache, AssetCacheStats
+
+
+def test_get_and_put():
+    """Test that cached models are returned and lookups are counted."""
+    cache = AssetCache()
+    model = Mock()
+
+    assert cache.get("base-sepolia", "eth") is None
+    cache.put("base-sepolia", "eth", model)
+
+    assert cache.get("base-sepolia", "eth") is model
+    assert cache.get("base-mainnet", "eth") is None
+    assert cache.stats == AssetCacheStats(hits=1, misses=2, size=1)
+    assert cache.stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_lru_eviction():
+    """Test that the least recently used model is evicted when the cache is full."""
+    cache = AssetCache(max_size=2)
+    cache.put("base-sepolia", "eth", Mock())
+    cache.put("base-sepolia", "usdc", Mock())
+
+    cache.get("base-sepolia", "eth")
+    cache.put("base-sepolia", "weth", Mock())
+
+    assert cache.get("base-sepolia", "usdc") is None
+    assert cache.get("base-sepolia", "eth") is not None
+    assert cache.get("base-sepolia", "weth") is not None
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+
+@patch("cdp.asset_cache.time.monotonic")
+def test_ttl(mock_monotonic):
+    """Test that models expire after the TTL."""
+    cache = AssetCache(ttl_seconds=60)
+    mock_monotonic.return_value = 100
+    cache.put("base-sepolia", "eth", Mock())
+
+    mock_monotonic.return_value = 159
+    assert cache.get("base-sepolia", "eth") is not None
+
+    mock_monotonic.return_value = 160
+    assert cache.get("base-sepolia", "eth") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_disabled():
+    """Test that a cache with a maximum size of 0 never stores models."""
+    cache = AssetCache(max_size=0)
+    cache.put("base-sepolia", "eth", Mock())
+
+    assert cache.get("base-sepolia", "eth") is None
+
+
+def test_clear():
+    """Test that clearing the cache removes models and resets the counters."""
+    cache = AssetCache()
+    cache.put("base-sepolia", "eth", Mock())
+    cache.get("base-sepolia", "eth")
+
+    cache.clear()
+
+    assert cache.stats == AssetCacheStats()
+
+
+@pytest.mark.parametrize("kwargs", [{"max_size": -1}, {"ttl_seconds": 0}], ids=str)
+def test_invalid_options(kwargs):
+    """Test that invalid cache options are rejected."""
+    with pytest.raises(ValueError):
+        AssetCache(**kwargs)
+
+
+def test_thread_safety():
+    """Test that concurrent lookups and inserts keep the counters consistent."""
+    cache = AssetCache(max_size=8)
+
+    def run(thread_index):
+        for i in range(200):
+            key = f"asset-{(thread_index + i) % 16}"
+            if cache.get("base-sepolia", key) is None:
+                cache.put("base-sepolia", key, Mock())
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats
+    assert stats.hits + stats.misses == 1600
+    assert stats.size <= 8
@@ -0,0 +1,130 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cdp.async_api_clients import AsyncApiClients
+from cdp.async_cdp_api_client import AsyncCdpApiClient, AsyncRESTResponse
+from cdp.client.api.transfers_api import TransfersApi
+from cdp.client.exceptions import ApiException
+from cdp.client.models.transfer import Transfer as TransferModel
+from cdp.errors import ApiError
+
+
+@pytest.fixture
+def async_client(dummy_key_factory):
+    """Create an AsyncCdpApiClient with a dummy ECDSA key."""
+    return AsyncCdpApiClient("test-api-key", dummy_key_factory(), max_network_retries=2)
+
+
+def test_request_serializes_and_deserializes(async_client, transfer_model_factory):
+    """Test that request runs a generated API method over the async transport."""
+    model = transfer_model_factory()
+    response = AsyncRESTResponse(
+        200, "OK", {"content-type": "application/json"}, model.to_json().encode()
+    )
+
+    with patch.object(
+        async_client, "call_api_async", AsyncMock(return_value=response)
+    ) as mock_call:
+        result = asyncio.run(
+            async_client.request(
+                TransfersApi,
+                "get_transfer",
+                wallet_id="test-wallet-id",
+                address_id="0xaddressid",
+                transfer_id="test-transfer-id",
+            )
+        )
+
+    assert isinstance(result, TransferModel)
+    assert result.transfer_id == model.transfer_id
+    method, url = mock_call.call_args.args[:2]
+    assert method == "GET"
+    assert url.endswith(
+        "/v1/wallets/test-wallet-id/addresses/0xaddressid/transfers/test-transfer-id"
+    )
+
+
+def test_request_raises_api_error(async_client):
+    """Test that error responses are mapped to ApiError."""
+    body = json.dumps({"code": "not_found", "message": "transfer not found"}).encode()
+    response = AsyncRESTResponse(404, "Not Found", {"content-type": "application/json"}, body)
+
+    with (
+        patch.object(async_client, "call_api_async", AsyncMock(return_value=response)),
+        pytest.raises(ApiError) as exc_info,
+    ):
+        asyncio.run(
+            async_client.request(
+                TransfersApi,
+                "get_transfer",
+                wallet_id="test-wallet-id",
+                address_id="0xaddressid",
+                transfer_id="test-transfer-id",
+            )
+        )
+
+    assert exc_info.value.http_code == 404
+    assert exc_info.value.api_code == "not_found"
+
+
+def test_api_clients_proxy_methods(async_client):
+    """Test that AsyncApiClients exposes awaitable API methods."""
+    api_clients = AsyncApiClients(async_client)
+
+    with patch.object(async_client, "request", AsyncMock(return_value="result")) as mock_request:
+        result = asyncio.run(api_clients.transfers.get_transfer("w", "a", "t"))
+
+    assert result == "result"
+    mock_request.assert_called_once_with(TransfersApi, "get_transfer", "w", "a", "t")
+    assert api_clients.transfers is api_clients.transfers
+
+    with pytest.raises(AttributeError):
+        api_clients.transfers.not_an_api_method  # noqa: B018
+
+
+def test_should_retry(async_client):
+    """Test the retry policy matches the synchronous client."""
+    assert async_client._should_retry("GET", 0)
+    assert async_client._should_retry("GET", 1)
+    assert not async_client._should_retry("GET", 2)
+    assert not async_client._should_retry("POST", 0)
+
+
+def test_should_retry_with_idempotency_keys(dummy_key_factory):
+    """Test that mutating requests are retried when idempotency keys are enabled."""
+    client = AsyncCdpApiClient(
+        "test-api-key", dummy_key_factory(), max_network_retries=2, idempotency_keys=True
+    )
+
+    assert client._should_retry("POST", 0)
+    assert not client._should_retry("POST", 2)
+
+
+def test_backoff_seconds(async_client):
+    """Test the retry backoff."""
+    assert async_client._backoff_seconds(1) == 0
+    assert async_client._backoff_seconds(2) == 2
+    assert async_client._backoff_seconds(3) == 4
+
+
+def test_call_api_async_connection_error(async_client):
+    """Test that connection failures surface as an ApiException."""
+
+    async def run():
+        try:
+            return await async_client.call_api_async(
+                "POST", "http://127.0.0.1:1/v1/wallets", {}, {}
+            )
+        finally:
+            await async_client.close()
+
+    with (
+        patch.object(async_client, "_backoff_seconds", return_value=0),
+        pytest.raises(ApiException) as exc_info,
+    ):
+        asyncio.run(run())
+
+    assert exc_info.value.status == 0
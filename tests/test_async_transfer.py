@@ -0,0 +1,107 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import ANY, AsyncMock, Mock, patch
+
+import pytest
+
+from cdp.async_transfer import AsyncTransfer
+from cdp.errors import TransactionNotSignedError
+
+
+@patch("cdp.async_transfer.AsyncCdp.api_clients")
+@patch("cdp.async_transfer.AsyncAsset")
+def test_create_async_transfer(mock_asset, mock_api_clients, transfer_model_factory, asset_factory):
+    """Test the creation of an AsyncTransfer object."""
+    mock_asset.fetch = AsyncMock(return_value=asset_factory())
+    mock_api_clients.transfers.create_transfer = AsyncMock(return_value=transfer_model_factory())
+
+    transfer = asyncio.run(
+        AsyncTransfer.create(
+            address_id="0xaddressid",
+            amount=Decimal("1"),
+            asset_id="usdc",
+            destination="0xdestination",
+            network_id="base-sepolia",
+            wallet_id="test-wallet-id",
+            gasless=True,
+        )
+    )
+
+    assert isinstance(transfer, AsyncTransfer)
+    mock_asset.fetch.assert_awaited_once_with("base-sepolia", "usdc")
+    mock_api_clients.transfers.create_transfer.assert_awaited_once_with(
+        wallet_id="test-wallet-id", address_id="0xaddressid", create_transfer_request=ANY
+    )
+
+
+def test_create_async_transfer_skip_batching_requires_gasless():
+    """Test that skip_batching without gasless is rejected."""
+    with pytest.raises(ValueError, match="skip_batching requires gasless to be True"):
+        asyncio.run(
+            AsyncTransfer.create(
+                address_id="0xaddressid",
+                amount=Decimal("1"),
+                asset_id="usdc",
+                destination="0xdestination",
+                network_id="base-sepolia",
+                wallet_id="test-wallet-id",
+                skip_batching=True,
+            )
+        )
+
+
+@patch("cdp.async_transfer.AsyncCdp.api_clients")
+def test_list_async_transfers(mock_api_clients, transfer_model_factory):
+    """Test listing transfers across pages."""
+    mock_api_clients.transfers.list_transfers = AsyncMock(
+        side_effect=[
+            Mock(data=[transfer_model_factory()], has_more=True, next_page="page-2"),
+            Mock(data=[transfer_model_factory()], has_more=False, next_page=None),
+        ]
+    )
+
+    async def collect():
+        return [t async for t in AsyncTransfer.list("test-wallet-id", "0xaddressid")]
+
+    transfers = asyncio.run(collect())
+
+    assert len(transfers) == 2
+    assert all(isinstance(t, AsyncTransfer) for t in transfers)
+    assert mock_api_clients.transfers.list_transfers.await_args_list[1].kwargs["page"] == "page-2"
+
+
+def test_broadcast_unsigned_async_transfer(transfer_model_factory):
+    """Test that broadcasting an unsigned transfer raises an error."""
+    transfer = AsyncTransfer(transfer_model_factory(status="pending"))
+
+    with pytest.raises(TransactionNotSignedError):
+        asyncio.run(transfer.broadcast())
+
+
+@patch("cdp.async_transfer.AsyncCdp.api_clients")
+def test_wait_async_transfer(mock_api_clients, transfer_model_factory):
+    """Test waiting for a transfer to reach a terminal state."""
+    mock_api_clients.transfers.get_transfer = AsyncMock(
+        side_effect=[
+            transfer_model_factory(status="pending"),
+            transfer_model_factory(status="complete"),
+        ]
+    )
+    transfer = AsyncTransfer(transfer_model_factory(status="pending"))
+
+    result = asyncio.run(transfer.wait(interval_seconds=0, timeout_seconds=1))
+
+    assert result.status.value == "complete"
+    assert mock_api_clients.transfers.get_transfer.await_count == 2
+
+
+@patch("cdp.async_transfer.AsyncCdp.api_clients")
+def test_wait_async_transfer_timeout(mock_api_clients, transfer_model_factory):
+    """Test that waiting times out when the transfer does not settle."""
+    mock_api_clients.transfers.get_transfer = AsyncMock(
+        return_value=transfer_model_factory(status="pending")
+    )
+    transfer = AsyncTransfer(transfer_model_factory(status="pending"))
+
+    with pytest.raises(TimeoutError, match="Timed out waiting for Transfer"):
+        asyncio.run(transfer.wait(interval_seconds=0.01, timeout_seconds=0.02))
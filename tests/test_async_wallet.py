@@ -0,0 +1,180 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from cdp.async_wallet import AsyncWallet
+from cdp.async_wallet_address import AsyncWalletAddress
+from cdp.errors import InsufficientFundsError
+from cdp.wallet_summary import WalletSummary
+
+
+@patch("cdp.async_wallet.AsyncCdp.use_server_signer", True)
+@patch("cdp.async_wallet.AsyncCdp.api_clients")
+def test_fetch_async_wallet_loads_addresses(
+    mock_api_clients, wallet_model_factory, address_model_factory
+):
+    """Test fetching a wallet loads its addresses."""
+    mock_api_clients.wallets.get_wallet = AsyncMock(return_value=wallet_model_factory())
+    mock_api_clients.addresses.list_addresses = AsyncMock(
+        return_value=Mock(data=[address_model_factory()])
+    )
+
+    wallet = asyncio.run(AsyncWallet.fetch("test-wallet-id"))
+
+    assert isinstance(wallet, AsyncWallet)
+    assert not wallet.can_sign
+    assert len(wallet.addresses) == 1
+    assert isinstance(wallet.default_address, AsyncWalletAddress)
+    mock_api_clients.addresses.list_addresses.assert_awaited_once_with(
+        "test-wallet-id", limit=AsyncWallet.MAX_ADDRESSES
+    )
+
+
+@patch("cdp.async_wallet.AsyncCdp.api_clients")
+def test_async_wallet_list_lightweight(mock_api_clients, wallet_model_factory):
+    """Test that AsyncWallet.list yields wallet summaries in lightweight mode."""
+    mock_api_clients.wallets.list_wallets = AsyncMock(
+        return_value=Mock(data=[wallet_model_factory(id="wallet-1")], has_more=False)
+    )
+
+    async def _list():
+        return [summary async for summary in AsyncWallet.list(lightweight=True)]
+
+    summaries = asyncio.run(_list())
+
+    assert [type(summary) for summary in summaries] == [WalletSummary]
+    assert summaries[0].id == "wallet-1"
+
+
+@patch("cdp.async_wallet.AsyncCdp.use_server_signer", True)
+def test_async_wallet_addresses_not_loaded(wallet_model_factory):
+    """Test that accessing addresses before loading them raises an error."""
+    wallet = AsyncWallet(wallet_model_factory())
+
+    with pytest.raises(ValueError, match="not loaded"):
+        _ = wallet.addresses
+
+
+@patch("cdp.async_wallet.AsyncCdp.use_server_signer", True)
+@patch("cdp.async_wallet.AsyncCdp.api_clients")
+def test_create_async_wallet_with_server_signer(
+    mock_api_clients, wallet_model_factory, address_model_factory
+):
+    """Test creating a wallet with a server signer."""
+    mock_api_clients.wallets.create_wallet = AsyncMock(
+        return_value=wallet_model_factory(server_signer_status="pending_seed_creation")
+    )
+    mock_api_clients.wallets.get_wallet = AsyncMock(return_value=wallet_model_factory())
+    mock_api_clients.addresses.create_address = AsyncMock(return_value=address_model_factory())
+
+    wallet = asyncio.run(AsyncWallet.create(interval_seconds=0))
+
+    assert wallet.server_signer_status == "active_seed"
+    assert len(wallet.addresses) == 1
+    mock_api_clients.wallets.get_wallet.assert_awaited_once_with("test-wallet-id")
+    mock_api_clients.addresses.create_address.assert_awaited_once()
+
+
+@patch("cdp.async_wallet_address.AsyncCdp.api_clients")
+def test_async_wallet_address_transfer_insufficient_funds(mock_api_clients, address_model_factory):
+    """Test that a transfer with insufficient funds raises an error."""
+    address = AsyncWalletAddress(address_model_factory())
+
+    with (
+        patch.object(address, "balance", AsyncMock(return_value=Decimal("0.5"))),
+        pytest.raises(InsufficientFundsError),
+    ):
+        asyncio.run(address.transfer(Decimal("1"), "usdc", "0xdestination"))
+
+    mock_api_clients.transfers.create_transfer.assert_not_called()
+
+
+@patch("cdp.async_wallet_address.AsyncCdp.use_server_signer", True)
+@patch("cdp.async_wallet_address.AsyncTransfer")
+@patch("cdp.async_wallet_address.AsyncCdp.api_clients")
+def test_async_wallet_address_transfer_uses_balance_ledger(
+    mock_api_clients, mock_transfer, address_model_factory, balance_model_factory
+):
+    """Test that transfers are checked against the ledger seeded by balances()."""
+    address = AsyncWalletAddress(address_model_factory())
+    mock_api_clients.external_addresses.list_external_address_balances = AsyncMock(
+        return_value=Mock(
+            data=[balance_model_factory(amount="2000000", asset_id="usdc", decimals=6)]
+        )
+    )
+    mock_api_clients.external_addresses.get_external_address_balance = AsyncMock()
+    mock_transfer.create = AsyncMock()
+
+    async def run():
+        await address.balances()
+        await address.transfer(Decimal("1.5"), "usdc", "0xdestination")
+        await address.transfer(Decimal("5"), "usdc", "0xdestination", skip_balance_check=True)
+
+    asyncio.run(run())
+
+    mock_api_clients.external_addresses.get_external_address_balance.assert_not_called()
+    assert mock_transfer.create.await_count == 2
+    assert address.balance_ledger.available("usdc") is None
+
+
+@patch("cdp.async_wallet_address.AsyncCdp.use_server_signer", True)
+@patch("cdp.async_wallet_address.AsyncAsset")
+@patch("cdp.async_wallet_address.AsyncTransfer")
+def test_async_wallet_address_batch_transfer(mock_transfer, mock_asset, address_model_factory):
+    """Test that async batches bound concurrency and report each transfer."""
+    address = AsyncWalletAddress(address_model_factory())
+    mock_asset.fetch = AsyncMock()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if kwargs["destination"] == "0xbad":
+            raise Exception("API Error")
+        return Mock(destination=kwargs["destination"])
+
+    mock_transfer.create = create
+    destinations = ["0xa", "0xbad", "0xb", "0xc", "0xd"]
+
+    report = asyncio.run(
+        address.batch_transfer(
+            [(1, "usdc", destination) for destination in destinations],
+            skip_balance_check=True,
+            max_concurrency=2,
+        )
+    )
+
+    assert [transfer.destination for transfer in report.transfers] == ["0xa", "0xb", "0xc", "0xd"]
+    assert [result.index for result in report.failed] == [1]
+    assert max_in_flight == 2
+    mock_asset.fetch.assert_awaited_once_with(address.network_id, "usdc")
+
+
+@patch("cdp.async_wallet_address.AsyncCdp.use_server_signer", True)
+@patch("cdp.async_wallet_address.AsyncAsset")
+@patch("cdp.async_wallet_address.AsyncTransfer")
+def test_async_wallet_address_batch_transfer_on_result_errors(
+    mock_transfer, mock_asset, address_model_factory
+):
+    """Test that exceptions raised by on_result are collected without stopping the batch."""
+    address = AsyncWalletAddress(address_model_factory())
+    mock_asset.fetch = AsyncMock()
+    mock_transfer.create = AsyncMock(return_value=Mock())
+    error = Exception("Callback Error")
+
+    report = asyncio.run(
+        address.batch_transfer(
+            [(1, "usdc", "0xa"), (2, "usdc", "0xb")],
+            skip_balance_check=True,
+            on_result=Mock(side_effect=error),
+        )
+    )
+
+    assert report.all_succeeded
+    assert report.callback_errors == [error, error]
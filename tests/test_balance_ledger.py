@@ -0,0 +1,166 @@
+import threading
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from cdp.balance_ledger import BalanceLedger
+from cdp.errors import InsufficientFundsError
+
+
+def test_seed_and_available(balance_model_factory):
+    """Test that seeded balances are available in whole units."""
+    ledger = BalanceLedger()
+    ledger.seed(
+        [
+            balance_model_factory(amount="1500000000000000000", asset_id="eth", decimals=18),
+            balance_model_factory(amount="2500000", asset_id="usdc", decimals=6),
+        ]
+    )
+
+    assert ledger.available("eth") == Decimal("1.5")
+    assert ledger.available("usdc") == Decimal("2.5")
+    assert ledger.available("weth") is None
+
+
+def test_available_derives_denominations(balance_model_factory):
+    """Test that wei and gwei balances are derived from the eth balance."""
+    ledger = BalanceLedger()
+    ledger.seed([balance_model_factory(amount="1500000000000000000", asset_id="eth")])
+
+    assert ledger.available("wei") == Decimal("1500000000000000000")
+    assert ledger.available("gwei") == Decimal("1500000000")
+
+
+def test_debit(balance_model_factory):
+    """Test that debits reduce the balance, across denominations."""
+    ledger = BalanceLedger()
+    ledger.seed([balance_model_factory(amount="2000000000000000000", asset_id="eth")])
+
+    ledger.debit("eth", Decimal("0.5"))
+    ledger.debit("gwei", Decimal("500000000"))
+
+    assert ledger.available("eth") == Decimal("1")
+
+
+def test_debit_below_zero_invalidates(balance_model_factory):
+    """Test that a debit exceeding the balance invalidates the entry."""
+    ledger = BalanceLedger()
+    ledger.seed([balance_model_factory(amount="1000000000000000000", asset_id="eth")])
+
+    ledger.debit("eth", Decimal("2"))
+
+    assert ledger.available("eth") is None
+
+
+def test_debit_untracked_asset():
+    """Test that debiting an asset without a balance is a no-op."""
+    ledger = BalanceLedger()
+
+    ledger.debit("eth", Decimal("1"))
+
+    assert ledger.available("eth") is None
+
+
+def test_invalidate(balance_model_factory):
+    """Test invalidating one asset or the whole ledger."""
+    ledger = BalanceLedger()
+    ledger.seed(
+        [
+            balance_model_factory(asset_id="eth"),
+            balance_model_factory(amount="1000000", asset_id="usdc", decimals=6),
+        ]
+    )
+
+    ledger.invalidate("wei")
+    assert ledger.available("eth") is None
+    assert ledger.available("usdc") == Decimal("1")
+
+    ledger.invalidate()
+    assert ledger.available("usdc") is None
+
+
+@patch("cdp.balance_ledger.time.monotonic")
+def test_ttl(mock_monotonic, balance_model_factory):
+    """Test that balances expire after the TTL."""
+    ledger = BalanceLedger(ttl_seconds=30)
+    mock_monotonic.return_value = 100
+    ledger.seed([balance_model_factory(asset_id="eth")])
+
+    mock_monotonic.return_value = 129
+    assert ledger.available("eth") == Decimal("1")
+
+    mock_monotonic.return_value = 130
+    assert ledger.available("eth") is None
+
+
+def test_invalid_ttl():
+    """Test that a non-positive TTL is rejected."""
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        BalanceLedger(ttl_seconds=0)
+
+
+def test_reserve(balance_model_factory):
+    """Test that reserved amounts are held back until they are settled or released."""
+    ledger = BalanceLedger()
+    ledger.seed([balance_model_factory(amount="2000000000000000000", asset_id="eth")])
+
+    reservation = ledger.reserve("eth", Decimal("1.5"))
+
+    assert reservation.amount == Decimal("1.5")
+    assert ledger.available("eth") == Decimal("0.5")
+    with pytest.raises(InsufficientFundsError, match=r"have 0\.5, need 1"):
+        ledger.reserve("eth", Decimal("1"))
+
+    ledger.settle(reservation, Decimal("500000000"), "gwei")
+
+    assert reservation.amount == Decimal("1")
+    assert ledger.available("eth") == Decimal("0.5")
+
+    ledger.release(reservation)
+
+    assert reservation.amount == 0
+    assert ledger.available("eth") == Decimal("1.5")
+
+
+def test_reserve_untracked_asset():
+    """Test that nothing is reserved for assets without an entry."""
+    assert BalanceLedger().reserve("eth", Decimal("1")) is None
+
+
+def test_reservations_survive_seeding(balance_model_factory):
+    """Test that re-seeding a balance keeps the amounts reserved for sends in flight."""
+    ledger = BalanceLedger()
+    ledger.seed([balance_model_factory(amount="2000000000000000000", asset_id="eth")])
+    ledger.reserve("eth", Decimal("1.5"))
+
+    ledger.invalidate("eth")
+    ledger.seed([balance_model_factory(amount="3000000000000000000", asset_id="eth")])
+
+    assert ledger.available("eth") == Decimal("1.5")
+
+
+def test_concurrent_reservations(balance_model_factory):
+    """Test that concurrent reservations cannot spend the same balance."""
+    ledger = BalanceLedger()
+    ledger.seed([balance_model_factory(amount="10000000", asset_id="usdc", decimals=6)])
+    barrier = threading.Barrier(8)
+    reservations = []
+    errors = []
+
+    def reserve():
+        barrier.wait()
+        try:
+            reservations.append(ledger.reserve("usdc", Decimal("2")))
+        except InsufficientFundsError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(reservations) == 5
+    assert len(errors) == 3
+    assert ledger.available("usdc") == 0
@@ -0,0 +1,78 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from cdp.asset import Asset
+from cdp.batch_transfer import (
+    BatchTransferItem,
+    BatchTransferReport,
+    BatchTransferResult,
+    totals_by_asset,
+)
+
+
+def test_coerce_tuple():
+    """Test that tuples are converted to items with Decimal amounts."""
+    item = BatchTransferItem.coerce(("1.5", "usdc", "0xdestination"))
+
+    assert item == BatchTransferItem(Decimal("1.5"), "usdc", "0xdestination")
+
+
+def test_coerce_item():
+    """Test that items are normalized to Decimal amounts."""
+    item = BatchTransferItem.coerce(BatchTransferItem(2, "eth", "0xdestination"))
+
+    assert item.amount == Decimal("2")
+    assert isinstance(item.amount, Decimal)
+
+
+def test_totals_by_asset():
+    """Test that amounts are summed per asset in order of first appearance."""
+    items = [
+        BatchTransferItem(Decimal("1"), "usdc", "0xa"),
+        BatchTransferItem(Decimal("0.5"), "eth", "0xb"),
+        BatchTransferItem(Decimal("2"), "usdc", "0xc"),
+    ]
+
+    assert list(totals_by_asset(items).items()) == [
+        ("usdc", Decimal("3")),
+        ("eth", Decimal("0.5")),
+    ]
+
+
+def test_totals_by_asset_denominations(asset_model_factory):
+    """Test that denominations of an asset are summed in the denomination of its first item."""
+    model = asset_model_factory(asset_id="eth", decimals=18)
+    assets = {
+        asset_id: Asset.from_model(model, asset_id=asset_id) for asset_id in ("gwei", "eth", "ETH")
+    }
+    items = [
+        BatchTransferItem(Decimal("500000000"), "gwei", "0xa"),
+        BatchTransferItem(Decimal("0.25"), "eth", "0xb"),
+        BatchTransferItem(Decimal("0.25"), "ETH", "0xc"),
+    ]
+
+    assert totals_by_asset(items, assets) == {"gwei": Decimal("1000000000")}
+    with pytest.raises(ValueError, match="requires the assets of the batch"):
+        totals_by_asset(items)
+
+
+def test_report():
+    """Test that the report splits successes and failures."""
+    item = BatchTransferItem(Decimal("1"), "usdc", "0xdestination")
+    transfer = Mock()
+    error = Exception("API Error")
+    report = BatchTransferReport(
+        [
+            BatchTransferResult(0, item, transfer=transfer),
+            BatchTransferResult(1, item, error=error),
+        ]
+    )
+
+    assert len(report) == 2
+    assert [result.index for result in report.succeeded] == [0]
+    assert [result.error for result in report.failed] == [error]
+    assert report.transfers == [transfer]
+    assert not report.all_succeeded
+    assert str(report) == "BatchTransferReport: (succeeded: 1, failed: 1)"
@@ -0,0 +1,261 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from urllib3 import HTTPResponse
+
+from cdp.asset import Asset
+from cdp.async_cdp import AsyncCdp
+from cdp.cdp import Cdp
+from cdp.cdp_client import (
+    AsyncCdpClient,
+    CdpClient,
+    CdpClientPool,
+    ClientBound,
+    active_async_client,
+    active_client,
+)
+from cdp.client import rest
+from cdp.errors import UninitializedSDKError
+from cdp.wallet import Wallet
+
+
+def _asset_response(asset_id):
+    return rest.RESTResponse(
+        HTTPResponse(
+            body=json.dumps(
+                {"network_id": "base-sepolia", "asset_id": asset_id, "decimals": 18}
+            ).encode(),
+            status=200,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+    )
+
+
+@pytest.fixture
+def configured(dummy_key_factory):
+    """Configure Cdp with a default client, and reset it afterwards."""
+    Cdp.configure(api_key_name="default-key", private_key=dummy_key_factory())
+    yield Cdp.default_client
+    Cdp.default_client = None
+
+
+def _get_asset_id():
+    return Cdp.api_clients.assets.get_asset("base-sepolia", "eth").asset_id
+
+
+def test_calls_go_to_the_default_client(configured):
+    """Test that calls outside of a `use()` block go to the configured client."""
+    with patch.object(
+        configured.cdp_client.rest_client, "request", return_value=_asset_response("default")
+    ):
+        assert _get_asset_id() == "default"
+
+    assert active_client() is None
+    assert configured.api_key_name == "default-key"
+
+
+def test_use_routes_calls_to_the_client(configured, dummy_key_factory):
+    """Test that calls within nested `use()` blocks go to the innermost client."""
+    tenant_a = CdpClient("tenant-a", dummy_key_factory())
+    tenant_b = CdpClient("tenant-b", dummy_key_factory())
+
+    with (
+        patch.object(tenant_a.cdp_client.rest_client, "request", return_value=_asset_response("a")),
+        patch.object(tenant_b.cdp_client.rest_client, "request", return_value=_asset_response("b")),
+        tenant_a.use() as client,
+    ):
+        assert client is tenant_a
+        assert _get_asset_id() == "a"
+        with tenant_b.use():
+            assert _get_asset_id() == "b"
+        assert _get_asset_id() == "a"
+
+    assert active_client() is None
+
+
+def test_use_applies_to_the_current_thread_only(configured, dummy_key_factory):
+    """Test that a client in use in one thread does not route the calls of another."""
+    tenant = CdpClient("tenant", dummy_key_factory())
+    seen = []
+
+    with tenant.use():
+        thread = threading.Thread(target=lambda: seen.append(active_client()))
+        thread.start()
+        thread.join()
+
+    assert seen == [None]
+
+
+def test_calls_without_a_client_raise(dummy_key_factory):
+    """Test that calls outside of a `use()` block fail when Cdp is not configured."""
+    tenant = CdpClient("tenant", dummy_key_factory())
+    Cdp.api_clients = Cdp.ApiClientsWrapper()
+
+    with pytest.raises(UninitializedSDKError):
+        Cdp.api_clients.assets  # noqa: B018
+
+    with (
+        patch.object(tenant.cdp_client.rest_client, "request", return_value=_asset_response("t")),
+        tenant.use(),
+    ):
+        assert Asset.fetch("base-sepolia", "t").asset_id == "t"
+
+
+def test_client_options(dummy_key_factory):
+    """Test that client options are passed to the CDP API client."""
+    client = CdpClient(
+        "tenant", dummy_key_factory(), base_path="http://localhost:8080", rate_limit=5
+    )
+
+    assert client.cdp_client.configuration.host == "http://localhost:8080"
+    assert client.cdp_client.rate_limiter_stats["default"].limit == 5
+    assert repr(client) == "CdpClient(api_key_name='tenant')"
+
+
+def test_pool_spreads_calls_across_keys(configured, dummy_key_factory):
+    """Test that a pool sends each call to the next client, sharing the rate limit of the keys."""
+    clients = [CdpClient(f"key-{i}", dummy_key_factory(), rate_limit=100) for i in range(3)]
+    pool = CdpClientPool(clients)
+
+    with (
+        patch.object(
+            clients[0].cdp_client.rest_client, "request", return_value=_asset_response("0")
+        ),
+        patch.object(
+            clients[1].cdp_client.rest_client, "request", return_value=_asset_response("1")
+        ),
+        patch.object(
+            clients[2].cdp_client.rest_client, "request", return_value=_asset_response("2")
+        ),
+        pool.use(),
+    ):
+        assert [_get_asset_id() for _ in range(4)] == ["0", "1", "2", "0"]
+
+    assert len(pool) == 3
+    assert pool.clients == tuple(clients)
+
+
+def test_pool_validates_clients(dummy_key_factory):
+    """Test that pools must have clients of a single kind."""
+    with pytest.raises(ValueError, match="clients must not be empty"):
+        CdpClientPool([])
+    with pytest.raises(ValueError, match="clients must all be"):
+        CdpClientPool(
+            [
+                CdpClient("sync", dummy_key_factory()),
+                AsyncCdpClient("async", dummy_key_factory()),
+            ]
+        )
+
+
+def test_async_use_routes_calls_per_task(dummy_key_factory):
+    """Test that async clients in use apply to their own task."""
+    tenant_a = AsyncCdpClient("tenant-a", dummy_key_factory())
+    tenant_b = AsyncCdpClient("tenant-b", dummy_key_factory())
+    AsyncCdp.api_clients = AsyncCdp.ApiClientsWrapper()
+
+    async def api_key_name_in(client):
+        with client.use():
+            await asyncio.sleep(0)
+            return AsyncCdp.api_clients.cdp_client.api_key
+
+    async def main():
+        names = await asyncio.gather(api_key_name_in(tenant_a), api_key_name_in(tenant_b))
+        await tenant_a.close()
+        await tenant_b.close()
+        return names
+
+    assert asyncio.run(main()) == ["tenant-a", "tenant-b"]
+    assert active_async_client() is None
+
+
+class _Resource(ClientBound):
+    """A resource that reports the client settings its methods see."""
+
+    def settings(self):
+        return active_client(), Cdp.uses_server_signer(), Cdp.api_private_key()
+
+    @property
+    def asset_id(self):
+        return _get_asset_id()
+
+    async def async_client(self):
+        return active_async_client()
+
+
+def test_resources_stay_bound_to_their_client(configured, dummy_key_factory):
+    """Test that resources created within a `use()` block keep using its client after it."""
+    tenant = CdpClient("tenant", dummy_key_factory(), use_server_signer=True)
+    unbound = _Resource()
+    with tenant.use():
+        resource = _Resource()
+
+    with patch.object(
+        tenant.cdp_client.rest_client, "request", return_value=_asset_response("tenant")
+    ):
+        assert resource.asset_id == "tenant"
+
+    assert resource.bound_client is tenant
+    assert resource.settings() == (tenant, True, tenant.private_key)
+    assert unbound.bound_client is None
+    assert unbound.settings() == (None, Cdp.use_server_signer, Cdp.private_key)
+    with tenant.use():
+        assert unbound.settings()[0] is tenant
+    assert active_client() is None
+
+
+def test_async_resources_stay_bound_to_their_client(dummy_key_factory):
+    """Test that async methods of resources run with the async client they were created with."""
+    tenant = AsyncCdpClient("tenant", dummy_key_factory(), use_server_signer=True)
+    with tenant.use():
+        resource = _Resource()
+
+    async def main():
+        client = await resource.async_client()
+        await tenant.close()
+        return client
+
+    assert asyncio.run(main()) is tenant
+    assert active_async_client() is None
+    with tenant.use():
+        assert AsyncCdp.uses_server_signer()
+        assert AsyncCdp.api_private_key() == tenant.private_key
+
+
+@patch.object(Cdp, "private_key", None)
+def test_wallet_seed_is_encrypted_with_its_client_key(
+    tmp_path, dummy_key_factory, wallet_model_factory
+):
+    """Test that seeds are encrypted with the key of the wallet's client, without `configure`."""
+    tenant = CdpClient("tenant", dummy_key_factory())
+    seed = "00" * 64
+    file_path = str(tmp_path / "seeds.json")
+    with tenant.use():
+        wallet = Wallet(wallet_model_factory(), seed)
+
+    wallet.save_seed_to_file(file_path, encrypt=True)
+    with tenant.use():
+        restored = Wallet(wallet_model_factory(), "")
+    restored.load_seed_from_file(file_path)
+
+    assert json.loads((tmp_path / "seeds.json").read_text())[wallet.id]["seed"] != seed
+    assert restored._seed == seed
+    with pytest.raises(UninitializedSDKError):
+        Wallet(wallet_model_factory(), seed).save_seed_to_file(file_path, encrypt=True)
+
+
+def test_pool_client_settings(dummy_key_factory):
+    """Test that pools share the signer mode of their clients and encrypt with the first key."""
+    clients = [CdpClient(f"key-{i}", dummy_key_factory()) for i in range(2)]
+    pool = CdpClientPool(clients)
+
+    assert pool.use_server_signer is False
+    assert pool.private_key == clients[0].private_key
+    with pytest.raises(ValueError, match="use the server signer"):
+        CdpClientPool(
+            [clients[0], CdpClient("signer", dummy_key_factory(), use_server_signer=True)]
+        )
@@ -0,0 +1,142 @@
+import socket
+import time
+from unittest.mock import patch
+
+import pytest
+import urllib3
+
+from cdp.cdp import Cdp
+from cdp.cdp_api_client import CdpApiClient
+from cdp.connection_pool import ConnectionPoolMonitor, ConnectionPoolStats
+
+
+@pytest.fixture
+def listener():
+    """Yield the URL of a local TCP listener that accepts connections without serving requests."""
+    server = socket.create_server(("127.0.0.1", 0), backlog=16)
+    yield f"http://127.0.0.1:{server.getsockname()[1]}"
+    server.close()
+
+
+def _monitor(maxsize=4, **kwargs):
+    return ConnectionPoolMonitor(urllib3.PoolManager(maxsize=maxsize), **kwargs)
+
+
+def test_connection_pool_stats_count_checkouts():
+    """Test that connections checked out of and returned to the pool are counted."""
+    monitor = _monitor()
+    pool = monitor._pool_manager.connection_from_url("http://127.0.0.1:1")
+
+    first, second = pool._get_conn(), pool._get_conn()
+    assert monitor.stats == ConnectionPoolStats(in_use=2, created=2)
+
+    pool._put_conn(first)
+    pool._put_conn(second)
+    assert monitor.stats == ConnectionPoolStats(in_use=0, created=2)
+
+
+def test_connection_pool_stats_count_discarded_connections():
+    """Test that connections returned to a full pool are counted as discarded."""
+    monitor = _monitor(maxsize=1)
+    pool = monitor._pool_manager.connection_from_url("http://127.0.0.1:1")
+
+    connections = [pool._get_conn() for _ in range(3)]
+    for conn in connections:
+        pool._put_conn(conn)
+
+    assert monitor.stats.discarded == 2
+    assert monitor.stats.in_use == 0
+
+
+def test_connection_pool_warm_up(listener):
+    """Test that warming up opens idle connections, capped at the pool size."""
+    monitor = _monitor(maxsize=3)
+
+    assert monitor.warm_up(listener, 5) == 3
+    assert monitor.stats == ConnectionPoolStats(idle=3, created=3)
+
+    assert monitor.warm_up(listener, 3) == 0
+    assert monitor.stats == ConnectionPoolStats(idle=3, created=3)
+
+
+def test_connection_pool_warm_up_stops_on_failure():
+    """Test that warming up stops at the first connection that cannot be opened."""
+    port_socket = socket.socket()
+    port_socket.bind(("127.0.0.1", 0))
+    port = port_socket.getsockname()[1]
+    port_socket.close()
+
+    monitor = _monitor()
+
+    assert monitor.warm_up(f"http://127.0.0.1:{port}", 2) == 0
+    assert monitor.stats.in_use == 0
+    assert monitor.stats.idle == 0
+
+
+def test_connection_pool_keepalive_timeout(listener):
+    """Test that connections idle for longer than the keep-alive timeout are reopened."""
+    monitor = _monitor(keepalive_timeout=0.01)
+    monitor.warm_up(listener, 1)
+    pool = monitor._pool_manager.connection_from_url(listener)
+
+    time.sleep(0.02)
+    conn = pool._get_conn()
+
+    assert conn.sock is None
+    assert monitor.stats.expired == 1
+    assert monitor.stats.created == 2
+    pool._put_conn(conn)
+
+
+def test_connection_pool_invalid_keepalive_timeout():
+    """Test that a non-positive keep-alive timeout is rejected."""
+    with pytest.raises(ValueError, match="keepalive_timeout must be positive"):
+        _monitor(keepalive_timeout=0)
+
+
+def test_cdp_api_client_connection_pool_options():
+    """Test that pool options are applied to the pool manager of the client."""
+    client = CdpApiClient(
+        "test", "test", connection_pool_maxsize=64, connection_pool_block=True, read_timeout=30
+    )
+
+    pool_kw = client.rest_client.pool_manager.connection_pool_kw
+    assert pool_kw["maxsize"] == 64
+    assert pool_kw["block"] is True
+    assert client.connection_pool_stats == ConnectionPoolStats()
+
+
+def test_cdp_api_client_default_request_timeout():
+    """Test that the configured timeouts apply to requests without their own timeout."""
+    client = CdpApiClient("test", "test", connect_timeout=2, read_timeout=30)
+
+    with (
+        patch.object(client, "_apply_headers"),
+        patch.object(client.rest_client, "request") as mock_request,
+    ):
+        client.call_api("GET", "https://api.cdp.coinbase.com/platform/v1/networks/base-sepolia")
+        client.call_api(
+            "GET",
+            "https://api.cdp.coinbase.com/platform/v1/networks/base-sepolia",
+            None,
+            None,
+            None,
+            5,
+        )
+
+    assert mock_request.call_args_list[0].kwargs["_request_timeout"] == (2, 30)
+    assert mock_request.call_args_list[1].kwargs["_request_timeout"] == 5
+
+
+def test_cdp_configure_connection_pool(listener):
+    """Test that Cdp.configure warms up the pool and exposes its stats."""
+    with patch.object(CdpApiClient, "warm_up", return_value=2) as mock_warm_up:
+        Cdp.configure(api_key_name="test", private_key="test", warm_up_connections=2)
+
+    mock_warm_up.assert_called_once_with(2)
+    assert Cdp.connection_pool_stats() == ConnectionPoolStats()
+
+    Cdp.configure(
+        api_key_name="test", private_key="test", base_path=listener, warm_up_connections=2
+    )
+    assert Cdp.connection_pool_stats().idle == 2
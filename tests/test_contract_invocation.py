@@ -17,6 +17,7 @@ def test_contract_invocation_properties(contract_invocation_factory):
     """Test the properties of a ContractInvocation object."""
     contract_invocation = contract_invocation_factory()
     assert contract_invocation.contract_invocation_id == "test-invocation-id"
+    assert contract_invocation.terminal_state is True
     assert contract_invocation.wallet_id == "test-wallet-id"
     assert contract_invocation.address_id == "0xaddressid"
     assert contract_invocation.contract_address == "0xcontractaddress"
@@ -86,3 +86,35 @@ def test_evm_call_union():
 
     call = abi_call_dict
     assert isinstance(call, FunctionCall)
+
+
+def test_function_call_encode():
+    """Test that function calls are encoded with the ABI registry."""
+    call = FunctionCall(
+        to="0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
+        value=Wei(1),
+        abi=[
+            {
+                "inputs": [
+                    {"name": "spender", "type": "address"},
+                    {"name": "amount", "type": "uint256"},
+                ],
+                "name": "approve",
+                "outputs": [{"type": "bool"}],
+                "stateMutability": "nonpayable",
+                "type": "function",
+            }
+        ],
+        function_name="approve",
+        args=["0x742d35Cc6634C0532925a3b844Bc454e4438f44e", 1000000],
+    )
+
+    encoded = call.encode()
+
+    assert encoded == EncodedCall(
+        to="0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
+        value=Wei(1),
+        data="0x095ea7b3000000000000000000000000742d35cc6634c0532925a3b844bc454e4438f44e"
+        "00000000000000000000000000000000000000000000000000000000000f4240",
+    )
+    assert len(FunctionCall.abi_registry) > 0
@@ -0,0 +1,55 @@
+from bip_utils import Bip32Slip10Secp256k1
+
+from cdp.hd_derivation import (
+    ACCOUNT_PATH,
+    derive_account_node,
+    derive_private_keys,
+    derive_private_keys_many,
+)
+
+SEED = "01" * 64
+
+
+def _full_path_key(seed, index):
+    master = Bip32Slip10Secp256k1.FromSeed(bytes.fromhex(seed))
+    return master.DerivePath(f"{ACCOUNT_PATH}/{index}").PrivateKey().Raw().ToHex()
+
+
+def test_derive_account_node_children_match_full_path():
+    """Test that children of the account node match keys derived from the full path."""
+    master = Bip32Slip10Secp256k1.FromSeed(bytes.fromhex(SEED))
+    account_node = derive_account_node(master)
+
+    assert account_node.ChildKey(3).PrivateKey().Raw().ToHex() == _full_path_key(SEED, 3)
+
+
+def test_derive_private_keys():
+    """Test deriving the keys of several addresses from a seed."""
+    assert derive_private_keys(SEED, [0, 2, 1]) == [
+        _full_path_key(SEED, 0),
+        _full_path_key(SEED, 2),
+        _full_path_key(SEED, 1),
+    ]
+
+
+def test_derive_private_keys_many_inline():
+    """Test deriving keys for many wallets in the calling process."""
+    other_seed = "02" * 32
+
+    keys = derive_private_keys_many([(SEED, [0, 1]), (other_seed, [0])], max_workers=1)
+
+    assert keys == [derive_private_keys(SEED, [0, 1]), derive_private_keys(other_seed, [0])]
+
+
+def test_derive_private_keys_many_process_pool():
+    """Test deriving keys for many wallets on a process pool, preserving order."""
+    seeds = [f"{i:02x}" * 32 for i in range(1, 6)]
+
+    keys = derive_private_keys_many([(seed, [0, 1]) for seed in seeds], max_workers=2)
+
+    assert keys == [derive_private_keys(seed, [0, 1]) for seed in seeds]
+
+
+def test_derive_private_keys_many_empty():
+    """Test that no keys are derived for an empty batch."""
+    assert derive_private_keys_many([]) == []
@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from cdp.api_key_utils import _parse_private_key
+from cdp.cdp_api_client import CdpApiClient
+from cdp.jwt_signer import JwtSigner
+
+URL = "https://api.cdp.coinbase.com/platform/v1/networks/base-sepolia/assets/usdc?foo=bar"
+
+
+@pytest.mark.parametrize(
+    "key_type, alg", [("ecdsa", "ES256"), ("ed25519-32", "EdDSA"), ("ed25519-64", "EdDSA")]
+)
+def test_sign(dummy_key_factory, key_type, alg):
+    """Test that signed tokens carry the expected header and claims."""
+    private_key = dummy_key_factory(key_type)
+    signer = JwtSigner("test-api-key", private_key)
+
+    token = signer.sign(URL, "GET")
+
+    public_key = _parse_private_key(private_key).public_key()
+    claims = jwt.decode(token, public_key, algorithms=[alg], audience="cdp_service")
+    header = jwt.get_unverified_header(token)
+    assert signer.alg == alg
+    assert header["alg"] == alg
+    assert header["kid"] == "test-api-key"
+    assert header["typ"] == "JWT"
+    assert len(header["nonce"]) == 16
+    assert claims["sub"] == "test-api-key"
+    assert claims["iss"] == "cdp"
+    assert claims["uris"] == [
+        "GET api.cdp.coinbase.com/platform/v1/networks/base-sepolia/assets/usdc"
+    ]
+    assert claims["exp"] - claims["nbf"] == JwtSigner.TOKEN_LIFETIME_SECONDS
+
+
+def test_sign_parses_key_once(dummy_key_factory):
+    """Test that the private key is parsed only on first use."""
+    signer = JwtSigner("test-api-key", dummy_key_factory())
+
+    with patch("cdp.jwt_signer._parse_private_key", wraps=_parse_private_key) as mock_parse:
+        signer.sign(URL, "GET")
+        signer.sign(URL, "POST")
+
+    mock_parse.assert_called_once()
+
+
+def test_sign_without_cache_issues_fresh_tokens(dummy_key_factory):
+    """Test that each call signs a new token when the token cache is disabled."""
+    signer = JwtSigner("test-api-key", dummy_key_factory())
+
+    assert signer.sign(URL, "GET") != signer.sign(URL, "GET")
+
+
+def test_sign_with_cache_reuses_tokens(dummy_key_factory):
+    """Test that cached tokens are reused per method and path."""
+    signer = JwtSigner("test-api-key", dummy_key_factory(), token_cache_min_validity_seconds=30)
+
+    token = signer.sign(URL, "GET")
+
+    assert signer.sign(URL.split("?")[0], "GET") == token
+    assert signer.sign(URL, "POST") != token
+    assert signer.sign("https://api.cdp.coinbase.com/platform/v1/networks", "GET") != token
+
+
+def test_sign_with_cache_refreshes_expiring_tokens(dummy_key_factory):
+    """Test that tokens are re-signed once their remaining validity drops below the minimum."""
+    signer = JwtSigner("test-api-key", dummy_key_factory(), token_cache_min_validity_seconds=30)
+
+    with patch("cdp.jwt_signer.time.time", return_value=1000):
+        token = signer.sign(URL, "GET")
+    with patch("cdp.jwt_signer.time.time", return_value=1029):
+        assert signer.sign(URL, "GET") == token
+    with patch("cdp.jwt_signer.time.time", return_value=1030):
+        assert signer.sign(URL, "GET") != token
+
+    signer.clear_token_cache()
+    assert signer._tokens == {}
+
+
+def test_token_cache_is_bounded(dummy_key_factory):
+    """Test that a full token cache drops expiring tokens first, then the oldest ones."""
+    signer = JwtSigner("test-api-key", dummy_key_factory(), token_cache_min_validity_seconds=30)
+    base_url = "https://api.cdp.coinbase.com/platform/v1/wallets/"
+
+    with patch.object(JwtSigner, "TOKEN_CACHE_MAX_SIZE", 3):
+        with patch("cdp.jwt_signer.time.time", return_value=1000):
+            signer.sign(base_url + "a", "GET")
+        with patch("cdp.jwt_signer.time.time", return_value=1020):
+            signer.sign(base_url + "b", "GET")
+            signer.sign(base_url + "c", "GET")
+            signer.sign(base_url + "d", "GET")
+        assert [path for _, path in signer._tokens] == [
+            "api.cdp.coinbase.com/platform/v1/wallets/b",
+            "api.cdp.coinbase.com/platform/v1/wallets/c",
+            "api.cdp.coinbase.com/platform/v1/wallets/d",
+        ]
+
+        with patch("cdp.jwt_signer.time.time", return_value=1020):
+            signer.sign(base_url + "e", "GET")
+        assert len(signer._tokens) == 3
+        assert ("GET", "api.cdp.coinbase.com/platform/v1/wallets/b") not in signer._tokens
+
+        with patch("cdp.jwt_signer.time.time", return_value=1055):
+            token = signer.sign(base_url + "f", "GET")
+        assert signer._tokens == {
+            ("GET", "api.cdp.coinbase.com/platform/v1/wallets/f"): (token, 1115)
+        }
+
+
+def test_invalid_token_cache_min_validity():
+    """Test that a minimum validity beyond the token lifetime is rejected."""
+    with pytest.raises(ValueError, match="token_cache_min_validity_seconds"):
+        JwtSigner("test-api-key", "key", token_cache_min_validity_seconds=60)
+
+
+def test_sign_invalid_key():
+    """Test that an invalid key fails when signing rather than on construction."""
+    signer = JwtSigner("test-api-key", "invalid_key")
+
+    with pytest.raises(ValueError, match="Could not parse the private key"):
+        signer.sign(URL, "GET")
+
+
+def test_api_client_build_jwt_uses_signer(dummy_key_factory):
+    """Test that CdpApiClient signs requests with its cached signer."""
+    client = CdpApiClient("test-api-key", dummy_key_factory(), token_cache_min_validity_seconds=30)
+
+    token = client._build_jwt(URL, "GET")
+
+    assert client._build_jwt(URL, "GET") == token
+    assert jwt.get_unverified_header(token)["kid"] == "test-api-key"
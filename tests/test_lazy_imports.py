@@ -0,0 +1,71 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cdp
+import cdp.client.models
+
+HEAVY_MODULES = [
+    "web3",
+    "eth_account",
+    "bip_utils",
+    "coincurve",
+    "Crypto",
+    "cdp.client.api.wallets_api",
+]
+
+
+def _loaded_modules(statement):
+    """Run a statement in a fresh interpreter and return the heavy modules it loaded."""
+    probe = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r}"
+        " if name in sys.modules]))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("statement", ["import cdp", "from cdp import *"])
+def test_import_does_not_load_heavy_dependencies(statement):
+    """Test that importing the SDK does not load crypto, web3 or the generated API modules."""
+    assert _loaded_modules(statement) == []
+
+
+def test_signing_loads_heavy_dependencies():
+    """Test that heavy dependencies are loaded once they are used."""
+    assert "eth_account" in _loaded_modules("from cdp import hash_message; hash_message('hi')")
+
+
+def test_lazy_attributes():
+    """Test that the lazily imported names resolve to the SDK classes."""
+    from cdp.wallet import Wallet
+
+    assert cdp.Wallet is Wallet
+    assert set(cdp.__all__) <= set(dir(cdp))
+    with pytest.raises(AttributeError, match="has no attribute 'NotAClass'"):
+        cdp.NotAClass  # noqa: B018
+
+
+def test_lazy_generated_client():
+    """Test that the generated client packages resolve their classes lazily."""
+    from cdp.client.api.wallets_api import WalletsApi
+    from cdp.client.models.transfer import Transfer
+
+    assert cdp.client.models.Transfer is Transfer
+    assert cdp.client.WalletsApi is WalletsApi
+    assert "Transfer" in dir(cdp.client.models)
+    with pytest.raises(AttributeError):
+        cdp.client.models.NotAModel  # noqa: B018
+
+
+def test_generated_packages_are_lazy():
+    """Test that the generated package modules are in the form written by the post-processor."""
+    script = Path(__file__).resolve().parent.parent / "scripts" / "lazy_client_exports.py"
+
+    assert subprocess.run([sys.executable, str(script), "--check"]).returncode == 0
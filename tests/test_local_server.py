@@ -0,0 +1,127 @@
+import pytest
+
+from cdp.bench import FlowResult, generate_api_key, main, run_flow
+from cdp.cdp import Cdp
+from cdp.cdp_client import CdpClient
+from cdp.errors import NotFoundError, UnauthorizedError
+from cdp.local_server import LocalCdpServer
+from cdp.polling_policy import FixedPollingPolicy
+from cdp.wallet import Wallet
+
+DESTINATION = "0x000000000000000000000000000000000000dEaD"
+
+
+@pytest.fixture
+def server():
+    """Yield a running stand-in server, with calls routed through real API clients."""
+    Cdp.api_clients = Cdp.ApiClientsWrapper()
+    with LocalCdpServer(seed=1) as server:
+        yield server
+
+
+def _client(server, **options):
+    return CdpClient("test-api-key", generate_api_key(), base_path=server.base_path, **options)
+
+
+def test_transfer_flow(server):
+    """Test that a transfer is created, signed, broadcast and completed against the server."""
+    with _client(server).use():
+        wallet = Wallet.create()
+        transfer = wallet.transfer(0.001, "eth", DESTINATION)
+        transfer.wait(polling_policy=FixedPollingPolicy(0))
+
+    assert transfer.status.value == "complete"
+    assert transfer.transaction_hash.startswith("0x")
+    assert (
+        server.request_counts["POST /v1/wallets/{wallet_id}/addresses/{address_id}/transfers"] == 1
+    )
+    assert (
+        server.request_counts[
+            "GET /v1/wallets/{wallet_id}/addresses/{address_id}/transfers/{transfer_id}"
+        ]
+        == 1
+    )
+
+
+def test_trade_flow_with_approval(server):
+    """Test that trades of ERC20 assets broadcast their approval transaction."""
+    with _client(server).use():
+        wallet = Wallet.create()
+        trade = wallet.trade(1, "usdc", "eth").wait(polling_policy=FixedPollingPolicy(0))
+
+    assert trade.status.value == "complete"
+    assert trade.approve_transaction.status.value == "complete"
+
+
+def test_api_errors(server):
+    """Test that unknown resources are answered with API errors."""
+    with _client(server).use(), pytest.raises(NotFoundError):
+        Wallet.fetch("unknown-wallet")
+
+
+def test_rejects_requests_without_token(server):
+    """Test that requests must carry a valid JWT."""
+    client = _client(server)
+    client.cdp_client._build_jwt = lambda url, method="GET": "not-a-jwt"
+
+    with client.use(), pytest.raises(UnauthorizedError):
+        Wallet.fetch("unknown-wallet")
+
+
+def test_error_injection():
+    """Test that injected errors are answered before requests are handled."""
+    server = LocalCdpServer(error_rate=1, error_status=429)
+    try:
+        status, headers, body = server.handle("POST", "/platform/v1/wallets", {}, b"{}")
+    finally:
+        server.stop()
+
+    assert (status, headers) == (429, {"Retry-After": "0"})
+    assert body["code"] == "injected_error"
+    assert server.injected_errors == 1
+    assert server.request_counts == {}
+
+
+def test_invalid_options():
+    """Test that invalid injection options are rejected."""
+    with pytest.raises(ValueError, match="error_rate must be between 0 and 1"):
+        LocalCdpServer(error_rate=2)
+    with pytest.raises(ValueError, match="latency must not be negative"):
+        LocalCdpServer(latency_seconds=-1)
+
+
+def test_run_flow(server):
+    """Test that flows are timed per operation."""
+    result = run_flow(_client(server), "user_operation", operations=4, concurrency=2)
+
+    assert (result.operations, result.errors, len(result.latencies)) == (4, 0, 4)
+    assert result.throughput > 0
+
+
+def test_flow_result_percentiles():
+    """Test that percentiles use the nearest rank."""
+    result = FlowResult("transfer", 4, 1, 2.0, (0.1, 0.2, 0.3))
+
+    assert result.percentile(50) == 0.2
+    assert result.percentile(99) == 0.3
+    assert result.summary() == {
+        "flow": "transfer",
+        "operations": 4,
+        "errors": 1,
+        "seconds": 2.0,
+        "throughput": 1.5,
+        "p50_ms": 200.0,
+        "p90_ms": 300.0,
+        "p99_ms": 300.0,
+        "max_ms": 300.0,
+    }
+
+
+def test_main(capsys):
+    """Test that the harness reports each flow and fails on a latency threshold."""
+    Cdp.api_clients = Cdp.ApiClientsWrapper()
+
+    assert main(["--flows", "webhook", "--operations", "2", "--json"]) == 0
+    assert '"flow": "webhook"' in capsys.readouterr().out
+
+    assert main(["--flows", "wallet", "--operations", "1", "--max-p99-ms", "0"]) == 1
@@ -0,0 +1,254 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from urllib3 import HTTPResponse
+
+from cdp.api_clients import ApiClients
+from cdp.async_cdp_api_client import AsyncCdpApiClient, AsyncRESTResponse
+from cdp.cdp import Cdp
+from cdp.cdp_api_client import CdpApiClient
+from cdp.client import rest
+from cdp.client.api.assets_api import AssetsApi
+from cdp.client.exceptions import ApiException
+from cdp.errors import NotFoundError
+from cdp.metrics import (
+    CacheMetrics,
+    MethodMetrics,
+    MetricsRegistry,
+    WaitMetrics,
+    current_api_method,
+    get_metrics_registry,
+    prometheus_text,
+    record_api_call,
+    set_metrics_registry,
+)
+from cdp.polling_policy import FixedPollingPolicy
+
+ASSET = {"network_id": "base-sepolia", "asset_id": "eth", "decimals": 18}
+
+
+def _rest_response(status, body, headers=None):
+    return rest.RESTResponse(
+        HTTPResponse(
+            body=json.dumps(body).encode(),
+            status=status,
+            headers={"Content-Type": "application/json", **(headers or {})},
+            preload_content=False,
+        )
+    )
+
+
+@pytest.fixture
+def registry():
+    """Yield a metrics registry that the wait loops report to."""
+    previous = get_metrics_registry()
+    registry = MetricsRegistry()
+    set_metrics_registry(registry)
+    yield registry
+    set_metrics_registry(previous)
+
+
+def test_record_call_builds_latency_histogram():
+    """Test that calls are counted into cumulative latency buckets."""
+    registry = MetricsRegistry(latency_buckets=(0.1, 1.0))
+
+    registry.record_call("get_transfer", 0.05)
+    registry.record_call("get_transfer", 0.5)
+    registry.record_call("get_transfer", 2.0, error_code="internal")
+
+    assert registry.snapshot().methods == {
+        "get_transfer": MethodMetrics(
+            count=3,
+            errors=1,
+            latency_sum=2.55,
+            latency_buckets=((0.1, 1), (1.0, 2), (float("inf"), 3)),
+        )
+    }
+    assert registry.snapshot().errors == {"internal": 1}
+
+
+def test_record_retries_and_waits():
+    """Test that retries are counted per method and reloads per resource type."""
+    registry = MetricsRegistry()
+
+    registry.record_retries("broadcast_transfer", 2)
+    registry.record_wait("transfer", 3)
+    registry.record_wait("transfer", 5, timed_out=True)
+
+    snapshot = registry.snapshot()
+    assert snapshot.methods["broadcast_transfer"].retries == 2
+    assert snapshot.waits == {"transfer": WaitMetrics(waits=2, reloads=8, timeouts=1)}
+    assert snapshot.waits["transfer"].average_reloads == 4
+
+
+def test_register_cache():
+    """Test that cache counters are read when a snapshot is taken."""
+    registry = MetricsRegistry()
+    counters = CacheMetrics(hits=3, misses=1)
+    registry.register_cache("asset", lambda: counters)
+
+    assert registry.snapshot().caches == {"asset": counters}
+    assert registry.snapshot().caches["asset"].hit_rate == 0.75
+
+
+def test_reset():
+    """Test that resetting clears the counters."""
+    registry = MetricsRegistry()
+    registry.record_call("get_transfer", 0.1, error_code="not_found")
+    registry.record_wait("transfer", 1)
+
+    registry.reset()
+
+    assert registry.snapshot().methods == {}
+    assert registry.snapshot().errors == {}
+    assert registry.snapshot().waits == {}
+
+
+def test_invalid_latency_buckets():
+    """Test that invalid latency buckets are rejected."""
+    with pytest.raises(ValueError, match="latency_buckets must be non-empty and increasing"):
+        MetricsRegistry(latency_buckets=())
+    with pytest.raises(ValueError, match="latency_buckets must be non-empty and increasing"):
+        MetricsRegistry(latency_buckets=(1.0, 0.5))
+
+
+def test_record_api_call():
+    """Test that a block is recorded under the method name, without its variant suffix."""
+    registry = MetricsRegistry()
+
+    with record_api_call(registry, "get_transfer_with_http_info"):
+        assert current_api_method() == "get_transfer"
+
+    with (
+        pytest.raises(NotFoundError),
+        record_api_call(registry, "get_transfer"),
+    ):
+        raise NotFoundError(ApiException(status=404), code="not_found", message="not found")
+
+    with pytest.raises(ValueError), record_api_call(registry, "get_transfer"):
+        raise ValueError("boom")
+
+    assert current_api_method() is None
+    metrics = registry.snapshot().methods["get_transfer"]
+    assert (metrics.count, metrics.errors) == (3, 2)
+    assert registry.snapshot().errors == {"not_found": 1}
+
+
+def test_prometheus_text():
+    """Test that metrics are exported in the Prometheus text format."""
+    registry = MetricsRegistry(latency_buckets=(0.1,))
+    registry.record_call("get_transfer", 0.05)
+    registry.record_call("get_transfer", 0.2, error_code="not_found")
+    registry.record_wait("transfer", 2)
+
+    text = prometheus_text(registry.snapshot())
+
+    assert "# TYPE cdp_api_requests_total counter" in text
+    assert 'cdp_api_requests_total{method="get_transfer"} 2' in text
+    assert 'cdp_api_request_errors_total{method="get_transfer"} 1' in text
+    assert "# TYPE cdp_api_request_duration_seconds histogram" in text
+    assert 'cdp_api_request_duration_seconds_bucket{method="get_transfer",le="0.1"} 1' in text
+    assert 'cdp_api_request_duration_seconds_bucket{method="get_transfer",le="+Inf"} 2' in text
+    assert 'cdp_api_request_duration_seconds_count{method="get_transfer"} 2' in text
+    assert 'cdp_api_errors_total{code="not_found"} 1' in text
+    assert 'cdp_wait_reloads_total{resource="transfer"} 2' in text
+    assert text == registry.prometheus_text()
+
+
+def test_prometheus_text_escapes_labels():
+    """Test that label values are escaped."""
+    registry = MetricsRegistry()
+    registry.record_call("get", 0.1, error_code='bad "code"\n')
+
+    assert 'cdp_api_errors_total{code="bad \\"code\\"\\n"} 1' in registry.prometheus_text()
+
+
+def test_api_clients_record_calls(dummy_key_factory):
+    """Test that calls through ApiClients are counted per method, with errors by code."""
+    registry = MetricsRegistry()
+    api_clients = ApiClients(CdpApiClient("test-api-key", dummy_key_factory(), metrics=registry))
+    not_found = {"code": "not_found", "message": "asset not found"}
+
+    with patch.object(
+        api_clients.cdp_client.rest_client,
+        "request",
+        side_effect=[_rest_response(200, ASSET), _rest_response(404, not_found)],
+    ):
+        assert api_clients.assets.get_asset("base-sepolia", "eth").asset_id == "eth"
+        with pytest.raises(NotFoundError):
+            api_clients.assets.get_asset("base-sepolia", "doge")
+
+    snapshot = registry.snapshot()
+    assert snapshot.methods["get_asset"].count == 2
+    assert snapshot.methods["get_asset"].errors == 1
+    assert snapshot.errors == {"not_found": 1}
+
+
+def test_api_clients_without_metrics(dummy_key_factory):
+    """Test that API clients are not wrapped when metrics are disabled."""
+    api_clients = ApiClients(CdpApiClient("test-api-key", dummy_key_factory()))
+
+    assert isinstance(api_clients.assets, AssetsApi)
+
+
+def test_cdp_api_client_records_throttle_retries(dummy_key_factory):
+    """Test that retries after 429 responses are counted towards the API method."""
+    registry = MetricsRegistry()
+    client = CdpApiClient("test-api-key", dummy_key_factory(), rate_limit=100, metrics=registry)
+
+    with patch.object(
+        client.rest_client,
+        "request",
+        side_effect=[
+            _rest_response(429, {}, {"Retry-After": "0"}),
+            _rest_response(200, ASSET),
+        ],
+    ):
+        ApiClients(client).assets.get_asset("base-sepolia", "eth")
+
+    assert registry.snapshot().methods["get_asset"].retries == 1
+
+
+def test_async_cdp_api_client_records_calls(dummy_key_factory):
+    """Test that async calls are counted per method with the retries of the transport."""
+    registry = MetricsRegistry()
+    client = AsyncCdpApiClient("test-api-key", dummy_key_factory(), metrics=registry)
+    response = AsyncRESTResponse(
+        200, "OK", {"Content-Type": "application/json"}, json.dumps(ASSET).encode()
+    )
+    response.retries = 2
+
+    async def send(method, url, header_params, data, timeout):
+        return response
+
+    with patch.object(client, "_send_async", send):
+        asyncio.run(client.request(AssetsApi, "get_asset", "base-sepolia", "eth"))
+
+    metrics = registry.snapshot().methods["get_asset"]
+    assert (metrics.count, metrics.errors, metrics.retries) == (1, 0, 2)
+
+
+def test_polling_schedule_records_waits(registry):
+    """Test that wait loops report their reloads per resource type."""
+    schedule = FixedPollingPolicy(0).schedule("transfer")
+    schedule.next_interval()
+    schedule.record(timed_out=True)
+
+    assert registry.snapshot().waits == {"transfer": WaitMetrics(waits=1, reloads=2, timeouts=1)}
+
+
+def test_cdp_configure_metrics():
+    """Test that Cdp.configure wires the registry into the client, wait loops and asset cache."""
+    registry = MetricsRegistry()
+    try:
+        Cdp.configure(api_key_name="test", private_key="test", metrics=registry)
+
+        assert Cdp.api_clients.cdp_client.metrics is registry
+        assert get_metrics_registry() is registry
+        assert "asset" in registry.snapshot().caches
+    finally:
+        Cdp.configure(api_key_name="test", private_key="test")
+
+    assert get_metrics_registry() is None
@@ -0,0 +1,164 @@
+import asyncio
+import contextvars
+import threading
+from unittest.mock import AsyncMock, Mock, call
+
+import pytest
+
+from cdp.paginator import AsyncPaginator, PageInfo, Paginator
+
+
+def _pages(*sizes):
+    """Return mock list responses with the given page sizes, numbering items consecutively."""
+    responses = []
+    start = 0
+    for index, size in enumerate(sizes):
+        has_more = index < len(sizes) - 1
+        responses.append(
+            Mock(
+                data=list(range(start, start + size)),
+                has_more=has_more,
+                next_page=f"page-{index + 2}" if has_more else None,
+            )
+        )
+        start += size
+    return responses
+
+
+def test_paginator_follows_next_page():
+    """Test that the paginator requests each page with the previous page's token."""
+    fetch_page = Mock(side_effect=_pages(2, 2, 1))
+
+    items = list(Paginator(fetch_page, str))
+
+    assert items == ["0", "1", "2", "3", "4"]
+    assert fetch_page.call_args_list == [call(None, 100), call("page-2", 100), call("page-3", 100)]
+
+
+def test_paginator_is_lazy():
+    """Test that no page is fetched until the first item is requested."""
+    fetch_page = Mock(side_effect=_pages(1))
+
+    paginator = Paginator(fetch_page, str)
+
+    fetch_page.assert_not_called()
+    assert next(paginator) == "0"
+    with pytest.raises(StopIteration):
+        next(paginator)
+
+
+def test_paginator_page_size():
+    """Test that the page size is passed to the fetch function."""
+    fetch_page = Mock(side_effect=_pages(1))
+
+    list(Paginator(fetch_page, str, page_size=25))
+
+    fetch_page.assert_called_once_with(None, 25)
+
+
+def test_paginator_max_items():
+    """Test that max_items stops iteration and shrinks the requested page size."""
+    fetch_page = Mock(side_effect=_pages(2, 2, 2))
+
+    items = list(Paginator(fetch_page, str, page_size=2, max_items=3))
+
+    assert items == ["0", "1", "2"]
+    assert fetch_page.call_args_list == [call(None, 2), call("page-2", 1)]
+
+
+def test_paginator_max_pages():
+    """Test that max_pages stops fetching further pages."""
+    fetch_page = Mock(side_effect=_pages(2, 2, 2))
+
+    items = list(Paginator(fetch_page, str, max_pages=2))
+
+    assert items == ["0", "1", "2", "3"]
+    assert fetch_page.call_count == 2
+
+
+@pytest.mark.parametrize("kwargs", [{"page_size": 0}, {"max_items": -1}, {"max_pages": 0}], ids=str)
+def test_paginator_invalid_options(kwargs):
+    """Test that invalid limits are rejected."""
+    with pytest.raises(ValueError):
+        Paginator(Mock(), str, **kwargs)
+
+
+def test_paginator_on_page():
+    """Test that the on_page hook receives information for each page."""
+    on_page = Mock()
+
+    list(Paginator(Mock(side_effect=_pages(2, 1)), str, on_page=on_page))
+
+    assert on_page.call_count == 2
+    first, second = (c.args[0] for c in on_page.call_args_list)
+    assert isinstance(first, PageInfo)
+    assert (first.page_number, first.item_count, first.has_more) == (1, 2, True)
+    assert (second.page_number, second.item_count, second.has_more) == (2, 1, False)
+    assert first.fetch_seconds >= 0
+    assert first.wait_seconds >= 0
+
+
+def test_paginator_prefetch():
+    """Test that the next page is fetched on a background thread before it is consumed."""
+    responses = iter(_pages(2, 2))
+    second_page_fetched = threading.Event()
+    fetch_threads = []
+    request_id = contextvars.ContextVar("request_id", default=None)
+    seen_context = []
+
+    def fetch_page(page, limit):
+        fetch_threads.append(threading.current_thread())
+        seen_context.append(request_id.get())
+        if page is not None:
+            second_page_fetched.set()
+        return next(responses)
+
+    request_id.set("test-request")
+    paginator = Paginator(fetch_page, str, prefetch=True)
+
+    assert next(paginator) == "0"
+    assert second_page_fetched.wait(timeout=5)
+    assert list(paginator) == ["1", "2", "3"]
+    assert fetch_threads[0] is threading.current_thread()
+    assert fetch_threads[1] is not threading.current_thread()
+    assert seen_context == ["test-request", "test-request"]
+
+
+def test_paginator_prefetch_propagates_errors():
+    """Test that errors raised while prefetching surface to the consumer."""
+    fetch_page = Mock(side_effect=[_pages(1, 1)[0], RuntimeError("boom")])
+    paginator = Paginator(fetch_page, str, prefetch=True)
+
+    assert next(paginator) == "0"
+    with pytest.raises(RuntimeError, match="boom"):
+        next(paginator)
+
+
+def test_async_paginator():
+    """Test that the async paginator follows pages and honours limits."""
+    fetch_page = AsyncMock(side_effect=_pages(2, 2, 2))
+
+    async def collect():
+        return [item async for item in AsyncPaginator(fetch_page, str, max_items=3)]
+
+    assert asyncio.run(collect()) == ["0", "1", "2"]
+    assert fetch_page.await_args_list == [call(None, 3), call("page-2", 1)]
+
+
+def test_async_paginator_prefetch():
+    """Test that the async paginator prefetches the next page in a background task."""
+    fetch_page = AsyncMock(side_effect=_pages(2, 2))
+
+    async def run():
+        paginator = AsyncPaginator(fetch_page, str, prefetch=True)
+        first = await paginator.__anext__()
+        await asyncio.sleep(0)
+        fetched_before_consumed = fetch_page.await_count
+        rest = [item async for item in paginator]
+        return first, fetched_before_consumed, rest
+
+    first, fetched_before_consumed, rest = asyncio.run(run())
+
+    assert first == "0"
+    assert fetched_before_consumed == 2
+    assert rest == ["1", "2", "3"]
@@ -0,0 +1,139 @@
+import random
+import threading
+from itertools import islice
+
+import pytest
+
+from cdp.polling_policy import (
+    DEFAULT_POLLING_POLICY,
+    NETWORK_POLLING_POLICIES,
+    ExponentialPollingPolicy,
+    FixedPollingPolicy,
+    JitteredExponentialPollingPolicy,
+    PollingPolicy,
+    PollingStats,
+    get_polling_policy,
+)
+
+
+def test_fixed_polling_policy():
+    """Test that the fixed policy always returns the same interval."""
+    assert list(islice(FixedPollingPolicy(0.5).intervals(), 3)) == [0.5, 0.5, 0.5]
+
+
+def test_exponential_polling_policy():
+    """Test that the exponential policy grows intervals up to the maximum."""
+    policy = ExponentialPollingPolicy(initial_seconds=0.5, max_seconds=3, multiplier=2)
+
+    assert list(islice(policy.intervals(), 5)) == [0.5, 1, 2, 3, 3]
+
+
+def test_jittered_exponential_polling_policy():
+    """Test that the jittered policy stays between the jitter bound and the exponential interval."""
+    policy = JitteredExponentialPollingPolicy(
+        initial_seconds=1, max_seconds=4, multiplier=2, jitter=0.5, rng=random.Random(1)
+    )
+
+    intervals = list(islice(policy.intervals(), 4))
+
+    for interval, upper in zip(intervals, [1, 2, 4, 4], strict=True):
+        assert upper / 2 <= interval <= upper
+    assert len(set(intervals)) == 4
+
+
+def test_jittered_exponential_polling_policy_without_jitter():
+    """Test that a jitter of zero behaves like the exponential policy."""
+    policy = JitteredExponentialPollingPolicy(initial_seconds=1, max_seconds=4, jitter=0)
+
+    assert list(islice(policy.intervals(), 4)) == [1, 2, 4, 4]
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: FixedPollingPolicy(-1),
+        lambda: ExponentialPollingPolicy(initial_seconds=0),
+        lambda: ExponentialPollingPolicy(initial_seconds=2, max_seconds=1),
+        lambda: ExponentialPollingPolicy(multiplier=0.5),
+        lambda: JitteredExponentialPollingPolicy(jitter=1.5),
+    ],
+)
+def test_invalid_polling_policies(factory):
+    """Test that invalid polling options are rejected."""
+    with pytest.raises(ValueError):
+        factory()
+
+
+def test_polling_policy_requires_intervals():
+    """Test that a policy cannot be created without implementing `intervals()`."""
+
+    class IncompletePollingPolicy(PollingPolicy):
+        pass
+
+    with pytest.raises(TypeError, match="intervals"):
+        PollingPolicy()
+    with pytest.raises(TypeError, match="intervals"):
+        IncompletePollingPolicy()
+
+
+def test_schedule_records_reloads():
+    """Test that schedules record the reloads used by each wait on the policy."""
+    policy = FixedPollingPolicy(0.1)
+
+    schedule = policy.schedule()
+    for _ in range(3):
+        schedule.next_interval()
+    assert schedule.record() == 3
+
+    schedule = policy.schedule()
+    schedule.next_interval()
+    assert schedule.record(timed_out=True) == 2
+
+    assert policy.stats == PollingStats(
+        waits=2, reloads=5, timeouts=1, last_wait_reloads=2, max_wait_reloads=3
+    )
+    assert policy.stats.average_wait_reloads == 2.5
+
+    policy.reset_stats()
+    assert policy.stats == PollingStats()
+    assert policy.stats.average_wait_reloads == 0
+
+
+def test_stats_are_thread_safe():
+    """Test that concurrent waits are all counted."""
+    policy = FixedPollingPolicy(0)
+
+    def run():
+        for _ in range(100):
+            schedule = policy.schedule()
+            schedule.next_interval()
+            schedule.record()
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert policy.stats.waits == 800
+    assert policy.stats.reloads == 800
+
+
+def test_get_polling_policy():
+    """Test the precedence of explicit policies, fixed intervals and network defaults."""
+    policy = FixedPollingPolicy(1)
+
+    assert get_polling_policy("base-sepolia", 0.5, policy) is policy
+    assert get_polling_policy("base-sepolia", 0.5).interval_seconds == 0.5
+    assert get_polling_policy("base-sepolia") is NETWORK_POLLING_POLICIES["base-sepolia"]
+    assert get_polling_policy("unknown-network") is DEFAULT_POLLING_POLICY
+    assert get_polling_policy(None) is DEFAULT_POLLING_POLICY
+
+
+def test_network_polling_policies_follow_block_time():
+    """Test that slower networks are polled less often than faster ones."""
+    ethereum = NETWORK_POLLING_POLICIES["ethereum-mainnet"]
+    base = NETWORK_POLLING_POLICIES["base-mainnet"]
+
+    assert ethereum.initial_seconds > base.initial_seconds
+    assert ethereum.max_seconds > base.max_seconds
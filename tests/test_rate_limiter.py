@@ -0,0 +1,313 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from cdp.async_cdp_api_client import AsyncCdpApiClient, AsyncRESTResponse
+from cdp.cdp import Cdp
+from cdp.cdp_api_client import CdpApiClient
+from cdp.errors import ResourceExhaustedError
+from cdp.rate_limiter import (
+    RateLimiter,
+    RateLimiterStats,
+    TokenBucket,
+    endpoint_group,
+    parse_retry_after,
+)
+
+WALLETS_URL = "https://api.cdp.coinbase.com/platform/v1/wallets/test-wallet-id/addresses"
+BALANCE_HISTORY_URL = (
+    "https://api.cdp.coinbase.com/platform/v1/networks/base-sepolia/addresses/0xabc"
+    "/balance_history/eth"
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status, retry_after=None):
+    response = Mock(status=status)
+    response.getheader.side_effect = lambda name, default=None: (
+        retry_after if name == "Retry-After" else default
+    )
+    return response
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    """Test that requests beyond the burst are delayed to the rate."""
+    clock = _FakeClock()
+    bucket = TokenBucket(10, burst=2, clock=clock)
+
+    delays = [bucket._reserve()[0] for _ in range(4)]
+
+    assert delays == pytest.approx([0, 0, 0.1, 0.2])
+
+
+def test_token_bucket_refills_while_idle():
+    """Test that an idle bucket allows a burst again."""
+    clock = _FakeClock()
+    bucket = TokenBucket(10, burst=2, clock=clock)
+    for _ in range(4):
+        bucket._reserve()
+
+    clock.now += 1
+
+    assert [bucket._reserve()[0] for _ in range(2)] == [0, 0]
+
+
+def test_token_bucket_throttle_honors_retry_after():
+    """Test that a 429 halves the rate and pauses the bucket for its Retry-After."""
+    clock = _FakeClock()
+    bucket = TokenBucket(10, burst=5, clock=clock)
+
+    bucket.throttle(retry_after=2)
+
+    assert bucket.stats.rate == 5
+    assert bucket.stats.throttled == 1
+    assert bucket._reserve()[0] == pytest.approx(2)
+    assert bucket._reserve()[0] == pytest.approx(2.2)
+
+
+def test_token_bucket_throttle_without_retry_after():
+    """Test that a 429 without Retry-After waits for the next token at the lowered rate."""
+    clock = _FakeClock()
+    bucket = TokenBucket(10, clock=clock)
+
+    bucket.throttle()
+
+    assert bucket._reserve()[0] == pytest.approx(0.2)
+
+
+def test_token_bucket_rate_recovers():
+    """Test that the rate recovers linearly to the limit after a 429."""
+    clock = _FakeClock()
+    bucket = TokenBucket(10, recovery_seconds=10, clock=clock)
+    bucket.throttle()
+    bucket.throttle()
+    assert bucket.stats.rate == 2.5
+
+    clock.now += 5
+    assert bucket.stats.rate == 7.5
+
+    clock.now += 5
+    assert bucket.stats == RateLimiterStats(rate=10, limit=10, throttled=2)
+
+
+def test_token_bucket_rate_floor():
+    """Test that repeated 429s do not lower the rate below a hundredth of the limit."""
+    bucket = TokenBucket(10, clock=_FakeClock())
+    for _ in range(20):
+        bucket.throttle(retry_after=0)
+
+    assert bucket.stats.rate == 0.1
+
+
+def test_token_bucket_invalid_options():
+    """Test that invalid bucket options are rejected."""
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucket(0)
+    with pytest.raises(ValueError, match="burst must be at least 1"):
+        TokenBucket(1, burst=0)
+    with pytest.raises(ValueError, match="recovery_seconds must be positive"):
+        TokenBucket(1, recovery_seconds=0)
+
+
+def test_token_bucket_queues_callers():
+    """Test that concurrent callers are queued and counted while they wait."""
+    bucket = TokenBucket(20, burst=1)
+    depths = []
+
+    def observe():
+        time.sleep(0.05)
+        depths.append(bucket.stats.queue_depth)
+
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+    observer = threading.Thread(target=observe)
+    start = time.monotonic()
+    for thread in [*threads, observer]:
+        thread.start()
+    for thread in [*threads, observer]:
+        thread.join()
+
+    assert time.monotonic() - start >= 0.15
+    assert depths[0] >= 1
+    assert bucket.stats.queue_depth == 0
+    assert bucket.stats.waited_seconds == pytest.approx(0.3, abs=0.05)
+
+
+def test_token_bucket_reschedules_queued_callers_on_throttle():
+    """Test that callers already queued wait for the Retry-After of a later 429."""
+    bucket = TokenBucket(20, burst=1)
+    bucket.acquire()
+    waiter = threading.Thread(target=bucket.acquire)
+
+    start = time.monotonic()
+    waiter.start()
+    time.sleep(0.01)
+    bucket.throttle(retry_after=0.2)
+    waiter.join()
+
+    assert time.monotonic() - start >= 0.2
+
+
+def test_token_bucket_acquire_async():
+    """Test that async callers are spaced to the rate."""
+    bucket = TokenBucket(20, burst=1)
+
+    async def run():
+        return await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+
+    waits = asyncio.run(run())
+
+    assert sorted(waits) == pytest.approx([0, 0.05, 0.1], abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("", None), ("3", 3), ("0.5", 0.5), ("-1", 0), ("soon", None)],
+)
+def test_parse_retry_after(value, expected):
+    """Test that Retry-After seconds are parsed."""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    """Test that a Retry-After HTTP date is converted to seconds from now."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
+
+
+@pytest.mark.parametrize(
+    "url, group",
+    [
+        (WALLETS_URL, "wallets"),
+        (BALANCE_HISTORY_URL, "networks"),
+        ("https://api.cdp.coinbase.com/platform/v1/webhooks", "webhooks"),
+        ("https://api.cdp.coinbase.com/platform/v1", "default"),
+        ("https://example.com/status", "default"),
+    ],
+)
+def test_endpoint_group(url, group):
+    """Test that the endpoint group is the resource following the API version."""
+    assert endpoint_group(url) == group
+
+
+def test_rate_limiter_buckets():
+    """Test that groups with a limit get their own bucket and others share the default."""
+    limiter = RateLimiter(10, {"networks": 2})
+
+    assert limiter.bucket(BALANCE_HISTORY_URL) is not limiter.bucket(WALLETS_URL)
+    assert limiter.bucket(WALLETS_URL) is limiter.bucket(
+        "https://api.cdp.coinbase.com/platform/v1/webhooks"
+    )
+    assert limiter.stats == {
+        "networks": RateLimiterStats(rate=2, limit=2),
+        "default": RateLimiterStats(rate=10, limit=10),
+    }
+
+
+def test_rate_limiter_group_only():
+    """Test that requests outside the limited groups are not limited without a default rate."""
+    limiter = RateLimiter(group_rates={"networks": 2})
+
+    assert limiter.bucket(WALLETS_URL) is None
+    assert limiter.bucket(BALANCE_HISTORY_URL) is not None
+
+
+def test_cdp_api_client_retries_throttled_requests():
+    """Test that a 429 response slows the client down and is retried after its Retry-After."""
+    client = CdpApiClient("test", "test", rate_limit=10)
+
+    with (
+        patch.object(client, "_apply_headers") as mock_apply_headers,
+        patch.object(
+            client.rest_client,
+            "request",
+            side_effect=[_response(429, "0.05"), _response(200)],
+        ) as mock_request,
+    ):
+        start = time.monotonic()
+        response = client.call_api("GET", WALLETS_URL)
+
+    assert response.status == 200
+    assert time.monotonic() - start >= 0.04
+    assert mock_request.call_count == 2
+    assert mock_apply_headers.call_count == 2
+    assert client.rate_limiter_stats["default"].throttled == 1
+    assert client.rate_limiter_stats["default"].rate < 10
+
+
+def test_cdp_api_client_gives_up_after_max_network_retries():
+    """Test that 429 responses are returned once the retries are used up."""
+    client = CdpApiClient("test", "test", max_network_retries=1, rate_limit=100)
+
+    with (
+        patch.object(client, "_apply_headers"),
+        patch.object(
+            client.rest_client, "request", return_value=_response(429, "0")
+        ) as mock_request,
+    ):
+        response = client.call_api("GET", WALLETS_URL)
+
+    assert response.status == 429
+    assert mock_request.call_count == 2
+
+
+def test_cdp_api_client_without_rate_limit():
+    """Test that 429 responses are not retried when rate limiting is disabled."""
+    client = CdpApiClient("test", "test")
+    response = _response(429, "0")
+    response.data = b'{"code": "resource_exhausted", "message": "rate limit exceeded"}'
+    response.reason = "Too Many Requests"
+    response.getheaders.return_value = {}
+
+    with (
+        patch.object(client, "_apply_headers"),
+        patch.object(client.rest_client, "request", return_value=response) as mock_request,
+    ):
+        result = client.call_api("GET", WALLETS_URL)
+        with pytest.raises(ResourceExhaustedError):
+            client.response_deserialize(result, {"200": "Wallet"})
+
+    assert mock_request.call_count == 1
+    assert client.rate_limiter_stats == {}
+
+
+def test_async_cdp_api_client_retries_throttled_requests():
+    """Test that the async client retries 429 responses through its rate limiter."""
+    client = AsyncCdpApiClient("test", "test", rate_limits={"wallets": 50})
+    throttled = AsyncRESTResponse(429, "Too Many Requests", {"Retry-After": "0.05"}, b"")
+    ok = AsyncRESTResponse(200, "OK", {}, b"{}")
+
+    with (
+        patch.object(client, "_apply_headers"),
+        patch.object(client, "_send_async", AsyncMock(side_effect=[throttled, ok])) as mock_send,
+    ):
+        response = asyncio.run(client.call_api_async("GET", WALLETS_URL))
+
+    assert response is ok
+    assert mock_send.call_count == 2
+    assert client.rate_limiter_stats["wallets"].throttled == 1
+    assert client.rate_limiter_stats["wallets"].waited_seconds == pytest.approx(0.05, abs=0.01)
+
+
+def test_cdp_configure_rate_limit():
+    """Test that Cdp.configure enables the rate limiter and exposes its stats."""
+    Cdp.configure(
+        api_key_name="test", private_key="test", rate_limit=25, rate_limits={"networks": 5}
+    )
+
+    assert Cdp.rate_limiter_stats() == {
+        "networks": RateLimiterStats(rate=5, limit=5),
+        "default": RateLimiterStats(rate=25, limit=25),
+    }
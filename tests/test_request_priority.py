@@ -0,0 +1,295 @@
+import asyncio
+import http.server
+import statistics
+import threading
+import time
+
+import pytest
+
+from cdp.async_cdp_api_client import AsyncCdpApiClient
+from cdp.cdp import Cdp
+from cdp.cdp_api_client import CdpApiClient
+from cdp.request_priority import (
+    RequestPriority,
+    RequestScheduler,
+    RequestSchedulerStats,
+    get_request_priority,
+    request_priority,
+    set_request_priority,
+)
+
+BROADCAST_PATH = "/v1/networks/base-sepolia/addresses/0xabc/transfers/transfer-id/broadcast"
+BALANCE_HISTORY_PATH = "/v1/networks/base-sepolia/addresses/0xabc/balance_history/eth"
+RESPONSE_DELAY = 0.02
+
+
+def _wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.001)
+
+
+def _queued(stats):
+    return stats.queued_high + stats.queued_normal + stats.queued_low
+
+
+def test_get_request_priority_defaults():
+    """Test that broadcasts are high priority and other requests normal priority."""
+    assert get_request_priority("POST", f"https://api.example.com{BROADCAST_PATH}") == (
+        RequestPriority.HIGH
+    )
+    assert get_request_priority("GET", f"https://api.example.com{BALANCE_HISTORY_PATH}") == (
+        RequestPriority.NORMAL
+    )
+
+
+def test_request_priority_context():
+    """Test that the priority set for a block overrides the default priority."""
+    url = f"https://api.example.com{BROADCAST_PATH}"
+
+    with request_priority(RequestPriority.LOW):
+        assert get_request_priority("POST", url) == RequestPriority.LOW
+
+    assert get_request_priority("POST", url) == RequestPriority.HIGH
+
+
+def test_set_request_priority_is_per_thread():
+    """Test that the priority set by one thread does not apply to other threads."""
+    url = f"https://api.example.com{BALANCE_HISTORY_PATH}"
+    seen = []
+
+    def worker():
+        set_request_priority(RequestPriority.LOW)
+        seen.append(get_request_priority("GET", url))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen == [RequestPriority.LOW]
+    assert get_request_priority("GET", url) == RequestPriority.NORMAL
+
+
+def test_request_priority_is_per_task():
+    """Test that the priority set within an asyncio task does not leak into other tasks."""
+    url = f"https://api.example.com{BALANCE_HISTORY_PATH}"
+
+    async def scan():
+        set_request_priority(RequestPriority.LOW)
+        await asyncio.sleep(0)
+        return get_request_priority("GET", url)
+
+    async def run():
+        scanned = await asyncio.create_task(scan())
+        return scanned, get_request_priority("GET", url)
+
+    assert asyncio.run(run()) == (RequestPriority.LOW, RequestPriority.NORMAL)
+
+
+def test_scheduler_starts_waiting_requests_by_priority():
+    """Test that queued requests start by priority, then in arrival order."""
+    scheduler = RequestScheduler(1)
+    started = []
+
+    def request(name, priority):
+        with scheduler.slot(priority):
+            started.append(name)
+
+    with scheduler.slot(RequestPriority.NORMAL):
+        threads = []
+        for name, priority in [
+            ("scan-1", RequestPriority.LOW),
+            ("sync", RequestPriority.NORMAL),
+            ("scan-2", RequestPriority.LOW),
+            ("broadcast", RequestPriority.HIGH),
+        ]:
+            thread = threading.Thread(target=request, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            _wait_for(lambda: _queued(scheduler.stats) == len(threads))
+
+        assert scheduler.stats == RequestSchedulerStats(
+            in_flight=1, queued_high=1, queued_normal=1, queued_low=2
+        )
+
+    for thread in threads:
+        thread.join()
+
+    assert started == ["broadcast", "sync", "scan-1", "scan-2"]
+    assert scheduler.stats == RequestSchedulerStats()
+
+
+def test_scheduler_reserves_slots_for_high_priority():
+    """Test that reserved slots are left free for high priority requests."""
+    scheduler = RequestScheduler(2, reserved=1)
+    queued = threading.Thread(
+        target=lambda: scheduler.slot(RequestPriority.LOW).__enter__(), daemon=True
+    )
+
+    with scheduler.slot(RequestPriority.LOW):
+        queued.start()
+        _wait_for(lambda: scheduler.stats.queued_low == 1)
+
+        with scheduler.slot(RequestPriority.HIGH):
+            assert scheduler.stats == RequestSchedulerStats(in_flight=2, queued_low=1, reserved=1)
+
+    _wait_for(lambda: scheduler.stats.queued_low == 0)
+    assert scheduler.stats.in_flight == 1
+
+
+def test_scheduler_slot_async_cancellation():
+    """Test that a cancelled async request gives up its place in the queue."""
+    scheduler = RequestScheduler(1)
+
+    async def run():
+        async with scheduler.slot_async(RequestPriority.NORMAL):
+            waiting = asyncio.create_task(scheduler.slot_async(RequestPriority.LOW).__aenter__())
+            await asyncio.sleep(0)
+            assert scheduler.stats.queued_low == 1
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            assert scheduler.stats.queued_low == 0
+
+        async with scheduler.slot_async(RequestPriority.LOW):
+            return scheduler.stats.in_flight
+
+    assert asyncio.run(run()) == 1
+    assert scheduler.stats == RequestSchedulerStats()
+
+
+def test_scheduler_invalid_options():
+    """Test that invalid scheduler options are rejected."""
+    with pytest.raises(ValueError, match="connections must be at least 1"):
+        RequestScheduler(0)
+    with pytest.raises(ValueError, match="reserved must be at least 0"):
+        RequestScheduler(2, reserved=2)
+
+
+class _SlowHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Otherwise the body waits for the delayed ACK of the headers.
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        time.sleep(RESPONSE_DELAY)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond  # noqa: N815
+    do_POST = _respond  # noqa: N815
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _SlowServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Pooled connections are reset by the client when the test ends.
+        pass
+
+
+@pytest.fixture
+def slow_server():
+    """Yield the URL of a local API stand-in that answers every request after a short delay."""
+    server = _SlowServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _p99(latencies):
+    return statistics.quantiles(latencies, n=100)[98]
+
+
+def _broadcast_latencies(client, url, count=30):
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = client.call_api("POST", url, None, {})
+        assert response.status == 200
+        response.read()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def test_broadcast_p99_stays_flat_during_history_scan(slow_server, dummy_key_factory):
+    """Test that broadcasts keep their latency while bulk scans saturate the connection pool."""
+    client = CdpApiClient(
+        "test-api-key",
+        dummy_key_factory(),
+        host=slow_server,
+        connection_pool_maxsize=4,
+        reserved_connections=1,
+    )
+    broadcast_url = f"{slow_server}{BROADCAST_PATH}"
+    scan_url = f"{slow_server}{BALANCE_HISTORY_PATH}"
+
+    # The first request opens a connection and loads the signing key.
+    _broadcast_latencies(client, broadcast_url, count=1)
+    baseline = _p99(_broadcast_latencies(client, broadcast_url))
+
+    stop = threading.Event()
+
+    def scan():
+        with request_priority(RequestPriority.LOW):
+            while not stop.is_set():
+                client.call_api("GET", scan_url).read()
+
+    scanners = [threading.Thread(target=scan) for _ in range(12)]
+    for scanner in scanners:
+        scanner.start()
+    try:
+        _wait_for(lambda: client.request_scheduler_stats.queued_low > 0)
+        during_scan = _p99(_broadcast_latencies(client, broadcast_url))
+        scan_stats = client.request_scheduler_stats
+    finally:
+        stop.set()
+        for scanner in scanners:
+            scanner.join()
+
+    assert scan_stats.in_flight <= 4
+    # Without a reserved connection, each broadcast would wait behind the queued scan requests.
+    assert during_scan < baseline + 2 * RESPONSE_DELAY
+
+
+def test_async_client_schedules_by_priority(dummy_key_factory):
+    """Test that the async client holds a scheduler slot for each request."""
+    client = AsyncCdpApiClient(
+        "test-api-key", dummy_key_factory(), connection_pool_maxsize=2, reserved_connections=1
+    )
+    seen = []
+
+    async def send(method, url, header_params, data, timeout):
+        seen.append(client.request_scheduler_stats)
+        return type("Response", (), {"status": 200})()
+
+    client._send_async = send
+
+    async def run():
+        await client.call_api_async("POST", f"https://api.example.com{BROADCAST_PATH}")
+
+    asyncio.run(run())
+
+    assert seen == [RequestSchedulerStats(in_flight=1, reserved=1)]
+    assert client.request_scheduler_stats == RequestSchedulerStats(reserved=1)
+
+
+def test_cdp_configure_reserved_connections():
+    """Test that Cdp.configure enables priority scheduling."""
+    Cdp.configure(api_key_name="test", private_key="test", reserved_connections=2)
+    assert Cdp.request_scheduler_stats() == RequestSchedulerStats(reserved=2)
+
+    Cdp.configure(api_key_name="test", private_key="test")
+    assert Cdp.request_scheduler_stats() is None
@@ -0,0 +1,312 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from cdp.cdp_api_client import CdpApiClient
+from cdp.client.api_client import ApiClient
+from cdp.client.models.address_historical_balance_list import AddressHistoricalBalanceList
+from cdp.client.models.address_transaction_list import AddressTransactionList
+from cdp.client.models.transaction_content import TransactionContent
+from cdp.client.models.transfer_list import TransferList
+from cdp.response_deserializer import ResponseDeserializer, is_json_content_type
+from cdp.smart_contract import SmartContract
+from cdp.trade import Trade
+from cdp.transaction import Transaction
+from cdp.transfer import Transfer
+
+ETHEREUM_TRANSACTION = {
+    "from": "0xfrom",
+    "to": "0xto",
+    "gas": 21000,
+    "hash": "0xhash",
+    "value": "1000",
+    "block_timestamp": "2025-01-01T00:00:00Z",
+    "token_transfers": [
+        {
+            "contract_address": "0xcontract",
+            "from_address": "0xfrom",
+            "to_address": "0xto",
+            "value": "1",
+            "log_index": 0,
+            "token_transfer_type": "erc20",
+        }
+    ],
+}
+
+TRANSACTION = {
+    "network_id": "base-sepolia",
+    "from_address_id": "0xfrom",
+    "to_address_id": "0xto",
+    "unsigned_payload": "0xunsigned",
+    "status": "complete",
+    "transaction_hash": "0xhash",
+    "content": ETHEREUM_TRANSACTION,
+}
+
+ASSET = {"network_id": "base-sepolia", "asset_id": "usdc", "decimals": 6}
+
+
+def _transfer(index):
+    return {
+        "network_id": "base-sepolia",
+        "wallet_id": "wallet-id",
+        "address_id": "0xfrom",
+        "destination": "0xto",
+        "amount": "1000000",
+        "asset_id": "usdc",
+        "asset": ASSET,
+        "transfer_id": f"transfer-{index}",
+        "transaction": TRANSACTION,
+        "status": "complete",
+        "gasless": False,
+    }
+
+
+def _standard(response_text, response_type):
+    return ApiClient().deserialize(response_text, response_type, "application/json")
+
+
+@pytest.mark.parametrize(
+    "response_type, payload",
+    [
+        (
+            "TransferList",
+            {
+                "data": [_transfer(i) for i in range(3)],
+                "has_more": False,
+                "next_page": "",
+                "total_count": 3,
+            },
+        ),
+        (
+            "AddressTransactionList",
+            {"data": [TRANSACTION, TRANSACTION], "has_more": True, "next_page": "page-2"},
+        ),
+        (
+            "AddressHistoricalBalanceList",
+            {
+                "data": [
+                    {"amount": "1", "block_hash": "0xblock", "block_height": "1", "asset": ASSET}
+                ],
+                "has_more": False,
+                "next_page": "",
+            },
+        ),
+        ("List[Transfer]", [_transfer(0)]),
+    ],
+)
+def test_response_deserializer_matches_generated_client(response_type, payload):
+    """Test that the fast path builds the same models as the generated client."""
+    response_text = json.dumps(payload)
+
+    result = ResponseDeserializer().deserialize(response_text, response_type)
+
+    assert result == _standard(response_text, response_type)
+
+
+def test_response_deserializer_builds_one_of_wrappers():
+    """Test that oneOf wrappers nested in a response hold the wrapped model."""
+    response_text = json.dumps(
+        {"data": [_transfer(0)], "has_more": False, "next_page": "", "total_count": 1}
+    )
+
+    result = ResponseDeserializer().deserialize(response_text, "TransferList")
+
+    assert isinstance(result, TransferList)
+    content = result.data[0].transaction.content
+    assert isinstance(content, TransactionContent)
+    assert content.actual_instance.var_from == "0xfrom"
+    assert content.actual_instance.token_transfers[0].value == "1"
+
+
+def test_response_deserializer_validates_plain_models_from_json():
+    """Test that models without oneOf wrappers are validated from the raw JSON."""
+    deserializer = ResponseDeserializer()
+
+    result = deserializer.deserialize(
+        json.dumps({"data": [], "has_more": False, "next_page": ""}),
+        "AddressHistoricalBalanceList",
+    )
+
+    assert isinstance(result, AddressHistoricalBalanceList)
+    assert deserializer.plan("AddressHistoricalBalanceList") is deserializer.plan(
+        "AddressHistoricalBalanceList"
+    )
+
+
+def test_response_deserializer_rejects_invalid_payload():
+    """Test that a payload that does not match the response type raises a validation error."""
+    with pytest.raises(ValidationError):
+        ResponseDeserializer().deserialize(json.dumps({"data": []}), "AddressTransactionList")
+
+
+@pytest.mark.parametrize("response_type", ["str", "object", "List[str]", "NotAModel"])
+def test_response_deserializer_unsupported_types(response_type):
+    """Test that non-model response types are left to the generated client."""
+    deserializer = ResponseDeserializer()
+
+    assert not deserializer.supports(response_type)
+    with pytest.raises(ValueError, match="Unsupported response type"):
+        deserializer.deserialize("{}", response_type)
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        (None, True),
+        ("application/json", True),
+        ("application/json; charset=utf-8", True),
+        ("application/problem+json", True),
+        ("text/plain", False),
+    ],
+)
+def test_is_json_content_type(content_type, expected):
+    """Test detecting JSON content types."""
+    assert is_json_content_type(content_type) is expected
+
+
+def test_cdp_api_client_fast_deserialization():
+    """Test that the CDP API client uses the fast path when enabled."""
+    client = CdpApiClient("test", "test", fast_deserialization=True)
+    response_text = json.dumps({"data": [TRANSACTION], "has_more": False, "next_page": ""})
+
+    result = client.deserialize(response_text, "AddressTransactionList", "application/json")
+
+    assert isinstance(result, AddressTransactionList)
+    assert result == _standard(response_text, "AddressTransactionList")
+    assert client._response_deserializer.supports("AddressTransactionList")
+
+
+def test_cdp_api_client_fast_deserialization_falls_back():
+    """Test that responses rejected by the fast path are deserialized by the generated client."""
+    client = CdpApiClient("test", "test", fast_deserialization=True)
+
+    assert client.deserialize("plain text", "str", "text/plain") == "plain text"
+    assert client.deserialize('"value"', "str", "application/json") == "value"
+
+
+def test_cdp_api_client_fast_deserialization_disabled_by_default():
+    """Test that the CDP API client uses the generated deserializer by default."""
+    assert CdpApiClient("test", "test")._response_deserializer is None
+
+
+@pytest.mark.parametrize(
+    "response_type, payload",
+    [
+        (
+            "TransferList",
+            {"data": [_transfer(0)], "has_more": False, "next_page": "", "total_count": 1},
+        ),
+        ("AddressTransactionList", {"data": [TRANSACTION], "has_more": False, "next_page": ""}),
+        ("List[Transfer]", [_transfer(0)]),
+    ],
+)
+def test_response_deserializer_trusted_matches_validated(response_type, payload):
+    """Test that trusted responses build the same models as validated ones."""
+    response_text = json.dumps(payload)
+
+    result = ResponseDeserializer(validate=False).deserialize(response_text, response_type)
+
+    assert result == _standard(response_text, response_type)
+
+
+def test_response_deserializer_trusted_converts_non_json_fields():
+    """Test that trusted responses convert fields whose JSON form differs from their type."""
+    response_text = json.dumps({"data": [TRANSACTION], "has_more": False, "next_page": ""})
+
+    result = ResponseDeserializer(validate=False).deserialize(
+        response_text, "AddressTransactionList"
+    )
+
+    ethereum_transaction = result.data[0].content.actual_instance
+    assert ethereum_transaction.block_timestamp == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert ethereum_transaction.var_from == "0xfrom"
+
+
+def test_response_deserializer_trusted_skips_validation():
+    """Test that trusted responses are not validated."""
+    response_text = json.dumps(
+        {"data": [{**TRANSACTION, "status": "not-a-status"}], "has_more": False, "next_page": ""}
+    )
+
+    result = ResponseDeserializer(validate=False).deserialize(
+        response_text, "AddressTransactionList"
+    )
+
+    assert result.data[0].status == "not-a-status"
+
+
+def test_response_deserializer_trusted_rejects_missing_required_fields():
+    """Test that trusted responses missing required fields are rejected."""
+    with pytest.raises(ValueError, match="does not match AddressTransactionList"):
+        ResponseDeserializer(validate=False).deserialize(
+            json.dumps({"data": []}), "AddressTransactionList"
+        )
+
+
+def test_cdp_api_client_validate_responses_false_falls_back():
+    """Test that a trusted response that does not match its model is validated instead."""
+    client = CdpApiClient("test", "test", validate_responses=False)
+
+    with pytest.raises(ValidationError):
+        client.deserialize(json.dumps({"data": []}), "AddressTransactionList", "application/json")
+
+    assert not client._response_deserializer._validate
+
+
+def _both_modes(response_text, response_type):
+    client = CdpApiClient("test", "test")
+    trusted_client = CdpApiClient("test", "test", validate_responses=False)
+    return (
+        client.deserialize(response_text, response_type, "application/json"),
+        trusted_client.deserialize(response_text, response_type, "application/json"),
+    )
+
+
+def _describe(wrapper, names):
+    return {name: str(getattr(wrapper, name)) for name in names}
+
+
+def test_wrappers_behave_identically_with_trusted_responses(
+    transfer_model_factory, trade_model_factory, smart_contract_model_factory
+):
+    """Test that the high-level wrappers behave identically in both validation modes."""
+    cases = [
+        (
+            Transfer,
+            transfer_model_factory(gasless=False),
+            "Transfer",
+            ["transfer_id", "amount", "asset_id", "status", "transaction_hash", "transaction"],
+        ),
+        (
+            Trade,
+            trade_model_factory(),
+            "Trade",
+            ["trade_id", "from_amount", "to_amount", "status", "transaction"],
+        ),
+        (
+            SmartContract,
+            smart_contract_model_factory(),
+            "SmartContract",
+            ["smart_contract_id", "type", "options", "abi", "transaction", "terminal_state"],
+        ),
+    ]
+
+    for wrapper, model, response_type, names in cases:
+        validated, trusted = _both_modes(model.to_json(), response_type)
+
+        assert trusted == validated
+        assert str(wrapper(trusted)) == str(wrapper(validated))
+        assert _describe(wrapper(trusted), names) == _describe(wrapper(validated), names)
+
+
+def test_transaction_wrapper_behaves_identically_with_trusted_responses():
+    """Test that Transaction behaves identically in both validation modes."""
+    validated, trusted = _both_modes(json.dumps(TRANSACTION), "Transaction")
+
+    assert trusted == validated
+
+    names = ["status", "transaction_hash", "from_address_id", "terminal_state", "content"]
+    assert _describe(Transaction(trusted), names) == _describe(Transaction(validated), names)
@@ -0,0 +1,179 @@
+import multiprocessing
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_account import Account
+
+from cdp.payload_signature import PayloadSignature
+from cdp.signing_pool import SigningPool
+from cdp.transaction_signer import get_transaction_signer, set_transaction_signer
+from cdp.user_operation import UserOperation
+from cdp.wallet_address import WalletAddress
+
+ACCOUNT = Account.from_key("0x" + "4c" * 32)
+
+TRANSACTION = {
+    "chainId": 84532,
+    "nonce": 0,
+    "maxPriorityFeePerGas": 10**6,
+    "maxFeePerGas": 10**9,
+    "gas": 21000,
+    "value": 10**15,
+    "data": "0x",
+    "type": "0x2",
+    "to": bytes.fromhex("22" * 20),
+}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Yield a signing pool of two workers with `ACCOUNT` registered."""
+    with SigningPool(max_workers=2) as pool:
+        pool.register(ACCOUNT)
+        yield pool
+
+
+def test_sign_transactions(pool):
+    """Test that batches are signed across the workers, in order."""
+    transactions = [{**TRANSACTION, "nonce": nonce} for nonce in range(5)]
+
+    signed = pool.sign_transactions(ACCOUNT.address, transactions)
+
+    assert signed == [
+        bytes(ACCOUNT.sign_transaction(transaction).raw_transaction) for transaction in transactions
+    ]
+    assert pool.sign_transactions(ACCOUNT.address, []) == []
+
+
+def test_sign_hashes(pool):
+    """Test that hashes are signed like eth_account."""
+    message_hashes = [bytes([i]) * 32 for i in range(3)]
+
+    assert pool.sign_hashes(ACCOUNT.address, message_hashes) == [
+        bytes(ACCOUNT.unsafe_sign_hash(message_hash).signature) for message_hash in message_hashes
+    ]
+
+
+def test_unregistered_addresses(pool):
+    """Test that batches of unregistered addresses are rejected, and single keys signed locally."""
+    account = Account.create()
+
+    with pytest.raises(ValueError, match="is not registered"):
+        pool.sign_hashes(account.address, [b"\x00" * 32])
+
+    assert pool.sign_transaction(account, TRANSACTION) == bytes(
+        account.sign_transaction(TRANSACTION).raw_transaction
+    )
+    assert account.address not in pool.addresses
+
+
+def test_worker_errors(pool):
+    """Test that errors raised in a worker are raised to the caller."""
+    with pytest.raises(ValueError, match="message_hash must be 32 bytes long"):
+        pool.sign_hash(ACCOUNT, b"\x00")
+
+
+def test_pool_as_transaction_signer(pool, user_operation_model_factory):
+    """Test that resources sign with registered keys in the workers when the pool is the signer."""
+    model = user_operation_model_factory(signature=None)
+    default_signer = get_transaction_signer()
+    set_transaction_signer(pool)
+    try:
+        user_operation = UserOperation(model, "0xsmartwallet").sign(ACCOUNT)
+    finally:
+        set_transaction_signer(default_signer)
+
+    expected = ACCOUNT.unsafe_sign_hash(bytes.fromhex(model.user_op_hash.removeprefix("0x")))
+    assert user_operation.signature == "0x" + expected.signature.hex()
+
+
+def test_pool_signs_payloads(pool, address_model_factory):
+    """Test that payload signatures of registered keys are signed in the workers."""
+    address = WalletAddress(address_model_factory(address_id=ACCOUNT.address), ACCOUNT)
+    message_hash = "0x" + "ab" * 32
+    default_signer = get_transaction_signer()
+    set_transaction_signer(pool)
+    try:
+        with patch.object(PayloadSignature, "create") as mock_create:
+            address.sign_payload(message_hash)
+    finally:
+        set_transaction_signer(default_signer)
+
+    expected = ACCOUNT.unsafe_sign_hash(bytes.fromhex("ab" * 32)).signature
+    assert mock_create.call_args.kwargs["signature"] == "0x" + expected.hex()
+
+
+def test_register_wallet(pool):
+    """Test that the keys of the addresses of a wallet are registered."""
+    account = Account.create()
+    wallet = Mock(can_sign=True, addresses=[Mock(key=account, can_sign=True)])
+
+    assert pool.register_wallet(wallet) == [account.address]
+    assert account.address in pool.addresses
+
+    with pytest.raises(ValueError, match="Cannot register a wallet without its seed"):
+        pool.register_wallet(Mock(can_sign=False))
+
+
+def test_closed_pool():
+    """Test that a closed pool rejects requests."""
+    pool = SigningPool(max_workers=1)
+    pool.close()
+    pool.close()
+
+    with pytest.raises(RuntimeError, match="SigningPool is closed"):
+        pool.register(ACCOUNT)
+
+
+def test_worker_exit_under_load():
+    """Test that a worker exiting while the others are busy fails only its own requests."""
+    with SigningPool(max_workers=2, timeout=30) as pool:
+        pool.register(ACCOUNT)
+        stop = threading.Event()
+        errors = []
+
+        def load():
+            while not stop.is_set():
+                try:
+                    pool.sign_hashes(ACCOUNT.address, [b"\x01" * 32] * 64)
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            time.sleep(0.5)
+            worker = next(
+                process
+                for process in multiprocessing.active_children()
+                if process.name == "cdp-signing-0"
+            )
+            worker.kill()
+            worker.join(timeout=5)
+            time.sleep(0.5)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=30)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert all(
+            isinstance(error, RuntimeError) and str(error) == "Signing worker exited"
+            for error in errors
+        )
+        assert (
+            pool.sign_hashes(ACCOUNT.address, [b"\x02" * 32] * 4)
+            == [bytes(ACCOUNT.unsafe_sign_hash(b"\x02" * 32).signature)] * 4
+        )
+
+
+def test_timeout():
+    """Test that waiting for a result is bounded by the timeout."""
+    with (
+        SigningPool(max_workers=1, timeout=0) as pool,
+        pytest.raises(TimeoutError, match="Signing request timed out"),
+    ):
+        pool.register(ACCOUNT)
@@ -22,6 +22,7 @@ def test_smart_contract_properties(smart_contract_factory):
     """Test the properties of a SmartContract object."""
     smart_contract = smart_contract_factory()
     assert smart_contract.smart_contract_id == "test-contract-id"
+    assert smart_contract.terminal_state is True
     assert smart_contract.wallet_id == "test-wallet-id"
     assert smart_contract.network_id == "base-sepolia"
     assert smart_contract.contract_address == "0xcontractaddress"
@@ -45,6 +46,7 @@ def test_external_smart_contract_properties(external_smart_contract_factory):
     """Test the properties of a SmartContract object."""
     smart_contract = external_smart_contract_factory()
     assert smart_contract.smart_contract_id == "test-contract-id"
+    assert smart_contract.terminal_state is True
     assert smart_contract.network_id == "base-sepolia"
     assert smart_contract.contract_address == "0xcontractaddress"
     assert smart_contract.type.value == SmartContract.Type.CUSTOM.value
@@ -1792,3 +1794,21 @@ def _validate_smart_contract(returned_smart_contract, expected_smart_contract):
     assert returned_smart_contract.contract_name == expected_smart_contract.contract_name
     assert returned_smart_contract.abi == json.loads(expected_smart_contract.abi)
     assert returned_smart_contract.is_external == expected_smart_contract.is_external
+
+
+@patch("cdp.Cdp.api_clients")
+def test_smart_contract_list_follows_pages(mock_api_clients, smart_contract_model_factory):
+    """Test that SmartContract.list requests each page once with the next page token."""
+    mock_list_smart_contracts = Mock(
+        side_effect=[
+            Mock(data=[smart_contract_model_factory()], has_more=True, next_page="page-2"),
+            Mock(data=[smart_contract_model_factory()], has_more=False, next_page=None),
+        ]
+    )
+    mock_api_clients.smart_contracts.list_smart_contracts = mock_list_smart_contracts
+
+    smart_contracts = list(SmartContract.list())
+
+    assert len(smart_contracts) == 2
+    assert all(isinstance(s, SmartContract) for s in smart_contracts)
+    assert mock_list_smart_contracts.call_args_list == [call(page=None), call(page="page-2")]
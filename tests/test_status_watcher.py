@@ -0,0 +1,257 @@
+import contextvars
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cdp.polling_policy import NETWORK_POLLING_POLICIES, FixedPollingPolicy
+from cdp.status_watcher import StatusWatcher
+from cdp.transfer import Transfer
+
+
+class FakeResource:
+    """A pollable resource that settles after a number of reloads."""
+
+    def __init__(self, polls_until_terminal=1, error=None):
+        self.reloads = 0
+        self._polls_until_terminal = polls_until_terminal
+        self._error = error
+
+    @property
+    def terminal_state(self):
+        """Return whether the resource has settled."""
+        return self.reloads >= self._polls_until_terminal
+
+    def reload(self):
+        """Simulate reloading the resource."""
+        if self._error is not None:
+            raise self._error
+        self.reloads += 1
+
+
+def test_watch_resolves_futures():
+    """Test that watched resources resolve their futures once terminal."""
+    resources = [FakeResource(polls_until_terminal=n) for n in (1, 2, 3)]
+
+    with StatusWatcher(interval_seconds=0.01, max_interval_seconds=0.02) as watcher:
+        futures = [watcher.watch(resource) for resource in resources]
+        results = watcher.wait_all(timeout_seconds=5)
+
+    assert results == resources
+    assert [future.result() for future in futures] == resources
+    assert [resource.reloads for resource in resources] == [1, 2, 3]
+    assert watcher.pending == 0
+
+
+def test_watch_already_terminal():
+    """Test that terminal resources resolve immediately without polling."""
+    resource = FakeResource(polls_until_terminal=0)
+
+    with StatusWatcher() as watcher:
+        future = watcher.watch(resource)
+
+        assert future.done()
+        assert future.result() is resource
+        assert watcher._thread is None
+    assert resource.reloads == 0
+
+
+def test_watch_supports_terminal_state_method():
+    """Test resources that expose terminal_state as a method, like FundOperation."""
+    resource = Mock()
+    resource.terminal_state = Mock(side_effect=[False, True])
+
+    with StatusWatcher(interval_seconds=0.01) as watcher:
+        assert watcher.watch(resource).result(timeout=5) is resource
+
+    resource.reload.assert_called_once()
+
+
+def test_watch_callback():
+    """Test that callbacks are invoked with the completed future."""
+    done = threading.Event()
+    callback = Mock(side_effect=lambda future: done.set())
+
+    with StatusWatcher(interval_seconds=0.01) as watcher:
+        future = watcher.watch(FakeResource(), callback=callback)
+        assert done.wait(timeout=5)
+
+    callback.assert_called_once_with(future)
+
+
+def test_watch_timeout():
+    """Test that resources that do not settle fail with a TimeoutError."""
+    with StatusWatcher(interval_seconds=0.01) as watcher:
+        future = watcher.watch(FakeResource(polls_until_terminal=10**6), timeout_seconds=0.05)
+
+        with pytest.raises(TimeoutError, match="FakeResource"):
+            future.result(timeout=5)
+
+
+def test_watch_reload_error():
+    """Test that reload errors are set on the future."""
+    with StatusWatcher(interval_seconds=0.01) as watcher:
+        future = watcher.watch(FakeResource(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            watcher.wait_all(timeout_seconds=5)
+
+    assert isinstance(future.exception(), RuntimeError)
+
+
+def test_as_completed_yields_in_completion_order():
+    """Test that as_completed yields futures as resources settle."""
+    slow = FakeResource(polls_until_terminal=3)
+    fast = FakeResource(polls_until_terminal=1)
+
+    with StatusWatcher(interval_seconds=0.01, backoff_factor=1) as watcher:
+        watcher.watch(slow)
+        watcher.watch(fast)
+        completed = [future.result() for future in watcher.as_completed(timeout_seconds=5)]
+
+    assert completed == [fast, slow]
+
+
+def test_backoff():
+    """Test that the polling interval grows up to the maximum."""
+    watcher = StatusWatcher(interval_seconds=1, max_interval_seconds=2, backoff_factor=1.5)
+    resource = FakeResource(polls_until_terminal=10)
+
+    with patch.object(watcher, "_start"):
+        watcher.watch(resource, timeout_seconds=None)
+    watch = watcher._watches[0]
+
+    intervals = []
+    for _ in range(3):
+        assert watcher._poll(watch)
+        intervals.append(watch.interval)
+
+    assert intervals == [1.5, 2, 2]
+    watcher.close()
+
+
+def test_poll_runs_in_registering_context():
+    """Test that reloads see the context variables of the caller that registered them."""
+    client = contextvars.ContextVar("client", default=None)
+    seen = []
+
+    class ContextResource(FakeResource):
+        def reload(self):
+            """Record the bound client when reloading."""
+            seen.append(client.get())
+            super().reload()
+
+    client.set("bound-client")
+    with StatusWatcher(interval_seconds=0.01) as watcher:
+        watcher.watch(ContextResource()).result(timeout=5)
+
+    assert seen == ["bound-client"]
+
+
+def test_close_cancels_pending():
+    """Test that closing the watcher cancels pending futures and rejects new resources."""
+    watcher = StatusWatcher(interval_seconds=10, max_interval_seconds=10)
+    future = watcher.watch(FakeResource())
+
+    watcher.close()
+
+    assert future.cancelled()
+    with pytest.raises(RuntimeError, match="closed"):
+        watcher.watch(FakeResource())
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"interval_seconds": 0},
+        {"interval_seconds": 2, "max_interval_seconds": 1},
+        {"backoff_factor": 0.5},
+    ],
+    ids=str,
+)
+def test_invalid_options(kwargs):
+    """Test that invalid polling options are rejected."""
+    with pytest.raises(ValueError):
+        StatusWatcher(**kwargs)
+
+
+@patch("cdp.Cdp.api_clients")
+def test_watch_transfers(mock_api_clients, transfer_model_factory):
+    """Test watching Transfers until they land onchain."""
+    mock_api_clients.transfers.get_transfer.return_value = transfer_model_factory(status="complete")
+    transfers = [Transfer(transfer_model_factory(status="pending")) for _ in range(3)]
+
+    with StatusWatcher(interval_seconds=0.01) as watcher:
+        for transfer in transfers:
+            watcher.watch(transfer)
+        results = watcher.wait_all(timeout_seconds=5)
+
+    assert all(transfer.terminal_state for transfer in results)
+    assert mock_api_clients.transfers.get_transfer.call_count == 3
+
+
+def test_slow_reload_does_not_delay_other_resources():
+    """Test that a slow reload only delays the polls of its own resource."""
+    release = threading.Event()
+
+    class SlowResource(FakeResource):
+        def reload(self):
+            """Block until released."""
+            release.wait(timeout=5)
+            super().reload()
+
+    slow = SlowResource()
+    fast = FakeResource(polls_until_terminal=5)
+
+    with StatusWatcher(interval_seconds=0.01, backoff_factor=1) as watcher:
+        slow_future = watcher.watch(slow)
+        fast_future = watcher.watch(fast)
+
+        assert fast_future.result(timeout=2) is fast
+        assert not slow_future.done()
+        release.set()
+        assert slow_future.result(timeout=5) is slow
+
+
+def test_finished_futures_are_released():
+    """Test that futures are dropped once collected, or once done if watched with a callback."""
+    with StatusWatcher(interval_seconds=0.01) as watcher:
+        done = threading.Event()
+        watcher.watch(FakeResource(), callback=lambda future: done.set())
+        watcher.watch(FakeResource(polls_until_terminal=0), callback=Mock())
+        assert done.wait(timeout=5)
+        assert watcher._futures == []
+
+        resource = FakeResource()
+        watcher.watch(resource)
+        assert watcher.wait_all(timeout_seconds=5) == [resource]
+        assert watcher._futures == []
+        assert watcher.wait_all() == []
+
+
+def test_network_polling_policy():
+    """Test that resources are polled with the policy of their network by default."""
+    resource = FakeResource(polls_until_terminal=10)
+    resource.network_id = "ethereum-mainnet"
+    watcher = StatusWatcher()
+
+    with patch.object(watcher, "_start"):
+        watcher.watch(resource)
+
+    assert watcher._watches[0].schedule.policy is NETWORK_POLLING_POLICIES["ethereum-mainnet"]
+    watcher.close()
+
+
+def test_polling_policy_stats():
+    """Test that watched resources are counted on the stats of their polling policy."""
+    policy = FixedPollingPolicy(0.01)
+
+    with StatusWatcher(polling_policy=policy) as watcher:
+        watcher.watch(FakeResource(polls_until_terminal=3))
+        watcher.watch(FakeResource(polls_until_terminal=50), timeout_seconds=0.05)
+        with pytest.raises(TimeoutError):
+            watcher.wait_all(timeout_seconds=5)
+
+    stats = policy.stats
+    assert (stats.waits, stats.timeouts) == (2, 1)
+    assert stats.max_wait_reloads < 50
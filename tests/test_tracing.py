@@ -0,0 +1,281 @@
+import asyncio
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from urllib3 import HTTPResponse
+
+from cdp.async_cdp_api_client import AsyncCdpApiClient, AsyncRESTResponse
+from cdp.cdp import Cdp
+from cdp.cdp_api_client import CdpApiClient
+from cdp.client import rest
+from cdp.client.api.assets_api import AssetsApi
+from cdp.errors import NotFoundError
+from cdp.paginator import AsyncPaginator, Paginator
+from cdp.tracing import (
+    OpenTelemetryTraceHook,
+    TraceHook,
+    Tracer,
+    current_span,
+    defer_spans,
+    finish_spans,
+)
+
+ASSET = {"network_id": "base-sepolia", "asset_id": "eth", "decimals": 18}
+
+
+class _RecordingHook(TraceHook):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span.name)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+def _rest_response(status, body):
+    return rest.RESTResponse(
+        HTTPResponse(
+            body=json.dumps(body).encode(),
+            status=status,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+    )
+
+
+def test_tracer_reports_spans_to_hooks():
+    """Test that hooks see the start and end of a span with its phases."""
+    hook = _RecordingHook()
+    tracer = Tracer([hook])
+
+    span = tracer.start_span("GET /v1/assets", {"cdp.endpoint": "/v1/assets"})
+    assert current_span() is span
+    with span.phase("network"):
+        pass
+    span.add_phase("network", 0.5)
+    tracer.end_span(span)
+
+    assert hook.started == ["GET /v1/assets"]
+    assert hook.ended == [span]
+    assert span.ended
+    assert span.phases["network"] >= 0.5
+    assert span.duration >= 0
+    assert current_span() is None
+
+
+def test_tracer_ends_stale_span():
+    """Test that a span left open by a call that was never deserialized ends with the next one."""
+    hook = _RecordingHook()
+    tracer = Tracer([hook])
+
+    stale = tracer.start_span("GET /v1/assets", {})
+    span = tracer.start_span("GET /v1/wallets", {})
+
+    assert hook.ended == [stale]
+    tracer.end_span(span)
+
+
+def test_deferred_spans_record_wrap_time():
+    """Test that deferred spans end with the time spent building SDK objects."""
+    hook = _RecordingHook()
+    tracer = Tracer([hook])
+
+    with defer_spans() as spans:
+        tracer.end_span(tracer.start_span("GET /v1/assets", {}))
+
+    assert hook.ended == []
+    finish_spans(spans, wrap_seconds=0.25)
+
+    assert [span.phases["wrap"] for span in hook.ended] == [0.25]
+
+
+def test_deferred_spans_end_failed_calls_immediately():
+    """Test that the span of a failed call is not held back for the wrap."""
+    hook = _RecordingHook()
+    tracer = Tracer([hook])
+
+    with defer_spans() as spans:
+        tracer.end_span(tracer.start_span("GET /v1/assets", {}), ValueError("boom"))
+
+    assert spans == []
+    assert isinstance(hook.ended[0].error, ValueError)
+
+
+def test_cdp_api_client_traces_calls(dummy_key_factory):
+    """Test that an API call is reported with its phases, endpoint, status and priority."""
+    hook = _RecordingHook()
+    client = CdpApiClient("test-api-key", dummy_key_factory(), trace_hooks=[hook])
+
+    with patch.object(client.rest_client, "request", return_value=_rest_response(200, ASSET)):
+        asset = AssetsApi(client).get_asset("base-sepolia", "eth")
+
+    assert asset.asset_id == "eth"
+    assert hook.started == ["GET /v1/networks/{network_id}/assets/{asset_id}"]
+    [span] = hook.ended
+    assert set(span.phases) == {"serialize", "queue", "sign", "network", "deserialize"}
+    assert span.attributes == {
+        "http.method": "GET",
+        "cdp.endpoint": "/v1/networks/{network_id}/assets/{asset_id}",
+        "cdp.priority": "NORMAL",
+        "http.status_code": 200,
+        "cdp.retry_count": 0,
+    }
+    assert span.error is None
+
+
+def test_cdp_api_client_traces_api_errors(dummy_key_factory):
+    """Test that failed calls are reported with their error code and correlation id."""
+    hook = _RecordingHook()
+    client = CdpApiClient("test-api-key", dummy_key_factory(), trace_hooks=[hook])
+    error = {"code": "not_found", "message": "asset not found", "correlation_id": "abc-123"}
+
+    with (
+        patch.object(client.rest_client, "request", return_value=_rest_response(404, error)),
+        pytest.raises(NotFoundError),
+    ):
+        AssetsApi(client).get_asset("base-sepolia", "doge")
+
+    [span] = hook.ended
+    assert span.attributes["http.status_code"] == 404
+    assert span.attributes["cdp.error_code"] == "not_found"
+    assert span.attributes["cdp.correlation_id"] == "abc-123"
+    assert isinstance(span.error, NotFoundError)
+
+
+def test_cdp_api_client_traces_network_failures(dummy_key_factory):
+    """Test that calls failing before a response is received end their span."""
+    hook = _RecordingHook()
+    client = CdpApiClient("test-api-key", dummy_key_factory(), trace_hooks=[hook])
+
+    with (
+        patch.object(client.rest_client, "request", side_effect=ConnectionError("reset")),
+        pytest.raises(ConnectionError),
+    ):
+        AssetsApi(client).get_asset("base-sepolia", "eth")
+
+    [span] = hook.ended
+    assert isinstance(span.error, ConnectionError)
+    assert current_span() is None
+
+
+def test_cdp_api_client_without_tracing(dummy_key_factory):
+    """Test that no spans are created when tracing is disabled."""
+    client = CdpApiClient("test-api-key", dummy_key_factory())
+
+    with patch.object(client.rest_client, "request", return_value=_rest_response(200, ASSET)):
+        AssetsApi(client).get_asset("base-sepolia", "eth")
+
+    assert client.tracer is None
+    assert current_span() is None
+
+
+def test_async_cdp_api_client_traces_calls(dummy_key_factory):
+    """Test that async calls are reported once, with the retries of the transport."""
+    hook = _RecordingHook()
+    client = AsyncCdpApiClient("test-api-key", dummy_key_factory(), trace_hooks=[hook])
+    response = AsyncRESTResponse(
+        200, "OK", {"Content-Type": "application/json"}, json.dumps(ASSET).encode()
+    )
+    response.retries = 2
+
+    async def send(method, url, header_params, data, timeout):
+        return response
+
+    with patch.object(client, "_send_async", send):
+        asset = asyncio.run(client.request(AssetsApi, "get_asset", "base-sepolia", "eth"))
+
+    assert asset.asset_id == "eth"
+    [span] = hook.ended
+    assert hook.started == [span.name]
+    assert span.attributes["cdp.retry_count"] == 2
+    assert span.attributes["http.status_code"] == 200
+    assert {"serialize", "sign", "network", "deserialize"} <= set(span.phases)
+
+
+def test_paginator_records_wrap_phase():
+    """Test that the spans of page fetches include the time spent building the items."""
+    hook = _RecordingHook()
+    tracer = Tracer([hook])
+
+    def fetch_page(page, limit):
+        tracer.end_span(tracer.start_span("GET /v1/assets", {}))
+        return Mock(data=[1, 2], has_more=page is None, next_page="2")
+
+    items = Paginator(fetch_page, str, page_size=2)
+
+    assert next(items) == "1"
+    assert len(hook.ended) == 1
+    assert list(items) == ["2", "1", "2"]
+    assert len(hook.ended) == 2
+    assert all("wrap" in span.phases for span in hook.ended)
+
+
+def test_paginator_spans_exclude_consumer_time():
+    """Test that the spans of page fetches do not include the time the consumer spends."""
+    hook = _RecordingHook()
+    tracer = Tracer([hook])
+
+    def fetch_page(page, limit):
+        tracer.end_span(tracer.start_span("GET /v1/assets", {}))
+        return Mock(data=[1, 2], has_more=False, next_page=None)
+
+    items = Paginator(fetch_page, str, page_size=2)
+    for _ in items:
+        time.sleep(0.1)
+
+    assert len(hook.ended) == 1
+    assert hook.ended[0].duration < 0.1
+
+
+def test_async_paginator_spans_exclude_consumer_time():
+    """Test that the spans of async page fetches do not include the time the consumer spends."""
+    hook = _RecordingHook()
+    tracer = Tracer([hook])
+
+    async def fetch_page(page, limit):
+        tracer.end_span(tracer.start_span("GET /v1/assets", {}))
+        return Mock(data=[1, 2], has_more=False, next_page=None)
+
+    async def consume():
+        async for _ in AsyncPaginator(fetch_page, str, page_size=2):
+            await asyncio.sleep(0.1)
+
+    asyncio.run(consume())
+
+    assert len(hook.ended) == 1
+    assert hook.ended[0].duration < 0.1
+
+
+def test_open_telemetry_trace_hook():
+    """Test that spans are exported with their attributes and phases."""
+    otel_tracer = Mock()
+    hook = OpenTelemetryTraceHook(otel_tracer)
+    tracer = Tracer([hook])
+
+    span = tracer.start_span("GET /v1/assets", {"http.status_code": 200})
+    span.add_phase("network", 0.1)
+    tracer.end_span(span, ValueError("boom"))
+
+    otel_tracer.start_span.assert_called_once_with(
+        "GET /v1/assets",
+        attributes={"http.status_code": 200, "cdp.phase.network": 0.1},
+        start_time=span.start_time_ns,
+    )
+    otel_span = otel_tracer.start_span.return_value
+    otel_span.record_exception.assert_called_once_with(span.error)
+    otel_span.end.assert_called_once()
+
+
+def test_cdp_configure_trace_hooks():
+    """Test that Cdp.configure enables tracing."""
+    hook = TraceHook()
+    Cdp.configure(api_key_name="test", private_key="test", trace_hooks=[hook])
+    assert Cdp.api_clients.cdp_client.tracer is not None
+
+    Cdp.configure(api_key_name="test", private_key="test")
+    assert Cdp.api_clients.cdp_client.tracer is None
@@ -20,6 +20,7 @@ def test_trade_properties(trade_factory):
     """Test the properties of a Trade object."""
     trade = trade_factory()
     assert trade.trade_id == "test-trade-id"
+    assert trade.terminal_state is True
     assert trade.network_id == "base-sepolia"
     assert trade.wallet_id == "test-wallet-id"
     assert trade.address_id == "0xaddressid"
@@ -0,0 +1,166 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+
+from cdp.client.models.transaction import Transaction as TransactionModel
+from cdp.transaction import Transaction
+from cdp.transaction_signer import (
+    CoincurveTransactionSigner,
+    EthAccountTransactionSigner,
+    TransactionSigner,
+    _rlp_encode,
+    get_transaction_signer,
+    set_transaction_signer,
+)
+
+ACCOUNT = Account.from_key("0x" + "4c" * 32)
+
+TRANSACTIONS = [
+    {
+        "chainId": 84532,
+        "nonce": 0,
+        "maxPriorityFeePerGas": 10**6,
+        "maxFeePerGas": 10**9,
+        "gas": 21000,
+        "value": 10**15,
+        "data": "0x",
+        "type": "0x2",
+        "to": bytes.fromhex("22" * 20),
+    },
+    {
+        "chainId": 8453,
+        "nonce": 2**40,
+        "maxPriorityFeePerGas": 0,
+        "maxFeePerGas": 2**255,
+        "gas": 3_000_000,
+        "value": 0,
+        "data": "0x" + "a9059cbb" + "00" * 200,
+        "type": 2,
+        "to": b"",
+    },
+    {
+        "chainId": 1,
+        "nonce": 127,
+        "maxPriorityFeePerGas": 128,
+        "maxFeePerGas": 10**12,
+        "gas": 60000,
+        "value": 1,
+        "data": bytes.fromhex("7f"),
+        "type": "0x2",
+        "to": "0x" + "33" * 20,
+        "accessList": [
+            {
+                "address": "0x" + "44" * 20,
+                "storageKeys": ["0x" + "00" * 31 + "01", "0x" + "ff" * 32],
+            }
+        ],
+    },
+]
+
+
+@pytest.mark.parametrize("transaction", TRANSACTIONS)
+def test_sign_transaction_matches_eth_account(transaction):
+    """Test that the coincurve signer builds the same envelope as eth_account."""
+    expected = bytes(ACCOUNT.sign_transaction(transaction).raw_transaction)
+
+    assert CoincurveTransactionSigner().sign_transaction(ACCOUNT, transaction) == expected
+    assert EthAccountTransactionSigner().sign_transaction(ACCOUNT, transaction) == expected
+
+
+@pytest.mark.parametrize("account", [ACCOUNT, Account.create(), Account.create()])
+def test_sign_hash_matches_eth_account(account):
+    """Test that the coincurve signer signs hashes like eth_account."""
+    message_hash = bytes(range(32))
+    expected = bytes(account.unsafe_sign_hash(message_hash).signature)
+
+    assert CoincurveTransactionSigner().sign_hash(account, message_hash) == expected
+    with pytest.raises(ValueError, match="message_hash must be 32 bytes long"):
+        CoincurveTransactionSigner().sign_hash(account, b"\x00" * 31)
+
+
+def test_unsupported_transaction_type():
+    """Test that only EIP-1559 transactions are signed directly."""
+    with pytest.raises(ValueError, match="Unsupported transaction type: 1"):
+        CoincurveTransactionSigner().sign_transaction(ACCOUNT, {**TRANSACTIONS[0], "type": 1})
+
+
+def test_other_accounts_sign_with_their_own_methods():
+    """Test that accounts other than plain LocalAccounts are not signed directly."""
+    key = Mock(spec=LocalAccount)
+    key.sign_transaction.return_value.raw_transaction = b"\x02signed"
+    key.unsafe_sign_hash.return_value.signature = b"\x01" * 65
+    signer = CoincurveTransactionSigner()
+
+    assert signer.sign_transaction(key, TRANSACTIONS[0]) == b"\x02signed"
+    assert signer.sign_hash(key, b"\x00" * 32) == b"\x01" * 65
+    key.sign_transaction.assert_called_once_with(TRANSACTIONS[0])
+
+
+@pytest.mark.parametrize(
+    "item, expected",
+    [
+        (0, "80"),
+        (127, "7f"),
+        (128, "8180"),
+        (b"", "80"),
+        (b"\x00", "00"),
+        ([], "c0"),
+        (b"a" * 56, "b838" + "61" * 56),
+        ([[], [[]]], "c3c0c1c0"),
+    ],
+)
+def test_rlp_encode(item, expected):
+    """Test the RLP encoding of integers, byte strings and lists."""
+    assert _rlp_encode(item).hex() == expected
+
+
+@pytest.mark.parametrize("signer", [CoincurveTransactionSigner(), EthAccountTransactionSigner()])
+def test_transaction_sign(signer):
+    """Test that transactions sign with the configured signer, and decode the signed payload."""
+    payload = {
+        "chainId": hex(84532),
+        "nonce": hex(7),
+        "maxPriorityFeePerGas": hex(10**6),
+        "maxFeePerGas": hex(10**9),
+        "gas": hex(21000),
+        "value": hex(10**15),
+        "input": "0x",
+        "to": "0x" + "22" * 20,
+    }
+    model = TransactionModel(
+        network_id="base-sepolia",
+        from_address_id=ACCOUNT.address,
+        unsigned_payload=json.dumps(payload).encode().hex(),
+        status="pending",
+    )
+    expected = ACCOUNT.sign_transaction(Transaction(model).raw.as_dict())
+    default_signer = get_transaction_signer()
+    set_transaction_signer(signer)
+    try:
+        transaction = Transaction(model)
+        signature = transaction.sign(ACCOUNT)
+    finally:
+        set_transaction_signer(default_signer)
+
+    assert signature == expected.raw_transaction.hex()
+    assert transaction.raw.as_dict()["nonce"] == 7
+    assert transaction.raw.vrs() == (expected.v, expected.r, expected.s)
+
+
+def test_default_signer():
+    """Test that transactions are signed with coincurve by default."""
+    assert isinstance(get_transaction_signer(), CoincurveTransactionSigner)
+
+
+def test_incomplete_signer():
+    """Test that signers must implement both signing methods."""
+
+    class HashOnlySigner(TransactionSigner):
+        def sign_hash(self, key, message_hash):
+            return b""
+
+    with pytest.raises(TypeError):
+        HashOnlySigner()
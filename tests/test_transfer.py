@@ -6,6 +6,11 @@ from eth_account.signers.local import LocalAccount
 
 from cdp.asset import Asset
 from cdp.errors import TransactionNotSignedError
+from cdp.polling_policy import (
+    NETWORK_POLLING_POLICIES,
+    ExponentialPollingPolicy,
+    FixedPollingPolicy,
+)
 from cdp.sponsored_send import SponsoredSend
 from cdp.transaction import Transaction
 from cdp.transfer import Transfer
@@ -86,6 +91,28 @@ def test_create_transfer(mock_asset, mock_api_clients, transfer_factory, asset_f
     assert create_transfer_request.gasless == gasless
 
 
+@patch("cdp.Cdp.api_clients")
+def test_create_transfer_with_asset(mock_api_clients, transfer_factory, asset_factory):
+    """Test that a provided asset is used instead of fetching it."""
+    mock_api_clients.transfers.create_transfer.return_value = transfer_factory()._model
+
+    Transfer.create(
+        address_id="0xaddressid",
+        amount=Decimal("1"),
+        asset_id="usdc",
+        destination="0xdestination",
+        network_id="base-sepolia",
+        wallet_id="test-wallet-id",
+        asset=asset_factory(asset_id="usdc", decimals=6),
+    )
+
+    mock_api_clients.assets.get_asset.assert_not_called()
+    create_transfer_request = mock_api_clients.transfers.create_transfer.call_args[1][
+        "create_transfer_request"
+    ]
+    assert create_transfer_request.amount == "1000000"
+
+
 @patch("cdp.Cdp.api_clients")
 @patch("cdp.transfer.Asset")
 def test_create_transfer_with_skip_batching(
@@ -274,6 +301,52 @@ def test_wait_for_transfer_timeout(
     assert mock_time.call_count == 6
 
 
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.transfer.time.sleep")
+@patch("cdp.transfer.time.time")
+def test_wait_for_transfer_with_polling_policy(
+    mock_time, mock_sleep, mock_api_clients, transfer_factory
+):
+    """Test that wait sleeps according to the given polling policy and records its reloads."""
+    pending_transfer = transfer_factory(status="pending")
+    complete_transfer = transfer_factory(status="complete")
+    mock_api_clients.transfers.get_transfer.side_effect = [
+        pending_transfer._model,
+        pending_transfer._model,
+        complete_transfer._model,
+    ]
+    mock_time.side_effect = [0, 0.1, 0.3, 0.7]
+    policy = ExponentialPollingPolicy(initial_seconds=0.1, max_seconds=1, multiplier=2)
+
+    pending_transfer.wait(timeout_seconds=1, polling_policy=policy)
+
+    assert mock_sleep.call_args_list == [call(0.1), call(0.2), call(0.4)]
+    assert policy.stats.waits == 1
+    assert policy.stats.last_wait_reloads == 3
+    assert policy.stats.timeouts == 0
+
+
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.transfer.time.sleep")
+@patch("cdp.transfer.time.time")
+def test_wait_for_transfer_uses_network_polling_policy(
+    mock_time, mock_sleep, mock_api_clients, transfer_factory
+):
+    """Test that wait uses the default polling policy of the transfer's network."""
+    pending_transfer = transfer_factory(status="pending")
+    mock_api_clients.transfers.get_transfer.return_value = transfer_factory(
+        status="complete"
+    )._model
+    mock_time.side_effect = [0, 0.1]
+    policy = FixedPollingPolicy(0.7)
+
+    with patch.dict(NETWORK_POLLING_POLICIES, {pending_transfer.network_id: policy}):
+        pending_transfer.wait()
+
+    mock_sleep.assert_called_once_with(0.7)
+    assert policy.stats.reloads == 1
+
+
 @pytest.mark.parametrize("gasless", [True, False])
 def test_transfer_str_representation(transfer_factory, gasless):
     """Test the string representation of a Transfer object."""
@@ -11,18 +11,20 @@ from cdp.client.models.create_wallet_webhook_request import CreateWalletWebhookR
 from cdp.contract_invocation import ContractInvocation
 from cdp.fund_operation import FundOperation
 from cdp.fund_quote import FundQuote
+from cdp.hd_derivation import derive_private_keys
 from cdp.payload_signature import PayloadSignature
 from cdp.smart_contract import SmartContract
 from cdp.trade import Trade
 from cdp.transfer import Transfer
 from cdp.wallet import Wallet
 from cdp.wallet_address import WalletAddress
+from cdp.wallet_summary import WalletSummary
 from cdp.webhook import Webhook
 
 
 @patch("cdp.Cdp.use_server_signer", False)
 @patch("cdp.wallet.os")
-@patch("cdp.wallet.Bip32Slip10Secp256k1")
+@patch("bip_utils.Bip32Slip10Secp256k1")
 def test_wallet_initialization(mock_bip32, mock_os, wallet_factory, master_key_factory):
     """Test Wallet initialization."""
     seed = b"\x00" * 64
@@ -34,11 +36,76 @@ def test_wallet_initialization(mock_bip32, mock_os, wallet_factory, master_key_f
     wallet = wallet_factory()
 
     mock_urandom.assert_called_once_with(64)
-    mock_from_seed.assert_called_once_with(seed)
     assert wallet.id == "test-wallet-id"
     assert wallet.network_id == "base-sepolia"
     assert wallet._seed == seed.hex()
     assert wallet.can_sign
+    mock_from_seed.assert_not_called()
+
+    wallet._derive_key(0)
+    wallet._derive_key(1)
+
+    mock_from_seed.assert_called_once_with(seed)
+
+
+@patch("cdp.Cdp.use_server_signer", False)
+@patch("bip_utils.Bip32Slip10Secp256k1")
+def test_wallet_initialization_with_invalid_seed(mock_bip32, wallet_factory):
+    """Test that an invalid seed is rejected without deriving the master node."""
+    with pytest.raises(ValueError, match="Seed must be 32 or 64 bytes"):
+        wallet_factory(seed="00" * 16)
+
+    mock_bip32.FromSeed.assert_not_called()
+
+
+@patch("cdp.Cdp.use_server_signer", False)
+def test_wallet_derive_key_caches_account_node(wallet_factory):
+    """Test that address keys are derived from a cached account node."""
+    seed = "01" * 64
+    wallet = wallet_factory(seed=seed)
+
+    with patch.object(wallet._master, "DerivePath", wraps=wallet._master.DerivePath) as derive:
+        keys = [wallet._derive_key(index).PrivateKey().Raw().ToHex() for index in range(3)]
+
+    derive.assert_called_once_with("m/44'/60'/0'/0")
+    assert keys == derive_private_keys(seed, range(3))
+
+
+@patch("cdp.Cdp.use_server_signer", False)
+@patch("cdp.Cdp.api_clients")
+def test_wallet_import_wallets(mock_api_clients, wallet_model_factory, address_model_factory):
+    """Test importing many wallets with keys derived together."""
+    seeds = {"wallet-1": "01" * 64, "wallet-2": "02" * 64}
+    address_models = {
+        wallet_id: [
+            address_model_factory(
+                wallet_id=wallet_id,
+                address_id=Account.from_key(key).address,
+                index=index,
+            )
+            for index, key in enumerate(derive_private_keys(seed, range(2)))
+        ]
+        for wallet_id, seed in seeds.items()
+    }
+    mock_api_clients.wallets.get_wallet.side_effect = lambda wallet_id: wallet_model_factory(
+        id=wallet_id
+    )
+    mock_api_clients.addresses.list_addresses.side_effect = lambda wallet_id, limit: Mock(
+        data=address_models[wallet_id]
+    )
+
+    wallets = Wallet.import_wallets(
+        [WalletData(wallet_id, seed) for wallet_id, seed in seeds.items()], max_workers=1
+    )
+
+    assert [wallet.id for wallet in wallets] == ["wallet-1", "wallet-2"]
+    for wallet in wallets:
+        assert wallet.can_sign
+        assert [address.address_id for address in wallet.addresses] == [
+            model.address_id for model in address_models[wallet.id]
+        ]
+        assert all(address.can_sign for address in wallet.addresses)
+        assert wallet._private_keys == {}
 
 
 @patch("cdp.Cdp.use_server_signer", True)
@@ -55,10 +122,10 @@ def test_wallet_initialization_with_server_signer(wallet_factory):
 
 @patch("cdp.Cdp.use_server_signer", False)
 @patch("cdp.Cdp.api_clients")
-@patch("cdp.wallet.Bip32Slip10Secp256k1")
-@patch("cdp.wallet.Account")
+@patch("bip_utils.Bip32Slip10Secp256k1")
+@patch("eth_account.Account")
 @patch("cdp.wallet.os")
-@patch("cdp.wallet.coincurve.PrivateKey")
+@patch("coincurve.PrivateKey")
 def test_wallet_create(
     mock_coincurve_private_key,
     mock_os,
@@ -91,7 +158,7 @@ def test_wallet_create(
     mock_from_key = Mock(return_value=mock_account_instance)
     mock_account.from_key = mock_from_key
 
-    mock_derive_path = Mock(
+    mock_child_key = Mock(
         return_value=Mock(
             PrivateKey=Mock(
                 return_value=Mock(
@@ -112,6 +179,7 @@ def test_wallet_create(
             ),
         )
     )
+    mock_derive_path = Mock(return_value=Mock(ChildKey=mock_child_key))
     mock_master_key.DerivePath = mock_derive_path
 
     # Mock for coincurve.PrivateKey
@@ -132,7 +200,8 @@ def test_wallet_create(
 
     mock_urandom.assert_called_once_with(64)
     mock_from_seed.assert_called_once_with(seed)
-    mock_derive_path.assert_has_calls([call("m/44'/60'/0'/0/0"), call("m/44'/60'/0'/0/0")])
+    mock_derive_path.assert_called_once_with("m/44'/60'/0'/0")
+    mock_child_key.assert_has_calls([call(0), call(0)])
     mock_from_key.assert_called_once_with("mock_private_key_hex")
 
     # Check that coincurve.PrivateKey was called correctly
@@ -227,7 +296,7 @@ def test_wallet_trade_with_server_signer(wallet_factory):
         trade = wallet.trade(amount=Decimal("1.0"), from_asset_id="eth", to_asset_id="usdc")
 
         assert isinstance(trade, Trade)
-        mock_default_address.trade.assert_called_once_with(Decimal("1.0"), "eth", "usdc")
+        mock_default_address.trade.assert_called_once_with(Decimal("1.0"), "eth", "usdc", False)
 
 
 @patch("cdp.Cdp.use_server_signer", True)
@@ -263,10 +332,34 @@ def test_wallet_transfer_with_server_signer(wallet_factory):
 
         assert isinstance(transfer, Transfer)
         mock_default_address.transfer.assert_called_once_with(
-            Decimal("1.0"), "eth", "0xdestination", False, False
+            Decimal("1.0"), "eth", "0xdestination", False, False, False
         )
 
 
+@patch("cdp.Cdp.use_server_signer", True)
+def test_wallet_batch_transfer(wallet_factory):
+    """Test that batch transfers are sent from the default address."""
+    wallet = wallet_factory()
+    mock_default_address = Mock(spec=WalletAddress)
+
+    with patch.object(
+        Wallet, "default_address", new_callable=PropertyMock
+    ) as mock_default_address_prop:
+        mock_default_address_prop.return_value = mock_default_address
+
+        report = wallet.batch_transfer([(1, "usdc", "0xa")], max_workers=4)
+
+    assert report is mock_default_address.batch_transfer.return_value
+    mock_default_address.batch_transfer.assert_called_once_with(
+        [(1, "usdc", "0xa")],
+        gasless=False,
+        skip_batching=False,
+        skip_balance_check=False,
+        max_workers=4,
+        on_result=None,
+    )
+
+
 @patch("cdp.Cdp.use_server_signer", True)
 def test_wallet_transfer_no_default_address(wallet_factory):
     """Test the transfer method of a Wallet with no default address."""
@@ -396,6 +489,8 @@ def test_wallet_fetch(mock_api_clients, wallet_factory):
     assert isinstance(fetched_wallet, Wallet)
     assert fetched_wallet.id == "fetched-wallet-id"
     mock_get_wallet.assert_called_once_with("fetched-wallet-id")
+    assert not fetched_wallet.can_sign
+    assert fetched_wallet._master is None
 
 
 @patch("cdp.Cdp.use_server_signer", True)
@@ -734,7 +829,7 @@ def test_wallet_quote_fund_no_default_address(wallet_factory):
 
 @patch("cdp.Cdp.use_server_signer", False)
 @patch("cdp.wallet.os")
-@patch("cdp.wallet.Bip32Slip10Secp256k1")
+@patch("bip_utils.Bip32Slip10Secp256k1")
 def test_wallet_export_data(mock_bip32, mock_os, wallet_factory, master_key_factory):
     """Test Wallet export_data method."""
     seed = b"\x00" * 64
@@ -754,7 +849,7 @@ def test_wallet_export_data(mock_bip32, mock_os, wallet_factory, master_key_fact
 
 @patch("cdp.Cdp.use_server_signer", False)
 @patch("cdp.Cdp.api_clients")
-@patch("cdp.wallet.Account")
+@patch("eth_account.Account")
 def test_wallet_import_from_mnemonic_seed_phrase(
     mock_account,
     mock_api_clients,
@@ -816,7 +911,7 @@ def test_wallet_import_from_mnemonic_seed_phrase(
 
 @patch("cdp.Cdp.use_server_signer", False)
 @patch("cdp.Cdp.api_clients")
-@patch("cdp.wallet.Account")
+@patch("eth_account.Account")
 def test_wallet_import_from_mnemonic_seed_phrase_specified_network_id(
     mock_account,
     mock_api_clients,
@@ -894,7 +989,7 @@ def test_wallet_import_from_mnemonic_invalid_phrase():
 
 @patch("cdp.Cdp.use_server_signer", False)
 @patch("cdp.Cdp.api_clients")
-@patch("cdp.wallet.Account")
+@patch("eth_account.Account")
 def test_wallet_import_wallet_data(
     mock_account,
     mock_api_clients,
@@ -973,3 +1068,49 @@ def test_wallet_import_wallet_data(
     assert addresses[0]._model.public_key == second_public_key
     assert addresses[1].address_id == first_address
     assert addresses[1]._model.public_key == first_public_key
+
+
+@patch("cdp.Cdp.use_server_signer", True)
+@patch("cdp.Cdp.api_clients")
+def test_wallet_list_follows_pages(mock_api_clients, wallet_model_factory):
+    """Test that Wallet.list requests each page once with the next page token."""
+    mock_list_wallets = Mock(
+        side_effect=[
+            Mock(data=[wallet_model_factory(id="wallet-1")], has_more=True, next_page="page-2"),
+            Mock(data=[wallet_model_factory(id="wallet-2")], has_more=False, next_page=None),
+        ]
+    )
+    mock_api_clients.wallets.list_wallets = mock_list_wallets
+
+    wallets = list(Wallet.list())
+
+    assert [wallet.id for wallet in wallets] == ["wallet-1", "wallet-2"]
+    assert mock_list_wallets.call_args_list == [
+        call(limit=100, page=None),
+        call(limit=100, page="page-2"),
+    ]
+
+
+@patch("cdp.Cdp.api_clients")
+def test_wallet_list_lightweight(mock_api_clients, wallet_model_factory, address_model_factory):
+    """Test that Wallet.list yields wallet summaries in lightweight mode."""
+    mock_api_clients.wallets.list_wallets.return_value = Mock(
+        data=[
+            wallet_model_factory(
+                id="wallet-1", default_address=address_model_factory(address_id="0xdefault")
+            )
+        ],
+        has_more=False,
+        next_page=None,
+    )
+
+    summaries = list(Wallet.list(lightweight=True))
+
+    assert summaries == [
+        WalletSummary(
+            id="wallet-1",
+            network_id="base-sepolia",
+            server_signer_status="active_seed",
+            default_address_id="0xdefault",
+        )
+    ]
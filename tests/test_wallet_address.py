@@ -1,3 +1,4 @@
+import threading
 from decimal import Decimal
 from unittest.mock import Mock, patch
 
@@ -137,6 +138,7 @@ def test_transfer_with_server_signer(
         wallet_id=wallet_address.wallet_id,
         gasless=False,
         skip_batching=False,
+        asset=None,
     )
     mock_transfer_instance.sign.assert_not_called()
     mock_transfer_instance.broadcast.assert_not_called()
@@ -178,6 +180,7 @@ def test_transfer(mock_api_clients, mock_transfer, wallet_address_factory, balan
         wallet_id=wallet_address_with_key.wallet_id,
         gasless=False,
         skip_batching=False,
+        asset=None,
     )
     mock_transfer_instance.sign.assert_called_once_with(wallet_address_with_key.key)
     mock_transfer_instance.broadcast.assert_called_once()
@@ -218,6 +221,7 @@ def test_transfer_create_api_error(
         wallet_id=wallet_address_with_key.wallet_id,
         gasless=False,
         skip_batching=False,
+        asset=None,
     )
 
 
@@ -258,6 +262,7 @@ def test_transfer_broadcast_api_error(
         wallet_id=wallet_address_with_key.wallet_id,
         gasless=False,
         skip_batching=False,
+        asset=None,
     )
     mock_transfer_instance.sign.assert_called_once_with(wallet_address_with_key.key)
     mock_transfer_instance.broadcast.assert_called_once()
@@ -613,7 +618,7 @@ def test_sign_payload_with_server_signer(mock_payload_signature, wallet_address_
     )
 
 
-@patch("cdp.wallet_address.to_hex", Mock(return_value="0xsignature"))
+@patch("eth_utils.to_hex", Mock(return_value="0xsignature"))
 @patch("cdp.wallet_address.PayloadSignature")
 @patch("cdp.Cdp.use_server_signer", False)
 def test_sign_payload(mock_payload_signature, wallet_address_factory):
@@ -624,7 +629,7 @@ def test_sign_payload(mock_payload_signature, wallet_address_factory):
     mock_payload_signature.create.return_value = mock_payload_signature_instance
 
     mock_signature = Mock(spec=SignedMessage)
-    mock_signature.signature = "0xsignature"
+    mock_signature.signature = b"\x01" * 65
     wallet_address_with_key.key.unsafe_sign_hash.return_value = mock_signature
 
     message_encoded = encode_defunct(text="eip-191 message")
@@ -644,7 +649,7 @@ def test_sign_payload(mock_payload_signature, wallet_address_factory):
     )
 
 
-@patch("cdp.wallet_address.to_hex", Mock(return_value="0xsignature"))
+@patch("eth_utils.to_hex", Mock(return_value="0xsignature"))
 @patch("cdp.wallet_address.PayloadSignature")
 @patch("cdp.Cdp.use_server_signer", False)
 def test_sign_payload_api_error(mock_payload_signature, wallet_address_factory):
@@ -652,7 +657,7 @@ def test_sign_payload_api_error(mock_payload_signature, wallet_address_factory):
     wallet_address_with_key = wallet_address_factory(key=True)
 
     mock_signature = Mock(spec=SignedMessage)
-    mock_signature.signature = "0xsignature"
+    mock_signature.signature = b"\x01" * 65
     wallet_address_with_key.key.unsafe_sign_hash.return_value = mock_signature
 
     message_encoded = encode_defunct(text="eip-191 message")
@@ -675,10 +680,10 @@ def test_sign_payload_api_error(mock_payload_signature, wallet_address_factory):
 
 
 @patch("cdp.Cdp.api_clients")
-def test_ensure_sufficient_balance_sufficient(
+def test_reserve_balance_sufficient(
     mock_api_clients, wallet_address_factory, balance_model_factory
 ):
-    """Test the ensure_sufficient_balance method with sufficient balance."""
+    """Test the reserve_balance method with sufficient balance."""
     wallet_address = wallet_address_factory()
     balance_model = balance_model_factory(
         amount="5000000000000000000", network_id="base-sepolia", asset_id="eth", decimals=18
@@ -688,7 +693,7 @@ def test_ensure_sufficient_balance_sufficient(
     mock_get_balance.return_value = balance_model
     mock_api_clients.external_addresses.get_external_address_balance = mock_get_balance
 
-    wallet_address._ensure_sufficient_balance(Decimal("1.5"), "eth")
+    wallet_address._reserve_balance(Decimal("1.5"), "eth")
 
     mock_get_balance.assert_called_once_with(
         network_id=wallet_address.network_id, address_id=wallet_address.address_id, asset_id="eth"
@@ -696,10 +701,10 @@ def test_ensure_sufficient_balance_sufficient(
 
 
 @patch("cdp.Cdp.api_clients")
-def test_ensure_sufficient_balance_insufficient(
+def test_reserve_balance_insufficient(
     mock_api_clients, wallet_address_factory, balance_model_factory
 ):
-    """Test the ensure_sufficient_balance method with insufficient balance."""
+    """Test the reserve_balance method with insufficient balance."""
     wallet_address = wallet_address_factory()
     balance_model = balance_model_factory(
         amount="5000000000000000000", network_id="base-sepolia", asset_id="eth", decimals=18
@@ -710,13 +715,304 @@ def test_ensure_sufficient_balance_insufficient(
     mock_api_clients.external_addresses.get_external_address_balance = mock_get_balance
 
     with pytest.raises(InsufficientFundsError):
-        wallet_address._ensure_sufficient_balance(Decimal("100.0"), "eth")
+        wallet_address._reserve_balance(Decimal("100.0"), "eth")
 
     mock_get_balance.assert_called_once_with(
         network_id=wallet_address.network_id, address_id=wallet_address.address_id, asset_id="eth"
     )
 
 
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_transfer_skip_balance_check(mock_api_clients, mock_transfer, wallet_address_factory):
+    """Test that the balance is not fetched when skipping the balance check."""
+    wallet_address = wallet_address_factory()
+    mock_transfer.create.return_value = Mock(spec=Transfer)
+
+    wallet_address.transfer(
+        amount="1.0", asset_id="eth", destination="0xdestination", skip_balance_check=True
+    )
+
+    mock_api_clients.external_addresses.get_external_address_balance.assert_not_called()
+    mock_transfer.create.assert_called_once()
+
+
+@patch("cdp.wallet_address.Trade")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_trade_skip_balance_check(mock_api_clients, mock_trade, wallet_address_factory):
+    """Test that the balance is not fetched when skipping the balance check of a trade."""
+    wallet_address = wallet_address_factory()
+    mock_trade.create.return_value = Mock(spec=Trade)
+
+    wallet_address.trade(
+        amount="1.0", from_asset_id="eth", to_asset_id="usdc", skip_balance_check=True
+    )
+
+    mock_api_clients.external_addresses.get_external_address_balance.assert_not_called()
+
+
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_transfer_uses_balance_ledger(
+    mock_api_clients, mock_transfer, wallet_address_factory, balance_model_factory
+):
+    """Test that transfers are checked against the ledger seeded by balances()."""
+    wallet_address = wallet_address_factory()
+    mock_api_clients.external_addresses.list_external_address_balances.return_value = Mock(
+        data=[balance_model_factory(amount="2000000000000000000", asset_id="eth")]
+    )
+    mock_get_balance = mock_api_clients.external_addresses.get_external_address_balance
+    mock_get_balance.return_value = balance_model_factory(
+        amount="2000000000000000000", asset_id="eth"
+    )
+    mock_transfer.create.return_value = Mock(spec=Transfer)
+
+    wallet_address.balances()
+    wallet_address.transfer(amount="0.75", asset_id="eth", destination="0xdestination")
+    wallet_address.transfer(amount="0.75", asset_id="eth", destination="0xdestination")
+
+    mock_get_balance.assert_not_called()
+    assert wallet_address.balance_ledger.available("eth") == Decimal("0.5")
+
+    wallet_address.transfer(amount="0.75", asset_id="eth", destination="0xdestination")
+
+    mock_get_balance.assert_called_once()
+    assert mock_transfer.create.call_count == 3
+
+
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_transfer_failure_invalidates_balance_ledger(
+    mock_api_clients, mock_transfer, wallet_address_factory, balance_model_factory
+):
+    """Test that a failed transfer invalidates the ledger balance of the asset."""
+    wallet_address = wallet_address_factory()
+    mock_api_clients.external_addresses.get_external_address_balance.return_value = (
+        balance_model_factory(amount="2000000000000000000", asset_id="eth")
+    )
+    mock_transfer.create.side_effect = Exception("API Error")
+
+    with pytest.raises(Exception, match="API Error"):
+        wallet_address.transfer(amount="1.0", asset_id="eth", destination="0xdestination")
+
+    assert wallet_address.balance_ledger.available("eth") is None
+
+
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_concurrent_transfers_reserve_balance(
+    mock_api_clients, mock_transfer, wallet_address_factory, balance_model_factory
+):
+    """Test that concurrent transfers cannot both pass the balance check for the same funds."""
+    wallet_address = wallet_address_factory()
+    mock_api_clients.external_addresses.get_external_address_balance.return_value = (
+        balance_model_factory(amount="1000000000000000000", asset_id="eth")
+    )
+    wallet_address.balance("eth")
+    created = threading.Event()
+    release = threading.Event()
+
+    def create(**kwargs):
+        created.set()
+        release.wait(timeout=5)
+        return Mock(spec=Transfer)
+
+    mock_transfer.create.side_effect = create
+    thread = threading.Thread(
+        target=wallet_address.transfer,
+        kwargs={"amount": "0.75", "asset_id": "eth", "destination": "0xdestination"},
+    )
+    thread.start()
+    try:
+        assert created.wait(timeout=5)
+        with pytest.raises(InsufficientFundsError):
+            wallet_address.transfer(amount="0.75", asset_id="eth", destination="0xdestination")
+    finally:
+        release.set()
+        thread.join()
+
+    assert mock_transfer.create.call_count == 1
+    assert wallet_address.balance_ledger.available("eth") == Decimal("0.25")
+
+
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_transfer_failure_releases_reservation(
+    mock_api_clients, mock_transfer, wallet_address_factory, balance_model_factory
+):
+    """Test that a failed transfer releases the balance it reserved."""
+    wallet_address = wallet_address_factory()
+    mock_api_clients.external_addresses.get_external_address_balance.return_value = (
+        balance_model_factory(amount="1000000000000000000", asset_id="eth")
+    )
+    mock_transfer.create.side_effect = [Exception("API Error"), Mock(spec=Transfer)]
+
+    with pytest.raises(Exception, match="API Error"):
+        wallet_address.transfer(amount="0.75", asset_id="eth", destination="0xdestination")
+    wallet_address.transfer(amount="0.75", asset_id="eth", destination="0xdestination")
+
+    assert wallet_address.balance_ledger.available("eth") == Decimal("0.25")
+
+
+@patch("cdp.wallet_address.Asset")
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", False)
+def test_batch_transfer(
+    mock_api_clients, mock_transfer, mock_asset, wallet_address_factory, balance_model_factory
+):
+    """Test that a batch checks balances and fetches assets once and reports each transfer."""
+    wallet_address = wallet_address_factory(key=True)
+    mock_api_clients.external_addresses.get_external_address_balance.return_value = (
+        balance_model_factory(amount="10000000", asset_id="usdc", decimals=6)
+    )
+    transfers = {destination: Mock(spec=Transfer) for destination in ("0xa", "0xb", "0xc", "0xd")}
+    transfers["0xc"].broadcast.side_effect = Exception("API Error")
+    mock_transfer.create.side_effect = lambda **kwargs: transfers[kwargs["destination"]]
+    on_result = Mock()
+
+    report = wallet_address.batch_transfer(
+        [(1, "usdc", "0xa"), ("2", "usdc", "0xb"), (3, "usdc", "0xc"), (Decimal(4), "usdc", "0xd")],
+        max_workers=2,
+        on_result=on_result,
+    )
+
+    assert [result.index for result in report.results] == [0, 1, 2, 3]
+    assert report.transfers == [transfers["0xa"], transfers["0xb"], transfers["0xd"]]
+    assert [result.item.destination for result in report.failed] == ["0xc"]
+    assert str(report.failed[0].error) == "API Error"
+    assert on_result.call_count == 4
+    mock_api_clients.external_addresses.get_external_address_balance.assert_called_once_with(
+        network_id=wallet_address.network_id, address_id=wallet_address.address_id, asset_id="usdc"
+    )
+    mock_asset.fetch.assert_called_once_with(wallet_address.network_id, "usdc")
+    assert mock_transfer.create.call_count == 4
+    for call_args in mock_transfer.create.call_args_list:
+        assert call_args.kwargs["asset"] is mock_asset.fetch.return_value
+    for transfer in transfers.values():
+        transfer.sign.assert_called_once_with(wallet_address.key)
+
+
+@patch("cdp.wallet_address.Asset")
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_batch_transfer_insufficient_funds(
+    mock_api_clients, mock_transfer, mock_asset, wallet_address_factory, balance_model_factory
+):
+    """Test that no transfer is created when the batch total exceeds the balance."""
+    wallet_address = wallet_address_factory()
+    mock_api_clients.external_addresses.get_external_address_balance.return_value = (
+        balance_model_factory(amount="2000000", asset_id="usdc", decimals=6)
+    )
+
+    with pytest.raises(InsufficientFundsError):
+        wallet_address.batch_transfer([(1, "usdc", "0xa"), (1.5, "usdc", "0xb")])
+
+    mock_transfer.create.assert_not_called()
+
+
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_batch_transfer_mixed_denominations_insufficient_funds(
+    mock_api_clients,
+    mock_transfer,
+    wallet_address_factory,
+    balance_model_factory,
+    asset_model_factory,
+):
+    """Test that amounts in different denominations of an asset are checked together."""
+    wallet_address = wallet_address_factory()
+    mock_api_clients.assets.get_asset.return_value = asset_model_factory(
+        asset_id="eth", decimals=18
+    )
+    mock_api_clients.external_addresses.get_external_address_balance.return_value = (
+        balance_model_factory(amount="1000000000000000000", asset_id="eth")
+    )
+
+    with pytest.raises(InsufficientFundsError):
+        wallet_address.batch_transfer(
+            [
+                (Decimal("0.6"), "eth", "0xa"),
+                (Decimal("300000000"), "gwei", "0xb"),
+                (Decimal("0.2"), "ETH", "0xc"),
+            ]
+        )
+
+    mock_transfer.create.assert_not_called()
+    assert wallet_address.balance_ledger.available("eth") == Decimal("1")
+
+
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_batch_transfer_mixed_denominations(
+    mock_api_clients,
+    mock_transfer,
+    wallet_address_factory,
+    balance_model_factory,
+    asset_model_factory,
+):
+    """Test that transfers in different denominations of an asset share its reservation."""
+    wallet_address = wallet_address_factory()
+    mock_api_clients.assets.get_asset.return_value = asset_model_factory(
+        asset_id="eth", decimals=18
+    )
+    mock_api_clients.external_addresses.get_external_address_balance.return_value = (
+        balance_model_factory(amount="1000000000000000000", asset_id="eth")
+    )
+    mock_transfer.create.return_value = Mock(spec=Transfer)
+
+    report = wallet_address.batch_transfer(
+        [(Decimal("0.5"), "eth", "0xa"), (Decimal("300000000"), "gwei", "0xb")]
+    )
+
+    assert report.all_succeeded
+    mock_api_clients.external_addresses.get_external_address_balance.assert_called_once()
+    assert wallet_address.balance_ledger.available("eth") == Decimal("0.2")
+
+
+@patch("cdp.wallet_address.Asset")
+@patch("cdp.wallet_address.Transfer")
+@patch("cdp.Cdp.api_clients")
+@patch("cdp.Cdp.use_server_signer", True)
+def test_batch_transfer_on_result_errors(
+    mock_api_clients, mock_transfer, mock_asset, wallet_address_factory
+):
+    """Test that exceptions raised by on_result are collected without stopping the batch."""
+    wallet_address = wallet_address_factory()
+    mock_transfer.create.return_value = Mock(spec=Transfer)
+    error = Exception("Callback Error")
+
+    report = wallet_address.batch_transfer(
+        [(1, "usdc", "0xa"), (2, "usdc", "0xb"), (3, "usdc", "0xc")],
+        skip_balance_check=True,
+        max_workers=1,
+        on_result=Mock(side_effect=error),
+    )
+
+    assert report.all_succeeded
+    assert len(report) == 3
+    assert report.callback_errors == [error, error, error]
+
+
+def test_batch_transfer_invalid_options(wallet_address_factory):
+    """Test that invalid batch options are rejected."""
+    wallet_address = wallet_address_factory()
+
+    with pytest.raises(ValueError, match="skip_batching requires gasless"):
+        wallet_address.batch_transfer([], skip_batching=True)
+    with pytest.raises(ValueError, match="max_workers"):
+        wallet_address.batch_transfer([], max_workers=0)
+
+
 def test_str_representation(wallet_address_factory):
     """Test the str representation of a WalletAddress."""
     wallet_address = wallet_address_factory()
@@ -1212,10 +1508,10 @@ def test_deploy_contract_broadcast_api_error(
 
 
 @patch("cdp.Cdp.api_clients")
-def test_ensure_sufficient_balance_sufficient_full_amount(
+def test_reserve_balance_sufficient_full_amount(
     mock_api_clients, wallet_address_factory, balance_model_factory
 ):
-    """Test the ensure_sufficient_balance method with sufficient full amount balance."""
+    """Test the reserve_balance method with sufficient full amount balance."""
     wallet_address = wallet_address_factory()
     balance_model = balance_model_factory(
         amount="1500000000000000000", network_id="base-sepolia", asset_id="eth", decimals=18
@@ -1225,7 +1521,7 @@ def test_ensure_sufficient_balance_sufficient_full_amount(
     mock_get_balance.return_value = balance_model
     mock_api_clients.external_addresses.get_external_address_balance = mock_get_balance
 
-    wallet_address._ensure_sufficient_balance(Decimal("1.5"), "eth")
+    wallet_address._reserve_balance(Decimal("1.5"), "eth")
 
     mock_get_balance.assert_called_once_with(
         network_id=wallet_address.network_id, address_id=wallet_address.address_id, asset_id="eth"
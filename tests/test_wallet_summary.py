@@ -0,0 +1,35 @@
+from cdp.wallet_summary import WalletSummary
+
+
+def test_wallet_summary_from_model(wallet_model_factory, address_model_factory):
+    """Test creating a WalletSummary from a wallet model."""
+    model = wallet_model_factory(
+        id="wallet-1",
+        network_id="base-mainnet",
+        default_address=address_model_factory(address_id="0xdefault"),
+    )
+
+    summary = WalletSummary.from_model(model)
+
+    assert summary.id == "wallet-1"
+    assert summary.network_id == "base-mainnet"
+    assert summary.server_signer_status == "active_seed"
+    assert summary.default_address_id == "0xdefault"
+
+
+def test_wallet_summary_from_model_without_default_address(wallet_model_factory):
+    """Test creating a WalletSummary from a wallet model without a default address."""
+    model = wallet_model_factory()
+    model.default_address = None
+
+    assert WalletSummary.from_model(model).default_address_id is None
+
+
+def test_wallet_summary_str():
+    """Test the string representation of a WalletSummary."""
+    summary = WalletSummary(id="wallet-1", network_id="base-sepolia", default_address_id="0xabc")
+
+    assert (
+        str(summary)
+        == "WalletSummary: (id: wallet-1, network_id: base-sepolia, default_address_id: 0xabc)"
+    )
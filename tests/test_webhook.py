@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import Mock, call, patch
 
 from cdp.client import CreateWebhookRequest, UpdateWebhookRequest, WebhookStatus
 from cdp.client.models.webhook import WebhookEventFilter, WebhookEventType, WebhookEventTypeFilter
@@ -106,3 +106,22 @@ def test_webhook_instance_delete(mock_api_clients, webhook_factory):
 
     # Verify the API client was called with the correct webhook ID
     mock_api_clients.webhooks.delete_webhook.assert_called_once_with("webhook-123")
+
+
+@patch("cdp.Cdp.api_clients")
+def test_webhook_list_follows_pages(mock_api_clients, webhook_factory):
+    """Test that Webhook.list requests each page once with the next page token."""
+    mock_api_clients.webhooks.list_webhooks = Mock(
+        side_effect=[
+            Mock(data=[webhook_factory("webhook-1")._model], has_more=True, next_page="page-2"),
+            Mock(data=[webhook_factory("webhook-2")._model], has_more=False, next_page=None),
+        ]
+    )
+
+    webhooks = list(Webhook.list())
+
+    assert [webhook.id for webhook in webhooks] == ["webhook-1", "webhook-2"]
+    assert mock_api_clients.webhooks.list_webhooks.call_args_list == [
+        call(limit=100, page=None),
+        call(limit=100, page="page-2"),
+    ]